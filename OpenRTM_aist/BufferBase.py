@@ -372,6 +372,28 @@ class BufferBase(OpenRTM_aist.BufferStatus):
     pass
 
 
+  ##
+  # @if jp
+  # 
+  # @brief ХåեǡޤȤɤ߽Ф(֥饹)
+  # 
+  # Хåե n ĤΥǡɤ߽Ф<BR>
+  # ֥饹Ǥμ
+  # 
+  # @param self 
+  # @param n ɤ߽Фǿ(ξ)
+  # 
+  # @return ɤ߽ФǡΥꥹ
+  # 
+  # @else
+  # 
+  # @brief Read at most n elements from the buffer
+  # 
+  # @endif
+  def readAll(self, n = -1):
+    pass
+
+
   ##
   # @if jp
   #
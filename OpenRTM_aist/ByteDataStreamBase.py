@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  ByteDataStreamBase.py
+# @brief ByteDataStreamBase class
+# @date  $Date$
+#
+
+
+
+import OpenRTM_aist
+
+
+##
+# @if jp
+#
+# @class ByteDataStreamBase
+#
+# @brief ꥢ饤δ쥯饹
+#
+# ǡݡȤΥǡХ˥ޡ󥰡ޡ
+# 륷ꥢ饤δ쥯饹ꥢ饤 SerializerFactory 
+# marshaling_type ̾Ͽ졢ͥ³˥ͥ
+# ץѥƥ marshaling_type ˻ꤵ줿̾ǥꥢ饤롣
+# ǡ˷Ȥν٤ԤǡȤ
+# serialize()/deserialize() ǤϷβԤʤ
+#
+# @else
+# @class ByteDataStreamBase
+#
+# @brief The base class of serializers
+#
+# The base class of serializers which marshal and unmarshal the data
+# of data ports into byte strings. Serializers are registered to
+# SerializerFactory by the name of marshaling_type, and connectors
+# create the serializer named by the connector property
+# marshaling_type at connection time. The preparation for the data
+# type is done only once when the data type is set, and the type is
+# not resolved in serialize()/deserialize() for each data.
+#
+# @endif
+#
+class ByteDataStreamBase:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief ǥ
+  #
+  # @param self
+  # @param little_endian True: ȥ륨ǥ, False: ӥåǥ
+  #
+  # @else
+  # @brief Setting the endian
+  #
+  # @param self
+  # @param little_endian True: little endian, False: big endian
+  #
+  # @endif
+  #
+  def isLittleEndian(self, little_endian):
+    pass
+
+
+  ##
+  # @if jp
+  # @brief ǡ
+  #
+  # @param self
+  # @param data ǡΥ󥹥
+  # @return True: бƤǡ, False: бƤʤǡ
+  #
+  # @else
+  # @brief Setting the data type
+  #
+  # @param self
+  # @param data An instance of the data type
+  # @return True: supported data type, False: not supported data type
+  #
+  # @endif
+  #
+  def setDataType(self, data):
+    pass
+
+
+  ##
+  # @if jp
+  # @brief ǡΥޡ
+  #
+  # @param self
+  # @param data ޡоݤΥǡ
+  # @return ޡ󥰤Х
+  #
+  # @else
+  # @brief Marshaling data
+  #
+  # @param self
+  # @param data Data to be marshaled
+  # @return Marshaled byte string
+  #
+  # @endif
+  #
+  def serialize(self, data):
+    pass
+
+
+  ##
+  # @if jp
+  # @brief ǡΥޡ
+  #
+  # @param self
+  # @param cdr ޡ󥰤줿Х
+  # @return ޡ󥰤ǡ
+  #
+  # @else
+  # @brief Unmarshaling data
+  #
+  # @param self
+  # @param cdr Marshaled byte string
+  # @return Unmarshaled data
+  #
+  # @endif
+  #
+  def deserialize(self, cdr):
+    pass
+
+
+
+serializerfactory = None
+
+
+class SerializerFactory(OpenRTM_aist.Factory):
+  def __init__(self):
+    OpenRTM_aist.Factory.__init__(self)
+    pass
+
+
+  def instance():
+    global serializerfactory
+
+    if serializerfactory is None:
+      serializerfactory = SerializerFactory()
+
+    return serializerfactory
+
+  instance = staticmethod(instance)
+
+
+
+##
+# @if jp
+# @brief ꥢ饤
+#
+# marshaling_type Υꥢ饤 SerializerFactory 
+# ǡȥǥꤹ롣marshaling_type ϿƤʤ
+# 䡢ꥢ饤ǡбƤʤ None ֤
+# ꥢ饤 SerializerFactory  deleteObject() Ǻ롣
+#
+# @param marshaling_type ꥢ饤̾
+# @param data ǡΥ󥹥
+# @param little_endian True: ȥ륨ǥ, False: ӥåǥ
+# @return ꥢ饤
+#
+# @else
+# @brief Creating a serializer
+#
+# This function creates the serializer of marshaling_type from
+# SerializerFactory and sets the data type and the endian to it.
+# None is returned if marshaling_type is not registered or the
+# serializer does not support the data type. The created serializer
+# should be deleted by deleteObject() of SerializerFactory.
+#
+# @param marshaling_type The name of the serializer
+# @param data An instance of the data type
+# @param little_endian True: little endian, False: big endian
+# @return The serializer
+#
+# @endif
+#
+def createSerializer(marshaling_type, data, little_endian):
+  factory = SerializerFactory.instance()
+  if not factory.hasFactory(marshaling_type):
+    return None
+
+  serializer = factory.createObject(marshaling_type)
+  if not serializer.setDataType(data):
+    factory.deleteObject(serializer)
+    return None
+
+  serializer.isLittleEndian(little_endian)
+  return serializer
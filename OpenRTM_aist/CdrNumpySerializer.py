@@ -0,0 +1,358 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  CdrNumpySerializer.py
+# @brief CdrNumpySerializer class
+# @date  $Date$
+#
+
+
+
+import struct
+
+try:
+  import numpy
+except ImportError:
+  numpy = None
+
+import OpenRTM_aist
+import RTC
+
+
+##
+# @if jp
+# @brief NumPy ǰͥ󥹷Ƿ
+#
+# BasicDataType.idl  Timed*Seq ΥݥȥIDȡdata եɤ
+# Ǥ NumPy (ǥʤ)б
+#
+# @else
+# @brief Element types of the numeric sequence types handled by NumPy
+#
+# The map from the repository ID of Timed*Seq types in
+# BasicDataType.idl to the NumPy type (without byte order) of the
+# elements of the data field.
+#
+# @endif
+#
+numpy_element_types = {
+  "IDL:RTC/TimedShortSeq:1.0":   "i2",
+  "IDL:RTC/TimedLongSeq:1.0":    "i4",
+  "IDL:RTC/TimedUShortSeq:1.0":  "u2",
+  "IDL:RTC/TimedULongSeq:1.0":   "u4",
+  "IDL:RTC/TimedFloatSeq:1.0":   "f4",
+  "IDL:RTC/TimedDoubleSeq:1.0":  "f8",
+  "IDL:RTC/TimedCharSeq:1.0":    "S1",
+  "IDL:RTC/TimedBooleanSeq:1.0": "b1",
+  "IDL:RTC/TimedOctetSeq:1.0":   "u1"
+  }
+
+
+##
+# @if jp
+#
+# @class CdrNumpySerializer
+#
+# @brief CdrNumpySerializer 饹
+#
+# BasicDataType.idl οͥ󥹷(TimedDoubleSeq ) NumPy 
+# CDR ˥ޡ󥰡ޡ󥰤륷ꥢ饤
+# Time tmĹdata Ǥɸ CDR Ʊ쥤Ȥ
+# ɤ߽񤭤뤿ᡢ̾ CDR ߤ̿Ǥ롣data Ǥ
+# numpy.frombuffer()/tobytes() ǤޤȤѴ졢ޡ
+# ̤ data եɤ NumPy Ȥʤ롣ϼǡ
+# Ȥɤ߽ФѤǤ롣
+#
+# ͥץѥƥ marshaling_type  cdr_numpy ꤹȻѤ롣
+# NumPy ʤĶ䡢бƤʤǡξϻѤǤʤ
+#
+# @else
+# @class CdrNumpySerializer
+#
+# @brief CdrNumpySerializer class
+#
+# This serializer marshals and unmarshals the numeric sequence types
+# of BasicDataType.idl (TimedDoubleSeq etc.) into CDR with NumPy.
+# Since Time tm, the sequence length and the elements of data are
+# read and written in the same layout as the standard CDR, it can
+# communicate with the ordinary CDR. The elements of data are
+# converted at once by numpy.frombuffer()/tobytes(), and the data
+# field of the unmarshaled data is a NumPy array. The array is
+# read-only and refers to the received data.
+#
+# This serializer is used if the connector property marshaling_type
+# is cdr_numpy. It is not available without NumPy or for the data
+# types which are not supported.
+#
+# @endif
+#
+class CdrNumpySerializer(OpenRTM_aist.ByteDataStreamBase):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # 󥹥ȥ饯
+  #
+  # @param self
+  #
+  # @else
+  # @brief Constructor
+  #
+  # Constructor
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def __init__(self):
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("CdrNumpySerializer")
+    self._endian = True
+    self._dataClass = None
+    self._elementType = None
+    self._dtype = None
+    self._header = None
+    self._padding = b""
+    self._offset = 0
+    return
+
+
+  ##
+  # @if jp
+  # @brief NumPy ѲǽĴ٤
+  #
+  # @return True: Ѳǽ, False: Բ
+  #
+  # @else
+  # @brief Check whether NumPy is available
+  #
+  # @return True: available, False: not available
+  #
+  # @endif
+  #
+  def available():
+    return numpy is not None
+
+  available = staticmethod(available)
+
+
+  ##
+  # @if jp
+  # @brief ǥ
+  #
+  # @param self
+  # @param little_endian True: ȥ륨ǥ, False: ӥåǥ
+  #
+  # @else
+  # @brief Setting the endian
+  #
+  # @param self
+  # @param little_endian True: little endian, False: big endian
+  #
+  # @endif
+  #
+  def isLittleEndian(self, little_endian):
+    self._endian = little_endian
+    self.compile()
+
+
+  ##
+  # @if jp
+  # @brief ǡ
+  #
+  # ǡꤹ롣NumPy ʤбƤʤǡ
+  #  False ֤
+  #
+  # @param self
+  # @param data ǡΥ󥹥
+  # @return True: бƤǡ, False: бƤʤǡ
+  #
+  # @else
+  # @brief Setting the data type
+  #
+  # This operation sets the data type. False is returned if NumPy is
+  # not available or the data type is not supported.
+  #
+  # @param self
+  # @param data An instance of the data type
+  # @return True: supported data type, False: not supported data type
+  #
+  # @endif
+  #
+  def setDataType(self, data):
+    if numpy is None:
+      self._rtcout.RTC_WARN("numpy is not available.")
+      return False
+
+    rid = getattr(data, "_NP_RepositoryId", None)
+    if rid not in numpy_element_types:
+      self._rtcout.RTC_WARN("%s is not supported.", str(rid))
+      return False
+
+    self._dataClass = data.__class__
+    self._elementType = numpy_element_types[rid]
+    self.compile()
+    return True
+
+
+  ##
+  # @if jp
+  # @brief Ѵѥ֥Ȥ
+  #
+  # ǥǷ NumPy  dtypeإå(tm.sec, tm.nsec,
+  # Ĺ) struct.StructǤζ·뤿Υѥǥ󥰤
+  # 롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Creating the objects for conversion
+  #
+  # This operation creates the NumPy dtype, the struct.Struct of the
+  # header (tm.sec, tm.nsec and the sequence length) and the padding
+  # to align the elements from the endian and the element type.
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def compile(self):
+    if self._elementType is None:
+      return
+
+    if self._endian:
+      order = "<"
+    else:
+      order = ">"
+    self._dtype = numpy.dtype(order + self._elementType)
+    self._header = struct.Struct(order + "III")
+    size = self._header.size
+    pad = (self._dtype.itemsize - size % self._dtype.itemsize) % self._dtype.itemsize
+    self._padding = b"\0" * pad
+    self._offset = size + pad
+
+
+  ##
+  # @if jp
+  # @brief ǡΥޡ
+  #
+  # data եɤˤϥꥹȡץ롢NumPy 󡢥ХǤ롣
+  # ¿ NumPy 1¤٤ΤȤ롣
+  #
+  # @param self
+  # @param data ޡоݤΥǡ
+  # @return CDR ǡ
+  #
+  # @else
+  # @brief Marshaling data
+  #
+  # The data field may be a list, a tuple, a NumPy array or a byte
+  # string. A multidimensional NumPy array is sent as it is flattened.
+  #
+  # @param self
+  # @param data Data to be marshaled
+  # @return CDR data
+  #
+  # @endif
+  #
+  def serialize(self, data):
+    value = data.data
+    if isinstance(value, (bytes, bytearray)):
+      arr = numpy.frombuffer(value, dtype=self._dtype)
+    else:
+      arr = numpy.asarray(value, dtype=self._dtype).reshape(-1)
+
+    return self._header.pack(data.tm.sec, data.tm.nsec, len(arr)) \
+        + self._padding + arr.tobytes()
+
+
+  ##
+  # @if jp
+  # @brief ǡΥޡ
+  #
+  # @param self
+  # @param cdr CDR ǡ
+  # @return ޡ󥰤ǡ
+  #
+  # @else
+  # @brief Unmarshaling data
+  #
+  # @param self
+  # @param cdr CDR data
+  # @return Unmarshaled data
+  #
+  # @endif
+  #
+  def deserialize(self, cdr):
+    sec, nsec, length = self._header.unpack_from(cdr, 0)
+    if length == 0:
+      arr = numpy.empty(0, dtype=self._dtype)
+    else:
+      arr = numpy.frombuffer(cdr, dtype=self._dtype,
+                             count=length, offset=self._offset)
+
+    return self._dataClass(RTC.Time(sec, nsec), arr)
+
+
+
+##
+# @if jp
+# @brief ͥ󥹷 CDR ǡ򻲾Ȥ NumPy μ
+#
+# CDR ǡ data եɤǤ򥳥ԡ˻Ȥɤ߽Ф
+# Ѥ NumPy ֤InPort.lease() ֤ memoryview Ϥȡ
+# ͭΥǡľܻȤǤ롣InPort.lease_sequence() Ϥ
+# ؿѤ롣
+#
+# @param cdr CDR ǡ(Хޤ memoryview)
+# @param data_type ǡ(Timed*Seq Υ饹ޤϥ󥹥)
+# @param little_endian True: ȥ륨ǥ, False: ӥåǥ
+# @return (tm.sec, tm.nsec, NumPy )
+#
+# @else
+# @brief Getting a NumPy array referring to the CDR data of a numeric
+#        sequence type
+#
+# This returns a read-only NumPy array referring to the elements of
+# the data field of the CDR data without copy. If the memoryview
+# returned by InPort.lease() is given, the data on the shared memory
+# is referred directly. InPort.lease_sequence() uses this function.
+#
+# @param cdr CDR data (byte string or memoryview)
+# @param data_type Data type (class or instance of Timed*Seq)
+# @param little_endian True: little endian, False: big endian
+# @return (tm.sec, tm.nsec, NumPy array)
+#
+# @endif
+#
+def numpySequenceView(cdr, data_type, little_endian=True):
+  if numpy is None:
+    raise ImportError("numpy is not available")
+
+  rid = getattr(data_type, "_NP_RepositoryId", None)
+  if rid not in numpy_element_types:
+    raise TypeError("%s is not supported" % str(rid))
+
+  if little_endian:
+    order = "<"
+  else:
+    order = ">"
+  dtype = numpy.dtype(order + numpy_element_types[rid])
+  header = struct.Struct(order + "III")
+  sec, nsec, length = header.unpack_from(cdr, 0)
+  if length == 0:
+    return (sec, nsec, numpy.empty(0, dtype=dtype))
+
+  offset = (header.size + dtype.itemsize - 1) // dtype.itemsize * dtype.itemsize
+  return (sec, nsec, numpy.frombuffer(cdr, dtype=dtype, count=length, offset=offset))
+
+
+
+def CdrNumpySerializerInit():
+  factory = OpenRTM_aist.SerializerFactory.instance()
+  factory.addFactory("cdr_numpy",
+                     OpenRTM_aist.CdrNumpySerializer,
+                     OpenRTM_aist.Delete)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  CdrSerializer.py
+# @brief CdrSerializer class
+# @date  $Date$
+#
+
+
+
+from omniORB import cdrMarshal
+from omniORB import cdrUnmarshal
+from omniORB import any
+
+import OpenRTM_aist
+
+
+##
+# @if jp
+#
+# @class CdrSerializer
+#
+# @brief CdrSerializer 饹
+#
+# omniORB  cdrMarshal()/cdrUnmarshal() ˤǡ CDR 
+# ޡ󥰡ޡ󥰤륷ꥢ饤ǡ
+# TypeCode ϥǡ˰٤롣marshaling_type 
+# ǥեȤ cdr ȤϿ롣
+#
+# @else
+# @class CdrSerializer
+#
+# @brief CdrSerializer class
+#
+# This serializer marshals and unmarshals data into CDR by
+# cdrMarshal()/cdrUnmarshal() of omniORB. The TypeCode of the data
+# type is resolved only once when the data type is set. It is
+# registered as cdr, which is the default marshaling_type.
+#
+# @endif
+#
+class CdrSerializer(OpenRTM_aist.ByteDataStreamBase):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # 󥹥ȥ饯
+  #
+  # @param self
+  #
+  # @else
+  # @brief Constructor
+  #
+  # Constructor
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def __init__(self):
+    self._endian = True
+    self._typecode = None
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǥ
+  #
+  # @param self
+  # @param little_endian True: ȥ륨ǥ, False: ӥåǥ
+  #
+  # @else
+  # @brief Setting the endian
+  #
+  # @param self
+  # @param little_endian True: little endian, False: big endian
+  #
+  # @endif
+  #
+  def isLittleEndian(self, little_endian):
+    self._endian = little_endian
+
+
+  ##
+  # @if jp
+  # @brief ǡ
+  #
+  # ǡ TypeCode 롣
+  #
+  # @param self
+  # @param data ǡΥ󥹥
+  # @return True
+  #
+  # @else
+  # @brief Setting the data type
+  #
+  # This operation resolves the TypeCode of the data type.
+  #
+  # @param self
+  # @param data An instance of the data type
+  # @return True
+  #
+  # @endif
+  #
+  def setDataType(self, data):
+    self._typecode = any.to_any(data).typecode()
+    return True
+
+
+  ##
+  # @if jp
+  # @brief ǡΥޡ
+  #
+  # @param self
+  # @param data ޡоݤΥǡ
+  # @return CDR ǡ
+  #
+  # @else
+  # @brief Marshaling data
+  #
+  # @param self
+  # @param data Data to be marshaled
+  # @return CDR data
+  #
+  # @endif
+  #
+  def serialize(self, data):
+    return cdrMarshal(self._typecode, data, self._endian)
+
+
+  ##
+  # @if jp
+  # @brief ǡΥޡ
+  #
+  # @param self
+  # @param cdr CDR ǡ
+  # @return ޡ󥰤ǡ
+  #
+  # @else
+  # @brief Unmarshaling data
+  #
+  # @param self
+  # @param cdr CDR data
+  # @return Unmarshaled data
+  #
+  # @endif
+  #
+  def deserialize(self, cdr):
+    return cdrUnmarshal(self._typecode, cdr, self._endian)
+
+
+
+def CdrSerializerInit():
+  factory = OpenRTM_aist.SerializerFactory.instance()
+  factory.addFactory("cdr",
+                     OpenRTM_aist.CdrSerializer,
+                     OpenRTM_aist.Delete)
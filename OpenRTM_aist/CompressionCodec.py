@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  CompressionCodec.py
+# @brief CompressionCodec class
+# @date  $Date$
+#
+
+
+
+import time
+import zlib
+
+try:
+  import lzma
+except ImportError:
+  lzma = None
+
+import OpenRTM_aist
+
+
+_cpu_time = getattr(time, "process_time", None) or time.clock
+
+
+##
+# @if jp
+# @class CompressionCodec
+# @brief CompressionCodec 饹
+#
+# ޡ󥰤줿ǡ򰵽̡Ĺ륳ͥѤΥǥå
+# ̸ΥǡƬˤϰ̷ɽ 1 ХȤΥإåդ롣
+# threshold ̤Υǡ䰵̤Ƥ⾮ʤʤǡϰ̤
+# Τޤ롣Ĺ¦ϥإåǰ̷Ƚꤹ뤿ᡢ¦
+# ̷ΤɬפϤʤ
+#
+# @else
+# @class CompressionCodec
+# @brief CompressionCodec class
+#
+# The codec for connectors which compresses and decompresses
+# marshaled data. The compressed data is prefixed with a 1 byte
+# header indicating the compression type. Data smaller than
+# threshold, or data which does not become smaller by compression,
+# are sent as they are without compression. Since the decompressing
+# side determines the type from the header, it does not need to know
+# the type chosen by the sending side.
+#
+# @endif
+#
+class CompressionCodec:
+  """
+  """
+
+  RAW  = b"\x00"
+  ZLIB = b"\x01"
+  LZMA = b"\x02"
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # @param self
+  # @param codec_type ̷ ("zlib" ޤ "lzma")
+  # @param threshold ̤ǡκǾХȿ
+  # @param level ̥٥ (0-9)
+  #
+  # @else
+  # @brief Constructor
+  #
+  # @param self
+  # @param codec_type The compression type ("zlib" or "lzma")
+  # @param threshold The minimum bytes of data to be compressed
+  # @param level The compression level (0-9)
+  #
+  # @endif
+  #
+  def __init__(self, codec_type, threshold=1024, level=1):
+    self._type = codec_type
+    self._threshold = threshold
+    self._level = level
+    if codec_type == "lzma":
+      self._header = self.LZMA
+    else:
+      self._header = self.ZLIB
+    return
+
+
+  ##
+  # @if jp
+  # @brief ̷μ
+  # @else
+  # @brief Getting the compression type
+  # @endif
+  #
+  def getType(self):
+    return self._type
+
+
+  ##
+  # @if jp
+  # @brief åΥμ
+  #
+  # Ʊ̤֤ǥåƱˤʤ롣
+  #
+  # @else
+  # @brief Getting the key of the cache
+  #
+  # The codecs returning the same result have the same key.
+  #
+  # @endif
+  #
+  def key(self):
+    return (self._type, self._threshold, self._level)
+
+
+  ##
+  # @if jp
+  # @brief ǡΰ
+  #
+  # @param self
+  # @param data ޡ󥰤줿ǡ
+  # @return إåդΰ̸Υǡ
+  #
+  # @else
+  # @brief Compressing data
+  #
+  # @param self
+  # @param data Marshaled data
+  # @return Compressed data with the header
+  #
+  # @endif
+  #
+  def compress(self, data):
+    if len(data) >= self._threshold:
+      if self._header == self.LZMA:
+        compressed = lzma.compress(data, preset=self._level)
+      else:
+        compressed = zlib.compress(data, self._level)
+      if len(compressed) < len(data):
+        return self._header + compressed
+    return self.RAW + data
+
+
+  ##
+  # @if jp
+  # @brief ǡοĹ
+  #
+  # إåǻꤵ줿ǿĹ롣
+  #
+  # @param data إåդΥǡ
+  # @return ޡ󥰤줿ǡ
+  #
+  # @else
+  # @brief Decompressing data
+  #
+  # This decompresses data with the type indicated by the header.
+  #
+  # @param data Data with the header
+  # @return Marshaled data
+  #
+  # @endif
+  #
+  def decompress(data):
+    header = data[0:1]
+    if header == CompressionCodec.ZLIB:
+      return zlib.decompress(data[1:])
+    elif header == CompressionCodec.LZMA:
+      if lzma is None:
+        raise ValueError("lzma is not available")
+      return lzma.decompress(data[1:])
+    return data[1:]
+
+  decompress = staticmethod(decompress)
+
+
+  ##
+  # @if jp
+  # @brief ץ CPU ֤μ
+  # @else
+  # @brief Getting the CPU time of the process
+  # @endif
+  #
+  def cpuTime():
+    return _cpu_time()
+
+  cpuTime = staticmethod(cpuTime)
+
+
+
+##
+# @if jp
+# @brief Ѳǽʰ̷Υꥹ
+# @else
+# @brief The list of available compression types
+# @endif
+#
+def availableCompressionTypes():
+  if lzma is None:
+    return ["zlib"]
+  return ["zlib", "lzma"]
+
+
+##
+# @if jp
+# @brief ̷θ
+#
+# ޶ڤΰ̷θ䤫顢available ˴ޤޤΤ򸵤
+# ֤Τޤ֤available άϤΥץǻѤǤ
+# Ȥ롣ѤǤΤʤ "none" ֤
+#
+# @param value ̷θ
+# @param available ѤǤ밵̷Υꥹ
+# @return Ѳǽʰ̷
+#
+# @else
+# @brief Negotiating compression types
+#
+# This returns the candidates contained in available out of the comma
+# separated compression types, keeping the original order. If
+# available is omitted, the types usable in this process are
+# used. "none" is returned if there is no usable one.
+#
+# @param value The candidates of compression types
+# @param available The list of usable compression types
+# @return The available compression types
+#
+# @endif
+#
+def negotiateCompressionType(value, available=None):
+  if available is None:
+    available = availableCompressionTypes()
+  types = [OpenRTM_aist.normalize([t]) for t in OpenRTM_aist.split(value, ",")]
+  types = [t for t in types if t in available]
+  if not types:
+    return "none"
+  return ",".join(types)
+
+
+##
+# @if jp
+# @brief ͥΥץѥƥ饳ǥå
+#
+# ʲΥץͿ뤳ȤǤ롣
+#
+# - compression.type: ̷θ (none, zlib, lzma)ʣξ
+#   ޶ڤǻꤹ롣³˸Ĥ줿Ƭη
+#   롣(ǥե: none)
+# - compression.threshold: ̤ǡκǾХȿ
+#   (ǥե: 1024)
+# - compression.level: ̥٥ 0-9 (ǥե: 1)
+#
+# @param prop ͥΥץѥƥ
+# @return ǥå̤ʤ None
+#
+# @else
+# @brief Creating the codec from the properties of a connector
+#
+# The following options are available.
+#
+# - compression.type: The candidates of compression type (none, zlib,
+#   lzma). Several types are specified in comma separated values. The
+#   first one of the types negotiated at connection is used.
+#   (default: none)
+# - compression.threshold: The minimum bytes of data to be compressed
+#   (default: 1024)
+# - compression.level: The compression level 0-9 (default: 1)
+#
+# @param prop The properties of a connector
+# @return The codec, None if data is not compressed
+#
+# @endif
+#
+def createCompressionCodec(prop):
+  types = negotiateCompressionType(prop.getProperty("compression.type", "none"))
+  codec_type = OpenRTM_aist.split(types, ",")[0]
+  if codec_type == "none":
+    return None
+
+  threshold = [1024]
+  if not OpenRTM_aist.stringTo(threshold,
+                               prop.getProperty("compression.threshold", "1024")):
+    threshold = [1024]
+  level = [1]
+  if not OpenRTM_aist.stringTo(level, prop.getProperty("compression.level", "1")) \
+        or not 0 <= level[0] <= 9:
+    level = [1]
+
+  return CompressionCodec(codec_type, threshold[0], level[0])
@@ -15,9 +15,6 @@
 #         Advanced Industrial Science and Technology (AIST), Japan
 #     All rights reserved.
 
-from omniORB import cdrUnmarshal
-from omniORB import any
-
 import OpenRTM_aist
 import OpenRTM_aist.Guard
 import threading
@@ -72,6 +69,7 @@ class ConnectorListenerStatus:
 # - ON_RECEIVER_FULL:         InProt¦Хåեե
 # - ON_RECEIVER_TIMEOUT:      InProt¦ХåեॢȻ
 # - ON_RECEIVER_ERROR:        InProt¦顼
+# - ON_SENDER_THROTTLED:      Ӱ¤ˤα˴
 #
 # @else
 # @brief The types of ConnectorDataListener
@@ -86,6 +84,8 @@ class ConnectorListenerStatus:
 # - ON_RECEIVER_FULL:         At the time of bufferfull of InPort
 # - ON_RECEIVER_TIMEOUT:      At the time of timeout of InPort
 # - ON_RECEIVER_ERROR:        At the time of error of InPort
+# - ON_SENDER_THROTTLED:      At the time of deferring or dropping by
+#                             the bandwidth limit
 #
 # @endif
 #
@@ -103,7 +103,8 @@ class ConnectorDataListenerType:
   ON_RECEIVER_FULL             = 7
   ON_RECEIVER_TIMEOUT          = 8
   ON_RECEIVER_ERROR            = 9
-  CONNECTOR_DATA_LISTENER_NUM  = 10
+  ON_SENDER_THROTTLED          = 10
+  CONNECTOR_DATA_LISTENER_NUM  = 11
 
 
 
@@ -153,6 +154,7 @@ class ConnectorDataListenerType:
 #      - ON_RECEIVER_FULL
 #      - ON_RECEIVER_TIMEOUT
 #      - ON_RECEIVER_ERROR
+#      - ON_SENDER_THROTTLED
 #      - ON_SENDER_ERROR
 #      - ON_CONNECT
 #      - ON_DISCONNECT
@@ -167,6 +169,7 @@ class ConnectorDataListenerType:
 #      - ON_RECEIVER_FULL
 #      - ON_RECEIVER_TIMEOUT
 #      - ON_RECEIVER_ERROR
+#      - ON_SENDER_THROTTLED
 #      - ON_BUFFER_EMPTY
 #      - ON_SENDER_EMPTY
 #      - ON_SENDER_ERROR
@@ -256,6 +259,7 @@ class ConnectorDataListener:
                   "ON_RECEIVER_FULL", 
                   "ON_RECEIVER_TIMEOUT", 
                   "ON_RECEIVER_ERROR",
+                  "ON_SENDER_THROTTLED",
                   "CONNECTOR_DATA_LISTENER_NUM"]
 
     if type < ConnectorDataListenerType.CONNECTOR_DATA_LISTENER_NUM:
@@ -294,6 +298,17 @@ class ConnectorDataListenerT(ConnectorDataListener):
   """
   """
 
+  # TypeCode and endian resolved at the first call
+  _serializerKey = None
+  _serializer = None
+  _endianKey = None
+  _endian = True
+  _codecKey = None
+  _compressed = False
+  _delta = False
+  _deltaDecoders = None
+  _restored = None
+
   def __del__(self):
     pass
 
@@ -304,7 +319,11 @@ class ConnectorDataListenerT(ConnectorDataListener):
   # @brief Хå᥽å
   #
   # ǡǡݡȤǻѤѿѴ ConnectorDataListenerT
-  # ΥХå᥽åɤƤӽФ
+  # ΥХå᥽åɤƤӽФͥǥǡ̤Ƥ
+  # ϿĹʬե졼ξƤѴ(restoreData()
+  # )Ǥʤʬե졼ξ None ֤
+  # ConnectorDataListenerHolder ϤΤ褦ʥե졼ǤϥꥹʤƤӽФ
+  # ʤ
   #
   # @param info ConnectorInfo 
   # @param cdrdata cdrMemoryStreamΥǡ
@@ -314,7 +333,12 @@ class ConnectorDataListenerT(ConnectorDataListener):
   # @brief Callback method
   #
   # This method invokes the callback method of ConnectorDataListenerT. 
-  # Data is converted into the variable type used in DataPort.
+  # Data is converted into the variable type used in DataPort. Data
+  # compressed by the connector is decompressed and delta frames are
+  # restored before the conversion (see restoreData()). None is returned
+  # for a delta frame which cannot be restored, but
+  # ConnectorDataListenerHolder does not invoke the listener with such
+  # a frame.
   #
   # @param info ConnectorInfo 
   # @param cdrdata Data of cdrMemoryStream type
@@ -324,22 +348,154 @@ class ConnectorDataListenerT(ConnectorDataListener):
   # virtual ReturnCode operator()(const ConnectorInfo& info,
   #                         const cdrMemoryStream& cdrdata)
   def __call__(self, info, cdrdata, data):
-    endian = info.properties.getProperty("serializer.cdr.endian","little")
-    if endian is not "little" and endian is not None:
-      endian = OpenRTM_aist.split(endian, ",") # Maybe endian is ["little","big"]
-      endian = OpenRTM_aist.normalize(endian) # Maybe self._endian is "little" or "big"
-
-    if endian == "little":
-      endian = True
-    elif endian == "big":
-      endian = False
-    else:
-      endian = True
-
-    _data = cdrUnmarshal(any.to_any(data).typecode(), cdrdata, endian)
+    endian_key = info.properties.getProperty("serializer.cdr.endian","little")
+    if endian_key != self._endianKey:
+      endian = endian_key
+      if endian is not "little" and endian is not None:
+        endian = OpenRTM_aist.split(endian, ",") # Maybe endian is ["little","big"]
+        endian = OpenRTM_aist.normalize(endian) # Maybe self._endian is "little" or "big"
+
+      if endian == "little":
+        self._endian = True
+      elif endian == "big":
+        self._endian = False
+      else:
+        self._endian = True
+      self._endianKey = endian_key
+
+    marshaling_type = info.properties.getProperty("marshaling_type","cdr")
+    key = (marshaling_type, self._endian, data.__class__)
+    if key != self._serializerKey:
+      factory = OpenRTM_aist.SerializerFactory.instance()
+      if self._serializer is not None:
+        factory.deleteObject(self._serializer)
+      self._serializer = OpenRTM_aist.createSerializer(marshaling_type,
+                                                       data, self._endian)
+      if self._serializer is None:
+        self._serializer = OpenRTM_aist.createSerializer("cdr",
+                                                         data, self._endian)
+      self._serializerKey = key
+
+    # the direct connection with the queue passes the data object
+    if isinstance(cdrdata, data.__class__):
+      return cdrdata
+
+    cdrdata = self.restoreData(info, cdrdata)
+    if cdrdata is None:
+      return None
+
+    _data = self._serializer.deserialize(cdrdata)
     return _data
 
 
+  ##
+  # @if jp
+  # @brief ޡ󥰤줿ǡ
+  #
+  # ͥǰ̤줿ǡĹե졼ࡦʬե졼
+  # 椹롣OutPort Υͥ񤭹 DeltaFrame 椻
+  # 沽Υǡ֤ľե졼η̤ϺѤ롣
+  #
+  # @param info ConnectorInfo
+  # @param cdrdata äǡ
+  # @return ޡ󥰤줿ǡǤʤʬե졼ξ
+  #         None
+  #
+  # @else
+  # @brief Restoring marshaled data
+  #
+  # Data compressed by the connector is decompressed, and key frames
+  # and delta frames are decoded. For DeltaFrame written by the
+  # connector of OutPort, the data before encoding is returned without
+  # decoding. The result for the last restored frame is reused.
+  #
+  # @param info ConnectorInfo
+  # @param cdrdata Received data
+  # @return Marshaled data, None for a delta frame which cannot be
+  #         restored
+  #
+  # @endif
+  #
+  def restoreData(self, info, cdrdata):
+    if isinstance(cdrdata, OpenRTM_aist.DeltaFrame):
+      return cdrdata.data
+    if self._restored is not None and self._restored[0] is cdrdata:
+      return self._restored[1]
+
+    compression = info.properties.getProperty("compression.type", "none")
+    delta = info.properties.getProperty("delta.enable", "NO")
+    if (compression, delta) != self._codecKey:
+      self._compressed = \
+          OpenRTM_aist.negotiateCompressionType(compression) != "none"
+      self._delta = OpenRTM_aist.isDeltaEnabled(info.properties)
+      self._codecKey = (compression, delta)
+
+    frame = cdrdata
+    if self._compressed:
+      cdrdata = OpenRTM_aist.CompressionCodec.decompress(cdrdata)
+    if self._delta:
+      cdrdata = self.decodeDelta(info, cdrdata)
+    self._restored = (frame, cdrdata)
+    return cdrdata
+
+
+  ##
+  # @if jp
+  # @brief ǡǤ뤫ɤ
+  #
+  # ConnectorDataListenerHolder ꥹʤƤӽФ˳ǧ롣
+  # Υե졼षʤ٥ȤΥꥹʤϡե졼
+  # äƤʤʬե졼Ǥʤ
+  #
+  # @param info ConnectorInfo
+  # @param cdrdata äǡ
+  # @return Ǥ True
+  #
+  # @else
+  # @brief Whether the data can be restored
+  #
+  # ConnectorDataListenerHolder checks this before invoking the
+  # listener. The listeners of the events which receive only a part of
+  # the frames cannot restore a delta frame whose key frame has not been
+  # received.
+  #
+  # @param info ConnectorInfo
+  # @param cdrdata Received data
+  # @return True if the data can be restored
+  #
+  # @endif
+  #
+  def restorable(self, info, cdrdata):
+    if not isinstance(cdrdata, bytes):
+      # the direct connection with the queue passes the data object
+      return True
+    return self.restoreData(info, cdrdata) is not None
+
+
+  ##
+  # @if jp
+  # @brief ե졼ࡦʬե졼
+  #
+  # ͥȤ DeltaDecoder äƼä椹롣
+  #
+  # @else
+  # @brief Decoding a key frame or a delta frame
+  #
+  # The frames are decoded in the order of reception with a
+  # DeltaDecoder for each connector.
+  #
+  # @endif
+  #
+  def decodeDelta(self, info, frame):
+    if self._deltaDecoders is None:
+      self._deltaDecoders = {}
+    decoder = self._deltaDecoders.get(info.id)
+    if decoder is None:
+      decoder = OpenRTM_aist.DeltaDecoder()
+      self._deltaDecoders[info.id] = decoder
+    return decoder.decode(frame)
+
+
 
 ##
 # @if jp
@@ -746,6 +902,8 @@ class ConnectorDataListenerHolder:
   # @brief ꥹʡΤ
   #
   # ϿƤꥹʤΥХå᥽åɤƤӽФ
+  # ConnectorDataListenerT Ǥʤʬե졼ξ硢
+  # ꥹʤϸƤӽФʤ
   #
   # @param self
   # @param info ConnectorInfo
@@ -755,6 +913,8 @@ class ConnectorDataListenerHolder:
   # @brief Notify listeners. 
   #
   # This calls the Callback method of the registered listener. 
+  # ConnectorDataListenerT is not invoked with a delta frame which it
+  # cannot restore.
   #
   # @param self
   # @param info ConnectorInfo
@@ -768,6 +928,10 @@ class ConnectorDataListenerHolder:
     ret = ConnectorListenerStatus.NO_CHANGE
     for listener in self._listeners:
       for (k,v) in listener.items():
+        if isinstance(k, ConnectorDataListenerT) and \
+              not k.restorable(info, cdrdata):
+          # a delta frame whose key frame the listener has not received
+          continue
         ret = ret | k(info, cdrdata)
     return ret
 
@@ -0,0 +1,621 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  ConnectorMetrics.py
+# @brief ConnectorMetrics class
+# @date  $Date$
+#
+
+
+
+import time
+
+
+##
+# @if jp
+#
+# @class ConnectorMetrics
+#
+# @brief ConnectorMetrics 饹
+#
+# ͥΥǡϩ׾ݻ륯饹
+# ǡȥХȿ񤭡˴줿ǡBUFFER_FULL
+# ॢȤβХåե̤κ͡ǡ tm ե
+# ᤿ü֤ٱΥҥȥݻ롣
+#
+# ƥ󥿤Ϥ򹹿륹å(ѥ֥åΥ
+# ץХǡɤ߽Фå)Ĥ˷ޤäƤ뤿ᡢ
+# Сإåɤޤ뤿˥åϻѤʤ
+#
+# @else
+# @class ConnectorMetrics
+#
+# @brief ConnectorMetrics class
+#
+# This class holds the statistics of the data path of a
+# connector. The number of data and bytes sent and received, the
+# number of data overwritten and dropped, the number of BUFFER_FULL
+# and timeouts, the high-water mark of the buffer occupancy and the
+# histogram of the end-to-end latency obtained from the tm field of
+# the data are kept.
+#
+# Since each counter is updated by only one thread (the task of the
+# publisher, the provider or the thread reading data), no lock is
+# used to keep the overhead low.
+#
+# @endif
+#
+class ConnectorMetrics:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief ٱΥҥȥγƶ֤ξ [sec]
+  # @else
+  # @brief The upper bounds of the bins of the latency histogram [sec]
+  # @endif
+  #
+  latency_bounds = [0.0001, 0.0005, 0.001, 0.005, 0.01,
+                    0.05, 0.1, 0.5, 1.0, float("inf")]
+
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # 󥹥ȥ饯
+  #
+  # @param self
+  #
+  # @else
+  # @brief Constructor
+  #
+  # Constructor
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def __init__(self):
+    self._pushPolicy = ""
+    self.reset()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ׾Υꥻå
+  #
+  # ƤΥ󥿤 0 ˤ¬ϻ򸽺߻ˤ롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Resetting the statistics
+  #
+  # This operation sets all counters to 0 and the start time of the
+  # measurement to the current time.
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def reset(self):
+    self._start = time.time()
+    self._sent = 0
+    self._sentBytes = 0
+    self._received = 0
+    self._receivedBytes = 0
+    self._overwrites = 0
+    self._drops = 0
+    self._bufferFull = 0
+    self._bufferTimeout = 0
+    self._receiverFull = 0
+    self._receiverTimeout = 0
+    self._errors = 0
+    self._throttled = 0
+    self._highWaterMark = 0
+    self._latencyCount = 0
+    self._latencySum = 0.0
+    self._latencyMin = None
+    self._latencyMax = None
+    self._histogram = [0] * len(self.latency_bounds)
+    self._policyChanges = 0
+    self._compressed = 0
+    self._compressInBytes = 0
+    self._compressOutBytes = 0
+    self._compressTime = 0.0
+    self._decompressed = 0
+    self._decompressTime = 0.0
+    self._keyFrames = 0
+    self._deltaFrames = 0
+    self._deltaInBytes = 0
+    self._deltaOutBytes = 0
+    self._deltaDiscards = 0
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǡεϿ
+  #
+  # 塼Ѥ쥯³ΥǡΥ֥ȤϥХȿ
+  # ޤʤ
+  #
+  # @else
+  # @brief Recording data sent
+  #
+  # The data objects of the direct connection with the queue are not
+  # counted in bytes.
+  #
+  # @endif
+  #
+  def onSent(self, data):
+    self._sent += 1
+    if isinstance(data, bytes):
+      self._sentBytes += len(data)
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǡμεϿ
+  # @else
+  # @brief Recording data received
+  # @endif
+  #
+  def onReceived(self, data):
+    self._received += 1
+    if isinstance(data, bytes):
+      self._receivedBytes += len(data)
+    return
+
+
+  ##
+  # @if jp
+  # @brief ХåեΥǡξ񤭤εϿ
+  # @else
+  # @brief Recording data overwritten in the buffer
+  # @endif
+  #
+  def onOverwrite(self):
+    self._overwrites += 1
+    return
+
+
+  ##
+  # @if jp
+  # @brief 줺˴줿ǡεϿ
+  #
+  # @param self
+  # @param n ˴줿ǡ
+  #
+  # @else
+  # @brief Recording data dropped without being sent
+  #
+  # @param self
+  # @param n The number of data dropped
+  #
+  # @endif
+  #
+  def onDrop(self, n=1):
+    if n > 0:
+      self._drops += n
+    return
+
+
+  ##
+  # @if jp
+  # @brief BUFFER_FULL εϿ
+  #
+  # Хåե˽񤭹ޤʤäǡ˴줿ΤȤƿ롣
+  #
+  # @else
+  # @brief Recording BUFFER_FULL
+  #
+  # The data which was not written into the buffer is counted as
+  # dropped.
+  #
+  # @endif
+  #
+  def onBufferFull(self):
+    self._bufferFull += 1
+    self._drops += 1
+    return
+
+
+  ##
+  # @if jp
+  # @brief Хåե񤭹ߥॢȤεϿ
+  #
+  # Хåե˽񤭹ޤʤäǡ˴줿ΤȤƿ롣
+  #
+  # @else
+  # @brief Recording the timeout of writing into the buffer
+  #
+  # The data which was not written into the buffer is counted as
+  # dropped.
+  #
+  # @endif
+  #
+  def onBufferTimeout(self):
+    self._bufferTimeout += 1
+    self._drops += 1
+    return
+
+
+  ##
+  # @if jp
+  # @brief ΥХåեեεϿ
+  # @else
+  # @brief Recording the buffer full of the destination
+  # @endif
+  #
+  def onReceiverFull(self):
+    self._receiverFull += 1
+    return
+
+
+  ##
+  # @if jp
+  # @brief ΥॢȤεϿ
+  # @else
+  # @brief Recording the timeout of the destination
+  # @endif
+  #
+  def onReceiverTimeout(self):
+    self._receiverTimeout += 1
+    return
+
+
+  ##
+  # @if jp
+  # @brief 顼εϿ
+  # @else
+  # @brief Recording the error of sending
+  # @endif
+  #
+  def onError(self):
+    self._errors += 1
+    return
+
+
+  ##
+  # @if jp
+  # @brief Ӱ¤ˤα˴εϿ
+  # @else
+  # @brief Recording the deferring or dropping by the bandwidth limit
+  # @endif
+  #
+  def onThrottle(self):
+    self._throttled += 1
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǡΰ̤εϿ
+  #
+  # @param self
+  # @param in_bytes ΥХȿ
+  # @param out_bytes ̸ΥХȿ
+  # @param cpu_time ̤פ CPU  [s]
+  #
+  # @else
+  # @brief Recording the compression of data
+  #
+  # @param self
+  # @param in_bytes The bytes before compression
+  # @param out_bytes The bytes after compression
+  # @param cpu_time The CPU time spent for compression [s]
+  #
+  # @endif
+  #
+  def onCompress(self, in_bytes, out_bytes, cpu_time=0.0):
+    self._compressed += 1
+    self._compressInBytes += in_bytes
+    self._compressOutBytes += out_bytes
+    self._compressTime += cpu_time
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǡοĹεϿ
+  #
+  # @param self
+  # @param cpu_time Ĺפ CPU  [s]
+  #
+  # @else
+  # @brief Recording the decompression of data
+  #
+  # @param self
+  # @param cpu_time The CPU time spent for decompression [s]
+  #
+  # @endif
+  #
+  def onDecompress(self, cpu_time):
+    self._decompressed += 1
+    self._decompressTime += cpu_time
+    return
+
+
+  ##
+  # @if jp
+  # @brief ե졼ࡦʬե졼εϿ
+  #
+  # @param self
+  # @param key ե졼ξ True
+  # @param in_bytes 沽ΥХȿ
+  # @param out_bytes ե졼ΥХȿ
+  #
+  # @else
+  # @brief Recording the sending of a key frame or a delta frame
+  #
+  # @param self
+  # @param key True if key frame
+  # @param in_bytes The bytes before encoding
+  # @param out_bytes The bytes of the frame
+  #
+  # @endif
+  #
+  def onDelta(self, key, in_bytes, out_bytes):
+    if key:
+      self._keyFrames += 1
+    else:
+      self._deltaFrames += 1
+    self._deltaInBytes += in_bytes
+    self._deltaOutBytes += out_bytes
+    return
+
+
+  ##
+  # @if jp
+  # @brief ե졼बʤ˴ʬե졼εϿ
+  # @else
+  # @brief Recording a delta frame discarded for lack of the key frame
+  # @endif
+  #
+  def onDeltaDiscard(self):
+    self._deltaDiscards += 1
+    self._drops += 1
+    return
+
+
+  ##
+  # @if jp
+  # @brief Хåե̤εϿ
+  #
+  # @param self
+  # @param n Хåե̤ɥǡ
+  #
+  # @else
+  # @brief Recording the buffer occupancy
+  #
+  # @param self
+  # @param n The number of unread data in the buffer
+  #
+  # @endif
+  #
+  def setOccupancy(self, n):
+    if n > self._highWaterMark:
+      self._highWaterMark = n
+    return
+
+
+  ##
+  # @if jp
+  # @brief ߤ Push ݥꥷεϿ
+  #
+  # @param self
+  # @param policy Push ݥꥷ̾
+  #
+  # @else
+  # @brief Recording the current push policy
+  #
+  # @param self
+  # @param policy The name of the push policy
+  #
+  # @endif
+  #
+  def setPushPolicy(self, policy):
+    self._pushPolicy = policy
+    return
+
+
+  ##
+  # @if jp
+  # @brief Push ݥꥷڤؤεϿ
+  #
+  # @param self
+  # @param policy ڤؤ Push ݥꥷ̾
+  #
+  # @else
+  # @brief Recording the change of the push policy
+  #
+  # @param self
+  # @param policy The name of the push policy after the change
+  #
+  # @endif
+  #
+  def onPolicyChange(self, policy):
+    self._pushPolicy = policy
+    self._policyChanges += 1
+    return
+
+
+  ##
+  # @if jp
+  # @brief ٱεϿ
+  #
+  # ǡ tm եɤλ狼鸽߻ޤǤλ֤ٱȤ
+  # ҥȥ˲ä롣tm եɤʤǡ̵뤹롣
+  #
+  # @param self
+  # @param data ޡ󥰤ǡ
+  #
+  # @else
+  # @brief Recording the latency
+  #
+  # This operation adds the time from the time of the tm field of the
+  # data to the current time to the histogram as the latency. The
+  # data which does not have the tm field is ignored.
+  #
+  # @param self
+  # @param data Unmarshaled data
+  #
+  # @endif
+  #
+  def onLatency(self, data):
+    tm = getattr(data, "tm", None)
+    if tm is None:
+      return
+
+    try:
+      latency = time.time() - (tm.sec + tm.nsec * 1e-9)
+    except AttributeError:
+      return
+
+    if latency < 0.0:
+      latency = 0.0
+
+    for i, bound in enumerate(self.latency_bounds):
+      if latency <= bound:
+        self._histogram[i] += 1
+        break
+
+    self._latencyCount += 1
+    self._latencySum += latency
+    if self._latencyMin is None or latency < self._latencyMin:
+      self._latencyMin = latency
+    if self._latencyMax is None or latency > self._latencyMax:
+      self._latencyMax = latency
+    return
+
+
+  ##
+  # @if jp
+  # @brief ׾μ
+  #
+  # ׾򼭽֤롼ץå(*_rate)Ϸ¬ϻ狼
+  # в(elapsed)ǵ롣latency.histogram γǤ
+  # latency_bounds γƶ֤äǡǤ롣compression.ratio 
+  # ̸ȰΥХȿǤꡢ*.cpu_time ϰ̡Ĺ
+  # פ CPU ֤ι [s] Ǥ롣
+  #
+  # @param self
+  # @return ׾
+  #
+  # @else
+  # @brief Getting the statistics
+  #
+  # This operation returns the statistics as a dictionary. The
+  # throughput (*_rate) is calculated from the time elapsed since
+  # the start of the measurement (elapsed). Each element of
+  # latency.histogram is the number of data in each bin of
+  # latency_bounds. compression.ratio is the ratio of the bytes after
+  # compression to the bytes before, and *.cpu_time is the total CPU
+  # time spent for compression and decompression [s].
+  #
+  # @param self
+  # @return The statistics
+  #
+  # @endif
+  #
+  def getMetrics(self):
+    elapsed = time.time() - self._start
+    if elapsed > 0.0:
+      scale = 1.0 / elapsed
+    else:
+      scale = 0.0
+
+    if self._latencyCount > 0:
+      mean = self._latencySum / self._latencyCount
+    else:
+      mean = 0.0
+
+    if self._compressInBytes > 0:
+      ratio = float(self._compressOutBytes) / self._compressInBytes
+    else:
+      ratio = 1.0
+
+    return {"elapsed":            elapsed,
+            "sent":               self._sent,
+            "sent_bytes":         self._sentBytes,
+            "send_rate":          self._sent * scale,
+            "send_byte_rate":     self._sentBytes * scale,
+            "received":           self._received,
+            "received_bytes":     self._receivedBytes,
+            "receive_rate":       self._received * scale,
+            "receive_byte_rate":  self._receivedBytes * scale,
+            "overwrites":         self._overwrites,
+            "drops":              self._drops,
+            "buffer_full":        self._bufferFull,
+            "buffer_timeout":     self._bufferTimeout,
+            "receiver_full":      self._receiverFull,
+            "receiver_timeout":   self._receiverTimeout,
+            "errors":             self._errors,
+            "throttled":          self._throttled,
+            "high_water_mark":    self._highWaterMark,
+            "push_policy":        self._pushPolicy,
+            "policy_changes":     self._policyChanges,
+            "compression.count":  self._compressed,
+            "compression.in_bytes":  self._compressInBytes,
+            "compression.out_bytes": self._compressOutBytes,
+            "compression.ratio":  ratio,
+            "compression.cpu_time":  self._compressTime,
+            "decompression.count":   self._decompressed,
+            "decompression.cpu_time": self._decompressTime,
+            "delta.key_frames":   self._keyFrames,
+            "delta.delta_frames": self._deltaFrames,
+            "delta.in_bytes":     self._deltaInBytes,
+            "delta.out_bytes":    self._deltaOutBytes,
+            "delta.discards":     self._deltaDiscards,
+            "latency.count":      self._latencyCount,
+            "latency.min":        self._latencyMin or 0.0,
+            "latency.max":        self._latencyMax or 0.0,
+            "latency.mean":       mean,
+            "latency.bounds":     list(self.latency_bounds),
+            "latency.histogram":  list(self._histogram)}
+
+
+  ##
+  # @if jp
+  # @brief ׾ʸȤǼ
+  #
+  # ͥץեΥץѥƥꤹ뤿ᡢ׾
+  # (prefix.̾, ʸ) ΥꥹȤ֤ꥹȤͤϥ
+  # ڤʸˤ롣
+  #
+  # @param self
+  # @param prefix ̾Ƭ
+  # @return (̾, ) Υꥹ
+  #
+  # @else
+  # @brief Getting the statistics as pairs of strings
+  #
+  # This operation returns the statistics as the list of
+  # (prefix.name, string value) to be set to the properties of the
+  # connector profile. The list values are comma separated strings.
+  #
+  # @param self
+  # @param prefix The prefix of the names
+  # @return The list of (name, value)
+  #
+  # @endif
+  #
+  def toStringPairs(self, prefix="dataport.metrics"):
+    pairs = []
+    metrics = self.getMetrics()
+    keys = list(metrics.keys())
+    keys.sort()
+    for key in keys:
+      value = metrics[key]
+      if isinstance(value, list):
+        value = ",".join([str(v) for v in value])
+      else:
+        value = str(value)
+      pairs.append((prefix + "." + key, value))
+    return pairs
@@ -0,0 +1,478 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  DeltaCodec.py
+# @brief DeltaEncoder and DeltaDecoder classes
+# @date  $Date$
+#
+
+
+
+import random
+import struct
+
+import OpenRTM_aist
+
+
+_key_header = struct.Struct("<I")
+_delta_header = struct.Struct("<III")
+_range_header = struct.Struct("<II")
+
+
+##
+# @if jp
+# @class DeltaEncoder
+# @brief DeltaEncoder 饹
+#
+# ޡ󥰤줿ǡ򡢥ե졼Ⱥʬե졼沽
+# 륯饹ǽΥǡkey_interval ĤȤΥǡǡĹ
+# Ѥä硢ʬΥǡȾʬĶˤϥǡΤ
+# ե졼ȤʳϺǸΥե졼٤
+# block_size ñ̤ѲϰϤʬե졼Ȥ롣
+# ʬľΥǡǤϤʤե졼ФƵ뤿ᡢʬ
+# ե졼बƤʹߤΥե졼ˤϱƶʤ
+#
+# ƥե졼ηϰʲ̤ꡣͤϥȥ륨ǥǤ롣
+#
+# - ե졼: "K", ե졼ID(uint32), ǡ
+# - ʬե졼: "D", ե졼ID(uint32), ǡĹ(uint32),
+#   ϰϤο(uint32), [եå(uint32), Ĺ(uint32), Х]...
+#
+# @else
+# @class DeltaEncoder
+# @brief DeltaEncoder class
+#
+# This class encodes marshaled data into key frames and delta
+# frames. The whole data is sent as a key frame for the first data,
+# every key_interval data, when the length of data changes and when
+# the delta exceeds half of the data. Otherwise only the ranges
+# changed from the last key frame in units of block_size are sent as
+# a delta frame. Since the delta is taken against the key frame
+# instead of the previous data, a lost delta frame does not affect
+# the following frames.
+#
+# The format of the frames is as follows. The numbers are little
+# endian.
+#
+# - key frame: "K", key frame ID(uint32), data
+# - delta frame: "D", key frame ID(uint32), data length(uint32),
+#   number of ranges(uint32), [offset(uint32), length(uint32), bytes]...
+#
+# @endif
+#
+class DeltaEncoder:
+  """
+  """
+
+  KEY   = b"K"
+  DELTA = b"D"
+  FULL  = b"F"
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # @param self
+  # @param key_interval ե졼δֳ [ǡ]0 ξ
+  #                     ե졼ˤʤ롣
+  # @param block_size ʬñ [Х]
+  #
+  # @else
+  # @brief Constructor
+  #
+  # @param self
+  # @param key_interval The interval of key frames [number of data]. All
+  #                     frames are key frames if 0.
+  # @param block_size The unit of the delta [bytes]
+  #
+  # @endif
+  #
+  def __init__(self, key_interval=30, block_size=4096):
+    self._keyInterval = key_interval
+    self._blockSize = block_size
+    self._key = None
+    self._keyId = random.getrandbits(32)
+    self._count = 0
+    return
+
+
+  ##
+  # @if jp
+  # @brief Υǡ򥭡ե졼ˤ
+  #
+  # ˼Ԥʤɡ¦ե졼äƤʤǽ
+  # ˸ƤӽФ
+  #
+  # @else
+  # @brief Making the next data a key frame
+  #
+  # This is called when the receiver may not have the key frame, for
+  # example when sending failed.
+  #
+  # @endif
+  #
+  def forceKeyFrame(self):
+    self._key = None
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǡ沽
+  #
+  # @param self
+  # @param data ޡ󥰤줿ǡ
+  # @return (ե졼ξ True, ե졼)
+  #
+  # @else
+  # @brief Encoding data
+  #
+  # @param self
+  # @param data Marshaled data
+  # @return (True if key frame, frame)
+  #
+  # @endif
+  #
+  def encode(self, data):
+    if self._key is None or self._count >= self._keyInterval or \
+          len(data) != len(self._key):
+      return (True, self.keyFrame(data))
+
+    ranges = self.diff(data)
+    size = 0
+    for offset, length in ranges:
+      size += length + _range_header.size
+    if size > len(data) // 2:
+      return (True, self.keyFrame(data))
+
+    self._count += 1
+    frame = [self.DELTA + _delta_header.pack(self._keyId, len(data), len(ranges))]
+    for offset, length in ranges:
+      frame.append(_range_header.pack(offset, length))
+      frame.append(data[offset:offset + length])
+    return (False, b"".join(frame))
+
+
+  ##
+  # @if jp
+  # @brief ե졼
+  # @else
+  # @brief Creating a key frame
+  # @endif
+  #
+  def keyFrame(self, data):
+    self._keyId = (self._keyId + 1) & 0xffffffff
+    self._key = data
+    self._count = 0
+    return self.KEY + _key_header.pack(self._keyId) + data
+
+
+  ##
+  # @if jp
+  # @brief ե졼फѲϰϤμ
+  #
+  # ܤѲ֥åϰĤϰϤˤޤȤ롣
+  #
+  # @param self
+  # @param data ޡ󥰤줿ǡ
+  # @return (եå, Ĺ) Υꥹ
+  #
+  # @else
+  # @brief Getting the ranges changed from the key frame
+  #
+  # Adjacent changed blocks are merged into one range.
+  #
+  # @param self
+  # @param data Marshaled data
+  # @return The list of (offset, length)
+  #
+  # @endif
+  #
+  def diff(self, data):
+    key = self._key
+    size = len(data)
+    block = self._blockSize
+    ranges = []
+    start = None
+    for offset in range(0, size, block):
+      if data[offset:offset + block] != key[offset:offset + block]:
+        if start is None:
+          start = offset
+      elif start is not None:
+        ranges.append((start, offset - start))
+        start = None
+    if start is not None:
+      ranges.append((start, size - start))
+    return ranges
+
+
+
+##
+# @if jp
+# @class DeltaDecoder
+# @brief DeltaDecoder 饹
+#
+# DeltaEncoder 沽줿ե졼फǡ륯饹
+# Ǹ˼ե졼ݻʬե졼򤽤ŬѤ롣
+# ե졼줿Ϳɬפ롣
+#
+# ѤߤΥǡ "F" θ˥ǡ³ե졼Ȥ
+# Хåե˳Ǽ졢ե졼Ͼ֤ѤˤΤޤ롣
+#
+# @else
+# @class DeltaDecoder
+# @brief DeltaDecoder class
+#
+# This class restores data from the frames encoded by
+# DeltaEncoder. The last key frame received is kept and delta frames
+# are applied to it. Frames must be given in the order of sending.
+#
+# Restored data is stored in the buffer as a full frame, which is
+# "F" followed by the data, and full frames are restored as they are
+# without changing the state.
+#
+# @endif
+#
+class DeltaDecoder:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  # @else
+  # @brief Constructor
+  # @endif
+  #
+  def __init__(self):
+    self._key = None
+    self._keyId = None
+    return
+
+
+  ##
+  # @if jp
+  # @brief ե졼
+  #
+  # @param self
+  # @param frame ե졼
+  # @return ޡ󥰤줿ǡб륭ե졼
+  #         ʤʬե졼ξ None
+  #
+  # @else
+  # @brief Decoding a frame
+  #
+  # @param self
+  # @param frame Frame
+  # @return Marshaled data, None for a delta frame whose key frame has
+  #         not been received
+  #
+  # @endif
+  #
+  def decode(self, frame):
+    kind = frame[0:1]
+    if kind == DeltaEncoder.KEY:
+      self._keyId = _key_header.unpack_from(frame, 1)[0]
+      self._key = frame[1 + _key_header.size:]
+      return self._key
+
+    elif kind == DeltaEncoder.DELTA:
+      key_id, size, count = _delta_header.unpack_from(frame, 1)
+      if key_id != self._keyId or size != len(self._key):
+        return None
+      data = bytearray(self._key)
+      pos = 1 + _delta_header.size
+      for i in range(count):
+        offset, length = _range_header.unpack_from(frame, pos)
+        pos += _range_header.size
+        data[offset:offset + length] = frame[pos:pos + length]
+        pos += length
+      return bytes(data)
+
+    return frame[1:]
+
+
+
+##
+# @if jp
+# @class DeltaFrame
+# @brief DeltaFrame 饹
+#
+# 沽Υޡ󥰤줿ǡݻե졼ࡣOutPort 
+# ͥϥХåեˤΥ饹ǥե졼񤭹ߡͥ
+# ꥹʤϥե졼椻 data ǡ롣ʬե졼
+# ϥͥǤ沽ν˰¸ʤᡢΥե졼ष
+# ʤ٥ȤΥꥹʤǤǡ뤳ȤǤ롣
+#
+# @else
+# @class DeltaFrame
+# @brief DeltaFrame class
+#
+# The frame which keeps the marshaled data before encoding. The
+# connector of OutPort writes the frames into the buffer with this
+# class, and the listeners of the connector get the data from data
+# without decoding the frame. Since this does not depend on the order
+# of the frames, the listeners of the events which receive only a part
+# of the frames can also get the data.
+#
+# @endif
+#
+class DeltaFrame(bytes):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # @param frame ե졼ޤϺʬե졼
+  # @param data 沽Υޡ󥰤줿ǡ
+  #
+  # @else
+  # @brief Constructor
+  #
+  # @param frame Key frame or delta frame
+  # @param data Marshaled data before encoding
+  #
+  # @endif
+  #
+  def __new__(cls, frame, data):
+    self = bytes.__new__(cls, frame)
+    self.data = data
+    return self
+
+
+
+##
+# @if jp
+# @brief ͥΥץѥƥ DeltaEncoder 
+#
+# ʲΥץͿ뤳ȤǤ롣
+#
+# - delta.enable: YES ξ祭ե졼Ⱥʬե졼
+#   (ǥե: NO)
+# - delta.key_interval: ե졼δֳ [ǡ] (ǥե: 30)
+# - delta.block_size: ʬñ [Х] (ǥե: 4096)
+#
+# 񤭹ǡȤϸ¤ʤ Publisher ξ
+# (isDeltaReliable() )ʤäե졼򸡽ФǤʤ
+# ᡢƤΥǡ򥭡ե졼Ȥ DeltaEncoder ֤
+#
+# @param prop ͥΥץѥƥ
+# @return DeltaEncoder̵ʾ None
+#
+# @else
+# @brief Creating DeltaEncoder from the properties of a connector
+#
+# The following options are available.
+#
+# - delta.enable: If YES, data is sent with key frames and delta
+#   frames (default: NO)
+# - delta.key_interval: The interval of key frames [number of data]
+#   (default: 30)
+# - delta.block_size: The unit of the delta [bytes] (default: 4096)
+#
+# If the publisher may not send all written data in order (see
+# isDeltaReliable()), a lost key frame cannot be detected, so
+# DeltaEncoder sending all data as key frames is returned.
+#
+# @param prop The properties of a connector
+# @return DeltaEncoder, None if disabled
+#
+# @endif
+#
+def createDeltaEncoder(prop):
+  if not isDeltaEnabled(prop):
+    return None
+
+  interval = [30]
+  if not OpenRTM_aist.stringTo(interval,
+                               prop.getProperty("delta.key_interval", "30")) \
+        or interval[0] < 1:
+    interval = [30]
+  block = [4096]
+  if not OpenRTM_aist.stringTo(block, prop.getProperty("delta.block_size", "4096")) \
+        or block[0] < 1:
+    block = [4096]
+
+  if not isDeltaReliable(prop):
+    return DeltaEncoder(0, block[0])
+  return DeltaEncoder(interval[0], block[0])
+
+
+##
+# @if jp
+# @brief ͥΥץѥƥ DeltaDecoder 
+#
+# @param prop ͥΥץѥƥ
+# @return DeltaDecoder̵ʾ None
+#
+# @else
+# @brief Creating DeltaDecoder from the properties of a connector
+#
+# @param prop The properties of a connector
+# @return DeltaDecoder, None if disabled
+#
+# @endif
+#
+def createDeltaDecoder(prop):
+  if not isDeltaEnabled(prop):
+    return None
+  return DeltaDecoder()
+
+
+##
+# @if jp
+# @brief ʬͭɤ
+# @else
+# @brief Whether delta sending is enabled
+# @endif
+#
+def isDeltaEnabled(prop):
+  return OpenRTM_aist.toBool(prop.getProperty("delta.enable", "NO"),
+                             "YES", "NO", False)
+
+
+##
+# @if jp
+# @brief Publisher 񤭹ǡ뤫ɤ
+#
+# flush Ͻ񤭹߻Ʊ̤񤭹ߤͤˤʤ롣
+# new  periodic  push_policy  all ޤ fifo ξ硢˼
+# ǡХåե˻Ĥƺ롣ʳ(push_policy  new,
+# skip, adaptive ξ coalesce)ϥǡְᡢ줿
+# ե졼बʤǽ롣
+#
+# @param prop ͥΥץѥƥ
+# @return  True
+#
+# @else
+# @brief Whether the publisher sends all written data in order
+#
+# flush sends data synchronously and the result of sending is returned
+# by write. new and periodic keep the data failed to send in the buffer
+# and send it again if push_policy is all or fifo. The others
+# (push_policy new, skip and adaptive, and coalesce) thin out data, so
+# an accepted key frame may not be sent.
+#
+# @param prop The properties of a connector
+# @return True if all data is sent
+#
+# @endif
+#
+def isDeltaReliable(prop):
+  io_mode = OpenRTM_aist.normalize([prop.getProperty("io_mode")])
+  if io_mode == "block":
+    pub_type = "flush"
+  elif io_mode == "nonblock":
+    pub_type = "new"
+  else:
+    pub_type = OpenRTM_aist.normalize([prop.getProperty("subscription_type", "flush")])
+
+  if pub_type == "flush":
+    return True
+  if pub_type not in ("new", "periodic"):
+    return False
+  policy = OpenRTM_aist.normalize([prop.getProperty("publisher.push_policy", "new")])
+  return policy in ("all", "fifo")
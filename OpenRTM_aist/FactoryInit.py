@@ -21,18 +21,30 @@ from OpenRTM_aist.ext.sdo.observer import ComponentObserverConsumer
 def FactoryInit():
     # Buffers
     OpenRTM_aist.CdrRingBufferInit()
+    OpenRTM_aist.SPSCRingBufferInit()
+
+    # Serializers
+    OpenRTM_aist.CdrSerializerInit()
+    OpenRTM_aist.CdrNumpySerializerInit()
+    OpenRTM_aist.StructSerializerInit()
 
     # Threads
     OpenRTM_aist.DefaultPeriodicTaskInit()
+    OpenRTM_aist.PooledPeriodicTaskInit()
 
     # Publishers
     OpenRTM_aist.PublisherFlushInit()
     OpenRTM_aist.PublisherNewInit()
     OpenRTM_aist.PublisherPeriodicInit()
+    OpenRTM_aist.PublisherCoalesceInit()
 
     # Providers/Consumer
     OpenRTM_aist.InPortCorbaCdrProviderInit()
     OpenRTM_aist.InPortCorbaCdrConsumerInit()
+    OpenRTM_aist.InPortCorbaCdrBatchProviderInit()
+    OpenRTM_aist.InPortCorbaCdrBatchConsumerInit()
+    OpenRTM_aist.InPortCorbaCdrOnewayProviderInit()
+    OpenRTM_aist.InPortCorbaCdrOnewayConsumerInit()
     OpenRTM_aist.OutPortCorbaCdrConsumerInit()
     OpenRTM_aist.OutPortCorbaCdrProviderInit()
     OpenRTM_aist.InPortDirectProviderInit()
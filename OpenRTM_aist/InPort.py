@@ -16,9 +16,6 @@
 
 
 
-import copy
-
-
 import OpenRTM_aist
 import threading
 
@@ -366,8 +363,9 @@ class InPort(OpenRTM_aist.InPortBase):
       self._rtcout.RTC_DEBUG("no connectors")
       return self._value
 
-    _val = copy.deepcopy(self._value)
-    cdr = [_val]
+    # the connector replaces cdr[0] with the unmarshaled data,
+    # so the current value need not be copied.
+    cdr = [self._value]
 
 
     if name is None:
@@ -425,6 +423,290 @@ class InPort(OpenRTM_aist.InPortBase):
     self.read()
 
 
+  ##
+  # @if jp
+  #
+  # @brief ƤӽФ¦Υ֥Ȥإǡɤ߽Ф
+  #
+  # read() Ʊͤ˥ǡɤ߽Фޡ󥰤줿ǡ
+  # ФƤӽФ¦ݤ֥ target ꤹ롣
+  # ǡΥԡϹԤʤᡢtarget  InPort ˥Хɤ
+  # ѿȤ뤳Ȥǡread() ͤ餺˥Хѿ
+  # Ǥ롣
+  #
+  # @param self
+  # @param target ɤ߽Фǡꤹ륪֥
+  # @param name ɤ߽Фͥ̾
+  #
+  # @return target
+  #
+  # @else
+  #
+  # @brief Read data into a caller-owned object
+  #
+  # This operation reads data in the same way as read() and sets the
+  # members of the unmarshaled data to target, which is an object
+  # allocated by the caller. Since the data is not copied, the bound
+  # variable can be updated without taking the return value of
+  # read() by passing it as target.
+  #
+  # @param self
+  # @param target The object into which the data is set
+  # @param name The connector name to be read
+  #
+  # @return target
+  #
+  # @endif
+  #
+  def read_into(self, target, name=None):
+    self._rtcout.RTC_TRACE("read_into()")
+    value = self.read(name)
+    if value is not target:
+      target.__dict__.update(value.__dict__)
+    return target
+
+
+  ##
+  # @if jp
+  #
+  # @brief ɤ߽Фǽʥǡ礷ɤ߽Ф
+  #
+  # ͥΥХåեɤ߽Фǽʥǡ max_n ġ
+  # ХåեΥå1ƤޤȤɤ߽ФꥹȤ֤
+  # OnRead Хå1ƤӽФ졢OnReadConvert 
+  # ХåϥǡȤ˸ƤӽФ롣raw  True ξ
+  # ޡ󥰤Ԥ鷺 CDR ǡΥꥹȤ֤쥯
+  # ³ǽ񤭹ޤ줿ǡϥޡ󥰤Ƥʤᡢraw 
+  # True ξɤ߽Ф˻ĤΥꥹȤ֤
+  # batch_notify  True ξ硢ON_BUFFER_READ ꥹʤϺǸ
+  # ǡ1ƤӽФ롣
+  #
+  # @param self
+  # @param max_n ɤ߽Фǡ(None ξ)
+  # @param name ɤ߽Фͥ̾
+  # @param raw True ξ CDR ǡ֤
+  # @param batch_notify True ξꥹʤ1ƤӽФ
+  #
+  # @return ɤ߽ФǡΥꥹ
+  #
+  # @else
+  #
+  # @brief Read all readable data at once
+  #
+  # This operation reads at most max_n readable data from the buffer
+  # of the connector, acquiring the buffer lock only once, and
+  # returns them as a list. The OnRead callback is called only once
+  # and the OnReadConvert callback is called for each data. If raw is
+  # True, the list of CDR data is returned without unmarshaling. Since
+  # data written by a direct connection is not marshaled, it is left
+  # unread and an empty list is returned if raw is True. If
+  # batch_notify is True, ON_BUFFER_READ listeners are called only
+  # once with the last data.
+  #
+  # @param self
+  # @param max_n Maximum number of data to be read (all if None)
+  # @param name The connector name to be read
+  # @param raw The CDR data is returned if True
+  # @param batch_notify Listeners are called only once if True
+  #
+  # @return The list of read data
+  #
+  # @endif
+  #
+  def read_all(self, max_n=None, name=None, raw=False, batch_notify=False):
+    self._rtcout.RTC_TRACE("read_all()")
+
+    if self._OnRead is not None:
+      self._OnRead()
+      self._rtcout.RTC_TRACE("OnRead called")
+
+    if max_n is None:
+      max_n = -1
+
+    guard = OpenRTM_aist.ScopedLock(self._valueMutex)
+    if self._directNewData == True:
+      if raw:
+        # direct data is not marshaled, so it is left for read()
+        self._rtcout.RTC_DEBUG("direct data is not read as CDR data")
+        return []
+      self._rtcout.RTC_TRACE("Direct data transfer")
+      self._directNewData = False
+      if self._OnReadConvert is not None:
+        self._value = self._OnReadConvert(self._value)
+        self._rtcout.RTC_TRACE("OnReadConvert for direct data called")
+      return [self._value]
+    del guard
+
+    if len(self._connectors) == 0:
+      self._rtcout.RTC_DEBUG("no connectors")
+      return []
+
+    if name is None:
+      con = self._connectors[0]
+    else:
+      con = None
+      for c in self._connectors:
+        if c.name() == name:
+          con = c
+      if con is None:
+        self._rtcout.RTC_DEBUG("not found %s",name)
+        return []
+
+    values = con.readAll(max_n, raw, batch_notify)
+    if not values:
+      self._rtcout.RTC_WARN("buffer empty")
+      return values
+
+    self._rtcout.RTC_DEBUG("%d data read", len(values))
+    if raw:
+      return values
+
+    if self._OnReadConvert is not None:
+      values = [self._OnReadConvert(v) for v in values]
+      self._rtcout.RTC_DEBUG("OnReadConvert called")
+
+    self._value = values[-1]
+    return values
+
+
+  ##
+  # @if jp
+  #
+  # @brief ͭΥǡ򥳥ԡ˻Ȥ
+  #
+  # ͭΥͥ shem_lease  YES ꤷ硢񤭹
+  # ¦񤭹ǤŤǡ򻲾Ȥ memoryview ֤release()
+  # ƤӽФޤǽ񤭹¦ϤΥǡ񤭤ʤˡ
+  # ɤ߽ФǡϥХåեͳʤᡢread() Ǥɤ߽Фʤ
+  #
+  # @param self
+  # @param name ɤ߽Фͥ̾
+  #
+  # @return ǡ memoryviewǡʤ None
+  #
+  # @else
+  #
+  # @brief Referring to the data on the shared memory without copy
+  #
+  # If shem_lease is YES for a shared memory connector, this returns
+  # a memoryview referring to the oldest data written by the
+  # writer. The writer does not overwrite the data until release() is
+  # called. Since the data read in this way does not pass through the
+  # buffer, it is not read by read().
+  #
+  # @param self
+  # @param name The connector name to be read
+  #
+  # @return The memoryview of the data, None if there is no data
+  #
+  # @endif
+  #
+  def lease(self, name=None):
+    self._rtcout.RTC_TRACE("lease()")
+    con = self.findConnector(name)
+    if con is None or not hasattr(con, "lease"):
+      return None
+    return con.lease()
+
+
+  ##
+  # @if jp
+  #
+  # @brief ͭοͥ󥹷Υǡ NumPy ȤƻȤ
+  #
+  # lease() Ʊͤ˥ǡ򻲾ȤTimed*Seq Υǡ
+  # (tm.sec, tm.nsec, NumPy ) Ȥ֤϶ͭľ
+  # Ȥ뤿ᡢrelease() θ˻ѤƤϤʤʤ
+  #
+  # @param self
+  # @param name ɤ߽Фͥ̾
+  #
+  # @return (tm.sec, tm.nsec, NumPy )ǡʤ None
+  #
+  # @else
+  #
+  # @brief Referring to the numeric sequence data on the shared memory
+  #        as a NumPy array
+  #
+  # This refers to the data in the same way as lease() and returns the
+  # data of a Timed*Seq type as (tm.sec, tm.nsec, NumPy array). Since
+  # the array refers to the shared memory directly, it must not be
+  # used after release().
+  #
+  # @param self
+  # @param name The connector name to be read
+  #
+  # @return (tm.sec, tm.nsec, NumPy array), None if there is no data
+  #
+  # @endif
+  #
+  def lease_sequence(self, name=None):
+    self._rtcout.RTC_TRACE("lease_sequence()")
+    con = self.findConnector(name)
+    if con is None or not hasattr(con, "leaseSequence"):
+      return None
+    return con.leaseSequence()
+
+
+  ##
+  # @if jp
+  #
+  # @brief lease() ǻȤǡβ
+  #
+  # @param self
+  # @param name ɤ߽Фͥ̾
+  #
+  # @else
+  #
+  # @brief Releasing the data referred by lease()
+  #
+  # @param self
+  # @param name The connector name which was read
+  #
+  # @endif
+  #
+  def release(self, name=None):
+    self._rtcout.RTC_TRACE("release()")
+    con = self.findConnector(name)
+    if con is not None and hasattr(con, "release"):
+      con.release()
+    return
+
+
+  ##
+  # @if jp
+  #
+  # @brief ͥθ
+  #
+  # @param self
+  # @param name ͥ̾None ξϺǽΥͥ
+  #
+  # @return ͥĤʤ None
+  #
+  # @else
+  #
+  # @brief Finding a connector
+  #
+  # @param self
+  # @param name The connector name, the first connector if None
+  #
+  # @return The connector, None if not found
+  #
+  # @endif
+  #
+  def findConnector(self, name=None):
+    if len(self._connectors) == 0:
+      self._rtcout.RTC_DEBUG("no connectors")
+      return None
+    if name is None:
+      return self._connectors[0]
+    for con in self._connectors:
+      if con.name() == name:
+        return con
+    self._rtcout.RTC_DEBUG("not found %s",name)
+    return None
+
+
   ##
   # @if jp
   #
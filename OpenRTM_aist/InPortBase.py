@@ -101,6 +101,9 @@ class InPortBase(OpenRTM_aist.PortBase, OpenRTM_aist.DataPortStatus):
 
     self._rtcout.RTC_DEBUG("setting port.data_type: %s", data_type)
     self.addProperty("dataport.data_type", data_type)
+    self.addProperty("dataport.host_id", OpenRTM_aist.getHostId())
+    self.addProperty("dataport.compression.available",
+                     ",".join(OpenRTM_aist.availableCompressionTypes()))
 
     self.addProperty("dataport.subscription_type", "Any")
     self._value = None
@@ -391,6 +394,85 @@ class InPortBase(OpenRTM_aist.PortBase, OpenRTM_aist.DataPortStatus):
     self._rtcout.RTC_WARN("ConnectorProfile with the name(%s) not found.", name)
     return None
 
+
+  ##
+  # @if jp
+  # @brief ͥ׾
+  #
+  # ͥΥǡϩ׾(ConnectorMetrics.getMetrics() 
+  # )롣connector_id άϡƤΥͥ
+  # ׾ ID 򥭡Ȥ뼭֤
+  #
+  # @param self
+  # @param connector_id Connector ID
+  # @return ׾󡢻ꤷIDʤ None
+  #
+  # @else
+  # @brief Getting the metrics of the connectors
+  #
+  # This operation returns the statistics of the data path of the
+  # connector (the dictionary of ConnectorMetrics.getMetrics()). If
+  # connector_id is omitted, the statistics of all connectors are
+  # returned as the dictionary whose keys are the IDs.
+  #
+  # @param self
+  # @param connector_id Connector ID
+  # @return The statistics, None if the specified ID does not exist
+  #
+  # @endif
+  #
+  def getConnectorMetrics(self, connector_id=None):
+    self._rtcout.RTC_TRACE("getConnectorMetrics()")
+
+    if connector_id is None:
+      metrics = {}
+      for con in self._connectors:
+        metrics[con.id()] = con.getMetrics().getMetrics()
+      return metrics
+
+    con = self.getConnectorById(connector_id)
+    if con is None:
+      return None
+    return con.getMetrics().getMetrics()
+
+
+  ##
+  # @if jp
+  # @brief ConnectorProfile ׾ι
+  #
+  # ƥͥ׾ ConnectorProfile  properties 
+  # dataport.metrics.* Ȥꤹ롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Updating the metrics in ConnectorProfile
+  #
+  # This operation sets the statistics of each connector to the
+  # properties of ConnectorProfile as dataport.metrics.*.
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def updateConnectorMetrics(self):
+    guard = OpenRTM_aist.ScopedLock(self._profile_mutex)
+
+    for con in self._connectors:
+      index = self.findConnProfileIndex(con.id())
+      if index < 0:
+        continue
+
+      props = self._profile.connector_profiles[index].properties
+      for name, value in con.getMetrics().toStringPairs():
+        nv = OpenRTM_aist.NVUtil.newNV(name, value)
+        i = OpenRTM_aist.NVUtil.find_index(props, name)
+        if i < 0:
+          OpenRTM_aist.CORBA_SeqUtil.push_back(props, nv)
+        else:
+          props[i] = nv
+    return
+
   ##
   # @if jp
   # @brief ConnectorProfileIDǼ
@@ -995,6 +1077,7 @@ class InPortBase(OpenRTM_aist.PortBase, OpenRTM_aist.DataPortStatus):
       if not connector:
         return RTC.RTC_ERROR
 
+      connector.setDataType(self._value)
       ret = connector.setConnectorInfo(profile)
 
       if ret == RTC.RTC_OK:
@@ -59,6 +59,12 @@ class InPortConnector(OpenRTM_aist.ConnectorBase):
     self._buffer = buffer
     self._dataType = None
     self._endian = None
+    self._serializer = None
+    self._unmarshal = None
+    self._marshalingType = "cdr"
+    self._metrics = OpenRTM_aist.ConnectorMetrics()
+    self._codec = OpenRTM_aist.createCompressionCodec(info.properties)
+    self._delta = OpenRTM_aist.createDeltaDecoder(info.properties)
     
 
   ##
@@ -129,6 +135,25 @@ class InPortConnector(OpenRTM_aist.ConnectorBase):
     return self.profile().name
 
 
+  ##
+  # @if jp
+  # @brief ׾
+  #
+  # Connector Υǡϩ׾ݻ ConnectorMetrics 
+  # 
+  #
+  # @else
+  # @brief Getting the metrics
+  #
+  # This operation returns ConnectorMetrics which holds the statistics
+  # of the data path of the Connector
+  #
+  # @endif
+  #
+  def getMetrics(self):
+    return self._metrics
+
+
   ##
   # @if jp
   # @brief ³ؿ
@@ -180,6 +205,22 @@ class InPortConnector(OpenRTM_aist.ConnectorBase):
   def read(self, data):
     pass
 
+  ##
+  # @if jp
+  # @brief ǡΰɤ߽Фؿ
+  #
+  # Buffer  max_n ĤΥǡޤȤɤ߽Фؿ
+  #
+  # @else
+  # @brief The function to read several data at once
+  #
+  # The function to read at most max_n data from buffer at once
+  #
+  # @endif
+  #
+  def readAll(self, max_n=-1, raw=False, batch_notify=False):
+    return []
+
   # void setConnectorInfo(ConnectorInfo profile);
   def setConnectorInfo(self, profile):
     self._profile = profile
@@ -203,14 +244,199 @@ class InPortConnector(OpenRTM_aist.ConnectorBase):
     else:
       self._endian = True # little endian
 
+    self._marshalingType = self._profile.properties.getProperty("marshaling_type", "cdr")
+    self._codec = OpenRTM_aist.createCompressionCodec(self._profile.properties)
+    self._delta = OpenRTM_aist.createDeltaDecoder(self._profile.properties)
+    self.bindUnmarshaler()
     return RTC.RTC_OK
 
 
 
+  ##
+  # @if jp
+  # @brief ǡ
+  #
+  # ǡꤷΥǡΥꥢ饤򤳤ǰ٤롣
+  #
+  # @param self
+  # @param data ǡΥ󥹥
+  #
+  # @else
+  # @brief Setting data type
+  #
+  # This operation sets the data type and creates the serializer
+  # for it only once here.
+  #
+  # @param self
+  # @param data An instance of the data type
+  #
+  # @endif
+  #
   # template<class DataType>
   # void setDataTyep(DataType data);
   def setDataType(self, data):
     self._dataType = data
+    self.bindUnmarshaler()
+
+
+  ##
+  # @if jp
+  # @brief ޡ󥰴ؿ
+  #
+  # ͥץѥƥ marshaling_type Υꥢ饤 SerializerFactory
+  # ǡȥǥꤷƤΥޡ
+  # ؿ«롣ǡȤ˥ǡ褹ɬפʤʤ롣
+  # marshaling_type Υꥢ饤¸ߤʤǡб
+  # ʤ cdr Υꥢ饤Ѥ롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Binding the unmarshaling function
+  #
+  # This operation creates the serializer of the connector property
+  # marshaling_type from SerializerFactory, sets the data type and
+  # the endian to it and binds its unmarshaling function, so that the
+  # data type is not resolved for every sample. The cdr serializer
+  # is used if the serializer of marshaling_type does not exist or
+  # does not support the data type.
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def bindUnmarshaler(self):
+    self.unbindUnmarshaler()
+    if self._dataType is None or self._endian is None:
+      return
+
+    self._serializer = OpenRTM_aist.createSerializer(self._marshalingType,
+                                                     self._dataType,
+                                                     self._endian)
+    if self._serializer is None:
+      self._rtcout.RTC_WARN("marshaling_type %s is not available. cdr is used.",
+                            self._marshalingType)
+      self._serializer = OpenRTM_aist.createSerializer("cdr",
+                                                       self._dataType,
+                                                       self._endian)
+    self._unmarshal = self._serializer.deserialize
+
+
+  ##
+  # @if jp
+  # @brief ꥢ饤κ
+  #
+  # @param self
+  #
+  # @else
+  # @brief Deleting the serializer
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def unbindUnmarshaler(self):
+    if self._serializer is not None:
+      OpenRTM_aist.SerializerFactory.instance().deleteObject(self._serializer)
+    self._serializer = None
+    self._unmarshal = None
+
+
+  ##
+  # @if jp
+  # @brief ǡοĹ
+  #
+  # OutPort ¦ǰ̤줿ǡĹCPU ֤׾˵Ͽ롣
+  #
+  # @param self
+  # @param data إåդΥǡ
+  # @return ޡ󥰤줿ǡ
+  #
+  # @else
+  # @brief Decompressing data
+  #
+  # This operation decompresses data compressed by the OutPort side
+  # and records the CPU time in the statistics.
+  #
+  # @param self
+  # @param data Data with the header
+  # @return Marshaled data
+  #
+  # @endif
+  #
+  def decompressData(self, data):
+    start = OpenRTM_aist.CompressionCodec.cpuTime()
+    cdr = OpenRTM_aist.CompressionCodec.decompress(data)
+    self._metrics.onDecompress(OpenRTM_aist.CompressionCodec.cpuTime() - start)
+    return cdr
+
+
+  ##
+  # @if jp
+  # @brief ե졼ࡦʬե졼
+  #
+  # ե졼椷Хåե˳Ǽ봰ե졼
+  # ֤̤ƤϿĹƤ椷ե졼
+  # ̤ʤΥإåդ֤б륭ե졼Ƥʤ
+  # ʬե졼ξ None ֤
+  #
+  # @param self
+  # @param data ǡ
+  # @return ե졼ࡢޤ None
+  #
+  # @else
+  # @brief Decoding a key frame or a delta frame
+  #
+  # This operation decodes the received frames in the order of arrival
+  # and returns the full frame to be stored in the buffer. Compressed
+  # data is decompressed before decoding, and the full frame is
+  # returned with the header of no compression. None is returned for
+  # a delta frame whose key frame has not been received.
+  #
+  # @param self
+  # @param data Received data
+  # @return Full frame or None
+  #
+  # @endif
+  #
+  def decodeDelta(self, data):
+    if self._codec is not None:
+      data = self.decompressData(data)
+    cdr = self._delta.decode(data)
+    if cdr is None:
+      self._metrics.onDeltaDiscard()
+      return None
+    if self._codec is not None:
+      return OpenRTM_aist.CompressionCodec.RAW + OpenRTM_aist.DeltaEncoder.FULL + cdr
+    return OpenRTM_aist.DeltaEncoder.FULL + cdr
+
+
+  ##
+  # @if jp
+  # @brief Хåեɤ߽Фǡ
+  #
+  # @param self
+  # @param data Хåեɤ߽Фǡ
+  # @return ޡ󥰤줿ǡ
+  #
+  # @else
+  # @brief Restoring data read from the buffer
+  #
+  # @param self
+  # @param data Data read from the buffer
+  # @return Marshaled data
+  #
+  # @endif
+  #
+  def decodeData(self, data):
+    if self._delta is not None:
+      # restored into a full frame by decodeDelta() on arrival
+      if self._codec is not None:
+        return data[2:]
+      return data[1:]
+    if self._codec is not None:
+      return self.decompressData(data)
+    return data
 
 
   def write(self, data):
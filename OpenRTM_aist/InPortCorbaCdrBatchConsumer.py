@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  InPortCorbaCdrBatchConsumer.py
+# @brief InPortCorbaCdrBatchConsumer class
+# @date  $Date$
+#
+
+
+
+import OpenRTM_aist
+import OpenRTM
+
+
+##
+# @if jp
+#
+# @class InPortCorbaCdrBatchConsumer
+#
+# @brief InPortCorbaCdrBatchConsumer 饹
+#
+# ̿ʤ CORBA Ѥϥݡȥ󥷥塼ޤμ饹
+# InPortCorbaCdrConsumer  put() ˲äơʣΥǡ1
+# ⡼ȸƤӽФ put_batch() 󶡤롣ѥ֥å
+# Хåեɤ߽Фǽʥǡ put_batch() ǤޤȤ롣
+#
+# @else
+# @class InPortCorbaCdrBatchConsumer
+#
+# @brief InPortCorbaCdrBatchConsumer class
+#
+# This is an implementation class of the input port Consumer that
+# uses CORBA for means of communication. In addition to put() of
+# InPortCorbaCdrConsumer, it provides put_batch() which sends
+# several samples in one remote call. Publishers send all readable
+# data in the buffer at once through put_batch().
+#
+# @endif
+#
+class InPortCorbaCdrBatchConsumer(OpenRTM_aist.InPortCorbaCdrConsumer):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # 󥹥ȥ饯
+  #
+  # @param self
+  #
+  # @else
+  # @brief Constructor
+  #
+  # Constructor
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def __init__(self):
+    OpenRTM_aist.InPortCorbaCdrConsumer.__init__(self)
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("InPortCorbaCdrBatchConsumer")
+    # the object reference is narrowed once in setObject()
+    self._interfaceType = OpenRTM.InPortCdrBatch
+    return
+
+
+  ##
+  # @if jp
+  # @brief ³ؤʣǡ
+  #
+  # ³ΥݡȤʣΥǡ1θƤӽФ롣
+  # ͤΥǡ³ΥХåե˽񤭹ޤ줿ǡοǤꡢ
+  # ꥿󥳡ɤ PORT_OK Ǥʤ硢ΥǥåΥǡ
+  # 񤭹ߤ˼ԤǡǤ롣
+  #
+  # @param self
+  # @param data ǡΥꥹ
+  # @return (꥿󥳡, Ǥǡ)
+  #
+  # @else
+  # @brief Send several samples to the destination port
+  #
+  # This operation sends several samples to the destination port in
+  # one call. The returned count is the number of samples written
+  # into the destination buffer. If the return code is not PORT_OK,
+  # the sample at that index is the one which failed.
+  #
+  # @param self
+  # @param data The list of data to be sent
+  # @return (return code, number of samples sent)
+  #
+  # @endif
+  #
+  # virtual ReturnCode put_batch(const std::vector<cdrMemoryStream>& data,
+  #                              CORBA::ULong& count);
+  def put_batch(self, data):
+    self._rtcout.RTC_PARANOID("put_batch()")
+
+    try:
+      inportcdr = self._ptr(True)
+      if inportcdr:
+        ret, count = inportcdr.put_batch(data)
+        return (self.convertReturnCode(ret), count)
+      return (self.CONNECTION_LOST, 0)
+    except:
+      self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
+      return (self.CONNECTION_LOST, 0)
+
+
+
+def InPortCorbaCdrBatchConsumerInit():
+  factory = OpenRTM_aist.InPortConsumerFactory.instance()
+  factory.addFactory("corba_cdr_batch",
+                     OpenRTM_aist.InPortCorbaCdrBatchConsumer,
+                     OpenRTM_aist.Delete)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  InPortCorbaCdrBatchProvider.py
+# @brief InPortCorbaCdrBatchProvider class
+# @date  $Date$
+#
+
+
+
+import OpenRTM_aist
+import OpenRTM__POA,OpenRTM
+
+
+##
+# @if jp
+# @class InPortCorbaCdrBatchProvider
+# @brief InPortCorbaCdrBatchProvider 饹
+#
+# ̿ʤ CORBA ѤϥݡȥץХμ饹
+# InPortCorbaCdrProvider  put() ˲äơʣΥǡ1
+# ƤӽФǼ put_batch() 󶡤롣ƥǡ put() Ʊͤ
+# Хåե˽񤭹ޤ졢ǡȤ˥ꥹʤƤӽФ롣
+#
+# @else
+# @class InPortCorbaCdrBatchProvider
+# @brief InPortCorbaCdrBatchProvider class
+#
+# This is an implementation class of the input port Provider that
+# uses CORBA for means of communication. In addition to put() of
+# InPortCorbaCdrProvider, it provides put_batch() which receives
+# several samples in one call. Each sample is written into the
+# buffer in the same way as put(), and the listeners are called for
+# each sample.
+#
+# @endif
+#
+class InPortCorbaCdrBatchProvider(OpenRTM_aist.InPortCorbaCdrProvider,
+                                  OpenRTM__POA.InPortCdrBatch):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # 󥹥ȥ饯
+  #
+  # @param self
+  #
+  # @else
+  # @brief Constructor
+  #
+  # Constructor
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def __init__(self):
+    OpenRTM_aist.InPortCorbaCdrProvider.__init__(self)
+    self.setInterfaceType("corba_cdr_batch")
+    return
+
+
+  ##
+  # @if jp
+  # @brief ʣΥХåեؤΥǡ
+  #
+  # ꤵ줿ХåեƬ˥ǡ񤭹ࡣ񤭹ߤ˼
+  # ǤλΥơȽ񤭹᤿ǡ֤
+  #
+  # @param self
+  # @param data оݥǡΥ
+  # @return (꥿󥳡, 񤭹ǡ)
+  #
+  # @else
+  # @brief Write several samples into the buffer
+  #
+  # This operation writes the samples into the buffer in order. It
+  # stops at the first sample which could not be written and returns
+  # its status together with the number of samples written.
+  #
+  # @param self
+  # @param data The sequence of data to be written
+  # @return (return code, number of samples written)
+  #
+  # @endif
+  #
+  # ::OpenRTM::PortStatus put_batch(const ::OpenRTM::CdrDataSeq& data,
+  #                                 CORBA::ULong& count)
+  def put_batch(self, data):
+    self._rtcout.RTC_PARANOID("InPortCorbaCdrBatchProvider.put_batch()")
+    self._rtcout.RTC_PARANOID("received data count: %d", len(data))
+    count = 0
+    for d in data:
+      ret = self.put(d)
+      if ret != OpenRTM.PORT_OK:
+        return (ret, count)
+      count += 1
+
+    return (OpenRTM.PORT_OK, count)
+
+
+
+def InPortCorbaCdrBatchProviderInit():
+  factory = OpenRTM_aist.InPortProviderFactory.instance()
+  factory.addFactory("corba_cdr_batch",
+                     OpenRTM_aist.InPortCorbaCdrBatchProvider,
+                     OpenRTM_aist.Delete)
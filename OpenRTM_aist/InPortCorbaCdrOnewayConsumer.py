@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  InPortCorbaCdrOnewayConsumer.py
+# @brief InPortCorbaCdrOnewayConsumer class
+# @date  $Date$
+#
+
+
+
+import OpenRTM_aist
+import OpenRTM
+
+
+##
+# @if jp
+#
+# @class InPortCorbaCdrOnewayConsumer
+#
+# @brief InPortCorbaCdrOnewayConsumer 饹
+#
+# ̿ʤ CORBA Ѥϥݡȥ󥷥塼ޤμ饹
+# put() Ǥ oneway Υڥ졼 push() ǥǡ³褬
+# Хåեؽ񤭹ΤԤʤǡ put() Ͼ
+# PORT_OK ֤ᡢѥ֥å㤬ǡ뤳ȤϤʤ
+# ack_interval ĤΥǡ뤴Ȥ ack() ƤӽФδ֤
+# PORT_OK ʳκǽΥơ ON_RECEIVER_FULL Υꥹʤ
+# Τ롣ΤȤꥹʤϤǡ ack() ƤӽФ
+# ǡǤ롣³褬äǡǡ
+# ʤ硢 ack() λϤƤʤäǡΤ
+#  ack() ޤǤϤʤäΤ˴줿ǡȤ׾
+# Ͽ롣
+#
+# ʲΥץѥƥǤ롣
+# - consumer.ack_interval: ack() ƤӽФǡδֳ(ǥե 10)
+#
+# @else
+# @class InPortCorbaCdrOnewayConsumer
+#
+# @brief InPortCorbaCdrOnewayConsumer class
+#
+# This is an implementation class of the input port Consumer that
+# uses CORBA for means of communication. put() sends data by push(),
+# which is a oneway operation, and does not wait for the destination
+# to write it into its buffer. put() always returns PORT_OK for the
+# sent data, so the publisher never sends it again. ack() is called
+# every ack_interval data and the first status other than PORT_OK in
+# that interval is notified to the listeners such as
+# ON_RECEIVER_FULL. The data given to the listeners is the data at
+# which ack() is called. If the destination has received fewer data
+# than were sent, the data which had not arrived at the previous ack()
+# and have not arrived by this ack() either are recorded in the
+# metrics as dropped data.
+#
+# The following property can be set.
+# - consumer.ack_interval: The interval of data to call ack() (default 10)
+#
+# @endif
+#
+class InPortCorbaCdrOnewayConsumer(OpenRTM_aist.InPortCorbaCdrConsumer):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # 󥹥ȥ饯
+  #
+  # @param self
+  #
+  # @else
+  # @brief Constructor
+  #
+  # Constructor
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def __init__(self):
+    OpenRTM_aist.InPortCorbaCdrConsumer.__init__(self)
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("InPortCorbaCdrOnewayConsumer")
+    # the object reference is narrowed once in setObject()
+    self._interfaceType = OpenRTM.InPortCdrOneway
+    self._ackInterval = 10
+    self._sent = 0
+    self._unacked = 0
+    self._inflight = 0
+    self._profile = None
+    self._listeners = None
+    self._metrics = None
+    return
+
+
+  ##
+  # @if jp
+  # @brief 
+  #
+  # ack_interval ꤹ롣
+  #
+  # @param self
+  # @param prop 
+  #
+  # @else
+  # @brief Initializing configuration
+  #
+  # This operation sets ack_interval.
+  #
+  # @param self
+  # @param prop Configuration information
+  #
+  # @endif
+  #
+  def init(self, prop):
+    OpenRTM_aist.InPortCorbaCdrConsumer.init(self, prop)
+
+    ack_interval = prop.getProperty("ack_interval", "10")
+    interval = [self._ackInterval]
+    if OpenRTM_aist.stringTo(interval, ack_interval) and interval[0] > 0:
+      self._ackInterval = interval[0]
+    else:
+      self._rtcout.RTC_ERROR("invalid ack_interval value: %s", ack_interval)
+    self._rtcout.RTC_DEBUG("ack_interval: %d", self._ackInterval)
+    return
+
+
+  ##
+  # @if jp
+  # @brief ꥹʤꤹ
+  #
+  # @param self
+  # @param info ConnectorInfo
+  # @param listeners ConnectorListeners
+  #
+  # @else
+  # @brief Setting the listeners
+  #
+  # @param self
+  # @param info ConnectorInfo
+  # @param listeners ConnectorListeners
+  #
+  # @endif
+  #
+  def setListener(self, info, listeners):
+    self._profile = info
+    self._listeners = listeners
+    return
+
+
+  ##
+  # @if jp
+  # @brief ׾ꤹ
+  # @else
+  # @brief Setting the metrics
+  # @endif
+  #
+  def setMetrics(self, metrics):
+    self._metrics = metrics
+    return
+
+
+  ##
+  # @if jp
+  # @brief ³ؤΥǡ
+  #
+  # oneway Υڥ졼ǥǡ롣ack_interval ĤȤ
+  # ack() ³η̤ƥꥹʤΤ롣Ǥ
+  #  PORT_OK ֤
+  #
+  # @param self
+  # @param data ǡ
+  # @return ꥿󥳡
+  #
+  # @else
+  # @brief Send data to the destination port
+  #
+  # This operation sends data by the oneway operation. Every
+  # ack_interval data the results of the destination are obtained by
+  # ack() and notified to the listeners. PORT_OK is always returned if
+  # the data is sent.
+  #
+  # @param self
+  # @param data The data that will be transmitted
+  # @return Return code
+  #
+  # @endif
+  #
+  # virtual ReturnCode put(const cdrMemoryStream& data);
+  def put(self, data):
+    self._rtcout.RTC_PARANOID("put()")
+
+    try:
+      inportcdr = self._ptr(True)
+      if not inportcdr:
+        return self.CONNECTION_LOST
+
+      inportcdr.push(data)
+      self._sent += 1
+      self._unacked += 1
+      if self._sent < self._ackInterval:
+        return self.PORT_OK
+
+      ret, count = inportcdr.ack()
+      self._rtcout.RTC_PARANOID("sent: %d, received: %d", (self._sent, count))
+      # the data on the way at the previous ack() must have arrived
+      self._unacked = max(self._unacked - count, 0)
+      lost = min(self._inflight, self._unacked)
+      if lost > 0:
+        self._rtcout.RTC_WARN("%d data were not received.", lost)
+        if self._metrics is not None:
+          self._metrics.onDrop(lost)
+        self._unacked -= lost
+      self._inflight = self._unacked
+      self._sent = 0
+      self.notifyAck(self.convertReturnCode(ret), data)
+      return self.PORT_OK
+
+    except:
+      self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
+      return self.CONNECTION_LOST
+
+
+
+  ##
+  # @if jp
+  # @brief ack() η̤ꥹʤΤ
+  #
+  # @param self
+  # @param status ack() Υ꥿󥳡
+  # @param data ack() ƤӽФΥǡ
+  #
+  # @else
+  # @brief Notifying the result of ack() to the listeners
+  #
+  # @param self
+  # @param status The return code of ack()
+  # @param data The data at which ack() is called
+  #
+  # @endif
+  #
+  def notifyAck(self, status, data):
+    if status == self.PORT_OK:
+      return
+    self._rtcout.RTC_DEBUG("%s = ack()", OpenRTM_aist.DataPortStatus.toString(status))
+
+    if status == self.SEND_FULL:
+      listener_type = OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_FULL
+      if self._metrics is not None:
+        self._metrics.onReceiverFull()
+    elif status == self.SEND_TIMEOUT:
+      listener_type = OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_TIMEOUT
+      if self._metrics is not None:
+        self._metrics.onReceiverTimeout()
+    else:
+      listener_type = OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_ERROR
+      if self._metrics is not None:
+        self._metrics.onError()
+
+    if self._listeners is not None and self._profile is not None:
+      self._listeners.connectorData_[listener_type].notify(self._profile, data)
+    return
+
+
+
+def InPortCorbaCdrOnewayConsumerInit():
+  factory = OpenRTM_aist.InPortConsumerFactory.instance()
+  factory.addFactory("corba_cdr_oneway",
+                     OpenRTM_aist.InPortCorbaCdrOnewayConsumer,
+                     OpenRTM_aist.Delete)
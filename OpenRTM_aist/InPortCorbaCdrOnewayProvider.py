@@ -0,0 +1,144 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  InPortCorbaCdrOnewayProvider.py
+# @brief InPortCorbaCdrOnewayProvider class
+# @date  $Date$
+#
+
+
+
+import threading
+
+import OpenRTM_aist
+import OpenRTM__POA,OpenRTM
+
+
+##
+# @if jp
+# @class InPortCorbaCdrOnewayProvider
+# @brief InPortCorbaCdrOnewayProvider 饹
+#
+# ̿ʤ CORBA ѤϥݡȥץХμ饹
+# InPortCorbaCdrProvider  put() ˲äơoneway Υڥ졼
+# push() ǥǡ롣push() η̤ϸƤӽФ¦֤ʤᡢ
+#  ack() ʹߤ˼äǡȡPORT_OK ʳκǽ
+# ơݻack() ֤
+#
+# @else
+# @class InPortCorbaCdrOnewayProvider
+# @brief InPortCorbaCdrOnewayProvider class
+#
+# This is an implementation class of the input port Provider that
+# uses CORBA for means of communication. In addition to put() of
+# InPortCorbaCdrProvider, it receives data by push(), which is a
+# oneway operation. Since the result of push() is not returned to
+# the caller, the number of data received and the first status
+# other than PORT_OK since the last ack() are kept and returned by
+# ack().
+#
+# @endif
+#
+class InPortCorbaCdrOnewayProvider(OpenRTM_aist.InPortCorbaCdrProvider,
+                                   OpenRTM__POA.InPortCdrOneway):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # 󥹥ȥ饯
+  #
+  # @param self
+  #
+  # @else
+  # @brief Constructor
+  #
+  # Constructor
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def __init__(self):
+    OpenRTM_aist.InPortCorbaCdrProvider.__init__(self)
+    self.setInterfaceType("corba_cdr_oneway")
+    self._ackMutex = threading.RLock()
+    self._status = OpenRTM.PORT_OK
+    self._count = 0
+    return
+
+
+  ##
+  # @if jp
+  # @brief Хåե˥ǡ񤭹(oneway)
+  #
+  # put() Ʊͤ˥ǡХåե˽񤭹ߡη̤ ack() 
+  # ֤ݻ롣
+  #
+  # @param self
+  # @param data оݥǡ
+  #
+  # @else
+  # @brief Write data into the buffer (oneway)
+  #
+  # This operation writes data into the buffer in the same way as
+  # put() and keeps the result to be returned by ack().
+  #
+  # @param self
+  # @param data The target data for writing
+  #
+  # @endif
+  #
+  # void push(const ::OpenRTM::CdrData& data)
+  def push(self, data):
+    self._rtcout.RTC_PARANOID("InPortCorbaCdrOnewayProvider.push()")
+    ret = self.put(data)
+
+    guard = OpenRTM_aist.ScopedLock(self._ackMutex)
+    self._count += 1
+    if ret != OpenRTM.PORT_OK and self._status == OpenRTM.PORT_OK:
+      self._status = ret
+    return
+
+
+  ##
+  # @if jp
+  # @brief push() η̤μ
+  #
+  #  ack() ʹߤ push() ǼäǡȡPORT_OK ʳ
+  # ǽΥơ(ʤ PORT_OK)֤ꥻåȤ롣
+  #
+  # @param self
+  # @return (꥿󥳡, äǡ)
+  #
+  # @else
+  # @brief Getting the results of push()
+  #
+  # This operation returns the number of data received by push() and
+  # the first status other than PORT_OK (PORT_OK if none) since the
+  # last ack(), and resets them.
+  #
+  # @param self
+  # @return (return code, number of data received)
+  #
+  # @endif
+  #
+  # ::OpenRTM::PortStatus ack(CORBA::ULong& count)
+  def ack(self):
+    self._rtcout.RTC_PARANOID("InPortCorbaCdrOnewayProvider.ack()")
+    guard = OpenRTM_aist.ScopedLock(self._ackMutex)
+    ret = (self._status, self._count)
+    self._status = OpenRTM.PORT_OK
+    self._count = 0
+    return ret
+
+
+
+def InPortCorbaCdrOnewayProviderInit():
+  factory = OpenRTM_aist.InPortProviderFactory.instance()
+  factory.addFactory("corba_cdr_oneway",
+                     OpenRTM_aist.InPortCorbaCdrOnewayProvider,
+                     OpenRTM_aist.Delete)
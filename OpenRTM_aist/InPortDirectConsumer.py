@@ -11,6 +11,7 @@
 
 
 import OpenRTM_aist
+import OpenRTM
 
 
 ##
@@ -22,12 +23,16 @@ import OpenRTM_aist
 #
 # ǡ쥯Ȥ˽񤭹push̿¸InPort󥷥ޡ饹
 #
+# ͥץѥƥ direct.queue  YES ξ硢put() ϼä
+# ǡΥ֥Ȥ³ InPortDirectProvider Ϥ
+#
 # @else
 # @class InPortDirectConsumer
 #
 # @brief InPortDirectConsumer class
 #
-#
+# If the connector property direct.queue is YES, put() passes the
+# data object to InPortDirectProvider of the destination.
 #
 # @endif
 #
@@ -56,6 +61,9 @@ class InPortDirectConsumer(OpenRTM_aist.InPortConsumer):
     OpenRTM_aist.InPortConsumer.__init__(self)
     self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("InPortDirectConsumer")
     self._properties = None
+    self._inport = None
+    self._connectorId = None
+    self._provider = None
     return
 
   ##
@@ -103,18 +111,48 @@ class InPortDirectConsumer(OpenRTM_aist.InPortConsumer):
 
   ##
   # @if jp
-  # @brief 
+  # @brief ³ InPort 
+  #
+  # @param self
+  # @param inport InPort ΥХ
+  # @param connector_id ͥID
+  #
+  # @else
+  # @brief Setting the destination InPort
+  #
+  # @param self
+  # @param inport The servant of InPort
+  # @param connector_id The connector ID
+  #
+  # @endif
+  #
+  def setInPort(self, inport, connector_id):
+    self._inport = inport
+    self._connectorId = connector_id
+    self._provider = None
+    return
+
+  ##
+  # @if jp
+  # @brief ³ؤΥǡ
+  #
+  # ǡΥ֥Ȥ³ InPortDirectProvider Ϥ
+  # ץХϺǽ InPort Υͥ롣
   #
   # @param self
-  # @param data
-  # @return 
+  # @param data ǡΥ֥
+  # @return ꥿󥳡
   #
   # @else
-  # @brief 
+  # @brief Send data to the destination port
+  #
+  # The data object is passed to InPortDirectProvider of the
+  # destination. The provider is obtained from the connector of the
+  # InPort at the first sending.
   #
   # @param self
-  # @param data
-  # @return 
+  # @param data The data object to be sent
+  # @return Return code
   #
   # @endif
   #
@@ -122,7 +160,39 @@ class InPortDirectConsumer(OpenRTM_aist.InPortConsumer):
   def put(self, data):
     self._rtcout.RTC_PARANOID("put()")
 
-        
+    if self._provider is None:
+      if self._inport is None:
+        return self.UNKNOWN_ERROR
+      connector = self._inport.getConnectorById(self._connectorId)
+      if connector is None:
+        return self.CONNECTION_LOST
+      self._provider = connector.getProvider()
+      if not hasattr(self._provider, "put"):
+        self._provider = None
+        return self.UNKNOWN_ERROR
+
+    return self.convertReturnCode(self._provider.put(data))
+
+  ##
+  # @if jp
+  # @brief ꥿󥳡Ѵ
+  # @else
+  # @brief Return codes conversion
+  # @endif
+  #
+  def convertReturnCode(self, ret):
+    if ret == OpenRTM.PORT_OK:
+      return self.PORT_OK
+
+    elif ret == OpenRTM.PORT_ERROR:
+      return self.PORT_ERROR
+
+    elif ret == OpenRTM.BUFFER_FULL:
+      return self.SEND_FULL
+
+    elif ret == OpenRTM.BUFFER_TIMEOUT:
+      return self.SEND_TIMEOUT
+
     return self.UNKNOWN_ERROR
 
   ##
@@ -12,6 +12,7 @@
 
 
 import OpenRTM_aist
+import OpenRTM
 
 
 ##
@@ -21,12 +22,19 @@ import OpenRTM_aist
 #
 # ǡ쥯Ȥ˽񤭹push̿¸InPortץХ饹
 #
+# ͥץѥƥ direct.queue  YES ξ硢InPortDirectConsumer
+#  put() ǥǡΥ֥Ȥꡢޡ󥰤
+# ͥΥХåե˽񤭹ࡣ
+#
 # @param self
 #
 # @else
 # @class InPortDirectProvider
 # @brief InPortDirectProvider class
 #
+# If the connector property direct.queue is YES, the data objects are
+# received from InPortDirectConsumer by put() and written into the
+# buffer of the connector without marshaling.
 #
 # @param self
 #
@@ -122,6 +130,69 @@ class InPortDirectProvider(OpenRTM_aist.InPortProvider):
 
   
   ## void onBufferWrite(const cdrMemoryStream& data)
+  ##
+  # @if jp
+  # @brief ХåեؤΥǡ񤭹
+  #
+  # InPortCorbaCdrProvider::put() ƱͤˡǡΥ֥Ȥ
+  # ͥΥХåե˽񤭹ߡ̤˱ꥹʤƤӽФ
+  #
+  # @param self
+  # @param data 񤭹ǡΥ֥
+  # @return ꥿󥳡
+  #
+  # @else
+  # @brief Writing data into the buffer
+  #
+  # As InPortCorbaCdrProvider::put(), the data object is written into
+  # the buffer of the connector and the listeners are called according
+  # to the result.
+  #
+  # @param self
+  # @param data The data object to be written
+  # @return Return code
+  #
+  # @endif
+  #
+  def put(self, data):
+    self._rtcout.RTC_PARANOID("InPortDirectProvider.put()")
+
+    if not self._connector:
+      self.onReceiverError(data)
+      return OpenRTM.PORT_ERROR
+
+    self.onReceived(data)
+    ret = self._connector.write(data)
+    return self.convertReturn(ret, data)
+
+
+  ##
+  # @if jp
+  # @brief Хåեͤ꥿󥳡ɤѴ
+  # @else
+  # @brief Converting the return value of the buffer into the return code
+  # @endif
+  #
+  def convertReturn(self, status, data):
+    if status == OpenRTM_aist.BufferStatus.BUFFER_OK:
+      self.onBufferWrite(data)
+      return OpenRTM.PORT_OK
+
+    elif status == OpenRTM_aist.BufferStatus.BUFFER_FULL:
+      self.onBufferFull(data)
+      self.onReceiverFull(data)
+      return OpenRTM.BUFFER_FULL
+
+    elif status == OpenRTM_aist.BufferStatus.TIMEOUT:
+      self.onBufferWriteTimeout(data)
+      self.onReceiverTimeout(data)
+      return OpenRTM.BUFFER_TIMEOUT
+
+    else:
+      self.onReceiverError(data)
+      return OpenRTM.PORT_ERROR
+
+
   def onBufferWrite(self, data):
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_BUFFER_WRITE].notify(self._profile, data)
@@ -179,6 +250,37 @@ class InPortDirectProvider(OpenRTM_aist.InPortProvider):
 
 
 
+##
+# @if jp
+# @brief 塼Ѥ쥯³ɤ
+#
+# ͥץѥƥ interface_type  direct ǡdirect.queue  YES
+# ξ硢ǡΥ֥Ȥѥ֥åȥХåեͳ
+# 롣(ǥե: NO)
+#
+# @param prop ͥץѥƥ
+# @return 塼Ѥ True
+#
+# @else
+# @brief Whether the direct connection uses the queue
+#
+# If the connector property interface_type is direct and direct.queue
+# is YES, the data objects are sent through the publisher and the
+# buffers. (default: NO)
+#
+# @param prop The connector properties
+# @return True if the queue is used
+#
+# @endif
+#
+def isDirectQueueEnabled(prop):
+  if OpenRTM_aist.normalize([prop.getProperty("interface_type", "")]) != "direct":
+    return False
+  return OpenRTM_aist.toBool(prop.getProperty("direct.queue", "NO"),
+                             "YES", "NO", False)
+
+
+
 def InPortDirectProviderInit():
   factory = OpenRTM_aist.InPortProviderFactory.instance()
   factory.addFactory("direct",
@@ -16,9 +16,6 @@
 #     All rights reserved.
 #
 
-from omniORB import cdrUnmarshal
-from omniORB import any
-
 import OpenRTM_aist
 
 
@@ -236,7 +233,9 @@ class InPortPullConnector(OpenRTM_aist.InPortConnector):
     if ret == self.PORT_OK:
       # CDR -> (conversion) -> data
       if self._endian is not None:
-        data[0] = cdrUnmarshal(any.to_any(data[0]).typecode(),cdr_data[0],self._endian)
+        if self._unmarshal is None:
+          self.setDataType(data[0])
+        data[0] = self._unmarshal(cdr_data[0])
 
       else:
         self._rtcout.RTC_ERROR("unknown endian from connector")
@@ -245,6 +244,56 @@ class InPortPullConnector(OpenRTM_aist.InPortConnector):
     return ret
 
 
+  ##
+  # @if jp
+  # @brief ǡΰɤ߽Ф
+  #
+  # pull ³Ǥ OutPort ¦1 get() 1ĤΥǡ
+  # Ǥʤᡢmax_n ˴ؤ餺1ĤΥǡ֤
+  # raw  True ξϥޡ󥰤 CDR ǡ֤
+  # (쥯³Ǥ CDR ǡ¸ߤʤꥹȤ֤)
+  #
+  # @param max_n ɤ߽Фǡ(ξ)
+  # @param raw True ξ CDR ǡ֤
+  # @param batch_notify pull ³ǤϻѤʤ
+  # @return ɤ߽ФǡΥꥹ
+  #
+  # @else
+  #
+  # @brief Reading all data
+  #
+  # In the pull type connection only one data can be obtained from
+  # the OutPort by one get(), so at most one data is returned
+  # regardless of max_n. If raw is True, the CDR data is returned
+  # without unmarshaling (an empty list is returned in direct mode
+  # since there is no CDR data).
+  #
+  # @param max_n Maximum number of data to be read (all if negative)
+  # @param raw The CDR data is returned if True
+  # @param batch_notify Not used in the pull type connection
+  # @return The list of read data
+  #
+  # @endif
+  #
+  def readAll(self, max_n=-1, raw=False, batch_notify=False):
+    self._rtcout.RTC_TRACE("InPortPullConnector.readAll()")
+    if max_n == 0:
+      return []
+
+    if raw:
+      if self._directOutPort is not None or not self._consumer:
+        return []
+      cdr_data = [None]
+      if self._consumer.get(cdr_data) == self.PORT_OK:
+        return [cdr_data[0]]
+      return []
+
+    data = [self._dataType]
+    if self.read(data) == self.PORT_OK:
+      return [data[0]]
+    return []
+
+
   ##
   # @if jp
   # @brief ³ؿ
@@ -267,6 +316,9 @@ class InPortPullConnector(OpenRTM_aist.InPortConnector):
       OpenRTM_aist.OutPortConsumerFactory.instance().deleteObject(self._consumer)
     self._consumer = 0
 
+    # delete serializer
+    self.unbindUnmarshaler()
+
     return self.PORT_OK
         
   ##
@@ -18,9 +18,6 @@
 #
 
 
-from omniORB import cdrUnmarshal
-from omniORB import any
-
 import OpenRTM_aist
 import threading
 
@@ -46,6 +43,10 @@ import threading
 # InPortProvider::put() ˥ǡϤ롣񤭹ޤ줿ǡ
 # Connector  Buffer ˥ǡ񤭹ޤ롣
 #
+# 塼Ѥ쥯³(direct.queue  YES)ξ硢Buffer
+# ˤϥǡΥ֥ȤΤޤ޳Ǽ졢ɤ߽Ф˥ޡ
+# 󥰤ϹԤʤ
+#
 # @since 1.0.0
 #
 # @else
@@ -70,6 +71,10 @@ import threading
 # InPortProvider::put() by OutPortConnector.  The data is written
 # into the buffer in the connector.
 #
+# For the direct connection with the queue (direct.queue is YES), the
+# data objects are stored in the buffer as they are and are not
+# unmarshaled when read.
+#
 # @since 1.0.0
 #
 # @endif
@@ -148,6 +153,8 @@ class InPortPushConnector(OpenRTM_aist.InPortConnector):
     self._sync_readwrite = False
     if OpenRTM_aist.toBool(info.properties.getProperty("sync_readwrite"),"YES","NO",False):
       self._sync_readwrite = True
+
+    self._directQueue = OpenRTM_aist.isDirectQueueEnabled(info.properties)
       
 
     
@@ -254,7 +261,11 @@ class InPortPushConnector(OpenRTM_aist.InPortConnector):
       return self.PRECONDITION_NOT_MET
     if self._endian is not None:
       if ret == OpenRTM_aist.BufferStatus.BUFFER_OK:
-        _data = cdrUnmarshal(any.to_any(self._dataType).typecode(),cdr[0],self._endian)
+        if self._directQueue:
+          _data = cdr[0]
+        else:
+          _data = self._unmarshal(self.decodeData(cdr[0]))
+        self._metrics.onLatency(_data)
         if type(data) == list:
           data[0] = _data
     else:
@@ -279,7 +290,161 @@ class InPortPushConnector(OpenRTM_aist.InPortConnector):
       return self.PRECONDITION_NOT_MET
     
     return self.PORT_ERROR
-        
+
+
+  ##
+  # @if jp
+  # @brief ǡΰɤ߽Ф
+  #
+  # Хåեɤ߽Фǽʥǡ max_n ġ1Υå
+  # ޤȤɤ߽Фraw  True ξϥޡ󥰤
+  # CDR ǡΤޤ֤ON_BUFFER_READ ꥹʤ batch_notify 
+  # False ξǡȤˡTrue ξϺǸΥǡ1
+  # ƤӽФ롣ǡʤ ON_BUFFER_EMPTY ƤӽФ롣
+  #
+  # @param max_n ɤ߽Фǡ(ξ)
+  # @param raw True ξ CDR ǡ֤
+  # @param batch_notify True ξꥹʤ1ƤӽФ
+  # @return ɤ߽ФǡΥꥹ
+  #
+  # @else
+  #
+  # @brief Reading all data
+  #
+  # This function reads at most max_n readable data from the buffer
+  # at once, acquiring the buffer lock only once. If raw is True,
+  # the CDR data is returned without unmarshaling. ON_BUFFER_READ
+  # listeners are called for each data if batch_notify is False,
+  # otherwise only once with the last data. ON_BUFFER_EMPTY is
+  # called if no data is available.
+  #
+  # @param max_n Maximum number of data to be read (all if negative)
+  # @param raw The CDR data is returned if True
+  # @param batch_notify Listeners are called only once if True
+  # @return The list of read data
+  #
+  # @endif
+  #
+  def readAll(self, max_n=-1, raw=False, batch_notify=False):
+    self._rtcout.RTC_TRACE("readAll()")
+    if not self._buffer:
+      return []
+
+    if not raw and self._unmarshal is None:
+      self._rtcout.RTC_ERROR("data type or endian is not set")
+      return []
+
+    cdrs = self._buffer.readAll(max_n)
+    if not cdrs:
+      self.onBufferEmpty(None)
+      return []
+
+    if batch_notify:
+      self.onBufferRead(cdrs[-1])
+    else:
+      for cdr in cdrs:
+        self.onBufferRead(cdr)
+
+    if self._directQueue:
+      values = cdrs
+    else:
+      if self._codec is not None or self._delta is not None:
+        cdrs = [self.decodeData(cdr) for cdr in cdrs]
+
+      if raw:
+        return cdrs
+
+      values = [self._unmarshal(cdr) for cdr in cdrs]
+    for value in values:
+      self._metrics.onLatency(value)
+    return values
+
+
+  ##
+  # @if jp
+  # @brief InPortProvider μ
+  # @else
+  # @brief Getting InPortProvider
+  # @endif
+  #
+  def getProvider(self):
+    return self._provider
+
+
+  ##
+  # @if jp
+  # @brief ץХΥǡ򥳥ԡ˻Ȥ
+  #
+  # ץХ leaseData() бǡ̡ʬ沽
+  # ʤΤ߻ѤǤ롣Ȥǡ release() ǲ롣
+  #
+  # @return ǡ memoryviewȤǤʤ None
+  #
+  # @else
+  # @brief Referring to the data of the provider without copy
+  #
+  # This is available only if the provider supports leaseData() and
+  # the data is neither compressed nor delta encoded. The data is
+  # released by release().
+  #
+  # @return The memoryview of the data, None if not available
+  #
+  # @endif
+  #
+  def lease(self):
+    if self._codec is not None or self._delta is not None:
+      return None
+    if not hasattr(self._provider, "leaseData"):
+      return None
+    return self._provider.leaseData()
+
+
+  ##
+  # @if jp
+  # @brief ͥ󥹷Υǡ NumPy ȤƻȤ
+  #
+  # lease() ǻȤǡ numpySequenceView()  NumPy 
+  # 롣Ȥǡ release() ǲ롣
+  #
+  # @return (tm.sec, tm.nsec, NumPy )ȤǤʤ None
+  #
+  # @else
+  # @brief Referring to the data of a numeric sequence type as a NumPy
+  #        array
+  #
+  # The data referred by lease() is converted into a NumPy array by
+  # numpySequenceView(). The data is released by release().
+  #
+  # @return (tm.sec, tm.nsec, NumPy array), None if not available
+  #
+  # @endif
+  #
+  def leaseSequence(self):
+    if self._dataType is None or self._endian is None:
+      self._rtcout.RTC_ERROR("data type or endian is not set")
+      return None
+    view = self.lease()
+    if view is None:
+      return None
+    try:
+      return OpenRTM_aist.numpySequenceView(view, self._dataType, self._endian)
+    except:
+      self.release()
+      raise
+
+
+  ##
+  # @if jp
+  # @brief lease() ǻȤǡβ
+  # @else
+  # @brief Releasing the data referred by lease()
+  # @endif
+  #
+  def release(self):
+    if hasattr(self._provider, "releaseData"):
+      self._provider.releaseData()
+    return
+
 
   ##
   # @if jp
@@ -319,6 +484,9 @@ class InPortPushConnector(OpenRTM_aist.InPortConnector):
       bfactory.deleteObject(self._buffer)
     
     self._buffer = None
+
+    # delete serializer
+    self.unbindUnmarshaler()
     
     return self.PORT_OK
 
@@ -417,13 +585,30 @@ class InPortPushConnector(OpenRTM_aist.InPortConnector):
   #
   # ReturnCode write(const OpenRTM::CdrData& data);
   def write(self, data):
+    cdr = data
+    if self._delta is not None and not self._directQueue:
+      cdr = self.decodeDelta(data)
+      if cdr is None:
+        self._rtcout.RTC_WARN("write(): the key frame has not been received.")
+        return OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET
+
     if self._sync_readwrite:
       self._readready_worker._cond.acquire()
       while not self._readready_worker._completed:
         self._readready_worker._cond.wait()
       self._readready_worker._cond.release()
 
-    ret = self._buffer.write(data)
+    full = self._buffer.full()
+    ret = self._buffer.write(cdr)
+    if ret == OpenRTM_aist.BufferStatus.BUFFER_OK:
+      self._metrics.onReceived(data)
+      if full:
+        self._metrics.onOverwrite()
+      self._metrics.setOccupancy(self._buffer.readable())
+    elif ret == OpenRTM_aist.BufferStatus.BUFFER_FULL:
+      self._metrics.onBufferFull()
+    elif ret == OpenRTM_aist.BufferStatus.TIMEOUT:
+      self._metrics.onBufferTimeout()
 
     if self._sync_readwrite:
       self._writecompleted_worker._completed = True
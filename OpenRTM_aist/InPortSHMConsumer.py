@@ -24,13 +24,34 @@ import threading
 #
 # ̿ʤ ͭ Ѥϥݡȥ󥷥塼ޤμ饹
 #
+# shem_slot_count 2ʾꤹȶͭ󥰷ǻѤ
+# ץХɤ߽ФԤ˶åȤإǡ񤭹ࡣ
+# ץХؤΤϡץХɤ߽ФǤʤȥ󥰤
+# ʤΤ߹ԤΤȤ put()  PORT_OK ϥǡ󥰤
+# 񤭹ޤ줿Ȥ򼨤ǥեȤ 1 ǤϽ̤1ǡȤ
+# ץХΥХåեؤν񤭹ߤԤġ
+#
+# POSIX ̾դޥեѤǤ硢󥰷Τ
+# ޥեǹԤCORBA  put() ϺǽΤȥ󥰤˶ʤ
+# Τ߸ƤӽФǥ³ǽ1Ԥ
 #
 # @else
 # @class InPortCorbaCdrConsumer
 #
 # @brief InPortCorbaCdrConsumer class
 #
+# If shem_slot_count is 2 or more, the shared memory is used with the
+# ring layout and data is written into free slots without waiting for
+# the provider to read. The provider is notified only when it is not
+# reading and when the ring has no free slot. PORT_OK returned by put()
+# then means that the data was written into the ring. With the default
+# value 1, each data waits to be written into the buffer of the
+# provider as before.
 #
+# If POSIX named semaphores are available, the ring is notified by the
+# semaphore, and put() of CORBA is called only for the first
+# notification and when the ring has no free slot. The endian is set
+# only once at the first sending after the connection.
 #
 # @endif
 #
@@ -67,6 +88,10 @@ class InPortSHMConsumer(OpenRTM_aist.InPortCorbaCdrConsumer):
     
 
     self._mutex = threading.RLock()
+    self._slotCount = 1
+    self._drainTimeout = 1.0
+    self._inportcdr = None
+    self._endianSent = False
       
     return
 
@@ -93,6 +118,7 @@ class InPortSHMConsumer(OpenRTM_aist.InPortCorbaCdrConsumer):
     self._rtcout.RTC_PARANOID("~InPortSHMConsumer()")
     CorbaConsumer.__del__(self)
     self._shmem.close_memory(True)
+    self._shmem.close_semaphore(True)
     
     oid = OpenRTM_aist.Manager.instance().getPOA().servant_to_id(self._shmem)
     OpenRTM_aist.Manager.instance().getPOA().deactivate_object(oid)
@@ -128,6 +154,21 @@ class InPortSHMConsumer(OpenRTM_aist.InPortCorbaCdrConsumer):
     ds = prop.getProperty("shem_default_size")
     self._memory_size = self._shmem.string_to_MemorySize(ds)
 
+    slot_count = [1]
+    if OpenRTM_aist.stringTo(slot_count, prop.getProperty("shem_slot_count", "1")) \
+          and slot_count[0] > 0:
+      self._slotCount = slot_count[0]
+    else:
+      self._rtcout.RTC_ERROR("init(): invalid shem_slot_count.")
+      self._slotCount = 1
+
+    timeout = [1.0]
+    if OpenRTM_aist.stringTo(timeout, prop.getProperty("shem_drain_timeout", "1.0")) \
+          and timeout[0] >= 0:
+      self._drainTimeout = timeout[0]
+    else:
+      self._rtcout.RTC_ERROR("init(): invalid shem_drain_timeout.")
+      self._drainTimeout = 1.0
 
 
     
@@ -158,6 +199,9 @@ class InPortSHMConsumer(OpenRTM_aist.InPortCorbaCdrConsumer):
         if inportcdr is None:
           return False
         self._shmem.setInterface(inportcdr)
+        # narrowed once here instead of on every put()
+        self._inportcdr = inportcdr
+        self._endianSent = False
 
         return True
     return False
@@ -190,14 +234,17 @@ class InPortSHMConsumer(OpenRTM_aist.InPortCorbaCdrConsumer):
     self._rtcout.RTC_PARANOID("put()")
 
     try:
-      ref_ = self.getObject()
-      if ref_:
-        inportcdr = ref_._narrow(OpenRTM__POA.PortSharedMemory)
-        
+      inportcdr = self._inportcdr
+      if self.getObject() and inportcdr is not None:
         guard = OpenRTM_aist.ScopedLock(self._mutex)
         
-        self._shmem.setEndian(self._endian)
+        self.sendEndian()
         self._shmem.create_memory(self._memory_size, self._shm_address)
+        if self.initRing(inportcdr):
+          ret, count = self.putSlots(inportcdr, [data])
+          del guard
+          return ret
+
         self._shmem.write(data)
         
         
@@ -209,6 +256,204 @@ class InPortSHMConsumer(OpenRTM_aist.InPortCorbaCdrConsumer):
       self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
       return self.CONNECTION_LOST
 
+
+  ##
+  # @if jp
+  # @brief ³ؤʣǡ
+  #
+  # 󥰷ξ硢åȤƤΥǡ񤭹Ǥ
+  # 1Τ롣ʳξ󥰷ǽǤʤ
+  # put() 򷫤֤
+  #
+  # @param self
+  # @param data ǡΥꥹ
+  # @return (꥿󥳡, Ǥǡ)
+  #
+  # @else
+  # @brief Send several samples to the destination port
+  #
+  # With the ring layout, all the data are written into free slots and
+  # then the provider is notified once. Otherwise, or if the ring
+  # cannot be initialized, put() is repeated.
+  #
+  # @param self
+  # @param data The list of data to be sent
+  # @return (return code, number of samples sent)
+  #
+  # @endif
+  #
+  def put_batch(self, data):
+    self._rtcout.RTC_PARANOID("put_batch()")
+
+    if self._slotCount >= 2:
+      try:
+        inportcdr = self._inportcdr
+        if self.getObject() and inportcdr is not None:
+          guard = OpenRTM_aist.ScopedLock(self._mutex)
+
+          self.sendEndian()
+          self._shmem.create_memory(self._memory_size, self._shm_address)
+          if self.initRing(inportcdr):
+            ret = self.putSlots(inportcdr, data)
+            del guard
+            return ret
+          del guard
+      except:
+        self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
+        return (self.CONNECTION_LOST, 0)
+
+    # the single slot layout, also used when the ring cannot be initialized
+    for i in range(len(data)):
+      ret = self.put(data[i])
+      if ret != self.PORT_OK:
+        return (ret, i)
+    return (self.PORT_OK, len(data))
+
+
+  ##
+  # @if jp
+  # @brief ǥ
+  #
+  # ץХΥǥꤹ롣⡼ȸƤӽФȤʤ뤿
+  # ³1Ԥ
+  #
+  # @else
+  # @brief Setting the endian
+  #
+  # The endian of the provider is set. Since this is a remote call, it
+  # is done only once after the connection.
+  #
+  # @endif
+  #
+  def sendEndian(self):
+    if not self._endianSent:
+      self._shmem.setEndian(self._endian)
+      self._endianSent = True
+    return
+
+
+  ##
+  # @if jp
+  # @brief ͭ󥰷ǽ
+  #
+  # 1 put() ƤӽФƥץХɤ߽Фåɤ
+  # ư롣ʹߤΤϥޥեѤǤХޥեǹԤ
+  # Ǥʤϰʹ1åȤηѤ롣
+  #
+  # @param self
+  # @param inportcdr ץХΥ֥ȥե
+  # @return 󥰷Ѥ True
+  #
+  # @else
+  # @brief Initializing the shared memory with the ring layout
+  #
+  # put() is called once after the initialization to start the
+  # reading thread of the provider. The following notifications use the
+  # semaphore if available. If the initialization fails, the single slot
+  # layout is used from then on.
+  #
+  # @param self
+  # @param inportcdr The object reference of the provider
+  # @return True if the ring layout is used
+  #
+  # @endif
+  #
+  def initRing(self, inportcdr):
+    if self._slotCount < 2:
+      return False
+    if self._shmem.is_ring():
+      return True
+    if not self._shmem.init_ring(self._slotCount):
+      self._rtcout.RTC_WARN("initRing(): falling back to the single slot layout.")
+      self._slotCount = 1
+      return False
+    inportcdr.put()
+    return True
+
+
+  ##
+  # @if jp
+  # @brief 󥰤ΥåȤؤΥǡ񤭹
+  #
+  # ץХɤ߽ФǤʤ硢ޤϥ󥰤˶ʤ
+  # ΤߥץХΤ롣ɤ߽ФǤʤΤϥޥե
+  # ѤǤХޥեǹԤʤ CORBA Τ
+  # ³γǧͤ롣񤭹ʤäǡϡץХ󥰤
+  # ɤ߽Τ shem_drain_timeout äޤԤäƤ1
+  # 񤭹ࡣåȤ礭ǡϤΤȤ󥰤ĥƽ񤭹ࡣ
+  #
+  # @param self
+  # @param inportcdr ץХΥ֥ȥե
+  # @param data ǡΥꥹ
+  # @return (꥿󥳡, 񤭹᤿ǡ)
+  #
+  # @else
+  # @brief Writing data into the slots of the ring
+  #
+  # The provider is notified only when it is not reading and when the
+  # ring has no free slot. The former is notified by the semaphore if
+  # available. The latter is notified by CORBA, which also checks the
+  # connection. The data not written is written once more after waiting
+  # up to shem_drain_timeout seconds for the provider to read the whole
+  # ring. Data larger than the slot grows the ring at that time.
+  #
+  # @param self
+  # @param inportcdr The object reference of the provider
+  # @param data The list of data to be sent
+  # @return (return code, number of samples written)
+  #
+  # @endif
+  #
+  def putSlots(self, inportcdr, data):
+    count = self.writeSlots(data, 0)
+
+    if count == len(data):
+      if not self._shmem.set_notify() or self._shmem.notify_slot():
+        return (self.PORT_OK, count)
+
+    ret = self.convertReturnCode(inportcdr.put())
+    if ret != self.PORT_OK or count == len(data):
+      return (ret, count)
+
+    # put() has woken up the provider. Once it has read all slots, the
+    # rest of the data fits, and the slots grow for larger data.
+    if self._shmem.wait_drained(self._drainTimeout):
+      count = self.writeSlots(data, count)
+    if count < len(data):
+      return (self.SEND_FULL, count)
+
+    if self._shmem.set_notify() and not self._shmem.notify_slot():
+      ret = self.convertReturnCode(inportcdr.put())
+    return (ret, count)
+
+
+  ##
+  # @if jp
+  # @brief åȤؤΥǡν񤭹
+  #
+  # @param self
+  # @param data ǡΥꥹ
+  # @param start 񤭹ߤϤǡΰ
+  # @return 񤭹߽ǡΰ
+  #
+  # @else
+  # @brief Writing data into free slots
+  #
+  # @param self
+  # @param data The list of data to be sent
+  # @param start The position of the data to start writing
+  # @return The position of the data written up to
+  #
+  # @endif
+  #
+  def writeSlots(self, data, start):
+    count = start
+    for d in data[start:]:
+      if not self._shmem.write_slot(d):
+        break
+      count += 1
+    return count
+
  
 
 def InPortSHMConsumerInit():
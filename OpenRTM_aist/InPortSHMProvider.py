@@ -11,6 +11,8 @@
 
 
 
+import threading
+
 import OpenRTM_aist
 import OpenRTM
 
@@ -22,12 +24,36 @@ import OpenRTM
 #
 # ̿ʤ ͭ ѤϥݡȥץХμ饹
 #
+# ꤬ͭ󥰷ξ硢put() ɤ߽Фåɤ򵯤
+# ꡢɤ߽Фåɤ񤭹ޤ줿ƤΥåȤХåե
+# 񤭹ࡣΤ줿ɤ߽Фåɤ
+# shem_poll_interval [s] (ǥե: 0.01) Ȥˤ⥹åȤǧ롣
+# 󥷥塼ޤѥޥեƤ硢ǽ put() ʹߤ
+# ΤϥޥեǼ롣
+#
+# shem_lease  YES ꤹȡɤ߽ФåɤϥåȤХåե
+# ˽񤭹ޤǡϥåȤ֤ޤ leaseData() ǻȤ
+# releaseData() ǲ롣ξ InPort.lease() ǥԡ
+# ͭΥǡɤ߽Ф롣1åȤηǤϤޤ̤
+# Хåե˽񤭹ࡣ
 #
 # @else
 # @class InPortCorbaCdrProvider
 # @brief InPortCorbaCdrProvider class
 #
+# If the shared memory has the ring layout, put() only wakes up the
+# reading thread and returns at once, and the reading thread writes
+# all the written slots into the buffer. In case a notification is
+# lost, the reading thread also checks the slots every
+# shem_poll_interval [s] (default: 0.01). If the consumer has created
+# the semaphore for the notification, the notifications after the
+# first put() are received by the semaphore.
 #
+# If shem_lease is YES, the reading thread does not write the slots
+# into the buffer. The data stays in the slot, referred by
+# leaseData() and released by releaseData(), so that InPort.lease()
+# reads the data on the shared memory without copy. The single slot
+# layout writes the data into the buffer as before.
 #
 # @endif
 #
@@ -68,6 +94,12 @@ class InPortSHMProvider(OpenRTM_aist.InPortProvider, OpenRTM_aist.SharedMemory):
 
     self._profile = None
     self._listeners = None
+    self._pollInterval = 0.01
+    self._drainThread = None
+    self._drainCond = threading.Condition()
+    self._drainSignaled = False
+    self._draining = False
+    self._leaseMode = False
 
     orb = OpenRTM_aist.Manager.instance().getORB()
     self._properties.append(OpenRTM_aist.NVUtil.newNV("dataport.corba_cdr.inport_ior",
@@ -114,14 +146,21 @@ class InPortSHMProvider(OpenRTM_aist.InPortProvider, OpenRTM_aist.SharedMemory):
   # @endif
   #
   def exit(self):
+    self.stopDrain()
+    self.close_semaphore()
     oid = OpenRTM_aist.Manager.instance().getPOA().servant_to_id(self)
     OpenRTM_aist.Manager.instance().getPOA().deactivate_object(oid)
     
   
   # void init(coil::Properties& prop)
   def init(self, prop):
-          
-    pass
+    interval = [self._pollInterval]
+    if OpenRTM_aist.stringTo(interval, prop.getProperty("shem_poll_interval", "0.01")) \
+          and interval[0] > 0.0:
+      self._pollInterval = interval[0]
+    self._leaseMode = OpenRTM_aist.toBool(prop.getProperty("shem_lease"),
+                                          "YES", "NO", False)
+    return
 
   def setBuffer(self, buffer):
     self._buffer = buffer
@@ -157,11 +196,12 @@ class InPortSHMProvider(OpenRTM_aist.InPortProvider, OpenRTM_aist.SharedMemory):
     
     try:
       self._rtcout.RTC_PARANOID("InPortCorbaCdrProvider.put()")
-            
-      
-      
 
-      
+      if self.is_ring():
+        if not self._leaseMode:
+          self.signalDrain()
+        return OpenRTM.PORT_OK
+            
       shm_data = self.read()
 
       if not self._buffer:
@@ -190,6 +230,171 @@ class InPortSHMProvider(OpenRTM_aist.InPortProvider, OpenRTM_aist.SharedMemory):
 
 
       
+  ##
+  # @if jp
+  # @brief ɤ߽Фåɤ򵯤
+  #
+  # ɤ߽ФåɤưƤʤϵư롣
+  #
+  # @else
+  # @brief Waking up the reading thread
+  #
+  # The reading thread is started if it is not running.
+  #
+  # @endif
+  #
+  def signalDrain(self):
+    self._drainCond.acquire()
+    try:
+      if self._drainThread is None:
+        self._draining = True
+        self._drainThread = threading.Thread(target=self.drain)
+        self._drainThread.daemon = True
+        self._drainThread.start()
+      self._drainSignaled = True
+      self._drainCond.notify()
+    finally:
+      self._drainCond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ɤ߽Фåɤ
+  # @else
+  # @brief Stopping the reading thread
+  # @endif
+  #
+  def stopDrain(self):
+    self._drainCond.acquire()
+    thread = self._drainThread
+    self._draining = False
+    self._drainThread = None
+    self._drainCond.notify()
+    self._drainCond.release()
+    if thread is not None and thread is not threading.currentThread():
+      thread.join()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ɤ߽Фåɤμ¹Դؿ
+  # @else
+  # @brief The function executed by the reading thread
+  # @endif
+  #
+  def drain(self):
+    while True:
+      if self.use_semaphore():
+        self.wait_slot(self._pollInterval)
+        self._drainCond.acquire()
+      else:
+        self._drainCond.acquire()
+        if self._draining and not self._drainSignaled:
+          self._drainCond.wait(self._pollInterval)
+      self._drainSignaled = False
+      draining = self._draining
+      self._drainCond.release()
+      if not draining:
+        return
+      try:
+        self.drainSlots()
+      except:
+        self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
+
+
+  ##
+  # @if jp
+  # @brief 񤭹ޤ줿ƤΥåȤХåե˽񤭹
+  #
+  # åȤˤʤäΥե饰򲼤δ֤˽񤭹ޤ줿
+  # åȤɤ߽Ф³롣Хåեեޤϥॢ
+  # ξϥåȤĤޤ޼γǧޤԤĤᡢ񤭹¦ˤ
+  # 󥰤ΥեȤ롣ƬΥåȤ leaseData() ǻȤ
+  # ֤ɤ߽Фʤ
+  #
+  # @else
+  # @brief Writing all the written slots into the buffer
+  #
+  # When the slots become empty, the notification flag is cleared and
+  # reading continues if slots were written in the meantime. If the
+  # buffer is full or times out, the slot is left and the thread waits
+  # for the next check, so the writer sees the ring as full. Nothing
+  # is read while the first slot is referred by leaseData().
+  #
+  # @endif
+  #
+  def drainSlots(self):
+    while self._draining:
+      if self._lease is not None:
+        return
+      shm_data = self.read_slot()
+      if shm_data is None:
+        self.clear_notify()
+        shm_data = self.read_slot()
+        if shm_data is None:
+          return
+        self.set_notify()
+
+      if not self._buffer or not self._connector:
+        self.onReceiverError(shm_data)
+        return
+
+      self._rtcout.RTC_PARANOID("received data size: %d", len(shm_data))
+      self.onReceived(shm_data)
+      ret = self._connector.write(shm_data)
+      self.convertReturn(ret, shm_data)
+      if ret == OpenRTM_aist.BufferStatus.BUFFER_FULL or \
+            ret == OpenRTM_aist.BufferStatus.TIMEOUT:
+        return
+      self.advance_slot()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ƬΥåȤΥǡ򥳥ԡ˻Ȥ
+  #
+  # shem_lease  YES ǥ󥰷ξΤ߻ѤǤ롣releaseData()
+  # ƤӽФޤǽ񤭹¦ϤΥåȤ񤭤ʤ
+  #
+  # @param self
+  # @return ǡ memoryviewǡʤ None
+  #
+  # @else
+  # @brief Referring to the data of the first slot without copy
+  #
+  # This is available only if shem_lease is YES and the memory has the
+  # ring layout. The writer does not overwrite the slot until
+  # releaseData() is called.
+  #
+  # @param self
+  # @return The memoryview of the data, None if there is no data
+  #
+  # @endif
+  #
+  def leaseData(self):
+    if not self._leaseMode:
+      return None
+    view = self.lease_slot()
+    if view is not None:
+      self._rtcout.RTC_PARANOID("leased data size: %d", len(view))
+    return view
+
+
+  ##
+  # @if jp
+  # @brief leaseData() ǻȤåȤβ
+  # @else
+  # @brief Releasing the slot referred by leaseData()
+  # @endif
+  #
+  def releaseData(self):
+    self.release_slot()
+    return
+
+
   def onBufferWrite(self, data):
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_BUFFER_WRITE].notify(self._profile, data)
@@ -971,6 +971,9 @@ class Manager:
                     "exec_cxt.deactivation_timeout",
                     "exec_cxt.reset_timeout",
                     "exec_cxt.cpu_affinity",
+                    "exec_cxt.scheduling_mode",
+                    "exec_cxt.overrun_policy",
+                    "exec_cxt.catchup_limit",
                     "logger.enable",
                     "logger.log_level",
                     "naming.enable",
@@ -183,10 +183,13 @@ class OutPort(OpenRTM_aist.OutPortBase):
       
     result = True
 
+    # marshaled data shared by all connectors during this write
+    cache = {}
+
     guard = OpenRTM_aist.ScopedLock(self._connector_mutex)
     for con in self._connectors:
       if not con.directMode():
-        ret = con.write(value)
+        ret = con.write(value, cache)
         if ret != self.PORT_OK:
           result = False
           if ret == self.CONNECTION_LOST:
@@ -138,6 +138,13 @@ import RTC
 #     ex. corba_cdr, corba_any, raw_tcp ʤɥ޶ڤǻꡣ
 #     ꤷʤѲǽʤ٤ƤΥץХѤ
 #
+# - transport_upgrade:
+#     YES ξ硢dataport.interface_type  corba_cdr ³
+#     ݡȤƱץˤ directƱۥȤˤ
+#     shared_memory ³롣ConnectorProfile 
+#     dataport.transport_upgrade ³˻ꤹ뤳ȤǤ롣
+#     (ǥե: NO)
+#
 #
 #
 #   
@@ -263,6 +270,9 @@ class OutPortBase(OpenRTM_aist.PortBase,OpenRTM_aist.DataPortStatus):
 
     self._rtcout.RTC_DEBUG("setting dataport.data_type: %s", data_type)
     self.addProperty("dataport.data_type", data_type)
+    self.addProperty("dataport.host_id", OpenRTM_aist.getHostId())
+    self.addProperty("dataport.compression.available",
+                     ",".join(OpenRTM_aist.availableCompressionTypes()))
 
     # publisher list
     factory = OpenRTM_aist.PublisherFactory.instance()
@@ -282,6 +292,7 @@ class OutPortBase(OpenRTM_aist.PortBase,OpenRTM_aist.DataPortStatus):
     self._providerTypes = ""
     self._consumerTypes = ""
     self._connector_mutex = threading.RLock()
+    self._value = None
 
     self._listeners = OpenRTM_aist.ConnectorListeners()
     return
@@ -613,6 +624,85 @@ class OutPortBase(OpenRTM_aist.PortBase,OpenRTM_aist.DataPortStatus):
     return None
 
 
+  ##
+  # @if jp
+  # @brief ͥ׾
+  #
+  # ͥΥǡϩ׾(ConnectorMetrics.getMetrics() 
+  # )롣connector_id άϡƤΥͥ
+  # ׾ ID 򥭡Ȥ뼭֤
+  #
+  # @param self
+  # @param connector_id Connector ID
+  # @return ׾󡢻ꤷIDʤ None
+  #
+  # @else
+  # @brief Getting the metrics of the connectors
+  #
+  # This operation returns the statistics of the data path of the
+  # connector (the dictionary of ConnectorMetrics.getMetrics()). If
+  # connector_id is omitted, the statistics of all connectors are
+  # returned as the dictionary whose keys are the IDs.
+  #
+  # @param self
+  # @param connector_id Connector ID
+  # @return The statistics, None if the specified ID does not exist
+  #
+  # @endif
+  #
+  def getConnectorMetrics(self, connector_id=None):
+    self._rtcout.RTC_TRACE("getConnectorMetrics()")
+
+    if connector_id is None:
+      metrics = {}
+      for con in self._connectors:
+        metrics[con.id()] = con.getMetrics().getMetrics()
+      return metrics
+
+    con = self.getConnectorById(connector_id)
+    if con is None:
+      return None
+    return con.getMetrics().getMetrics()
+
+
+  ##
+  # @if jp
+  # @brief ConnectorProfile ׾ι
+  #
+  # ƥͥ׾ ConnectorProfile  properties 
+  # dataport.metrics.* Ȥꤹ롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Updating the metrics in ConnectorProfile
+  #
+  # This operation sets the statistics of each connector to the
+  # properties of ConnectorProfile as dataport.metrics.*.
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def updateConnectorMetrics(self):
+    guard = OpenRTM_aist.ScopedLock(self._profile_mutex)
+
+    for con in self._connectors:
+      index = self.findConnProfileIndex(con.id())
+      if index < 0:
+        continue
+
+      props = self._profile.connector_profiles[index].properties
+      for name, value in con.getMetrics().toStringPairs():
+        nv = OpenRTM_aist.NVUtil.newNV(name, value)
+        i = OpenRTM_aist.NVUtil.find_index(props, name)
+        if i < 0:
+          OpenRTM_aist.CORBA_SeqUtil.push_back(props, nv)
+        else:
+          props[i] = nv
+    return
+
+
   ##
   # @if jp
   # @brief ConnectorProfileIDǼ
@@ -1288,6 +1378,8 @@ class OutPortBase(OpenRTM_aist.PortBase,OpenRTM_aist.DataPortStatus):
       elif provider_ is not None:
         self._rtcout.RTC_TRACE("OutPortPullConnector created")
 
+      if self._value is not None:
+        connector.setDataType(self._value)
         
       if OpenRTM_aist.StringUtil.normalize([prop.getProperty("interface_type")]) == "direct":
         if consumer_ is not None:
@@ -18,6 +18,8 @@
 #     All rights reserved.
 #
 
+import copy
+
 import OpenRTM_aist
 import RTC
 
@@ -58,6 +60,13 @@ class OutPortConnector(OpenRTM_aist.ConnectorBase):
     self._profile = info
     self._endian = True
     self._directMode = False
+    self._dataType = None
+    self._serializer = None
+    self._marshal = None
+    self._marshalingType = "cdr"
+    self._metrics = OpenRTM_aist.ConnectorMetrics()
+    self._codec = OpenRTM_aist.createCompressionCodec(info.properties)
+    self._delta = OpenRTM_aist.createDeltaEncoder(info.properties)
     return
 
   ##
@@ -127,6 +136,25 @@ class OutPortConnector(OpenRTM_aist.ConnectorBase):
     return self.profile().name
 
 
+  ##
+  # @if jp
+  # @brief ׾
+  #
+  # Connector Υǡϩ׾ݻ ConnectorMetrics 
+  # 
+  #
+  # @else
+  # @brief Getting the metrics
+  #
+  # This operation returns ConnectorMetrics which holds the statistics
+  # of the data path of the Connector
+  #
+  # @endif
+  #
+  def getMetrics(self):
+    return self._metrics
+
+
   # ReturnCode_t setConnectorInfo(ConnectorInfo info);
   def setConnectorInfo(self, info):
     self._profile = info
@@ -150,8 +178,100 @@ class OutPortConnector(OpenRTM_aist.ConnectorBase):
     else:
       self._endian = True # little endian
 
+    self._marshalingType = self._profile.properties.getProperty("marshaling_type", "cdr")
+    self._codec = OpenRTM_aist.createCompressionCodec(self._profile.properties)
+    self._delta = OpenRTM_aist.createDeltaEncoder(self._profile.properties)
+    self.bindMarshaler()
     return RTC.RTC_OK
 
+
+  ##
+  # @if jp
+  # @brief ǡ
+  #
+  # ǡꤷΥǡΥꥢ饤򤳤ǰ٤롣
+  #
+  # @param self
+  # @param data ǡΥ󥹥
+  #
+  # @else
+  # @brief Setting data type
+  #
+  # This operation sets the data type and creates the serializer
+  # for it only once here.
+  #
+  # @param self
+  # @param data An instance of the data type
+  #
+  # @endif
+  #
+  def setDataType(self, data):
+    self._dataType = data
+    self.bindMarshaler()
+
+
+  ##
+  # @if jp
+  # @brief ޡ󥰴ؿ
+  #
+  # ͥץѥƥ marshaling_type Υꥢ饤 SerializerFactory
+  # ǡȥǥꤷƤΥޡ󥰴ؿ
+  # «롣ǡȤ˥ǡ褹ɬפʤʤ롣
+  # marshaling_type Υꥢ饤¸ߤʤǡб
+  # ʤ cdr Υꥢ饤Ѥ롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Binding the marshaling function
+  #
+  # This operation creates the serializer of the connector property
+  # marshaling_type from SerializerFactory, sets the data type and
+  # the endian to it and binds its marshaling function, so that the
+  # data type is not resolved for every sample. The cdr serializer
+  # is used if the serializer of marshaling_type does not exist or
+  # does not support the data type.
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def bindMarshaler(self):
+    self.unbindMarshaler()
+    if self._dataType is None or self._endian is None:
+      return
+
+    self._serializer = OpenRTM_aist.createSerializer(self._marshalingType,
+                                                     self._dataType,
+                                                     self._endian)
+    if self._serializer is None:
+      self._rtcout.RTC_WARN("marshaling_type %s is not available. cdr is used.",
+                            self._marshalingType)
+      self._serializer = OpenRTM_aist.createSerializer("cdr",
+                                                       self._dataType,
+                                                       self._endian)
+    self._marshal = self._serializer.serialize
+
+
+  ##
+  # @if jp
+  # @brief ꥢ饤κ
+  #
+  # @param self
+  #
+  # @else
+  # @brief Deleting the serializer
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def unbindMarshaler(self):
+    if self._serializer is not None:
+      OpenRTM_aist.SerializerFactory.instance().deleteObject(self._serializer)
+    self._serializer = None
+    self._marshal = None
+
   ##
   # @if jp
   # @brief 쥯³⡼ɤ
@@ -186,7 +306,167 @@ class OutPortConnector(OpenRTM_aist.ConnectorBase):
     return self._directMode
 
 
-  def write(self, data):
+  ##
+  # @if jp
+  # @brief ǡΥޡ
+  #
+  # ǡ CDR ˥ޡ󥰤롣cache Ϳ줿硢
+  # Ʊޡȥǥǥޡ󥰺ѤߤΥǡ
+  # cache ˤФ֤ʤХޡ󥰷̤ cache 
+  # Ǽ롣OutPort  write() 1ˤĤ1Ĥ cache ͥ
+  # ͭ롣
+  #
+  # @param self
+  # @param data ޡоݤΥǡ
+  # @param cache ޡ󥰺ѤߥǡΥå(dict)
+  # @return CDR ǡ
+  #
+  # @else
+  # @brief Marshaling data
+  #
+  # This operation marshals data into a CDR stream. If a cache is
+  # given, data already marshaled with the same marshaling type and
+  # endian is returned from it, otherwise the result is stored in
+  # the cache. One cache is shared by all connectors of an OutPort
+  # during one write() call.
+  #
+  # @param self
+  # @param data Data to be marshaled
+  # @param cache Cache of marshaled data (dict)
+  # @return CDR data
+  #
+  # @endif
+  #
+  def serializeData(self, data, cache=None):
+    key = (self._marshalingType, self._endian)
+    if cache is not None and key in cache:
+      return cache[key]
+
+    if self._marshal is None:
+      self.setDataType(data)
+
+    cdr_data = self._marshal(data)
+    if cache is not None:
+      cache[key] = cdr_data
+    return cdr_data
+
+
+  ##
+  # @if jp
+  # @brief ǡΰ
+  #
+  # ޡ󥰤줿ǡ compression.* ˽äư̤
+  # ΥХȿ CPU ֤׾˵Ͽ롣serializeData()
+  # ƱͤˡƱޡǥ󡢰ǰ̺Ѥ
+  # Υǡ cache ˤФ֤
+  #
+  # @param self
+  # @param cdr_data ޡ󥰤줿ǡ
+  # @param cache ޡ󥰺ѤߥǡΥå(dict)
+  # @return إåդΥǡ
+  #
+  # @else
+  # @brief Compressing data
+  #
+  # This operation compresses marshaled data according to the
+  # compression.* settings and records the bytes before and after
+  # compression and the CPU time in the statistics. As serializeData(),
+  # data already compressed with the same marshaling type, endian and
+  # compression settings is returned from the cache.
+  #
+  # @param self
+  # @param cdr_data Marshaled data
+  # @param cache Cache of marshaled data (dict)
+  # @return Data with the header
+  #
+  # @endif
+  #
+  def compressData(self, cdr_data, cache=None):
+    key = (self._marshalingType, self._endian) + self._codec.key()
+    if cache is not None and key in cache:
+      data = cache[key]
+      self._metrics.onCompress(len(cdr_data), len(data))
+      return data
+
+    start = OpenRTM_aist.CompressionCodec.cpuTime()
+    data = self._codec.compress(cdr_data)
+    self._metrics.onCompress(len(cdr_data), len(data),
+                             OpenRTM_aist.CompressionCodec.cpuTime() - start)
+    if cache is not None:
+      cache[key] = data
+    return data
+
+
+  ##
+  # @if jp
+  # @brief ե졼ࡦʬե졼ؤ沽
+  #
+  # ޡ󥰤줿ǡ delta.* ˽äƥե졼
+  # ޤϺʬե졼沽롣ե졼ϥͥȤ˰ۤʤ
+  # ᡢåϻѤʤ
+  #
+  # @param self
+  # @param cdr_data ޡ󥰤줿ǡ
+  # @return ե졼
+  #
+  # @else
+  # @brief Encoding into a key frame or a delta frame
+  #
+  # This operation encodes marshaled data into a key frame or a delta
+  # frame according to the delta.* settings. Since the frames differ
+  # among connectors, the cache is not used.
+  #
+  # @param self
+  # @param cdr_data Marshaled data
+  # @return Frame
+  #
+  # @endif
+  #
+  def encodeDelta(self, cdr_data):
+    key, frame = self._delta.encode(cdr_data)
+    self._metrics.onDelta(key, len(cdr_data), len(frame))
+    return frame
+
+
+  ##
+  # @if jp
+  # @brief ޡ󥰤˳ǼǡΥԡ
+  #
+  # ǡΥ֥Ȥ򥳥ԡ¤ΤΥФȥꥹȤΥФ
+  # 1ʳԡ롣tm.sec ѹꥹȤǤν񤭴ʤɡ
+  # 񤭹߸Τ褯ѹϳǼǡ˱ƶʤ
+  #
+  # @param self
+  # @param data ǡ
+  # @return ԡǡ
+  #
+  # @else
+  # @brief Copying data stored without marshaling
+  #
+  # The data object is copied, and its struct and list members are also
+  # copied by one level. The common modifications after writing, such
+  # as changing tm.sec or replacing elements of a list, do not affect
+  # the stored data.
+  #
+  # @param self
+  # @param data Data
+  # @return The copied data
+  #
+  # @endif
+  #
+  def copyData(self, data):
+    data = copy.copy(data)
+    members = getattr(data, "__dict__", None)
+    if members:
+      for key, value in members.items():
+        if isinstance(value, list):
+          members[key] = list(value)
+        elif hasattr(value, "__dict__"):
+          members[key] = copy.copy(value)
+    return data
+
+
+  def write(self, data, cache=None):
     pass
   def read(self, data):
     pass
\ No newline at end of file
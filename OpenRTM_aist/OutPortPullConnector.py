@@ -17,9 +17,6 @@
 #     All rights reserved.
 #
 
-from omniORB import cdrMarshal
-from omniORB import any
-
 import OpenRTM_aist
 import threading
 
@@ -46,6 +43,12 @@ import threading
 # OutPortPullConnector ǡɤ߽ФȤ InPort ˥ǡ
 # ž롣
 #
+# ͥץѥƥ lazy_marshal  YES ꤹȡ񤭹߻ˤ
+# ǡΥԡ Buffer ˳Ǽɤ߽Ф˽ƥޡ
+# 󥰤롣ޡ󥰤ǡƱǤƤɤ߽Ф
+# ޤݻ롣񤭹ߤ٤ɤ߽Ф⤤硢ɤ߽Фʤ
+# ǡΥޡ󥰤ά롣
+#
 # @since 1.0.0
 #
 # @else
@@ -71,6 +74,12 @@ import threading
 # By reading data from OutPortPullConnector to InPortPullConnector,
 # data transfer is realized.
 #
+# If the connector property lazy_marshal is YES, a shallow copy of the
+# data is stored in the buffer when written, and it is marshaled when
+# read for the first time. The marshaled data is kept in case the same
+# element is read again. If data is written more often than read, the
+# data never read is not marshaled.
+#
 # @since 1.0.0
 #
 # @endif
@@ -150,6 +159,9 @@ class OutPortPullConnector(OpenRTM_aist.OutPortConnector):
     if OpenRTM_aist.toBool(info.properties.getProperty("sync_readwrite"),"YES","NO",False):
       self._sync_readwrite = True
 
+    self._lazyMarshal = OpenRTM_aist.toBool(info.properties.getProperty("lazy_marshal"),
+                                            "YES", "NO", False)
+
     self._writecompleted_worker = OutPortPullConnector.WorkerThreadCtrl()
     self._readcompleted_worker = OutPortPullConnector.WorkerThreadCtrl()
     self._readready_worker = OutPortPullConnector.WorkerThreadCtrl()
@@ -182,6 +194,11 @@ class OutPortPullConnector(OpenRTM_aist.OutPortConnector):
   #
   # PublisherФƥǡ񤭹ߡˤбInPort
   # ǡž롣
+  # cache Ϳ줿硢Ʊ OutPort ¾Υͥޡ
+  # ѤߤΥǡѤ롣
+  #
+  # @param data 񤭹ǡ
+  # @param cache ޡ󥰺ѤߥǡΥå
   #
   # @else
   #
@@ -189,17 +206,25 @@ class OutPortPullConnector(OpenRTM_aist.OutPortConnector):
   #
   # This operation writes data into publisher and then the data
   # will be transferred to correspondent InPort.
+  # If a cache is given, data already marshaled by other connectors
+  # of the same OutPort is reused.
+  #
+  # @param data Data to be written
+  # @param cache Cache of marshaled data
   #
   # @endif
   #
   # virtual ReturnCode write(const cdrMemoryStream& data);
-  def write(self, data):
+  def write(self, data, cache=None):
     if self._directMode:
       return self.PORT_OK
     # data -> (conversion) -> CDR stream
     cdr_data = None
     if self._endian is not None:
-      cdr_data = cdrMarshal(any.to_any(data).typecode(), data, self._endian)
+      if self._lazyMarshal:
+        cdr_data = OutPortPullConnector.LazyData(self.copyData(data))
+      else:
+        cdr_data = self.serializeData(data, cache)
     else:
       self._rtcout.RTC_ERROR("write(): endian %s is not support.",self._endian)
       return self.UNKNOWN_ERROR
@@ -251,6 +276,8 @@ class OutPortPullConnector(OpenRTM_aist.OutPortConnector):
       
       
     ret = self._buffer.read(data)
+    if isinstance(data[0], OutPortPullConnector.LazyData):
+      data[0] = self.marshalLazyData(data[0])
 
     if self._sync_readwrite:
       self._readcompleted_worker._completed = True
@@ -294,6 +321,8 @@ class OutPortPullConnector(OpenRTM_aist.OutPortConnector):
       OpenRTM_aist.CdrBufferFactory.instance().deleteObject(self._buffer)
     self._buffer = 0
 
+    # delete serializer
+    self.unbindMarshaler()
 
 
     return self.PORT_OK
@@ -402,7 +431,50 @@ class OutPortPullConnector(OpenRTM_aist.OutPortConnector):
   # void onDisconnect()
   def setDirectMode(self):
     self._directMode = True
-  
+
+
+  ##
+  # @if jp
+  # @brief ٱޡ󥰤ǡΥޡ
+  #
+  # ϥޡ󥰤Ʒ̤ݻʹߤݻǡ֤
+  #
+  # @param self
+  # @param lazy LazyData
+  # @return CDR ǡ
+  #
+  # @else
+  # @brief Marshaling the data to be marshaled lazily
+  #
+  # The data is marshaled at the first time and the result is kept and
+  # returned afterwards.
+  #
+  # @param self
+  # @param lazy LazyData
+  # @return CDR data
+  #
+  # @endif
+  #
+  def marshalLazyData(self, lazy):
+    if lazy.cdr is None:
+      lazy.cdr = self.serializeData(lazy.data)
+    return lazy.cdr
+
+
+  ##
+  # @if jp
+  # @class LazyData
+  # @brief ޡΥǡȥޡ󥰺ѤߤΥǡݻ
+  # @else
+  # @class LazyData
+  # @brief Holds data before marshaling and the marshaled data
+  # @endif
+  #
+  class LazyData:
+    def __init__(self, data):
+      self.data = data
+      self.cdr = None
+
   class WorkerThreadCtrl:
     def __init__(self):
       self._mutex = threading.RLock()
@@ -17,9 +17,6 @@
 #     All rights reserved.
 #
 
-from omniORB import cdrMarshal
-from omniORB import any
-
 import OpenRTM_aist
 
 
@@ -46,6 +43,15 @@ import OpenRTM_aist
 # ˽äƥǡ Buffer  InPortConsumer Ф
 # push 뤳Ȥ InPort ˥ǡž롣
 #
+# 쥯³Ǥ̾ǡ InPort ľܽ񤭹ޤ졢InPort 
+# ɤ߽Ф˼Υǡ񤭹ޤȼ롣ͥץѥƥ
+# direct.queue  YES ꤹȡǡΥ֥Ȥޡ
+#  Publisher  Buffer ͳ뤿ᡢpush_policy
+# ХåեĹХåեΥꥹʤͭˤʤ롣񤭹߸˥ǡѹ
+# Ƥ⥭塼ΥǡѤʤ褦ˡdirect.copy  shallow
+# (ǥե)ξϥǡԡ롣񤭹ǡ
+# ѹʤ none ꤹȥԡάǤ롣
+#
 # @since 1.0.0
 #
 # @else
@@ -75,6 +81,16 @@ import OpenRTM_aist
 # policy and it is transferred to InPort by pushing it into the
 # InPortConsumer.
 #
+# The direct connection usually writes data into the InPort directly,
+# and the data is lost if the next data is written before the InPort
+# reads it. If the connector property direct.queue is YES, the data
+# objects are sent through the publisher and the buffer without
+# marshaling, so push_policy, the buffer length and the buffer
+# listeners take effect. So that the data in the queue does not change
+# when the data is modified after writing, a shallow copy of the data
+# is sent if direct.copy is shallow (default). The copy is omitted
+# with none if the written data is not modified.
+#
 # @endif
 #
 class OutPortPushConnector(OpenRTM_aist.OutPortConnector):
@@ -134,6 +150,9 @@ class OutPortPushConnector(OpenRTM_aist.OutPortConnector):
 
     self._directInPort = None
     self._inPortListeners = None
+    self._directQueue = OpenRTM_aist.isDirectQueueEnabled(info.properties)
+    self._directCopy = OpenRTM_aist.normalize(
+      [info.properties.getProperty("direct.copy", "shallow")]) != "none"
 
     # publisher/buffer creation. This may throw std::bad_alloc;
     self._publisher = self.createPublisher(info)
@@ -146,6 +165,10 @@ class OutPortPushConnector(OpenRTM_aist.OutPortConnector):
 
     if self._publisher.init(info.properties) != self.PORT_OK:
       raise
+
+    if OpenRTM_aist.isDeltaEnabled(info.properties) and \
+          not OpenRTM_aist.isDeltaReliable(info.properties):
+      self._rtcout.RTC_WARN("the publisher may drop key frames, all frames are sent as key frames.")
         
     if self._profile.properties.hasKey("serializer"):
       endian = self._profile.properties.getProperty("serializer.cdr.endian")
@@ -167,9 +190,14 @@ class OutPortPushConnector(OpenRTM_aist.OutPortConnector):
 
     self._buffer.init(info.properties.getNode("buffer"))
     self._consumer.init(info.properties)
+    if hasattr(self._consumer, "setListener"):
+      # consumers reporting the results of the destination asynchronously
+      self._consumer.setListener(self._profile, self._listeners)
+      self._consumer.setMetrics(self._metrics)
     self._publisher.setConsumer(self._consumer)
     self._publisher.setBuffer(self._buffer)
     self._publisher.setListener(self._profile, self._listeners)
+    self._publisher.setMetrics(self._metrics)
 
     self.onConnect()
     return
@@ -202,6 +230,11 @@ class OutPortPushConnector(OpenRTM_aist.OutPortConnector):
   # 硢顼ͤȤơCONNECTION_LOST, BUFFER_FULL,
   # BUFFER_ERROR, PORT_ERROR, BUFFER_TIMEOUT, PRECONDITION_NO_MET 
   # ֤롣
+  # cache Ϳ줿硢Ʊ OutPort ¾Υͥޡ
+  # ѤߤΥǡѤ롣
+  #
+  # @param data 񤭹ǡ
+  # @param cache ޡ󥰺ѤߥǡΥå
   #
   # @return PORT_OK              ｪλ
   #         CONNECTION_LOST      ³Ȥ
@@ -221,6 +254,11 @@ class OutPortPushConnector(OpenRTM_aist.OutPortConnector):
   # normal return, CONNECTION_LOST, BUFFER_FULL, BUFFER_ERROR,
   # PORT_ERROR, BUFFER_TIMEOUT and PRECONDITION_NO_MET will be
   # returned as error codes.
+  # If a cache is given, data already marshaled by other connectors
+  # of the same OutPort is reused.
+  #
+  # @param data Data to be written
+  # @param cache Cache of marshaled data
   #  
   # @return PORT_OK              Normal return
   #         CONNECTION_LOST      Connectin lost
@@ -234,9 +272,14 @@ class OutPortPushConnector(OpenRTM_aist.OutPortConnector):
   #
   # template<class DataType>
   # virtual ReturnCode write(const DataType& data);
-  def write(self, data):
+  def write(self, data, cache=None):
     self._rtcout.RTC_TRACE("write()")
 
+    if self._directInPort is not None and self._directQueue:
+      if self._directCopy:
+        data = self.copyData(data)
+      return self._publisher.write(data, -1, 0)
+
     if self._directInPort is not None:
       if self._directInPort.isNew():
         #self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_BUFFER_OVERWRITE].notify(self._profile, data)
@@ -259,12 +302,27 @@ class OutPortPushConnector(OpenRTM_aist.OutPortConnector):
     # data -> (conversion) -> CDR stream
     cdr_data = None
     if self._endian is not None:
-      cdr_data = cdrMarshal(any.to_any(data).typecode(), data, self._endian)
+      cdr_data = self.serializeData(data, cache)
+      if self._delta is not None:
+        if self._buffer.full():
+          # the oldest data, which may be the key frame, is overwritten
+          self._delta.forceKeyFrame()
+        frame = self.encodeDelta(cdr_data)
+        if self._codec is not None:
+          frame = self.compressData(frame)
+        # the listeners get the data without decoding the frame
+        cdr_data = OpenRTM_aist.DeltaFrame(frame, cdr_data)
+      elif self._codec is not None:
+        cdr_data = self.compressData(cdr_data, cache)
     else:
       self._rtcout.RTC_ERROR("write(): endian %s is not support.",self._endian)
       return self.UNKNOWN_ERROR
 
-    return self._publisher.write(cdr_data, -1, 0)
+    ret = self._publisher.write(cdr_data, -1, 0)
+    if ret != self.PORT_OK and self._delta is not None:
+      # the receiver may have missed the key frame
+      self._delta.forceKeyFrame()
+    return ret
 
 
   ##
@@ -309,6 +367,9 @@ class OutPortPushConnector(OpenRTM_aist.OutPortConnector):
       bfactory.deleteObject(self._buffer)
 
     self._buffer = None
+
+    # delete serializer
+    self.unbindMarshaler()
     self._rtcout.RTC_TRACE("disconnect() done")
 
     return self.PORT_OK
@@ -479,4 +540,7 @@ class OutPortPushConnector(OpenRTM_aist.OutPortConnector):
       return False
     self._directInPort = directInPort
     self._inPortListeners = self._directInPort._listeners
-    return True
\ No newline at end of file
+    if self._directQueue:
+      self._consumer.setInPort(directInPort, self._profile.id)
+    return True
+
@@ -76,6 +76,13 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
 
     self._cpu = []
 
+    self._absolute = False
+    self._overrunPolicy = "skip"
+    self._deadline = None
+    self._overruns = 0
+    self._missedCycles = 0
+    self._catchupLimit = 10
+
     return
 
   ##
@@ -124,6 +131,7 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
   def init(self, props):
     OpenRTM_aist.ExecutionContextBase.init(self, props)
     self.setCpuAffinity(props)
+    self.setSchedulingMode(props)
     self._rtcout.RTC_DEBUG("init() done")
 
 
@@ -158,9 +166,15 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
       # before stopping thread.
       guard = OpenRTM_aist.ScopedLock(self._workerthread._mutex)
       while not self._workerthread._running:
+        # the phase is restarted when the worker is resumed
+        self._deadline = None
         self._workerthread._cond.wait()
       del guard
 
+      if self._absolute:
+        self.svcAbsolute()
+        continue
+
       t0_ = OpenRTM_aist.Time()
       OpenRTM_aist.ExecutionContextBase.invokeWorkerDo(self)
       OpenRTM_aist.ExecutionContextBase.invokeWorkerPostDo(self)
@@ -194,6 +208,163 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
     return 0
 
 
+  ##
+  # @if jp
+  # @brief л⡼ɤ1ʬν
+  #
+  # ñĴû׾μμγϻ(ǥåɥ饤)ݻλ
+  # ޤԵ롣νλ狼ǤϤʤǥåɥ饤󤫤鼡
+  # ǥåɥ饤뤿ᡢinvokeWorkerPreDo()å
+  # פ֤ˤäƼ뤳ȤϤʤ
+  #
+  # @param self
+  #
+  # @else
+  # @brief The procedure of one cycle in the absolute mode
+  #
+  # This keeps the start time of the next cycle (deadline) on the
+  # monotonic clock and waits until the time. Since the next deadline
+  # is calculated from the deadline instead of the end of the cycle,
+  # the time spent in invokeWorkerPreDo(), locks, logging, etc. does
+  # not make the rate drift.
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def svcAbsolute(self):
+    period_ = self.getPeriod().toDouble()
+    if self._deadline is None:
+      self._deadline = OpenRTM_aist.TimerScheduler.now()
+
+    OpenRTM_aist.ExecutionContextBase.invokeWorkerDo(self)
+    OpenRTM_aist.ExecutionContextBase.invokeWorkerPostDo(self)
+
+    now_ = OpenRTM_aist.TimerScheduler.now()
+    self._deadline = self.nextDeadline(self._deadline, now_, period_)
+
+    if not self._nowait and self._deadline > now_:
+      time.sleep(self._deadline - now_)
+    return
+
+
+  ##
+  # @if jp
+  # @brief Υǥåɥ饤η׻
+  #
+  # ߤμΥǥåɥ饤˼äΤ򼡤Υǥåɥ饤
+  # 롣Υǥåɥ饤ĶᤷϥСȤ
+  # Ͽoverrun_policy ˽äƼΥǥåɥ饤롣
+  #
+  # - skip: ƨФΰǼμ򳫻Ϥ롣
+  # - catchup: ƨԵ³Ƽ¹Ԥ롣ƨ
+  #            catchup_limit Ķ skip ƱͤФ
+  #            碌ľ
+  # - shift: ľ˼μ򳫻Ϥʹߤΰ򸽺߻ˤ餹
+  #
+  # @param self
+  # @param deadline ߤμΥǥåɥ饤 [sec]
+  # @param now ߻ [sec]
+  # @param period  [sec]
+  # @return Υǥåɥ饤 [sec]
+  #
+  # @else
+  # @brief Calculating the next deadline
+  #
+  # The next deadline is the deadline of the current cycle plus the
+  # period. If the execution overruns the next deadline, the overrun
+  # is recorded and the next deadline is determined according to
+  # overrun_policy.
+  #
+  # - skip: The missed cycles are skipped and the next cycle starts
+  #         in the original phase.
+  # - catchup: The missed cycles are executed back to back without
+  #            waiting. If more than catchup_limit cycles are missed,
+  #            they are skipped like skip to resynchronize the phase.
+  # - shift: The next cycle starts immediately and the following
+  #          phase is shifted to the current time.
+  #
+  # @param self
+  # @param deadline The deadline of the current cycle [sec]
+  # @param now The current time [sec]
+  # @param period The period [sec]
+  # @return The next deadline [sec]
+  #
+  # @endif
+  #
+  def nextDeadline(self, deadline, now, period):
+    next_ = deadline + period
+    if now <= next_:
+      return next_
+
+    self._overruns += 1
+    if period <= 0.0:
+      return now
+
+    missed_ = int((now - next_) / period) + 1
+    self._rtcout.RTC_DEBUG("Overrun: %f [s] late, %d cycles missed (%s)",
+                           (now - next_, missed_, self._overrunPolicy))
+
+    if self._overrunPolicy == "catchup":
+      if missed_ <= self._catchupLimit:
+        return next_
+      self._rtcout.RTC_WARN("%d cycles missed. The phase is resynchronized.",
+                            missed_)
+    elif self._overrunPolicy == "shift":
+      return now
+
+    self._missedCycles += missed_
+    return next_ + missed_ * period
+
+
+  ##
+  # @if jp
+  # @brief Сμ
+  #
+  # л⡼ɤǽǥåɥ饤Ķᤷ롣
+  #
+  # @param self
+  # @return С
+  #
+  # @else
+  # @brief Getting the number of overruns
+  #
+  # This operation returns the number of times that the execution
+  # overran the deadline in the absolute mode.
+  #
+  # @param self
+  # @return The number of overruns
+  #
+  # @endif
+  #
+  def getOverrunCount(self):
+    return self._overruns
+
+
+  ##
+  # @if jp
+  # @brief Фμ
+  #
+  # overrun_policy  skip ξ˼¹Ԥʤäο롣
+  #
+  # @param self
+  # @return Ф
+  #
+  # @else
+  # @brief Getting the number of skipped cycles
+  #
+  # This operation returns the number of cycles which were not
+  # executed when overrun_policy is skip.
+  #
+  # @param self
+  # @return The number of skipped cycles
+  #
+  # @endif
+  #
+  def getMissedCycleCount(self):
+    return self._missedCycles
+
+
   ##
   # @if jp
   # @brief ExecutionContextѥƥӥƥåɤ
@@ -763,6 +934,69 @@ class PeriodicExecutionContext(OpenRTM_aist.ExecutionContextBase,
     return self._svc
 
 
+  ##
+  # @if jp
+  # @brief 塼󥰥⡼ɤ
+  #
+  # ʲΥץѥƥɤ߹ࡣ
+  #
+  # - scheduling_mode: relative(ǥե) ޤ absolute
+  # - overrun_policy: skip(ǥե)catchup ޤ shift
+  # - catchup_limit: catchup ³Ƽ¹Ԥξ(ǥե: 10)
+  #
+  # relative Ǥϼ¹Ի֤֤Ե롣absolute
+  # ǤñĴû׾Υǥåɥ饤ޤԵ롣
+  #
+  # @param self
+  # @param props ץѥƥ
+  #
+  # @else
+  # @brief Setting the scheduling mode
+  #
+  # The following properties are read.
+  #
+  # - scheduling_mode: relative (default) or absolute
+  # - overrun_policy: skip (default), catchup or shift
+  # - catchup_limit: The maximum number of cycles executed back to back
+  #                  by catchup (default: 10)
+  #
+  # In relative mode, the thread sleeps the period minus the execution
+  # time. In absolute mode, it sleeps until the deadline on the
+  # monotonic clock.
+  #
+  # @param self
+  # @param props The properties
+  #
+  # @endif
+  #
+  def setSchedulingMode(self, props):
+    self._rtcout.RTC_TRACE("setSchedulingMode()")
+
+    mode_ = OpenRTM_aist.normalize([props.getProperty("scheduling_mode",
+                                                      "relative")])
+    self._absolute = (mode_ == "absolute")
+
+    policy_ = OpenRTM_aist.normalize([props.getProperty("overrun_policy",
+                                                        "skip")])
+    if policy_ in ["skip", "catchup", "shift"]:
+      self._overrunPolicy = policy_
+    else:
+      self._rtcout.RTC_WARN("Invalid overrun_policy: %s. skip is used.",
+                            policy_)
+      self._overrunPolicy = "skip"
+
+    limit_ = [10]
+    if not OpenRTM_aist.stringTo(limit_, props.getProperty("catchup_limit",
+                                                           "10")):
+      self._rtcout.RTC_WARN("Invalid catchup_limit. 10 is used.")
+      limit_ = [10]
+    self._catchupLimit = limit_[0]
+
+    self._rtcout.RTC_DEBUG("Scheduling mode: %s, overrun policy: %s",
+                           (mode_, self._overrunPolicy))
+    return
+
+
   def setCpuAffinity(self, props):
     self._rtcout.RTC_TRACE("setCpuAffinity()")
     
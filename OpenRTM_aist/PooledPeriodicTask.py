@@ -0,0 +1,518 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  PooledPeriodicTask.py
+# @brief PooledPeriodicTask class
+# @date  $Date$
+#
+
+
+
+import collections
+import multiprocessing
+import threading
+
+import OpenRTM_aist
+
+
+##
+# @if jp
+# @class PeriodicTaskPool
+# @brief Υåɥס
+#
+# Υåɤ PooledPeriodicTask ¹Ԥ륯饹
+# ¹Բǽˤʤäϼ¹ԥ塼졢Ƥ
+# ˼ФƼ¹Ԥ롣¹ԤΥϼμ¹Ի
+# TimerScheduler Ͽλˤʤȼ¹ԥ塼롣
+# ϥǥեȤǤ CPU ΥǤ롣
+#
+# @else
+# @class PeriodicTaskPool
+# @brief The worker thread pool of periodic tasks
+#
+# This class executes PooledPeriodicTask with a fixed number of
+# worker threads. The tasks which become ready are put into the run
+# queue, and idle workers take them out in order and execute
+# them. The next execution time of the periodic tasks is registered
+# to TimerScheduler, and they are put into the run queue at that
+# time. The number of workers is the number of CPU cores by default.
+#
+# @endif
+#
+class PeriodicTaskPool:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # åɤư롣
+  #
+  # @param self
+  # @param nthreads (0 ʲξ CPU Υ)
+  #
+  # @else
+  # @brief Constructor
+  #
+  # This starts the worker threads.
+  #
+  # @param self
+  # @param nthreads The number of workers (the number of CPU cores
+  #                 if it is 0 or less)
+  #
+  # @endif
+  #
+  def __init__(self, nthreads=0):
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("PeriodicTaskPool")
+    if nthreads <= 0:
+      try:
+        nthreads = multiprocessing.cpu_count()
+      except NotImplementedError:
+        nthreads = 1
+
+    self._cond = threading.Condition(threading.Lock())
+    self._runq = collections.deque()
+    self._workers = []
+    for i in range(nthreads):
+      worker = threading.Thread(target=self.svc)
+      worker.daemon = True
+      self._workers.append(worker)
+      worker.start()
+    self._rtcout.RTC_DEBUG("%d workers started.", nthreads)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 󥹥󥹼
+  #
+  # ץǶͭ PeriodicTaskPool 롣
+  #
+  # @return PeriodicTaskPool
+  #
+  # @else
+  # @brief Getting the instance
+  #
+  # This operation returns PeriodicTaskPool shared in the process.
+  #
+  # @return PeriodicTaskPool
+  #
+  # @endif
+  #
+  def instance():
+    global periodictaskpool
+
+    guard = OpenRTM_aist.ScopedLock(pool_mutex)
+    if periodictaskpool is None:
+      periodictaskpool = PeriodicTaskPool()
+    return periodictaskpool
+
+  instance = staticmethod(instance)
+
+
+  ##
+  # @if jp
+  # @brief μ
+  # @else
+  # @brief Getting the number of workers
+  # @endif
+  #
+  def size(self):
+    return len(self._workers)
+
+
+  ##
+  # @if jp
+  # @brief ¹ԥ塼
+  #
+  # @param self
+  # @param task 
+  # @param generation 
+  #
+  # @else
+  # @brief Putting a task into the run queue
+  #
+  # @param self
+  # @param task The task
+  # @param generation The generation of the task
+  #
+  # @endif
+  #
+  def enqueue(self, task, generation):
+    self._cond.acquire()
+    self._runq.append((task, generation))
+    self._cond.notify()
+    self._cond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief μ¹Իͽ
+  #
+  # @param self
+  # @param task 
+  # @param generation 
+  # @param deadline ¹Ի(TimerScheduler.now() ˤл) [sec]
+  #
+  # @else
+  # @brief Scheduling the execution time of a task
+  #
+  # @param self
+  # @param task The task
+  # @param generation The generation of the task
+  # @param deadline The execution time (absolute time of
+  #                 TimerScheduler.now()) [sec]
+  #
+  # @endif
+  #
+  def schedule(self, task, generation, deadline):
+    def expire():
+      self.enqueue(task, generation)
+    OpenRTM_aist.TimerScheduler.instance().schedule(deadline, expire)
+    return
+
+
+  ##
+  # @if jp
+  # @brief åɤν
+  # @else
+  # @brief The procedure of the worker threads
+  # @endif
+  #
+  def svc(self):
+    while True:
+      self._cond.acquire()
+      try:
+        while not self._runq:
+          self._cond.wait()
+        task, generation = self._runq.popleft()
+      finally:
+        self._cond.release()
+
+      try:
+        task.run(generation)
+      except:
+        self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
+
+    return
+
+
+periodictaskpool = None
+pool_mutex = threading.RLock()
+
+
+
+##
+# @if jp
+# @class PooledPeriodicTask
+# @brief åɥסǼ¹Ԥ
+#
+# PeriodicTask Ʊ󥿡եĤȤ˥åɤ
+# ץǶͭ PeriodicTaskPool ΥǼ¹
+# 롣ƱʣΥƱ˼¹Ԥ뤳ȤϤʤ
+# ¹ signal() 줿ϼ¹Խλ˺ټ¹Ԥ뤿ᡢ
+# Ȥμ¹Խݤ롣
+#
+# PeriodicTaskFactory  "pool" ȤϿ졢ѥ֥å
+# thread_type  pool ꤹȻѤ롣
+#
+# @else
+# @class PooledPeriodicTask
+# @brief The periodic task executed by the worker thread pool
+#
+# This has the same interface as PeriodicTask, but no thread is
+# created for each task, and it is executed by the workers of
+# PeriodicTaskPool shared in the process. The same task is never
+# executed by multiple workers at the same time, and if signal() is
+# called during the execution the task is executed again after it,
+# so the order of the executions is kept for each task.
+#
+# This is registered to PeriodicTaskFactory as "pool", and is used
+# if thread_type of the publisher is pool.
+#
+# @endif
+#
+class PooledPeriodicTask(OpenRTM_aist.PeriodicTask):
+  """
+  """
+
+  IDLE    = 0
+  QUEUED  = 1
+  WAITING = 2
+  RUNNING = 3
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  # @else
+  # @brief Constructor
+  # @endif
+  #
+  def __init__(self):
+    OpenRTM_aist.PeriodicTask.__init__(self)
+    self._pool       = PeriodicTaskPool.instance()
+    self._stateCond  = threading.Condition(threading.RLock())
+    self._state      = self.IDLE
+    self._generation = 0
+    self._pending    = False
+    self._worker     = None
+    self._deadline   = None
+    return
+
+
+  ##
+  # @if jp
+  # @brief μ¹Ԥ򳫻Ϥ
+  # @else
+  # @brief Starting the execution of the task
+  # @endif
+  #
+  def activate(self):
+    guard = OpenRTM_aist.ScopedLock(self._alive.mutex)
+    if not self._func:
+      return
+
+    if self._alive.value:
+      return
+
+    self._alive.value = True
+    self._stateCond.acquire()
+    if not self._suspend.suspend:
+      self.enqueue()
+    self._stateCond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief μ¹Ԥλ
+  #
+  # ¹ΥνλԤäƤ롣ȤƤФ줿
+  # Ԥʤ
+  #
+  # @else
+  # @brief Finalizing the execution of the task
+  #
+  # This returns after the running task ends. It does not wait if it is
+  # called from the task itself.
+  #
+  # @endif
+  #
+  def finalize(self):
+    guard = OpenRTM_aist.ScopedLock(self._alive.mutex)
+    self._alive.value = False
+
+    self._stateCond.acquire()
+    self._suspend.suspend = False
+    self._generation += 1
+    self._pending = False
+    if self._state != self.RUNNING:
+      self._state = self.IDLE
+    del guard
+
+    while self._state == self.RUNNING and \
+          self._worker is not threading.currentThread():
+      self._stateCond.wait()
+    self._stateCond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ¹Ԥߤ
+  #
+  # μ¹Ԥͽäsignal() 줿¹Ԥϼäʤ
+  #
+  # @else
+  # @brief Suspending the periodic execution
+  #
+  # This cancels the reservation of the next periodic execution. The
+  # execution requested by signal() is not cancelled.
+  #
+  # @endif
+  #
+  def suspend(self):
+    self._stateCond.acquire()
+    self._suspend.suspend = True
+    if self._state == self.WAITING:
+      self._generation += 1
+      self._state = self.IDLE
+    self._stateCond.release()
+    return 0
+
+
+  ##
+  # @if jp
+  # @brief ¹ԤƳ
+  # @else
+  # @brief Resuming the periodic execution
+  # @endif
+  #
+  def resume(self):
+    self._periodTime.reset()
+    self._execTime.reset()
+    self._stateCond.acquire()
+    self._suspend.suspend = False
+    if self._alive.value and self._state == self.IDLE:
+      self.enqueue()
+    self._stateCond.release()
+    return 0
+
+
+  ##
+  # @if jp
+  # @brief 1¹Ԥ
+  #
+  # ¹ξϡ¹Խλ˺ټ¹Ԥ롣
+  #
+  # @else
+  # @brief Executing the task once
+  #
+  # If the task is running, it is executed again after the execution.
+  #
+  # @endif
+  #
+  def signal(self):
+    self._stateCond.acquire()
+    if self._alive.value:
+      if self._state == self.RUNNING:
+        self._pending = True
+      elif self._state != self.QUEUED:
+        self.enqueue()
+    self._stateCond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ¹ԽλԵ
+  #
+  # ¹ΥνλԤġȤƤФ줿Ԥʤ
+  #
+  # @else
+  # @brief Waiting for the end of the execution
+  #
+  # This waits for the end of the running task. It does not wait if
+  # it is called from the task itself.
+  #
+  # @endif
+  #
+  def wait(self):
+    self._stateCond.acquire()
+    while self._state == self.RUNNING and \
+          self._worker is not threading.currentThread():
+      self._stateCond.wait()
+    self._stateCond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ¹ԥ塼ؤϿ
+  #
+  # self._stateCond å֤ǸƤӽФ
+  #
+  # @else
+  # @brief Registering to the run queue
+  #
+  # This must be called with self._stateCond locked.
+  #
+  # @endif
+  #
+  def enqueue(self):
+    self._generation += 1
+    self._state = self.QUEUED
+    self._deadline = None
+    self._pool.enqueue(self, self._generation)
+    return
+
+
+  ##
+  # @if jp
+  # @brief μ¹
+  #
+  # åɤƤӽФ롣夬פʤϡ
+  # 줿¹ԤȤƲ⤷ʤ¹ԸˡαƤ signal()
+  # ¹Ԥξ֤˱Ƽμ¹ԤϿ롣¹Ԥμμ¹
+  # μ¹ͽ˼äлȤ¹Ԥ٤
+  # μ¹Ի᤮ƤϤμФ
+  #
+  # @param self
+  # @param generation ϿΥ
+  #
+  # @else
+  # @brief Executing the task
+  #
+  # This is called from the worker threads. If the generation does
+  # not match, it does nothing as the cancelled execution. After the
+  # execution, the next execution is registered according to the
+  # pending signal() and the state of the periodic execution. The next
+  # time of the periodic execution is the absolute time of the last
+  # scheduled time plus the period, and if the execution is delayed
+  # and the next time has also passed, that cycle is skipped.
+  #
+  # @param self
+  # @param generation The generation of the task when it was registered
+  #
+  # @endif
+  #
+  def run(self, generation):
+    self._stateCond.acquire()
+    if generation != self._generation or not self._alive.value:
+      self._stateCond.release()
+      return
+    self._state = self.RUNNING
+    self._worker = threading.currentThread()
+    self._stateCond.release()
+
+    start = OpenRTM_aist.TimerScheduler.now()
+    if self._periodMeasure:
+      self._periodTime.tack()
+      self._periodTime.tick()
+
+    if self._execMeasure:
+      self._execTime.tick()
+
+    try:
+      self._func()
+    finally:
+      if self._execMeasure:
+        self._execTime.tack()
+
+      self.updateExecStat()
+      self.updatePeriodStat()
+
+      self._stateCond.acquire()
+      self._worker = None
+      self._state = self.IDLE
+      if self._alive.value:
+        if self._pending:
+          self._pending = False
+          self.enqueue()
+        elif not self._suspend.suspend:
+          if self._nowait:
+            self.enqueue()
+          else:
+            period = self._period.toDouble()
+            if self._deadline is None:
+              self._deadline = start
+            self._deadline += period
+            now = OpenRTM_aist.TimerScheduler.now()
+            if self._deadline <= now:
+              self._deadline = now + period
+            self._generation += 1
+            self._state = self.WAITING
+            self._pool.schedule(self, self._generation, self._deadline)
+      self._stateCond.notifyAll()
+      self._stateCond.release()
+    return
+
+
+
+def PooledPeriodicTaskInit():
+  OpenRTM_aist.PeriodicTaskFactory.instance().addFactory("pool",
+                                                         OpenRTM_aist.PooledPeriodicTask,
+                                                         OpenRTM_aist.Delete)
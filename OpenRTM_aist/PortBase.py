@@ -17,6 +17,8 @@
 
 import threading
 import copy
+import socket
+import uuid
 
 import OpenRTM_aist
 import OpenRTM_aist.CORBA_RTCUtil
@@ -264,6 +266,7 @@ class PortBase(RTC__POA.PortService):
     self._rtcout.RTC_TRACE("get_port_profile()")
 
     self.updateConnectors()
+    self.updateConnectorMetrics()
 
     guard = OpenRTM_aist.ScopedLock(self._profile_mutex)
 
@@ -352,6 +355,7 @@ class PortBase(RTC__POA.PortService):
     self._rtcout.RTC_TRACE("get_connector_profiles()")
 
     self.updateConnectors()
+    self.updateConnectorMetrics()
 
     guard = OpenRTM_aist.ScopedLock(self._profile_mutex)
     return self._profile.connector_profiles
@@ -387,6 +391,7 @@ class PortBase(RTC__POA.PortService):
     self._rtcout.RTC_TRACE("get_connector_profile(%s)", connector_id)
 
     self.updateConnectors()
+    self.updateConnectorMetrics()
 
     guard = OpenRTM_aist.ScopedLock(self._profile_mutex)
     index = OpenRTM_aist.CORBA_SeqUtil.find(self._profile.connector_profiles,
@@ -575,11 +580,21 @@ class PortBase(RTC__POA.PortService):
       del guard
 
 
+    self.negotiateCompression(connector_profile)
+    # the properties before the upgrade, kept apart from the NVs
+    # published during a failed attempt
+    properties = [copy.copy(nv) for nv in connector_profile.properties]
+    upgraded = self.upgradeInterfaceType(connector_profile)
+
     try:
       retval,connector_profile = connector_profile.ports[0].notify_connect(connector_profile)
       if retval != RTC.RTC_OK:
         self._rtcout.RTC_ERROR("Connection failed. cleanup.")
         self.disconnect(connector_profile.connector_id)
+        if upgraded:
+          self._rtcout.RTC_WARN("Retrying with the requested interface_type.")
+          self.restoreInterfaceType(connector_profile, properties)
+          return self.connect(connector_profile)
     
       return (retval, connector_profile)
       #return connector_profile.ports[0].notify_connect(connector_profile)
@@ -728,6 +743,7 @@ class PortBase(RTC__POA.PortService):
     retval = [RTC.RTC_OK for i in range(3)]
 
     self.onNotifyConnect(self.getName(),connector_profile)
+    self.negotiateCompression(connector_profile)
     retval[0] = self.publishInterfaces(connector_profile)
     if retval[0] != RTC.RTC_OK:
       self._rtcout.RTC_ERROR("publishInterfaces() in notify_connect() failed.")
@@ -1908,6 +1924,289 @@ class PortBase(RTC__POA.PortService):
     assert(connector_profile.connector_id != "")
 
 
+  ##
+  # @if jp
+  #
+  # @brief ǡΰ̷Ĥ
+  #
+  # ConnectorProfile  dataport.compression.type ˻ꤵ줿̷
+  # Τ³ƤΥݡȤ PortProfile 
+  # dataport.compression.available ǸƤĤ
+  # Ƥʤݡ(C++ ŤСΥݡ) none Τߤ
+  # бΤȤ롣̤ƤΥݡȤξ󤫤ޤ뤿ᡢ
+  # connect() ȳƥݡȤ notify_connect() ΤɤǸƤФƤƱ
+  # ʤꡢξüΥͥƱѤ롣ѤǤʤ
+  #  none ˤʤꡢǡϰ̤ʤ
+  #
+  # @param self
+  # @param connector_profile ConnectorProfile
+  #
+  # @else
+  #
+  # @brief Negotiate the compression type of data
+  #
+  # This operation keeps only the candidates of the compression type
+  # specified by dataport.compression.type of the ConnectorProfile
+  # which all the connected ports publish in
+  # dataport.compression.available of their PortProfiles. A port which
+  # publishes nothing (a C++ or older port) is regarded as supporting
+  # only none. Since the result depends only on the information of all
+  # the ports, it is the same whether this is called in connect() or in
+  # notify_connect() of any port, and the connectors of both ends use
+  # the same type. If no type is usable, it becomes none and data is
+  # not compressed.
+  #
+  # @param self
+  # @param connector_profile ConnectorProfile
+  #
+  # @endif
+  #
+  def negotiateCompression(self, connector_profile):
+    index = OpenRTM_aist.NVUtil.find_index(connector_profile.properties,
+                                           "dataport.compression.type")
+    if index < 0:
+      return
+
+    value = OpenRTM_aist.NVUtil.toString(connector_profile.properties,
+                                         "dataport.compression.type")
+    types = value
+    for port in connector_profile.ports:
+      if port._is_equivalent(self._objref):
+        properties = self._profile.properties
+      else:
+        try:
+          properties = port.get_port_profile().properties
+        except:
+          self._rtcout.RTC_WARN(OpenRTM_aist.Logger.print_exception())
+          properties = []
+      types = OpenRTM_aist.negotiateCompressionType(types,
+                                                    self.compressionTypes(properties))
+    if types != value:
+      self._rtcout.RTC_DEBUG("dataport.compression.type: %s -> %s",
+                             (value, types))
+      connector_profile.properties[index] = \
+          OpenRTM_aist.NVUtil.newNV("dataport.compression.type", types)
+    return
+
+
+  ##
+  # @if jp
+  #
+  # @brief ƱץƱۥȤΥݡȴ֤Υ󥿡եѹ
+  #
+  # dataport.interface_type  corba_cdr ³ǡݡȤΥץѥƥ
+  # transport_upgrade ޤ ConnectorProfile  dataport.transport_upgrade
+  #  YES ξ硢ΥݡȤƱץˤ direct ˡƱ
+  # ۥȤˤ shared_memory  dataport.interface_type ѹ롣
+  # ξüΥݡȤѹΥ󥿡եбƤʤѹ
+  # ʤdirect ѹ硢dataport.direct.queue ꤵ
+  # ʤ YES ˤơХåեѤ corba_cdr Ʊưˤ롣
+  # ׵ᤵ줿󥿡ե dataport.transport_upgrade.requested
+  # ˵Ͽ롣
+  #
+  # ƱۥȤȽϡξüΥݡȤ PortProfile  dataport.host_id
+  # (getHostId() )פ뤫ɤǹԤ
+  #
+  # @param self
+  # @param connector_profile ConnectorProfile
+  # @return 󥿡եѹ True
+  #
+  # @else
+  #
+  # @brief Upgrade the interface type between ports in the same process
+  # or on the same host
+  #
+  # If dataport.interface_type is corba_cdr and the port property
+  # transport_upgrade or dataport.transport_upgrade of the
+  # ConnectorProfile is YES, this operation changes
+  # dataport.interface_type to direct when the peer port is in the same
+  # process, or to shared_memory when it is on the same host. The type
+  # is not changed if both ports do not support it. When changing to
+  # direct, dataport.direct.queue is set to YES unless it is specified,
+  # so that the connection buffers data as corba_cdr does. The requested
+  # interface type is recorded in dataport.transport_upgrade.requested.
+  #
+  # The peer port is regarded as on the same host if dataport.host_id
+  # (see getHostId()) of the PortProfiles of both ports match.
+  #
+  # @param self
+  # @param connector_profile ConnectorProfile
+  # @return True if the interface type is changed
+  #
+  # @endif
+  #
+  def upgradeInterfaceType(self, connector_profile):
+    prop = OpenRTM_aist.Properties()
+    OpenRTM_aist.NVUtil.copyToProperties(prop, connector_profile.properties)
+
+    default_value = OpenRTM_aist.toBool(self._properties.getProperty("transport_upgrade"),
+                                        "YES", "NO", False)
+    if not OpenRTM_aist.toBool(prop.getProperty("dataport.transport_upgrade"),
+                               "YES", "NO", default_value):
+      return False
+
+    requested = OpenRTM_aist.normalize([prop.getProperty("dataport.interface_type")])
+    if requested != "corba_cdr":
+      return False
+
+    peers = [port for port in connector_profile.ports
+             if not port._is_equivalent(self._objref)]
+    if len(peers) != 1:
+      return False
+
+    try:
+      peer_props = peers[0].get_port_profile().properties
+      if self.isSameProcess(peers[0]):
+        itype = "direct"
+      elif self.isSameHost(peer_props):
+        itype = "shared_memory"
+      else:
+        return False
+
+      if not self.supportsInterfaceType(self._profile.properties, itype) or \
+            not self.supportsInterfaceType(peer_props, itype):
+        self._rtcout.RTC_DEBUG("interface_type %s is not supported.", itype)
+        return False
+    except:
+      self._rtcout.RTC_WARN(OpenRTM_aist.Logger.print_exception())
+      return False
+
+    self._rtcout.RTC_INFO("dataport.interface_type: %s -> %s", (requested, itype))
+    prop.setProperty("dataport.interface_type", itype)
+    prop.setProperty("dataport.transport_upgrade.requested", requested)
+    if itype == "direct" and not prop.getProperty("dataport.direct.queue"):
+      prop.setProperty("dataport.direct.queue", "YES")
+    OpenRTM_aist.NVUtil.copyFromProperties(connector_profile.properties, prop)
+    return True
+
+
+  ##
+  # @if jp
+  #
+  # @brief ׵ᤵ줿󥿡ե᤹
+  #
+  # upgradeInterfaceType() ѹ󥿡եǤ³˼
+  # ˡ׵ᤵ줿󥿡ե³ľ˸ƤФ롣
+  # Ԥ³Ǹ줿󥿡եξѤʤ褦
+  # ConnectorProfile ΥץѥƥѹΤΤᤷ
+  # dataport.transport_upgrade  NO ˤơ connector_id 
+  # 롣
+  #
+  # @param self
+  # @param connector_profile ConnectorProfile
+  # @param properties upgradeInterfaceType() ΥץѥƥΥԡ
+  #
+  # @else
+  #
+  # @brief Restore the requested interface type
+  #
+  # This operation is called to connect again with the requested
+  # interface type when the connection with the type changed by
+  # upgradeInterfaceType() failed. So that the interface information
+  # published by the failed connection is not taken over, the
+  # properties of the ConnectorProfile are put back to those before the
+  # upgrade, dataport.transport_upgrade is set to NO and a new
+  # connector_id is set.
+  #
+  # @param self
+  # @param connector_profile ConnectorProfile
+  # @param properties The copy of the properties before
+  #                   upgradeInterfaceType()
+  #
+  # @endif
+  #
+  def restoreInterfaceType(self, connector_profile, properties):
+    connector_profile.properties = properties
+    prop = OpenRTM_aist.Properties()
+    OpenRTM_aist.NVUtil.copyToProperties(prop, connector_profile.properties)
+    prop.setProperty("dataport.transport_upgrade", "NO")
+    OpenRTM_aist.NVUtil.copyFromProperties(connector_profile.properties, prop)
+
+    guard = OpenRTM_aist.ScopedLock(self._profile_mutex)
+    self.setUUID(connector_profile)
+    del guard
+    return
+
+
+  ##
+  # @if jp
+  # @brief ݡȤƤ밵̷Υꥹ
+  #
+  # @param properties ݡȤ PortProfile Υץѥƥ
+  #
+  # @else
+  # @brief The list of compression types published by the port
+  #
+  # @param properties The properties of PortProfile of the port
+  #
+  # @endif
+  #
+  def compressionTypes(self, properties):
+    if OpenRTM_aist.NVUtil.find_index(properties,
+                                      "dataport.compression.available") < 0:
+      return []
+    value = OpenRTM_aist.NVUtil.toString(properties,
+                                         "dataport.compression.available")
+    return [OpenRTM_aist.normalize([t]) for t in OpenRTM_aist.split(value, ",")]
+
+
+  ##
+  # @if jp
+  # @brief ݡȤƱץˤ뤫ɤ
+  # @else
+  # @brief Whether the port is in the same process
+  # @endif
+  #
+  def isSameProcess(self, port):
+    try:
+      OpenRTM_aist.Manager.instance().getPOA().reference_to_servant(port)
+      return True
+    except:
+      return False
+
+
+  ##
+  # @if jp
+  # @brief ݡȤƱۥȤˤ뤫ɤ
+  #
+  # @param properties ΥݡȤ PortProfile Υץѥƥ
+  #
+  # @else
+  # @brief Whether the port is on the same host
+  #
+  # @param properties The properties of PortProfile of the peer port
+  #
+  # @endif
+  #
+  def isSameHost(self, properties):
+    if OpenRTM_aist.NVUtil.find_index(properties, "dataport.host_id") < 0:
+      return False
+    host_id = OpenRTM_aist.NVUtil.toString(properties, "dataport.host_id")
+    return host_id == OpenRTM_aist.NVUtil.toString(self._profile.properties,
+                                                   "dataport.host_id")
+
+
+  ##
+  # @if jp
+  # @brief ݡȤ󥿡եбƤ뤫ɤ
+  #
+  # @param properties PortProfile Υץѥƥ
+  # @param itype 󥿡ե
+  #
+  # @else
+  # @brief Whether the port supports the interface type
+  #
+  # @param properties The properties of PortProfile
+  # @param itype The interface type
+  #
+  # @endif
+  #
+  def supportsInterfaceType(self, properties, itype):
+    value = OpenRTM_aist.NVUtil.toString(properties, "dataport.interface_type")
+    types = [OpenRTM_aist.normalize([t]) for t in OpenRTM_aist.split(value, ",")]
+    return itype in types
+
+
   ##
   # @if jp
   #
@@ -2274,6 +2573,28 @@ class PortBase(RTC__POA.PortService):
     return
 
 
+  ##
+  # @if jp
+  #
+  # @brief ConnectorProfile ׾򹹿롣
+  #
+  # ConnectorProfile  properties ˥ͥ׾ꤹ롣
+  # PortBase Ǥϲ⤷ʤǡݡȤǥС饤ɤ롣
+  #
+  # @else
+  #
+  # @brief Update the metrics in ConnectorProfile.
+  #
+  # This operation sets the statistics of the connectors to the
+  # properties of ConnectorProfile. PortBase does nothing. This is
+  # overridden by the data ports.
+  #
+  # @endif
+  # void updateConnectorMetrics()
+  def updateConnectorMetrics(self):
+    pass
+
+
   ##
   # @if jp
   #
@@ -2548,3 +2869,45 @@ class PortBase(RTC__POA.PortService):
       """
       name = prof.instance_name
       return (str(self._name) == str(name)) and (self._pol == prof.polarity)
+
+
+
+_host_id = None
+
+##
+# @if jp
+# @brief ۥȤμ̻Ҥ
+#
+# ۥ̾ȥ֡ ID (/proc/sys/kernel/random/boot_idǤʤ
+#  MAC ɥ쥹)Ȥ߹碌ʸ֤ǡݡȤ
+# PortProfile  dataport.host_id ꤵ졢ƱۥȤȽ˻
+# 롣Ʊɥ쥹̤ΥۥȤ䥳ƥʤ̤뤿ᡢ
+# ͥåȥΥɥ쥹ϻѤʤ
+#
+# @return ۥȤμ̻
+#
+# @else
+# @brief Get the identifier of the host
+#
+# This returns the string combining the host name and the boot ID
+# (/proc/sys/kernel/random/boot_id, or the MAC address if it is not
+# available). It is set to dataport.host_id of PortProfile of data
+# ports and used to decide whether ports are on the same host. Network
+# addresses are not used, to tell apart the hosts and the containers
+# publishing the same address.
+#
+# @return The identifier of the host
+#
+# @endif
+#
+def getHostId():
+  global _host_id
+  if _host_id is None:
+    try:
+      f = open("/proc/sys/kernel/random/boot_id")
+      boot_id = f.read().strip()
+      f.close()
+    except IOError:
+      boot_id = "%012x" % uuid.getnode()
+    _host_id = socket.gethostname() + "/" + boot_id
+  return _host_id
@@ -108,6 +108,177 @@ class PublisherBase(OpenRTM_aist.DataPortStatus):
     pass
 
 
+  ##
+  # @if jp
+  #
+  # @brief ׾ꤹ롣
+  #
+  # ǡϩ׾Ͽ ConnectorMetrics ꤹ롣
+  # ͥݻ ConnectorMetrics  Publisher ȶͭ뤿
+  # ͥƤӽФ롣
+  #
+  # @param self
+  # @param metrics ConnectorMetrics
+  #
+  # @else
+  #
+  # @brief Set the metrics
+  #
+  # This operation sets ConnectorMetrics which records the statistics
+  # of the data path. This is invoked from the connector to share
+  # ConnectorMetrics held by the connector with the Publisher.
+  #
+  # @param self
+  # @param metrics ConnectorMetrics
+  #
+  # @endif
+  #
+  def setMetrics(self, metrics):
+    self._metrics = metrics
+    return
+
+
+  _byteBucket = None
+  _msgBucket  = None
+
+  ##
+  # @if jp
+  #
+  # @brief Ӱ¤ꤹ롣
+  #
+  # ʲΥץѥƥȡХåȤ롣0 ޤ̤
+  # ¤ʤХåȤ̤1ʬǤ롣
+  #
+  # - publisher.max_bytes_per_sec: 1äκХȿ
+  # - publisher.max_msgs_per_sec: 1äκǡ
+  #
+  # @param self
+  # @param prop 
+  #
+  # @else
+  #
+  # @brief Set the bandwidth limit
+  #
+  # This operation creates token buckets from the following
+  # properties. If 0 or not specified, there is no limit. The capacity
+  # of a bucket is one second.
+  #
+  # - publisher.max_bytes_per_sec: The maximum bytes sent per second
+  # - publisher.max_msgs_per_sec: The maximum data sent per second
+  #
+  # @param self
+  # @param prop Configuration information
+  #
+  # @endif
+  #
+  def setThrottle(self, prop):
+    self._byteBucket = None
+    self._msgBucket  = None
+
+    bps = [0.0]
+    if OpenRTM_aist.stringTo(bps, prop.getProperty("publisher.max_bytes_per_sec", "0")) \
+          and bps[0] > 0.0:
+      self._byteBucket = OpenRTM_aist.TokenBucket(bps[0])
+
+    mps = [0.0]
+    if OpenRTM_aist.stringTo(mps, prop.getProperty("publisher.max_msgs_per_sec", "0")) \
+          and mps[0] > 0.0:
+      self._msgBucket = OpenRTM_aist.TokenBucket(mps[0])
+    return
+
+
+  ##
+  # @if jp
+  #
+  # @brief Ӱ¤γǧ
+  #
+  # ǡǽǤХȡ񤷤 True ֤Ӱ
+  # Ķ False ֤ȡϾ񤷤ʤ
+  #
+  # @param self
+  # @param data ǡ
+  # @return ǽʾ True
+  #
+  # @else
+  #
+  # @brief Checking the bandwidth limit
+  #
+  # If the data can be sent, this consumes tokens and returns
+  # True. If the bandwidth limit is exceeded, this returns False
+  # without consuming tokens.
+  #
+  # @param self
+  # @param data The data to be sent
+  # @return True if the data can be sent
+  #
+  # @endif
+  #
+  def throttle(self, data):
+    if self._byteBucket is None and self._msgBucket is None:
+      return True
+
+    size = self.dataSize(data)
+    if self._byteBucket is not None and not self._byteBucket.available(size):
+      return False
+    if self._msgBucket is not None and not self._msgBucket.available(1):
+      return False
+
+    if self._byteBucket is not None:
+      self._byteBucket.consume(size)
+    if self._msgBucket is not None:
+      self._msgBucket.consume(1)
+    return True
+
+
+  ##
+  # @if jp
+  #
+  # @brief ǡǽˤʤޤǤλ
+  #
+  # @param self
+  # @param data ǡ
+  # @return ǽˤʤޤǤλ [s]
+  #
+  # @else
+  #
+  # @brief The time until the data can be sent
+  #
+  # @param self
+  # @param data The data to be sent
+  # @return The time until the data can be sent [s]
+  #
+  # @endif
+  #
+  def throttleDelay(self, data):
+    delay = 0.0
+    if self._byteBucket is not None:
+      delay = max(delay, self._byteBucket.delay(self.dataSize(data)))
+    if self._msgBucket is not None:
+      delay = max(delay, self._msgBucket.delay(1))
+    return delay
+
+
+  ##
+  # @if jp
+  #
+  # @brief Ӱ¤ѤǡΥХȿ
+  #
+  # 塼Ѥ쥯³ΥǡΥ֥Ȥ 0 Ȥ롣
+  #
+  # @else
+  #
+  # @brief The bytes of data used for the bandwidth limit
+  #
+  # The data objects of the direct connection with the queue are 0.
+  #
+  # @endif
+  #
+  def dataSize(self, data):
+    if isinstance(data, bytes):
+      return len(data)
+    return 0
+
+
     
   ##
   # @if jp
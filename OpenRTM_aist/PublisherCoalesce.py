@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  PublisherCoalesce.py
+# @brief PublisherCoalesce class
+# @date  $Date$
+#
+
+
+
+import threading
+
+import OpenRTM_aist
+
+
+##
+# @if jp
+# @class PublisherCoalesce
+# @brief PublisherCoalesce 饹
+#
+# 񤭹ޤ줿ǡ֡ĿޤϰХȿޤ
+# ХåեίᡢޤȤ Publisher졼Ȥξ
+# ǡǤ󤢤ΥСإåɤŪˤʤ뤿ᡢ
+# åɤεȥȥ󥹥ݡȤθƤӽФβ򸺤餹
+# 󥷥塼ޤ put_batch() 󶡤ϰθƤӽФ
+# 롣ꥹʤϤޤǤƱͤ˥ǡ˸ƤӽФ롣
+#
+#  PublisherNew  push_policy=all ƱǤ롣
+#
+# @else
+# @class PublisherCoalesce
+# @brief PublisherCoalesce class
+#
+# This Publisher accumulates the written data in the buffer for at
+# most a certain time, number of data or bytes and sends them
+# together. For small data at a high rate, the overhead per sending
+# dominates, so this reduces the number of wake-ups of the sending
+# thread and calls of the transport. If the consumer provides
+# put_batch(), the data are sent by one call. The listeners are
+# invoked for each data as before.
+#
+# The sending procedure is the same as push_policy=all of
+# PublisherNew.
+#
+# @endif
+#
+class PublisherCoalesce(OpenRTM_aist.PublisherNew):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # @param self
+  #
+  # @else
+  # @brief Constructor
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def __init__(self):
+    OpenRTM_aist.PublisherNew.__init__(self)
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("PublisherCoalesce")
+    self._pushPolicy   = self.PUBLISHER_POLICY_ALL
+    self._window       = 0.001
+    self._maxSamples   = 32
+    self._maxBytes     = 65536
+    self._pending      = 0
+    self._pendingBytes = 0
+    self._timer        = None
+    self._windowId     = 0
+    self._coalesceMutex = threading.RLock()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǥȥ饯
+  #
+  # @param self
+  #
+  # @else
+  # @brief Destructor
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def __del__(self):
+    guard = OpenRTM_aist.ScopedLock(self._coalesceMutex)
+    self.cancelWindow()
+    del guard
+    OpenRTM_aist.PublisherNew.__del__(self)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 
+  #
+  # ʲΥץͿ뤳ȤǤ롣PublisherNew Ʊͤ
+  # thread_typemeasurement.*publisher.max_bytes_per_sec
+  # publisher.max_msgs_per_sec Ǥ롣
+  #
+  # - publisher.coalesce.window: ǡί [s]
+  #   (ǥե: 0.001)
+  # - publisher.coalesce.max_samples: ޤȤǡκĿ
+  #   (ǥե: 32)
+  # - publisher.coalesce.max_bytes: ޤȤǡκХȿ
+  #   (ǥե: 65536)
+  #
+  # 줫ã롣Хåեդˤʤä
+  # 뤿ᡢbuffer.length  max_samples ʾˤ뤳ȡ
+  #
+  # @param self
+  # @param prop PublisherζưꤷProperty֥
+  # @return ReturnCode PORT_OK ｪλ
+  #                    INVALID_ARGS Properties ͤޤ
+  #
+  # @else
+  # @brief Initialization
+  #
+  # The following options are available. thread_type, measurement.*,
+  # publisher.max_bytes_per_sec and publisher.max_msgs_per_sec can be
+  # also given as PublisherNew.
+  #
+  # - publisher.coalesce.window: The maximum time to accumulate data
+  #   [s] (default: 0.001)
+  # - publisher.coalesce.max_samples: The maximum number of data sent
+  #   together (default: 32)
+  # - publisher.coalesce.max_bytes: The maximum bytes of data sent
+  #   together (default: 65536)
+  #
+  # The data are sent when any of them is reached. Since they are also
+  # sent when the buffer becomes full, buffer.length should be
+  # max_samples or more.
+  #
+  # @param self
+  # @param prop Property objects that includes the control information
+  #             of this Publisher
+  # @return ReturnCode PORT_OK normal return
+  #                    INVALID_ARGS Properties with invalid values.
+  #
+  # @endif
+  #
+  def init(self, prop):
+    self._rtcout.RTC_TRACE("init()")
+    cprop = prop.getNode("publisher.coalesce")
+
+    window = [self._window]
+    if OpenRTM_aist.stringTo(window, cprop.getProperty("window", "0.001")) \
+          and window[0] >= 0.0:
+      self._window = window[0]
+    else:
+      self._rtcout.RTC_ERROR("invalid window value: %s",
+                             cprop.getProperty("window"))
+
+    samples = [self._maxSamples]
+    if OpenRTM_aist.stringTo(samples, cprop.getProperty("max_samples", "32")) \
+          and samples[0] > 0:
+      self._maxSamples = samples[0]
+    else:
+      self._rtcout.RTC_ERROR("invalid max_samples value: %s",
+                             cprop.getProperty("max_samples"))
+
+    nbytes = [self._maxBytes]
+    if OpenRTM_aist.stringTo(nbytes, cprop.getProperty("max_bytes", "65536")) \
+          and nbytes[0] > 0:
+      self._maxBytes = nbytes[0]
+    else:
+      self._rtcout.RTC_ERROR("invalid max_bytes value: %s",
+                             cprop.getProperty("max_bytes"))
+
+    self._rtcout.RTC_DEBUG("window: %f [s], max_samples: %d, max_bytes: %d",
+                           (self._window, self._maxSamples, self._maxBytes))
+    self.setThrottle(prop)
+    return self.createTask(prop)
+
+
+  ##
+  # @if jp
+  # @brief ǡ񤭹
+  #
+  # ǡХåե˽񤭹ߡãåɤ
+  # 롣ǽΥǡǤ window 륿ޤꤹ롣
+  #
+  # @param self
+  # @param data 񤭹ǡ
+  # @param sec ॢȻ
+  # @param usec ॢȻ
+  # @return ReturnCode PublisherNew::write() 򻲾
+  #
+  # @else
+  # @brief Write data
+  #
+  # This writes data into the buffer and wakes up the sending thread
+  # if the condition of sending is reached. For the first data, the
+  # timer to send after the window is set.
+  #
+  # @param self
+  # @param data Data to be wrote to the buffer
+  # @param sec Timeout time in unit seconds
+  # @param usec Timeout time in unit milliseconds
+  # @return ReturnCode See PublisherNew::write()
+  #
+  # @endif
+  #
+  def write(self, data, sec, usec):
+    self._rtcout.RTC_PARANOID("write()")
+
+    if not self._consumer or not self._buffer or not self._listeners:
+      return self.PRECONDITION_NOT_MET
+
+    if self._retcode == self.CONNECTION_LOST:
+      self._rtcout.RTC_DEBUG("write(): connection lost.")
+      return self._retcode
+
+    if self._retcode == self.SEND_FULL:
+      self._rtcout.RTC_DEBUG("write(): InPort buffer is full.")
+      ret = self.writeBuffer(data, sec, usec)
+      if ret == OpenRTM_aist.BufferStatus.BUFFER_OK:
+        self.addPending(data)
+      return self.BUFFER_FULL
+
+    self.onBufferWrite(data)
+    ret = self.writeBuffer(data, sec, usec)
+    if ret == OpenRTM_aist.BufferStatus.BUFFER_OK:
+      self.addPending(data)
+
+    return self.convertReturn(ret, data)
+
+
+  ##
+  # @if jp
+  # @brief åɼ¹Դؿ
+  #
+  # ί줿ǡ롣ǡĤäƤ
+  #  window Ǻ롣
+  #
+  # @else
+  # @brief Thread execution function
+  #
+  # This sends all the accumulated data. If data still remain after
+  # sending, they are sent again in the next window.
+  #
+  # @endif
+  #
+  def svc(self):
+    OpenRTM_aist.PublisherNew.svc(self)
+
+    guard = OpenRTM_aist.ScopedLock(self._coalesceMutex)
+    if self._buffer and self._retcode != self.CONNECTION_LOST and \
+          self._timer is None and self._buffer.readable() > 0:
+      self.startWindow()
+    return 0
+
+
+  ##
+  # @if jp
+  # @brief Ԥǡɲ
+  # @else
+  # @brief Adding the data waiting for sending
+  # @endif
+  #
+  def addPending(self, data):
+    guard = OpenRTM_aist.ScopedLock(self._coalesceMutex)
+    self._pending += 1
+    try:
+      self._pendingBytes += len(data)
+    except TypeError:
+      pass
+
+    if self._pending >= self._maxSamples or \
+          self._pendingBytes >= self._maxBytes or \
+          self._buffer.full():
+      self.flush()
+    elif self._timer is None:
+      self.startWindow()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ί줿ǡ
+  #
+  # ޤäåɤ򵯾롣_coalesceMutex 
+  # åƸƤӽФȡ
+  #
+  # @else
+  # @brief Sending the accumulated data
+  #
+  # This cancels the timer and wakes up the sending thread. This must
+  # be called with _coalesceMutex locked.
+  #
+  # @endif
+  #
+  def flush(self):
+    self.cancelWindow()
+    self._pending = 0
+    self._pendingBytes = 0
+    self._task.signal()
+    return
+
+
+  ##
+  # @if jp
+  # @brief window 륿ޤ
+  # @else
+  # @brief Setting the timer to send after the window
+  # @endif
+  #
+  def startWindow(self):
+    self._windowId += 1
+    window_id = self._windowId
+    scheduler = OpenRTM_aist.TimerScheduler.instance()
+    self._timer = scheduler.schedule(scheduler.now() + self._window,
+                                     lambda: self.onWindowExpired(window_id))
+    return
+
+
+  ##
+  # @if jp
+  # @brief ޤμä
+  # @else
+  # @brief Cancelling the timer
+  # @endif
+  #
+  def cancelWindow(self):
+    if self._timer is not None:
+      OpenRTM_aist.TimerScheduler.instance().cancel(self._timer)
+      self._timer = None
+    return
+
+
+  ##
+  # @if jp
+  # @brief window ηв
+  #
+  # TimerScheduler ΥåɤƤӽФ롣
+  #
+  # @param self
+  # @param window_id ޤμ̻
+  #
+  # @else
+  # @brief The window expired
+  #
+  # This is invoked from the thread of TimerScheduler.
+  #
+  # @param self
+  # @param window_id The identifier of the timer
+  #
+  # @endif
+  #
+  def onWindowExpired(self, window_id):
+    guard = OpenRTM_aist.ScopedLock(self._coalesceMutex)
+    if window_id != self._windowId or self._timer is None:
+      # cancelled after the scheduler took it out
+      return
+    self._timer = None
+    self.flush()
+    return
+
+
+
+def PublisherCoalesceInit():
+  OpenRTM_aist.PublisherFactory.instance().addFactory("coalesce",
+                                                      OpenRTM_aist.PublisherCoalesce,
+                                                      OpenRTM_aist.Delete)
@@ -58,6 +58,7 @@ class PublisherFlush(OpenRTM_aist.PublisherBase):
     self._profile   = None # ConnectorInfo
     self._listeners = None # ConnectorListeners
     self._retcode   = self.PORT_OK
+    self._metrics   = OpenRTM_aist.ConnectorMetrics()
 
   ##
   # @if jp
@@ -438,6 +439,7 @@ class PublisherFlush(OpenRTM_aist.PublisherBase):
   #
   # inline void onReceived(const cdrMemoryStream& data)
   def onReceived(self, data):
+    self._metrics.onSent(data)
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVED].notify(self._profile, data)
     return
@@ -453,6 +455,7 @@ class PublisherFlush(OpenRTM_aist.PublisherBase):
   #
   # inline void onReceiverFull(const cdrMemoryStream& data)
   def onReceiverFull(self, data):
+    self._metrics.onReceiverFull()
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_FULL].notify(self._profile, data)
     return
@@ -468,6 +471,7 @@ class PublisherFlush(OpenRTM_aist.PublisherBase):
   #
   # inline void onReceiverTimeout(const cdrMemoryStream& data)
   def onReceiverTimeout(self, data):
+    self._metrics.onReceiverTimeout()
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_TIMEOUT].notify(self._profile, data)
     return
@@ -483,6 +487,7 @@ class PublisherFlush(OpenRTM_aist.PublisherBase):
   #
   # inline void onReceiverError(const cdrMemoryStream& data)
   def onReceiverError(self, data):
+    self._metrics.onError()
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_ERROR].notify(self._profile, data)
     return
@@ -52,6 +52,13 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   PUBLISHER_POLICY_FIFO = 1
   PUBLISHER_POLICY_SKIP = 2
   PUBLISHER_POLICY_NEW  = 3
+  PUBLISHER_POLICY_ADAPTIVE = 4
+
+  policy_names = {PUBLISHER_POLICY_ALL:      "all",
+                  PUBLISHER_POLICY_FIFO:     "fifo",
+                  PUBLISHER_POLICY_SKIP:     "skip",
+                  PUBLISHER_POLICY_NEW:      "new",
+                  PUBLISHER_POLICY_ADAPTIVE: "adaptive"}
 
   ##
   # @if jp
@@ -80,6 +87,22 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
     self._leftskip   = 0
     self._profile    = None
     self._listeners  = None
+    self._batchPush  = False
+    self._metrics    = OpenRTM_aist.ConnectorMetrics()
+
+    # adaptive push policy
+    self._adaptivePolicy = self.PUBLISHER_POLICY_ALL
+    self._highWatermark  = 0.5
+    self._lowWatermark   = 0.1
+    self._maxRtt         = 0.1
+    self._holdCount      = 10
+    self._calmCount      = 0
+    self._rtt            = 0.0
+    self._sendTime       = None
+
+    # bandwidth limit
+    self._throttleTimer  = None
+    self._throttleMutex  = threading.RLock()
 
   ##
   # @if jp
@@ -95,6 +118,12 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   # @endif
   def __del__(self):
     self._rtcout.RTC_TRACE("~PublisherNew()")
+    guard = OpenRTM_aist.ScopedLock(self._throttleMutex)
+    if self._throttleTimer is not None:
+      OpenRTM_aist.TimerScheduler.instance().cancel(self._throttleTimer)
+      self._throttleTimer = None
+    del guard
+
     if self._task:
       self._task.resume()
       self._task.finalize()
@@ -135,6 +164,9 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
     elif push_policy == "new":
       self._pushPolicy = self.PUBLISHER_POLICY_NEW
 
+    elif push_policy == "adaptive":
+      self._pushPolicy = self.PUBLISHER_POLICY_ADAPTIVE
+
     else:
       self._rtcout.RTC_ERROR("invalid push_policy value: %s", push_policy)
       self._pushPolicy = self.PUBLISHER_POLICY_NEW
@@ -154,6 +186,73 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
       self._rtcout.RTC_ERROR("invalid skip_count value: %d", self._skipn)
       self._skipn = 0
 
+    if self._pushPolicy == self.PUBLISHER_POLICY_ADAPTIVE:
+      self.setAdaptivePolicy(prop)
+
+    return
+
+  ##
+  # @if jp
+  # @brief ŬŪ Push ݥꥷ
+  #
+  # push_policy  adaptive ξΥѥ᡼ꤹ롣
+  #
+  # - publisher.adaptive.high_watermark: skip ˰ܹԤХåեΨ
+  #   (ǥե: 0.5)
+  # - publisher.adaptive.low_watermark: ʳ᤹ХåեΨ
+  #   (ǥե: 0.1)
+  # - publisher.adaptive.max_rtt: new ˰ܹԤ put() α [s]
+  #   (ǥե: 0.1)
+  # - publisher.adaptive.hold_count: ʳ᤹ޤǤ˾³
+  #    (ǥե: 10)
+  #
+  # skip_count  0 ξ硢skip ʳǤ 1 Ѥ롣
+  #
+  # @else
+  # @brief Setting the adaptive push policy
+  #
+  # This operation sets the parameters of the "adaptive" push policy.
+  #
+  # - publisher.adaptive.high_watermark: The buffer occupancy ratio to
+  #   move to skip (default: 0.5)
+  # - publisher.adaptive.low_watermark: The buffer occupancy ratio to
+  #   step back (default: 0.1)
+  # - publisher.adaptive.max_rtt: The round-trip time of put() to move
+  #   to new [s] (default: 0.1)
+  # - publisher.adaptive.hold_count: The number of pushes that must
+  #   keep satisfying the condition before stepping back (default: 10)
+  #
+  # If skip_count is 0, 1 is used in the skip stage.
+  #
+  # @endif
+  #
+  def setAdaptivePolicy(self, prop):
+    aprop = prop.getNode("publisher.adaptive")
+
+    high = [self._highWatermark]
+    if OpenRTM_aist.stringTo(high, aprop.getProperty("high_watermark", "0.5")):
+      self._highWatermark = high[0]
+    low = [self._lowWatermark]
+    if OpenRTM_aist.stringTo(low, aprop.getProperty("low_watermark", "0.1")):
+      self._lowWatermark = low[0]
+    if self._lowWatermark > self._highWatermark:
+      self._rtcout.RTC_ERROR("invalid watermarks: low %f > high %f",
+                             (self._lowWatermark, self._highWatermark))
+      self._lowWatermark = self._highWatermark
+
+    rtt = [self._maxRtt]
+    if OpenRTM_aist.stringTo(rtt, aprop.getProperty("max_rtt", "0.1")):
+      self._maxRtt = rtt[0]
+    hold = [self._holdCount]
+    if OpenRTM_aist.stringTo(hold, aprop.getProperty("hold_count", "10")):
+      self._holdCount = hold[0]
+
+    if self._skipn == 0:
+      self._skipn = 1
+
+    self._rtcout.RTC_DEBUG("adaptive: high %f, low %f, max_rtt %f, hold %d",
+                           (self._highWatermark, self._lowWatermark,
+                            self._maxRtt, self._holdCount))
     return
 
   ##
@@ -215,8 +314,13 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   # ʲΥץͿ뤳ȤǤ롣
   # 
   # - thread_type: åɤΥ (ʸ󡢥ǥե: default)
-  # - publisher.push_policy: Pushݥꥷ (all, fifo, skip, new)
+  #   (pool: åɤͭΥåɥסǼ¹)
+  # - publisher.push_policy: Pushݥꥷ (all, fifo, skip, new, adaptive)
   # - publisher.skip_count: 嵭ݥꥷ skip ΤȤΥå׿
+  # - publisher.adaptive.*: 嵭ݥꥷ adaptive ΤȤΥѥ᡼
+  #   (setAdaptivePolicy() )
+  # - publisher.max_bytes_per_sec: 1äκХȿ (0: ¤ʤ)
+  # - publisher.max_msgs_per_sec: 1äκǡ (0: ¤ʤ)
   # - measurement.exec_time: ¹Իַ¬ (enable/disable)
   # - measurement.exec_count: ؿ¹Իַ¬ (, )
   # - measurement.period_time: ַ¬ (enable/disable)
@@ -238,8 +342,16 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   # The following options are available.
   # 
   # - thread_type: Thread type (string, default: default)
-  # - publisher.push_policy: Push policy (all, fifo, skip, new)
+  #   (pool: executed by the shared worker thread pool without
+  #   creating a thread)
+  # - publisher.push_policy: Push policy (all, fifo, skip, new, adaptive)
   # - publisher.skip_count: The number of skip count in the "skip" policy
+  # - publisher.adaptive.*: The parameters of the "adaptive" policy
+  #   (see setAdaptivePolicy())
+  # - publisher.max_bytes_per_sec: The maximum bytes sent per second
+  #   (0: no limit)
+  # - publisher.max_msgs_per_sec: The maximum data sent per second
+  #   (0: no limit)
   # - measurement.exec_time: Task execution time measurement (enable/disable)
   # - measurement.exec_count: Task execution time measurement count
   #                           (numerical, number of times)
@@ -257,6 +369,7 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   def init(self, prop):
     self._rtcout.RTC_TRACE("init()")
     self.setPushPolicy(prop)
+    self.setThrottle(prop)
     return self.createTask(prop)
 
   ##
@@ -293,6 +406,8 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
       return self.INVALID_ARGS
 
     self._consumer = consumer
+    # consumers providing put_batch() receive "all" in one call
+    self._batchPush = hasattr(consumer, "put_batch")
     return self.PORT_OK
 
   ##
@@ -378,6 +493,27 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
 
     return self.PORT_OK
 
+  ##
+  # @if jp
+  # @brief ׾ꤹ롣
+  #
+  # PublisherBase::setMetrics() 򻲾ȡpush_policy  adaptive ξ
+  # ߤʳϿ롣
+  #
+  # @else
+  # @brief Set the metrics
+  #
+  # See PublisherBase::setMetrics(). If push_policy is adaptive, the
+  # current stage is recorded.
+  #
+  # @endif
+  #
+  def setMetrics(self, metrics):
+    OpenRTM_aist.PublisherBase.setMetrics(self, metrics)
+    if self._pushPolicy == self.PUBLISHER_POLICY_ADAPTIVE:
+      self._metrics.setPushPolicy(self.policy_names[self._adaptivePolicy])
+    return
+
   ##
   # @if jp
   # @brief ǡ񤭹
@@ -468,7 +604,7 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
 
     if self._retcode == self.SEND_FULL:
       self._rtcout.RTC_DEBUG("write(): InPort buffer is full.")
-      ret = self._buffer.write(data, sec, usec)
+      ret = self.writeBuffer(data, sec, usec)
       self._task.signal()
       return self.BUFFER_FULL
 
@@ -476,13 +612,51 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
     #assert(self._buffer != 0)
 
     self.onBufferWrite(data)
-    ret = self._buffer.write(data, sec, usec)
+    ret = self.writeBuffer(data, sec, usec)
 
     self._task.signal()
     self._rtcout.RTC_DEBUG("%s = write()", OpenRTM_aist.DataPortStatus.toString(ret))
 
     return self.convertReturn(ret, data)
 
+  ##
+  # @if jp
+  #
+  # @brief ХåեؤΥǡ񤭹
+  #
+  # Хåե˥ǡ񤭹ߡ񤭤̵ͭȥХåե̤
+  # ׾˵Ͽ롣
+  #
+  # @param self
+  # @param data 񤭹ǡ
+  # @param sec ॢȻ [sec]
+  # @param usec ॢȻ [usec]
+  # @return ХåեΥ꥿󥳡
+  #
+  # @else
+  #
+  # @brief Write data into the buffer
+  #
+  # This operation writes data into the buffer and records whether
+  # data was overwritten and the buffer occupancy in the metrics.
+  #
+  # @param self
+  # @param data The data to be written
+  # @param sec Timeout [sec]
+  # @param usec Timeout [usec]
+  # @return Return code of the buffer
+  #
+  # @endif
+  #
+  def writeBuffer(self, data, sec, usec):
+    full = self._buffer.full()
+    ret = self._buffer.write(data, sec, usec)
+    if ret == OpenRTM_aist.BufferStatus.BUFFER_OK:
+      if full:
+        self._metrics.onOverwrite()
+      self._metrics.setOccupancy(self._buffer.readable())
+    return ret
+
   ##
   # @if jp
   #
@@ -603,6 +777,9 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
     elif self._pushPolicy == self.PUBLISHER_POLICY_NEW:
       self._retcode = self.pushNew()
       return 0
+    elif self._pushPolicy == self.PUBLISHER_POLICY_ADAPTIVE:
+      self._retcode = self.pushAdaptive()
+      return 0
     else:
       self._retcode = self.pushNew()
 
@@ -614,10 +791,15 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   # PublisherNew::ReturnCode PublisherNew::pushAll()
   def pushAll(self):
     self._rtcout.RTC_TRACE("pushAll()")
+    if self._batchPush:
+      return self.pushAllBatch()
+
     try:
 
       while self._buffer.readable() > 0:
         cdr = self._buffer.get()
+        if not self.throttle(cdr):
+          return self.deferPush(cdr)
         self.onBufferRead(cdr)
 
         self.onSend(cdr)
@@ -636,6 +818,58 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
       return self.CONNECTION_LOST
 
 
+  ##
+  # @brief push "all" policy in one batch
+  #
+  # PublisherNew::ReturnCode PublisherNew::pushAllBatch()
+  def pushAllBatch(self):
+    self._rtcout.RTC_TRACE("pushAllBatch()")
+    try:
+      readable = self._buffer.readable()
+      if readable == 0:
+        return self.PORT_OK
+
+      cdrs = []
+      for i in range(readable):
+        cdr = self._buffer.rptr(i)
+        if not self.throttle(cdr):
+          self.deferPush(cdr)
+          break
+        cdrs.append(cdr)
+      readable = len(cdrs)
+      if readable == 0:
+        return self.PORT_OK
+
+      start = OpenRTM_aist.TimerScheduler.now()
+      ret, count = self._consumer.put_batch(cdrs)
+      rtt = OpenRTM_aist.TimerScheduler.now() - start
+
+      # the listeners are notified only of the samples the consumer took
+      # and the one it failed to take
+      sent = count
+      if ret != self.PORT_OK:
+        sent = min(count + 1, readable)
+      for i in range(sent):
+        self.onBufferRead(cdrs[i])
+        self.onSend(cdrs[i])
+        # the round-trip time is that of the whole put_batch()
+        self._sendTime = None
+        if i < count:
+          self.onReceived(cdrs[i])
+      if self._pushPolicy == self.PUBLISHER_POLICY_ADAPTIVE:
+        self.updateRtt(rtt)
+      self._buffer.advanceRptr(count)
+
+      if ret != self.PORT_OK:
+        self._rtcout.RTC_DEBUG("%s = consumer.put_batch()", OpenRTM_aist.DataPortStatus.toString(ret))
+        return self.invokeListener(ret, cdrs[min(count, readable - 1)])
+
+      return self.PORT_OK
+    except:
+      self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
+      return self.CONNECTION_LOST
+
+
 
   ##
   # @brief push "fifo" policy
@@ -646,6 +880,8 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
 
     try:
       cdr = self._buffer.get()
+      if not self.throttle(cdr):
+        return self.deferPush(cdr)
       self.onBufferRead(cdr)
 
       self.onSend(cdr)
@@ -674,13 +910,20 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
     try:
       ret = self.PORT_OK
       
-      preskip = self._buffer.readable() + self._leftskip
+      readable = self._buffer.readable()
+      preskip = readable + self._leftskip
       loopcnt = preskip/(self._skipn+1)
       postskip = self._skipn - self._leftskip
 
       for i in range(int(loopcnt)):
         self._buffer.advanceRptr(postskip)
         cdr = self._buffer.get()
+        if not self.throttle(cdr):
+          # skip and new drop the data exceeding the bandwidth limit
+          self.onSenderThrottled(cdr)
+          self._metrics.onDrop()
+          postskip = self._skipn + 1
+          continue
         self.onBufferRead(cdr)
 
         self.onSend(cdr)
@@ -693,6 +936,7 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
         self.onReceived(cdr)
         postskip = self._skipn + 1
 
+      self._metrics.onDrop(readable - int(loopcnt))
       self._buffer.advanceRptr(self._buffer.readable())
       
       if loopcnt == 0:
@@ -721,9 +965,16 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   def pushNew(self):
     self._rtcout.RTC_TRACE("pushNew()")
     try:
-      self._buffer.advanceRptr(self._buffer.readable() - 1)
+      skipn = self._buffer.readable() - 1
+      self._metrics.onDrop(skipn)
+      self._buffer.advanceRptr(skipn)
         
       cdr = self._buffer.get()
+      if not self.throttle(cdr):
+        self.onSenderThrottled(cdr)
+        self._metrics.onDrop()
+        self._buffer.advanceRptr()
+        return self.PORT_OK
       self.onBufferRead(cdr)
 
       self.onSend(cdr)
@@ -743,6 +994,156 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
       return self.CONNECTION_LOST
 
 
+  ##
+  # @if jp
+  # @brief Ӱ¤ˤα
+  #
+  # all, fifo ǤϥǡХåե˻ĤӰ¤ϰǽ
+  # ˤʤ˥ٵ롣ޡޤǤδ֤
+  # αȤON_SENDER_THROTTLED Τȥޡα
+  # ϻ1Ԥ
+  #
+  # @param self
+  # @param data αǡ
+  # @return PORT_OK
+  #
+  # @else
+  # @brief Deferring sending by the bandwidth limit
+  #
+  # For all and fifo, the data are left in the buffer and the task is
+  # woken up again when they can be sent within the bandwidth limit.
+  # The sending stays deferred until the timer expires, and
+  # ON_SENDER_THROTTLED is notified and the timer is set only once at
+  # the beginning of the deferral.
+  #
+  # @param self
+  # @param data The deferred data
+  # @return PORT_OK
+  #
+  # @endif
+  #
+  def deferPush(self, data):
+    guard = OpenRTM_aist.ScopedLock(self._throttleMutex)
+    if self._throttleTimer is not None:
+      return self.PORT_OK
+
+    scheduler = OpenRTM_aist.TimerScheduler.instance()
+    self._throttleTimer = scheduler.schedule(scheduler.now() + self.throttleDelay(data),
+                                             self.onThrottleExpired)
+    del guard
+
+    self.onSenderThrottled(data)
+    return self.PORT_OK
+
+
+  ##
+  # @if jp
+  # @brief ακƳ
+  #
+  # TimerScheduler ΥåɤƤӽФ롣
+  #
+  # @else
+  # @brief Resuming the deferred sending
+  #
+  # This is invoked from the thread of TimerScheduler.
+  #
+  # @endif
+  #
+  def onThrottleExpired(self):
+    guard = OpenRTM_aist.ScopedLock(self._throttleMutex)
+    self._throttleTimer = None
+    del guard
+    if self._task:
+      self._task.signal()
+    return
+
+
+  ##
+  # @brief push adaptive policy
+  #
+  # The stage of all, skip or new is chosen by updateAdaptivePolicy()
+  # and the data are pushed by the function of the stage.
+  #
+  def pushAdaptive(self):
+    self._rtcout.RTC_TRACE("pushAdaptive()")
+    self.updateAdaptivePolicy()
+
+    if self._adaptivePolicy == self.PUBLISHER_POLICY_ALL:
+      return self.pushAll()
+    elif self._adaptivePolicy == self.PUBLISHER_POLICY_SKIP:
+      return self.pushSkip()
+    return self.pushNew()
+
+
+  ##
+  # @if jp
+  # @brief ŬŪ Push ݥꥷʳι
+  #
+  # 褬ɤĤƤ֤ all Хå
+  # high_watermark Ķ skip ˡ褬˰¤(Хåե
+  # աput() α֤ max_rtt Ķᡢޤ褬 FULL
+  # TIMEOUT ֤) new ľ˰ܹԤ롣ХåեΨ
+  # low_watermark ʲı֤ max_rtt Ⱦʬʲξ֤
+  # hold_count ³˰ʳ᤹
+  #
+  # @param self
+  #
+  # @else
+  # @brief Updating the stage of the adaptive push policy
+  #
+  # All data are sent by "all" while the receiver keeps up. The stage
+  # moves to "skip" immediately when the backlog exceeds
+  # high_watermark, and to "new" when the receiver is saturated (the
+  # buffer is full, the round-trip time of put() exceeds max_rtt or
+  # the receiver returns FULL or TIMEOUT). The stage steps back by one
+  # after the buffer occupancy stays at or below low_watermark and the
+  # round-trip time at or below half of max_rtt for hold_count pushes.
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def updateAdaptivePolicy(self):
+    length = self._buffer.length()
+    readable = self._buffer.readable()
+    if length > 0:
+      occupancy = float(readable) / length
+    else:
+      occupancy = 0.0
+
+    current = self._adaptivePolicy
+    calm = False
+    if (readable >= length or self._rtt > self._maxRtt or
+        self._retcode == self.SEND_FULL or self._retcode == self.SEND_TIMEOUT):
+      next_policy = self.PUBLISHER_POLICY_NEW
+    elif occupancy >= self._highWatermark:
+      next_policy = max(current, self.PUBLISHER_POLICY_SKIP)
+    elif occupancy <= self._lowWatermark and self._rtt <= self._maxRtt / 2.0:
+      calm = True
+      next_policy = current
+      self._calmCount += 1
+      if self._calmCount >= self._holdCount:
+        if current == self.PUBLISHER_POLICY_NEW:
+          next_policy = self.PUBLISHER_POLICY_SKIP
+        else:
+          next_policy = self.PUBLISHER_POLICY_ALL
+    else:
+      next_policy = current
+
+    if not calm:
+      self._calmCount = 0
+
+    if next_policy != current:
+      self._rtcout.RTC_INFO("adaptive push policy: %s -> %s (occupancy: %f, rtt: %f [s])",
+                            (self.policy_names[current],
+                             self.policy_names[next_policy],
+                             occupancy, self._rtt))
+      self._adaptivePolicy = next_policy
+      self._calmCount = 0
+      self._leftskip = 0
+      self._metrics.onPolicyChange(self.policy_names[next_policy])
+    return
+
 
   ##
   # @if jp
@@ -910,6 +1311,7 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   #
   # inline void onBufferFull(const cdrMemoryStream& data)
   def onBufferFull(self, data):
+    self._metrics.onBufferFull()
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_BUFFER_FULL].notify(self._profile, data)
     return
@@ -925,6 +1327,7 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   #
   # inline void onBufferWriteTimeout(const cdrMemoryStream& data)
   def onBufferWriteTimeout(self, data):
+    self._metrics.onBufferTimeout()
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_BUFFER_WRITE_TIMEOUT].notify(self._profile, data)
     return
@@ -972,6 +1375,27 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   def onSend(self, data):
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_SEND].notify(self._profile, data)
+    if self._pushPolicy == self.PUBLISHER_POLICY_ADAPTIVE:
+      self._sendTime = OpenRTM_aist.TimerScheduler.now()
+    return
+
+  ##
+  # @if jp
+  # @brief put() α֤ι
+  #
+  # ֤λؿưʿѤ򹹿롣
+  #
+  # @param rtt put() α [s]
+  # @else
+  # @brief Updating the round-trip time of put()
+  #
+  # This updates the exponential moving average of the round-trip time.
+  #
+  # @param rtt The round-trip time of put() [s]
+  # @endif
+  #
+  def updateRtt(self, rtt):
+    self._rtt += 0.2 * (rtt - self._rtt)
     return
 
   ##
@@ -985,6 +1409,10 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   #
   # inline void onReceived(const cdrMemoryStream& data)
   def onReceived(self, data):
+    self._metrics.onSent(data)
+    if self._sendTime is not None:
+      self.updateRtt(OpenRTM_aist.TimerScheduler.now() - self._sendTime)
+      self._sendTime = None
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVED].notify(self._profile, data)
     return
@@ -1000,6 +1428,7 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   #
   # inline void onReceiverFull(const cdrMemoryStream& data)
   def onReceiverFull(self, data):
+    self._metrics.onReceiverFull()
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_FULL].notify(self._profile, data)
     return
@@ -1015,6 +1444,7 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   #
   # inline void onReceiverTimeout(const cdrMemoryStream& data)
   def onReceiverTimeout(self, data):
+    self._metrics.onReceiverTimeout()
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_TIMEOUT].notify(self._profile, data)
     return
@@ -1030,10 +1460,26 @@ class PublisherNew(OpenRTM_aist.PublisherBase):
   #
   # inline void onReceiverError(const cdrMemoryStream& data)
   def onReceiverError(self, data):
+    self._metrics.onError()
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_ERROR].notify(self._profile, data)
     return
 
+  ##
+  # @if jp
+  # @brief ON_SENDER_THROTTLEDΥꥹʤΤ롣 
+  # @param data cdrMemoryStream
+  # @else
+  # @brief Notify an ON_SENDER_THROTTLED event to listeners
+  # @param data cdrMemoryStream
+  # @endif
+  #
+  def onSenderThrottled(self, data):
+    self._metrics.onThrottle()
+    if self._listeners is not None and self._profile is not None:
+      self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_SENDER_THROTTLED].notify(self._profile, data)
+    return
+
   ##
   # @if jp
   # @brief ON_SENDER_ERRORΥꥹʤΤ롣 
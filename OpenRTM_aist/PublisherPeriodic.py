@@ -83,6 +83,8 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
     self._leftskip   = 0
     self._profile    = None
     self._listeners  = None
+    self._batchPush  = False
+    self._metrics    = OpenRTM_aist.ConnectorMetrics()
 
     return
 
@@ -240,9 +242,12 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
   # ʲΥץͿ뤳ȤǤ롣
   # 
   # - publisher.thread_type: åɤΥ (ʸ󡢥ǥե: default)
+  #   (pool: åɤͭΥåɥסǼ¹)
   # - publisher.push_rate: Publisher ()
   # - publisher.push_policy: Pushݥꥷ (all, fifo, skip, new)
   # - publisher.skip_count: 嵭ݥꥷ skip ΤȤΥå׿
+  # - publisher.max_bytes_per_sec: 1äκХȿ (0: ¤ʤ)
+  # - publisher.max_msgs_per_sec: 1äκǡ (0: ¤ʤ)
   # - measurement.exec_time: ¹Իַ¬ (enable/disable)
   # - measurement.exec_count: ؿ¹Իַ¬ (, )
   # - measurement.period_time: ַ¬ (enable/disable)
@@ -268,9 +273,15 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
   # The following options are available.
   # 
   # - publisher.thread_type: Thread type (string, default: default)
+  #   (pool: executed by the shared worker thread pool without
+  #   creating a thread)
   # - publisher.push_rate: Publisher sending period (numberical)
   # - publisher.push_policy: Push policy (all, fifo, skip, new)
   # - publisher.skip_count: The number of skip count in the "skip" policy
+  # - publisher.max_bytes_per_sec: The maximum bytes sent per second
+  #   (0: no limit)
+  # - publisher.max_msgs_per_sec: The maximum data sent per second
+  #   (0: no limit)
   # - measurement.exec_time: Task execution time measurement (enable/disable)
   # - measurement.exec_count: Task execution time measurement count
   #                           (numerical, number of times)
@@ -288,6 +299,7 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
   def init(self, prop):
     self._rtcout.RTC_TRACE("init()")
     self.setPushPolicy(prop)
+    self.setThrottle(prop)
     return self.createTask(prop)
   
   ##
@@ -325,6 +337,8 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
       return self.INVALID_ARGS
 
     self._consumer = consumer
+    # consumers providing put_batch() receive "all" in one call
+    self._batchPush = hasattr(consumer, "put_batch")
     return self.PORT_OK
   
   ##
@@ -501,15 +515,53 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
 
     if self._retcode == self.SEND_FULL:
       self._rtcout.RTC_DEBUG("write(): InPort buffer is full.")
-      self._buffer.write(data,sec,usec)
+      self.writeBuffer(data,sec,usec)
       return self.BUFFER_FULL
 
     self.onBufferWrite(data)
-    ret = self._buffer.write(data, sec, usec)
+    ret = self.writeBuffer(data, sec, usec)
     self._rtcout.RTC_DEBUG("%s = write()", OpenRTM_aist.DataPortStatus.toString(ret))
     self._task.resume()
     return self.convertReturn(ret, data)
 
+  ##
+  # @if jp
+  #
+  # @brief ХåեؤΥǡ񤭹
+  #
+  # Хåե˥ǡ񤭹ߡ񤭤̵ͭȥХåե̤
+  # ׾˵Ͽ롣
+  #
+  # @param self
+  # @param data 񤭹ǡ
+  # @param sec ॢȻ [sec]
+  # @param usec ॢȻ [usec]
+  # @return ХåեΥ꥿󥳡
+  #
+  # @else
+  #
+  # @brief Write data into the buffer
+  #
+  # This operation writes data into the buffer and records whether
+  # data was overwritten and the buffer occupancy in the metrics.
+  #
+  # @param self
+  # @param data The data to be written
+  # @param sec Timeout [sec]
+  # @param usec Timeout [usec]
+  # @return Return code of the buffer
+  #
+  # @endif
+  #
+  def writeBuffer(self, data, sec, usec):
+    full = self._buffer.full()
+    ret = self._buffer.write(data, sec, usec)
+    if ret == OpenRTM_aist.BufferStatus.BUFFER_OK:
+      if full:
+        self._metrics.onOverwrite()
+      self._metrics.setOccupancy(self._buffer.readable())
+    return ret
+
   ##
   # @if jp
   #
@@ -653,8 +705,15 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
     if self.bufferIsEmpty():
       return self.BUFFER_EMPTY
 
+    if self._batchPush:
+      return self.pushAllBatch()
+
     while self._buffer.readable() > 0:
       cdr = self._buffer.get()
+      if not self.throttle(cdr):
+        # all and fifo defer the data to the next period
+        self.onSenderThrottled(cdr)
+        return self.PORT_OK
       self.onBufferRead(cdr)
 
       self.onSend(cdr)
@@ -670,6 +729,46 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
     return self.PORT_OK
 
 
+  ##
+  # @brief push "all" policy in one batch
+  #
+  # PublisherPeriodic::ReturnCode PublisherPeriodic::pushAllBatch()
+  def pushAllBatch(self):
+    self._rtcout.RTC_TRACE("pushAllBatch()")
+
+    readable = self._buffer.readable()
+    cdrs = []
+    for i in range(readable):
+      cdr = self._buffer.rptr(i)
+      if not self.throttle(cdr):
+        self.onSenderThrottled(cdr)
+        break
+      cdrs.append(cdr)
+    readable = len(cdrs)
+    if readable == 0:
+      return self.PORT_OK
+
+    ret, count = self._consumer.put_batch(cdrs)
+
+    # the listeners are notified only of the samples the consumer took
+    # and the one it failed to take
+    sent = count
+    if ret != self.PORT_OK:
+      sent = min(count + 1, readable)
+    for i in range(sent):
+      self.onBufferRead(cdrs[i])
+      self.onSend(cdrs[i])
+      if i < count:
+        self.onReceived(cdrs[i])
+    self._buffer.advanceRptr(count)
+
+    if ret != self.PORT_OK:
+      self._rtcout.RTC_DEBUG("%s = consumer.put_batch()", OpenRTM_aist.DataPortStatus.toString(ret))
+      return self.invokeListener(ret, cdrs[min(count, readable - 1)])
+
+    return self.PORT_OK
+
+
   ##
   # @brief push "fifo" policy
   #
@@ -683,6 +782,9 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
       return self.BUFFER_EMPTY
 
     cdr = self._buffer.get()
+    if not self.throttle(cdr):
+      self.onSenderThrottled(cdr)
+      return self.PORT_OK
     self.onBufferRead(cdr)
 
     self.onSend(cdr)
@@ -711,12 +813,19 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
       return self.BUFFER_EMPTY
 
     ret = self.PORT_OK
-    preskip  = self._buffer.readable() + self._leftskip
+    readable = self._buffer.readable()
+    preskip  = readable + self._leftskip
     loopcnt  = preskip / (self._skipn + 1)
     postskip = self._skipn - self._leftskip
     for i in range(int(loopcnt)):
       self._buffer.advanceRptr(postskip)
       cdr = self._buffer.get()
+      if not self.throttle(cdr):
+        # skip and new drop the data exceeding the bandwidth limit
+        self.onSenderThrottled(cdr)
+        self._metrics.onDrop()
+        postskip = self._skipn + 1
+        continue
       self.onBufferRead(cdr)
 
       self.onSend(cdr)
@@ -728,6 +837,7 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
       self.onReceived(cdr)
       postskip = self._skipn + 1
 
+    self._metrics.onDrop(readable - int(loopcnt))
     self._buffer.advanceRptr(self._buffer.readable())
     self._leftskip = preskip % (self._skipn + 1)
     
@@ -751,9 +861,16 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
     # after written at least one datum into the buffer.
     self._readback = True
 
-    self._buffer.advanceRptr(self._buffer.readable() - 1)
+    skipn = self._buffer.readable() - 1
+    self._metrics.onDrop(skipn)
+    self._buffer.advanceRptr(skipn)
     
     cdr = self._buffer.get()
+    if not self.throttle(cdr):
+      self.onSenderThrottled(cdr)
+      self._metrics.onDrop()
+      self._buffer.advanceRptr()
+      return self.PORT_OK
     self.onBufferRead(cdr)
 
     self.onSend(cdr)
@@ -926,6 +1043,7 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
   #
   # inline void onBufferFull(const cdrMemoryStream& data)
   def onBufferFull(self, data):
+    self._metrics.onBufferFull()
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_BUFFER_FULL].notify(self._profile, data)
     return
@@ -941,6 +1059,7 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
   #
   # inline void onBufferWriteTimeout(const cdrMemoryStream& data)
   def onBufferWriteTimeout(self, data):
+    self._metrics.onBufferTimeout()
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_BUFFER_WRITE_TIMEOUT].notify(self._profile, data)
     return
@@ -986,6 +1105,7 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
   #
   # inline void onReceived(const cdrMemoryStream& data)
   def onReceived(self, data):
+    self._metrics.onSent(data)
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVED].notify(self._profile, data)
     return
@@ -1001,6 +1121,7 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
   #
   # inline void onReceiverFull(const cdrMemoryStream& data)
   def onReceiverFull(self, data):
+    self._metrics.onReceiverFull()
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_FULL].notify(self._profile, data)
     return
@@ -1016,6 +1137,7 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
   #
   # inline void onReceiverTimeout(const cdrMemoryStream& data)
   def onReceiverTimeout(self, data):
+    self._metrics.onReceiverTimeout()
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_TIMEOUT].notify(self._profile, data)
     return
@@ -1031,10 +1153,26 @@ class PublisherPeriodic(OpenRTM_aist.PublisherBase):
   #
   # inline void onReceiverError(const cdrMemoryStream& data)
   def onReceiverError(self, data):
+    self._metrics.onError()
     if self._listeners is not None and self._profile is not None:
       self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_ERROR].notify(self._profile, data)
     return
 
+  ##
+  # @if jp
+  # @brief ON_SENDER_THROTTLEDΥꥹʤΤ롣 
+  # @param data cdrMemoryStream
+  # @else
+  # @brief Notify an ON_SENDER_THROTTLED event to listeners
+  # @param data cdrMemoryStream
+  # @endif
+  #
+  def onSenderThrottled(self, data):
+    self._metrics.onThrottle()
+    if self._listeners is not None and self._profile is not None:
+      self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_SENDER_THROTTLED].notify(self._profile, data)
+    return
+
 
   ##
   # @if jp
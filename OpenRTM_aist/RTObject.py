@@ -5065,7 +5065,10 @@ class RTObject_impl:
                        "activation_timeout",
                        "deactivation_timeout",
                        "reset_timeout",
-                       "cpu_affinity"]
+                       "cpu_affinity",
+                       "scheduling_mode",
+                       "overrun_policy",
+                       "catchup_limit"]
 
     p_ = self._properties.findNode("exec_cxt")
     if not p_:
@@ -5283,7 +5286,10 @@ class RTObject_impl:
                        "activation_timeout",
                        "deactivation_timeout",
                        "reset_timeout",
-                       "cpu_affinity"]
+                       "cpu_affinity",
+                       "scheduling_mode",
+                       "overrun_policy",
+                       "catchup_limit"]
 
       p_ = self._properties.findNode("exec_cxt")
       
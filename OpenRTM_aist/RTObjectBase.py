@@ -5004,7 +5004,10 @@ class RTObjectBase:
                        "activation_timeout",
                        "deactivation_timeout",
                        "reset_timeout"
-                       "cpu_affinity"]
+                       "cpu_affinity",
+                       "scheduling_mode",
+                       "overrun_policy",
+                       "catchup_limit"]
 
     p_ = self._properties.findNode("exec_cxt")
     if not p_:
@@ -5222,7 +5225,10 @@ class RTObjectBase:
                        "activation_timeout",
                        "deactivation_timeout",
                        "reset_timeout",
-                       "cpu_affinity"]
+                       "cpu_affinity",
+                       "scheduling_mode",
+                       "overrun_policy",
+                       "catchup_limit"]
 
       p_ = self._properties.findNode("exec_cxt")
       
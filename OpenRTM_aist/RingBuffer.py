@@ -690,6 +690,58 @@ class RingBuffer(OpenRTM_aist.BufferBase):
 
     return OpenRTM_aist.BufferStatus.BUFFER_OK
 
+
+  ##
+  # @if jp
+  #
+  # @brief ХåեǡޤȤɤ߽Ф
+  # 
+  # Хåեɤ߽Фǽʥǡ n ĤޤȤɤ߽Ф
+  # ɤ߽Фݥ󥿤ʤ롣åμ1ΤߤǤ롣Хåե
+  # ξ϶ΥꥹȤ֤empty_policy ˤ֥å
+  # ɤ߽ФϹԤʤ
+  # 
+  # @param self
+  # @param n ɤ߽Фǿ(ξ)
+  # 
+  # @return ɤ߽ФǡΥꥹ
+  # 
+  # @else
+  #
+  # @brief Read data from the buffer at once
+  #
+  # This operation reads at most n readable elements at once and
+  # advances the read pointer, acquiring the lock only once. If the
+  # buffer is empty, an empty list is returned without blocking or
+  # reading back according to the empty_policy.
+  #
+  # @param self
+  # @param n Maximum number of elements to be read (all if negative)
+  #
+  # @return The list of read data
+  #
+  # @endif
+  #
+  def readAll(self, n = -1):
+    self._full_cond.acquire()
+    guard = OpenRTM_aist.ScopedLock(self._pos_mutex)
+    full_ = self._length == self._fillcount
+
+    count = self._fillcount
+    if not n < 0 and n < count:
+      count = n
+
+    values = [self._buffer[(self._rpos + i) % self._length]
+              for i in range(count)]
+    self._rpos = (self._rpos + count) % self._length
+    self._fillcount -= count
+    del guard
+
+    if full_ and count > 0:
+      self._full_cond.notify()
+    self._full_cond.release()
+    return values
+
     
   ##
   # @if jp
@@ -0,0 +1,498 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  SPSCRingBuffer.py
+# @brief SPSCRingBuffer class
+# @date  $Date$
+#
+
+import threading
+import OpenRTM_aist
+
+
+##
+# @if jp
+# @class SPSCRingBuffer
+# @brief ñ񤭹/ñɤ߽Фѥ󥰥Хåե饹
+#
+# 񤭹¦ɤ߽Ф¦줾1åɤǤ뤳ȤȤ
+# 󥰥Хåեץå巿ͥΥХåեϽ񤭹¦(OutPort
+# ޤϥץХ)ɤ߽Ф¦(ѥ֥åޤ InPort)
+# 줾1ĤǤ뤿ᡢ
+#
+# 񤭹߿ɤ߽Ф2ĤΥ󥿤ǰ֤ȳǼɽ
+# 餫ݤåȤ˳Ǽ롣write()/read() 
+# 1ĤΥå1֥åԤ碌⤽Υå
+# ѿǹԤԤäƤ륹åɤʤΤԤʤ
+# wptr()/put() Ͻ񤭹¦rptr()/get() ɤ߽Ф¦
+# åȤ򻲾Ȥ뤿ᡢåʤ
+#
+# BufferBase Υ󥿡եȡRingBuffer Ʊץѥƥ
+# (length, write.full_policy, write.timeout, read.empty_policy,
+# read.timeout)б롣CdrBufferFactory  spsc_ring_buffer 
+# Ͽ졢ͥץѥƥ buffer_type ǻꤹ롣
+#
+# @else
+# @class SPSCRingBuffer
+# @brief Ring buffer class for single producer/single consumer
+#
+# The ring buffer on the assumption that each of the writer and the
+# reader is one thread. The buffer of a push type connector satisfies
+# this since it has only one writer (OutPort or provider) and one
+# reader (publisher or InPort).
+#
+# The position and the number of stored data are represented by two
+# counters of the written and read data, and data are stored in the
+# slot array allocated in advance. write()/read() etc. acquire one
+# lock only once, and blocking is done with the condition variables
+# of that lock. Nothing is notified if no thread is waiting.
+# wptr()/put() and rptr()/get() do not acquire the lock since they
+# refer to the slots which are operated only by the writer or the
+# reader respectively.
+#
+# It supports the interface of BufferBase and the same properties as
+# RingBuffer (length, write.full_policy, write.timeout,
+# read.empty_policy, read.timeout). It is registered in
+# CdrBufferFactory as spsc_ring_buffer and specified by the connector
+# property buffer_type.
+#
+# @endif
+#
+class SPSCRingBuffer(OpenRTM_aist.RingBuffer):
+  """
+  """
+
+  ##
+  # @if jp
+  #
+  # @brief 󥹥ȥ饯
+  #
+  # ꤵ줿ХåեĹǥХåե롣
+  #
+  # @param length ХåեĹ
+  #
+  # @else
+  #
+  # @brief Constructor
+  #
+  # Initialize the buffer by specified buffer length.
+  #
+  # @param length Buffer length
+  #
+  # @endif
+  #
+  def __init__(self, length=OpenRTM_aist.RingBuffer.RINGBUFFER_DEFAULT_LENGTH):
+    self._overwrite = True
+    self._readback = True
+    self._timedwrite = False
+    self._timedread  = False
+    self._wtimeout = OpenRTM_aist.TimeValue(1,0)
+    self._rtimeout = OpenRTM_aist.TimeValue(1,0)
+    self._length = length
+    self._buffer = [None] * self._length
+    self._wcount = 0
+    self._rcount = 0
+    self._mutex = threading.Lock()
+    self._notEmpty = threading.Condition(self._mutex)
+    self._notFull = threading.Condition(self._mutex)
+    self._readWaiters = 0
+    self._writeWaiters = 0
+
+
+  ##
+  # @if jp
+  # @brief ХåեĹꤹ
+  #
+  # n ꤵ줿ϥХåեĹ n ꤷХåե롣
+  #
+  # @param n ХåեĹ
+  # @return n  BUFFER_OK/NOT_SUPPORTEDʳϥХåեĹ
+  #
+  # @else
+  # @brief Get or set the buffer length
+  #
+  # If n is given, the buffer length is set to n and the buffer is
+  # initialized.
+  #
+  # @param n The new buffer length
+  # @return BUFFER_OK/NOT_SUPPORTED if n is given, otherwise the length
+  #
+  # @endif
+  #
+  def length(self, n = None):
+    if n is None:
+      return self._length
+
+    if n < 1:
+      return OpenRTM_aist.BufferStatus.NOT_SUPPORTED
+
+    self._mutex.acquire()
+    self._buffer = [None] * n
+    self._length = n
+    self._wcount = 0
+    self._rcount = 0
+    self._mutex.release()
+    return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+
+  ##
+  # @if jp
+  # @brief Хåեξ֤ꥻåȤ
+  # @else
+  # @brief Reset the buffer status
+  # @endif
+  #
+  def reset(self):
+    self._mutex.acquire()
+    self._wcount = 0
+    self._rcount = 0
+    self._mutex.release()
+    return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+
+  ##
+  # @if jp
+  # @brief ХåեθߤνǤΥݥ
+  # @else
+  # @brief Get the writing pointer
+  # @endif
+  #
+  def wptr(self, n = 0):
+    return self._buffer[(self._wcount + n) % self._length]
+
+
+  ##
+  # @if jp
+  # @brief ߥݥ󥿤ʤ
+  #
+  # ߥݥ󥿤 n ĤޤȤƿʤᡢɤ߽ФԤΥåɤ
+  # Τ롣
+  #
+  # @else
+  # @brief Forward n writing pointers
+  #
+  # This operation forwards n writing pointers at once and notifies
+  # the thread waiting for reading if any.
+  #
+  # @endif
+  #
+  def advanceWptr(self, n = 1, unlock_enable=True):
+    self._mutex.acquire()
+    fill = self._wcount - self._rcount
+    if (n > 0 and n > (self._length - fill)) or \
+          (n < 0 and n < (-fill)):
+      self._mutex.release()
+      return OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET
+
+    self._wcount += n
+    if n > 0 and self._readWaiters > 0:
+      self._notEmpty.notify()
+    self._mutex.release()
+    return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+
+  ##
+  # @if jp
+  # @brief Хåե˥ǡǼ(ߥݥ󥿤Ͽʤʤ)
+  # @else
+  # @brief Write data into the buffer (the pointer is not forwarded)
+  # @endif
+  #
+  def put(self, value):
+    self._buffer[self._wcount % self._length] = value
+    return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+
+  ##
+  # @if jp
+  # @brief Хåե˽񤭹
+  #
+  # RingBuffer.write() Ʊͤ write.full_policy ˽äƽ񤭹ࡣ
+  # åμ1Ǥ롣
+  #
+  # @param value 񤭹оݥǡ
+  # @param sec ॢȻ sec (ǥե -1: ̵)
+  # @param nsec ॢȻ nsec (ǥե 0)
+  # @return BUFFER_OK, BUFFER_FULL, TIMEOUT, PRECONDITION_NOT_MET
+  #
+  # @else
+  # @brief Write data into the buffer
+  #
+  # This operation writes data according to write.full_policy in the
+  # same way as RingBuffer.write(). The lock is acquired only once.
+  #
+  # @param value Target data to write.
+  # @param sec Timeout sec (default -1: no timeout)
+  # @param nsec Timeout nsec (default 0)
+  # @return BUFFER_OK, BUFFER_FULL, TIMEOUT, PRECONDITION_NOT_MET
+  #
+  # @endif
+  #
+  def write(self, value, sec = -1, nsec = 0):
+    self._mutex.acquire()
+    try:
+      if self._wcount - self._rcount >= self._length:
+        timedwrite = self._timedwrite # default is False
+        overwrite  = self._overwrite  # default is True
+
+        if not (sec < 0): # if second arg is set -> block mode
+          timedwrite = True
+          overwrite  = False
+
+        if overwrite and not timedwrite:       # "overwrite" mode
+          self._rcount += 1
+
+        elif not overwrite and not timedwrite: # "do_nothing" mode
+          return OpenRTM_aist.BufferStatus.BUFFER_FULL
+
+        elif not overwrite and timedwrite:     # "block" mode
+          if sec < 0:
+            sec = self._wtimeout.sec()
+            nsec = self._wtimeout.usec() * 1000
+          if sec != 0 or nsec != 0:
+            wait_time = sec + (nsec/1000000000.0)
+          else:
+            wait_time = None
+
+          self._writeWaiters += 1
+          self._notFull.wait(wait_time)
+          self._writeWaiters -= 1
+          if self._wcount - self._rcount >= self._length:
+            return OpenRTM_aist.BufferStatus.TIMEOUT
+
+        else: # unknown condition
+          return OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET
+
+      self._buffer[self._wcount % self._length] = value
+      self._wcount += 1
+      if self._readWaiters > 0:
+        self._notEmpty.notify()
+      return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+    finally:
+      self._mutex.release()
+
+
+  ##
+  # @if jp
+  # @brief Хåե˽߲ǽǿ
+  # @else
+  # @brief Get a writable number
+  # @endif
+  #
+  def writable(self):
+    return self._length - (self._wcount - self._rcount)
+
+
+  ##
+  # @if jp
+  # @brief Хåեfullå
+  # @else
+  # @brief Check on whether the buffer is full.
+  # @endif
+  #
+  def full(self):
+    return self._wcount - self._rcount >= self._length
+
+
+  ##
+  # @if jp
+  # @brief ɤ߽Фݥ󥿤ΰ֤ˤǤ֤
+  # @else
+  # @brief Get the reading pointer
+  # @endif
+  #
+  def rptr(self, n = 0):
+    return self._buffer[(self._rcount + n) % self._length]
+
+
+  ##
+  # @if jp
+  # @brief ɤ߽Фݥ󥿤ʤ
+  #
+  # ɤ߽Фݥ󥿤 n ĤޤȤƿʤᡢ񤭹ԤΥåɤ
+  # Τ롣
+  #
+  # @else
+  # @brief Forward n reading pointers
+  #
+  # This operation forwards n reading pointers at once and notifies
+  # the thread waiting for writing if any.
+  #
+  # @endif
+  #
+  def advanceRptr(self, n = 1, unlock_enable=True):
+    self._mutex.acquire()
+    fill = self._wcount - self._rcount
+    if (n > 0 and n > fill) or \
+          (n < 0 and n < (fill - self._length)):
+      self._mutex.release()
+      return OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET
+
+    self._rcount += n
+    if n > 0 and self._writeWaiters > 0:
+      self._notFull.notify()
+    self._mutex.release()
+    return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+
+  ##
+  # @if jp
+  # @brief ХåեǡФ(ɤ߽Фݥ󥿤Ͽʤʤ)
+  # @else
+  # @brief Read data from the buffer (the pointer is not forwarded)
+  # @endif
+  #
+  def get(self, value=None):
+    if value is None:
+      return self._buffer[self._rcount % self._length]
+
+    value[0] = self._buffer[self._rcount % self._length]
+    return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+
+  ##
+  # @if jp
+  # @brief Хåեɤ߽Ф
+  #
+  # RingBuffer.read() Ʊͤ read.empty_policy ˽äɤ߽Ф
+  # åμ1Ǥ롣
+  #
+  # @param value ɤ߽ФǡǼꥹ
+  # @param sec ॢȻ sec (ǥե -1: ̵)
+  # @param nsec ॢȻ nsec (ǥե 0)
+  # @return BUFFER_OK, BUFFER_EMPTY, TIMEOUT, PRECONDITION_NOT_MET
+  #
+  # @else
+  # @brief Readout data from the buffer
+  #
+  # This operation reads data according to read.empty_policy in the
+  # same way as RingBuffer.read(). The lock is acquired only once.
+  #
+  # @param value The list to store the read data
+  # @param sec Timeout sec (default -1: no timeout)
+  # @param nsec Timeout nsec (default 0)
+  # @return BUFFER_OK, BUFFER_EMPTY, TIMEOUT, PRECONDITION_NOT_MET
+  #
+  # @endif
+  #
+  def read(self, value, sec = -1, nsec = 0):
+    self._mutex.acquire()
+    try:
+      if self._wcount == self._rcount:
+        timedread = self._timedread
+        readback  = self._readback
+
+        if not (sec < 0):  # if second arg is set -> block mode
+          timedread = True
+          readback  = False
+
+        if readback and  not timedread:      # "readback" mode
+          if not self._wcount > 0:
+            return OpenRTM_aist.BufferStatus.BUFFER_EMPTY
+          val = self._buffer[(self._rcount - 1) % self._length]
+          if len(value) > 0:
+            value[0] = val
+          else:
+            value.append(val)
+          return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+        elif not readback and not timedread: # "do_nothing" mode
+          return OpenRTM_aist.BufferStatus.BUFFER_EMPTY
+
+        elif not readback and timedread:     # "block" mode
+          if sec < 0:
+            sec = self._rtimeout.sec()
+            nsec = self._rtimeout.usec() * 1000
+          if sec != 0 or nsec != 0:
+            wait_time = sec + (nsec/1000000000.0)
+          else:
+            wait_time = None
+
+          self._readWaiters += 1
+          self._notEmpty.wait(wait_time)
+          self._readWaiters -= 1
+          if self._wcount == self._rcount:
+            return OpenRTM_aist.BufferStatus.TIMEOUT
+
+        else:                              # unknown condition
+          return OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET
+
+      val = self._buffer[self._rcount % self._length]
+      if len(value) > 0:
+        value[0] = val
+      else:
+        value.append(val)
+      self._rcount += 1
+      if self._writeWaiters > 0:
+        self._notFull.notify()
+      return OpenRTM_aist.BufferStatus.BUFFER_OK
+
+    finally:
+      self._mutex.release()
+
+
+  ##
+  # @if jp
+  # @brief ǡΰɤ߽Ф
+  #
+  # ɤ߽Фǽʥǡ n ġå1ƤޤȤ
+  # ɤ߽Ф
+  #
+  # @param n ɤ߽Фǡ(ξ)
+  # @return ɤ߽ФǡΥꥹ
+  #
+  # @else
+  # @brief Reading all data
+  #
+  # This operation reads at most n readable data at once, acquiring
+  # the lock only once.
+  #
+  # @param n Maximum number of data to be read (all if negative)
+  # @return The list of read data
+  #
+  # @endif
+  #
+  def readAll(self, n = -1):
+    self._mutex.acquire()
+    count = self._wcount - self._rcount
+    if not n < 0 and n < count:
+      count = n
+
+    values = [self._buffer[(self._rcount + i) % self._length]
+              for i in range(count)]
+    self._rcount += count
+    if count > 0 and self._writeWaiters > 0:
+      self._notFull.notify()
+    self._mutex.release()
+    return values
+
+
+  ##
+  # @if jp
+  # @brief Хåեɤ߽Фǽǿ
+  # @else
+  # @brief Get a readable number
+  # @endif
+  #
+  def readable(self):
+    return self._wcount - self._rcount
+
+
+  ##
+  # @if jp
+  # @brief Хåեemptyå
+  # @else
+  # @brief Check on whether the buffer is empty.
+  # @endif
+  #
+  def empty(self):
+    return self._wcount == self._rcount
+
+
+
+def SPSCRingBufferInit():
+  OpenRTM_aist.CdrBufferFactory.instance().addFactory("spsc_ring_buffer",
+                                                      OpenRTM_aist.SPSCRingBuffer,
+                                                      OpenRTM_aist.Delete)
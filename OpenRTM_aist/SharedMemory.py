@@ -10,7 +10,11 @@
 
 
 import mmap, os
+import platform
 import ctypes
+import struct
+import threading
+import time
 from omniORB import cdrMarshal
 from omniORB import cdrUnmarshal
 from omniORB import CORBA
@@ -20,6 +24,9 @@ import OpenRTM
 
 
 
+class _timespec(ctypes.Structure):
+  _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
 
 ##
 # @if jp
@@ -31,19 +38,85 @@ import OpenRTM
 # ͭ饹
 # CORBAˤ̿ˤꡢmmapνλʤɤ⡼ȤǤ
 #
+# ͭˤϡƬ8byte˥ǡ֤1åȤηȡ
+# ʣåȤΥ󥰷롣󥰷ǤƬ˥إå
+# (ޥåʥСåȿåȥ񤭹ߡɤ߽Ф
+# ֹ桢Υե饰ե饰ֹ)֤θ
+# ƥå(ֹ桢ǡǡ)¤٤롣񤭹¦ɤ߽Ф¦Ԥ
+# åȤؽ񤭹ߡɤ߽Ф¦1Τǽ񤭹ޤ줿Ƥ
+# åȤɤ߽ФإåͤƱۥȤΥץ֤ǤΤ߶ͭ
+# 뤿ᡢͥƥ֤ΥХȥǳǼ롣
+#
+# Python ϥХꥢȯԤǤʤᡢåȤΥǡ
+# 񤭹ߥֹɤ߽Ф¦鸫뤳Ȥϡȥ
+# ؤʤ x86  x86-64 Υǥ˰¸Ƥ롣
+# Τᡢ󥰷ϤΥޥǤΤ߻ѤʳǤ
+# 1åȤηѤ롣
+#
+# 󥰤ΥåȤ礭ǡ񤭹硢񤭹¦ϥå
+# 2ܰʾ˳礷ͭľ ftruncate ǳĥ
+# ƥإåֹʤ롣ɤ߽Ф¦ֹ椬ѤäȤ
+# Фǥޥåԥ󥰤ľᡢ CORBA θƤӽФ
+# Ǥ롣
+#
+# POSIX ̾դޥեѤǤ硢󥰷Τˤ
+# ͭƱ̾ΥޥեѤCORBA θƤӽФ϶ͭ
+# νȽλΤߤѤ롣
 #
 # @else
 # @class SharedMemory
 #
 # @brief SharedMemory class
 #
+# The shared memory has either the single slot layout, which puts the
+# data size in the first 8 bytes, or the ring layout with several
+# slots. The ring layout starts with a header (magic number, number of
+# slots, slot size, write and read sequence numbers, notification
+# flag, flags and generation) followed by the slots (sequence number,
+# data size and data). The writer writes into free slots without waiting for the
+# reader, and the reader reads all the written slots per
+# notification. The header values are stored in the native byte order
+# since they are shared only among the processes on the same host.
+#
+# Since Python cannot issue memory barriers, the data of a slot being
+# visible to the reader before the write sequence number relies on the
+# memory model of x86 and x86-64, which never reorders stores with
+# other stores. The ring layout is therefore used only on these
+# machines, and the single slot layout is used on the others.
 #
+# To write data larger than the slots of the ring, the writer at least
+# doubles the slot size, extends the shared memory by ftruncate
+# instead of creating it again and advances the generation in the
+# header. Since the reader maps the memory again when it detects the
+# new generation, the growth does not need CORBA calls.
+#
+# If POSIX named semaphores are available, the notification of the
+# ring layout uses the semaphore with the same name as the shared
+# memory, and CORBA calls are used only to set up and tear down the
+# shared memory.
 #
 # @endif
 #
 class SharedMemory(OpenRTM__POA.PortSharedMemory):
   default_size = 8
   default_memory_size = 2097152
+  ring_magic = 0x474e495252484d53
+  ring_header_size = 64
+  slot_header_size = 16
+  slot_header = struct.Struct("=QQ")
+  # indices of the ring header fields
+  RING_MAGIC      = 0
+  RING_SLOT_COUNT = 1
+  RING_SLOT_SIZE  = 2
+  RING_WRITE_SEQ  = 3
+  RING_READ_SEQ   = 4
+  RING_NOTIFY     = 5
+  RING_FLAGS      = 6
+  RING_GENERATION = 7
+  # flags of the ring header
+  RING_SEM_NOTIFY = 1
+  # machines whose stores are not reordered with other stores (TSO)
+  ring_machines = ("x86_64", "amd64", "x86", "i386", "i486", "i586", "i686")
   
 
   ##
@@ -70,6 +143,12 @@ class SharedMemory(OpenRTM__POA.PortSharedMemory):
     self._shm_address = ""
     self._memory_size = SharedMemory.default_memory_size
     self._endian = True
+    self._ringHeader = None
+    self._ringMutex = threading.RLock()
+    self._sem = None
+    self._semAvailable = False
+    self._ringGeneration = None
+    self._lease = None
     if os.name == "nt":
       pass
     else:
@@ -90,6 +169,20 @@ class SharedMemory(OpenRTM__POA.PortSharedMemory):
       self.rt.close.restype = ctypes.c_int
       self.rt.shm_unlink.argtypes = [ctypes.c_char_p]
       self.rt.shm_unlink.restype = ctypes.c_int
+      try:
+        self.rt.sem_open.argtypes = [ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.c_uint]
+        self.rt.sem_open.restype = ctypes.c_void_p
+        self.rt.sem_post.argtypes = [ctypes.c_void_p]
+        self.rt.sem_post.restype = ctypes.c_int
+        self.rt.sem_timedwait.argtypes = [ctypes.c_void_p, ctypes.POINTER(_timespec)]
+        self.rt.sem_timedwait.restype = ctypes.c_int
+        self.rt.sem_close.argtypes = [ctypes.c_void_p]
+        self.rt.sem_close.restype = ctypes.c_int
+        self.rt.sem_unlink.argtypes = [ctypes.c_char_p]
+        self.rt.sem_unlink.restype = ctypes.c_int
+        self._semAvailable = True
+      except AttributeError:
+        self._rtcout.RTC_WARN("named semaphores are not available.")
 
       self.fd = -1
     return
@@ -265,7 +358,14 @@ class SharedMemory(OpenRTM__POA.PortSharedMemory):
   def close_memory(self, unlink=False):
     self._rtcout.RTC_TRACE("open()")
     if self._shmem:
+      guard = OpenRTM_aist.ScopedLock(self._ringMutex)
+      # the views of the ring header and the leased slot must be
+      # released before closing
+      self.release_slot(False)
+      self._ringHeader = None
+      self._ringGeneration = None
       self._shmem.close()
+      del guard
       if os.name == "nt":
         pass
       else:
@@ -312,7 +412,10 @@ class SharedMemory(OpenRTM__POA.PortSharedMemory):
 
       
       if data_size + SharedMemory.default_size > self._memory_size:
-        self._memory_size = data_size + SharedMemory.default_size
+        # grown geometrically so that slowly growing data does not
+        # create the memory again on every write
+        self._memory_size = max(self._memory_size * 2,
+                                data_size + SharedMemory.default_size)
 
         if not CORBA.is_nil(self._smInterface):
           self._smInterface.close_memory(False)
@@ -365,6 +468,704 @@ class SharedMemory(OpenRTM__POA.PortSharedMemory):
     return ""
 
 
+  ##
+  # @if jp
+  # @brief 󥰤Υإåμ
+  #
+  # إåγƥեɤ8byte󤷤 ctypes Ȥ
+  # 뤿ᡢ1ɤ߽񤭤ͤξ֤ˤʤ뤳ȤϤʤ
+  # _ringMutex åƸƤӽФȡ
+  #
+  # @param self
+  # @return إå꤬ͭʤ None
+  #
+  # @else
+  # @brief Getting the header of the ring
+  #
+  # The fields of the header are accessed as an array of ctypes
+  # aligned on 8 bytes, so a value is never observed half written.
+  # This must be called with _ringMutex locked.
+  #
+  # @param self
+  # @return The header, None if there is no shared memory
+  #
+  # @endif
+  #
+  def ring_header(self):
+    if self._ringHeader is None and self._shmem is not None and \
+          self._memory_size >= SharedMemory.ring_header_size:
+      self._ringHeader = (ctypes.c_uint64 * 8).from_buffer(self._shmem)
+    return self._ringHeader
+
+
+  ##
+  # @if jp
+  # @brief ꤬ͭ󥰷ɤ
+  # @else
+  # @brief Whether the shared memory has the ring layout
+  # @endif
+  #
+  def is_ring(self):
+    guard = OpenRTM_aist.ScopedLock(self._ringMutex)
+    header = self.ring_header()
+    return header is not None and \
+        header[SharedMemory.RING_MAGIC] == SharedMemory.ring_magic
+
+
+  ##
+  # @if jp
+  # @brief 󥰷ν
+  #
+  # ͭ򥹥åȿʬƥåȥ롣
+  # x86  x86-64 ʳΥޥǤϼԤ롣
+  #
+  # @param self
+  # @param slot_count åȿ
+  # @return  True
+  #
+  # @else
+  # @brief Initializing the ring layout
+  #
+  # The slot size is decided by dividing the shared memory by the
+  # number of slots. This fails on machines other than x86 and x86-64.
+  #
+  # @param self
+  # @param slot_count The number of slots
+  # @return True if succeeded
+  #
+  # @endif
+  #
+  def init_ring(self, slot_count):
+    if platform.machine().lower() not in SharedMemory.ring_machines:
+      self._rtcout.RTC_WARN("the ring layout is not supported on %s.",
+                            platform.machine())
+      return False
+
+    guard = OpenRTM_aist.ScopedLock(self._ringMutex)
+    header = self.ring_header()
+    if header is None:
+      return False
+    slot_size = (self._memory_size - SharedMemory.ring_header_size) // slot_count \
+        - SharedMemory.slot_header_size
+    if slot_size <= 0:
+      self._rtcout.RTC_ERROR("shared memory is too small for %d slots.", slot_count)
+      return False
+    header[SharedMemory.RING_SLOT_COUNT] = slot_count
+    header[SharedMemory.RING_SLOT_SIZE] = slot_size
+    header[SharedMemory.RING_WRITE_SEQ] = 0
+    header[SharedMemory.RING_READ_SEQ] = 0
+    header[SharedMemory.RING_NOTIFY] = 0
+    header[SharedMemory.RING_GENERATION] = 0
+    self._ringGeneration = 0
+    if self.open_semaphore(True):
+      header[SharedMemory.RING_FLAGS] = SharedMemory.RING_SEM_NOTIFY
+    else:
+      header[SharedMemory.RING_FLAGS] = 0
+    header[SharedMemory.RING_MAGIC] = SharedMemory.ring_magic
+    return True
+
+
+  ##
+  # @if jp
+  # @brief 󥰤ΥåȤΥեå
+  # @else
+  # @brief The offset of a slot of the ring
+  # @endif
+  #
+  def slot_offset(self, header, seq):
+    return SharedMemory.ring_header_size + \
+        (seq % header[SharedMemory.RING_SLOT_COUNT]) * \
+        (SharedMemory.slot_header_size + header[SharedMemory.RING_SLOT_SIZE])
+
+
+  ##
+  # @if jp
+  # @brief 󥰤ΥåȤ˥ǡ񤭹
+  #
+  # åȤΥǡ񤭹Ǥ񤭹ߥֹʤ롣
+  # ǡåȤ礭硢󥰤ǤХåȥ
+  # 礹롣
+  #
+  # @param self
+  # @param data 񤭹ǡ
+  # @return 񤭹᤿ TrueåȤʤ False
+  #
+  # @else
+  # @brief Writing data into a slot of the ring
+  #
+  # The write sequence number is advanced after the data of the slot is
+  # written. If the data is larger than the slot, the slot size is
+  # enlarged when the ring is empty.
+  #
+  # @param self
+  # @param data The data to be written
+  # @return True if written, False if there is no free slot
+  #
+  # @endif
+  #
+  def write_slot(self, data):
+    guard = OpenRTM_aist.ScopedLock(self._ringMutex)
+    header = self.ring_header()
+    if header is None:
+      return False
+    count = header[SharedMemory.RING_SLOT_COUNT]
+    seq = header[SharedMemory.RING_WRITE_SEQ]
+    if seq - header[SharedMemory.RING_READ_SEQ] >= count:
+      return False
+
+    if len(data) > header[SharedMemory.RING_SLOT_SIZE]:
+      if seq != header[SharedMemory.RING_READ_SEQ]:
+        return False
+      slot_size = max(header[SharedMemory.RING_SLOT_SIZE] * 2, len(data))
+      del header
+      if not self.grow_ring(count, slot_size):
+        return False
+      header = self.ring_header()
+      seq = header[SharedMemory.RING_WRITE_SEQ]
+
+    offset = self.slot_offset(header, seq)
+    SharedMemory.slot_header.pack_into(self._shmem, offset, seq, len(data))
+    offset += SharedMemory.slot_header_size
+    self._shmem[offset:offset + len(data)] = data
+    header[SharedMemory.RING_WRITE_SEQ] = seq + 1
+    return True
+
+
+  ##
+  # @if jp
+  # @brief 󥰤Υåȥγ
+  #
+  # ͭ ftruncate ǳĥƥޥåԥ󥰤ľåȥ
+  # ѹƤֹʤ롣ɤ߽Ф¦ read_slot() ǿ
+  # ֹ򸡽Фƥޥåԥ󥰤ľ̾դζͭĥ
+  # Ǥʤ Windows Ǥ resize_ring() Ѥ롣
+  #
+  # @param self
+  # @param slot_count åȿ
+  # @param slot_size åȥ
+  # @return  True
+  #
+  # @else
+  # @brief Enlarging the slot size of the ring
+  #
+  # The shared memory is extended by ftruncate and mapped again, and the
+  # generation is advanced after the slot size is changed. The reader
+  # detects the new generation in read_slot() and maps the memory
+  # again. resize_ring() is used on Windows, where a named shared memory
+  # cannot be extended.
+  #
+  # @param self
+  # @param slot_count The number of slots
+  # @param slot_size The new slot size
+  # @return True if succeeded
+  #
+  # @endif
+  #
+  def grow_ring(self, slot_count, slot_size):
+    if os.name == "nt":
+      return self.resize_ring(slot_count, slot_size)
+
+    guard = OpenRTM_aist.ScopedLock(self._ringMutex)
+    memory_size = SharedMemory.ring_header_size + \
+        slot_count * (SharedMemory.slot_header_size + slot_size)
+    self._rtcout.RTC_DEBUG("grow_ring(): memory_size=%d", memory_size)
+    self._ringHeader = None
+    self._shmem.close()
+    self._shmem = None
+    self.open_memory(memory_size, self._shm_address)
+    header = self.ring_header()
+    if header is None:
+      return False
+    header[SharedMemory.RING_SLOT_SIZE] = slot_size
+    self._ringGeneration = header[SharedMemory.RING_GENERATION] + 1
+    header[SharedMemory.RING_GENERATION] = self._ringGeneration
+    return True
+
+
+  ##
+  # @if jp
+  # @brief 󥰤ֹγǧ
+  #
+  # 񤭹¦󥰤礷Ƥ硢ͭ򿷤
+  # ޥåԥ󥰤ľ񤭹¦Ͻ̾ʤᡢftruncate ϹԤʤ
+  # _ringMutex åإåؤλȤʤ֤ǸƤӽФȡ
+  #
+  # @param self
+  # @return إå
+  #
+  # @else
+  # @brief Checking the generation of the ring
+  #
+  # If the writer has enlarged the ring, the shared memory is mapped
+  # again with the new size. ftruncate is not called since the writer
+  # never shrinks it. This must be called with _ringMutex locked and
+  # without references to the header.
+  #
+  # @param self
+  # @return The header
+  #
+  # @endif
+  #
+  def check_generation(self):
+    header = self.ring_header()
+    generation = header[SharedMemory.RING_GENERATION]
+    if generation == self._ringGeneration:
+      return header
+    memory_size = SharedMemory.ring_header_size + \
+        header[SharedMemory.RING_SLOT_COUNT] * \
+        (SharedMemory.slot_header_size + header[SharedMemory.RING_SLOT_SIZE])
+    del header
+
+    if memory_size > self._memory_size and os.name != "nt":
+      self._rtcout.RTC_DEBUG("check_generation(): memory_size=%d", memory_size)
+      O_RDWR = 2
+      fd = self.rt.shm_open(self._shm_address, O_RDWR, 0)
+      if fd < 0:
+        return None
+      shmem = mmap.mmap(fd, memory_size, mmap.MAP_SHARED)
+      self.rt.close(fd)
+      self._ringHeader = None
+      self._shmem.close()
+      self._shmem = shmem
+      self._memory_size = memory_size
+    self._ringGeneration = generation
+    return self.ring_header()
+
+
+  ##
+  # @if jp
+  # @brief 󥰤Υåȥγ(ͭκƺ)
+  #
+  # write() Ʊͤ˶ͭľ󥰷ǽ롣
+  #
+  # @param self
+  # @param slot_count åȿ
+  # @param data_size ǡ
+  # @return  True
+  #
+  # @else
+  # @brief Enlarging the slot size of the ring (creating the memory again)
+  #
+  # The shared memory is created again as write() and initialized with
+  # the ring layout.
+  #
+  # @param self
+  # @param slot_count The number of slots
+  # @param data_size The data size
+  # @return True if succeeded
+  #
+  # @endif
+  #
+  def resize_ring(self, slot_count, data_size):
+    self._memory_size = SharedMemory.ring_header_size + \
+        slot_count * (SharedMemory.slot_header_size + data_size + SharedMemory.default_size)
+    if not CORBA.is_nil(self._smInterface):
+      self._smInterface.close_memory(False)
+    self.close_memory(True)
+    self.create_memory(self._memory_size, self._shm_address)
+    return self.init_ring(slot_count)
+
+
+  ##
+  # @if jp
+  # @brief 󥰤ƬΥåȤΥǡɤ߹
+  #
+  # ɤ߽ФֹϿʤʤᡢǡ
+  # advance_slot() ƤӽФȡƬΥåȤ lease_slot() 
+  # ȤƤ֤ɤ߹ޤʤ
+  #
+  # @param self
+  # @return ǡåȤξ None
+  #
+  # @else
+  # @brief Reading the data of the first slot of the ring
+  #
+  # Since the read sequence number is not advanced, advance_slot()
+  # must be called after the data is processed. Nothing is read while
+  # the first slot is referred by lease_slot().
+  #
+  # @param self
+  # @return The data, None if the slots are empty
+  #
+  # @endif
+  #
+  def read_slot(self):
+    guard = OpenRTM_aist.ScopedLock(self._ringMutex)
+    if self._lease is not None:
+      return None
+    data_range = self.slot_data_range()
+    if data_range is None:
+      return None
+    offset, data_size = data_range
+    return self._shmem[offset:offset + data_size]
+
+
+  ##
+  # @if jp
+  # @brief 󥰤ƬΥåȤΥǡ򥳥ԡ˻Ȥ
+  #
+  # åȤΥǡ򻲾Ȥ memoryview ֤release_slot() 
+  # ƤӽФޤɤ߽ФֹϿʤޤʤᡢ񤭹¦
+  # ΥåȤ񤭤뤳ȤϤʤrelease_slot() θ
+  # memoryview 䤽򻲾Ȥ NumPy ѤƤϤʤʤ
+  #
+  # @param self
+  # @return ǡ memoryviewåȤξ None
+  #
+  # @else
+  # @brief Referring to the data of the first slot of the ring without copy
+  #
+  # This returns a memoryview referring to the data of the slot. Since
+  # the read sequence number is not advanced until release_slot() is
+  # called, the writer never overwrites the slot. The memoryview and
+  # NumPy arrays referring to it must not be used after release_slot().
+  #
+  # @param self
+  # @return The memoryview of the data, None if the slots are empty
+  #
+  # @endif
+  #
+  def lease_slot(self):
+    guard = OpenRTM_aist.ScopedLock(self._ringMutex)
+    if self._lease is not None:
+      return self._lease
+    data_range = self.slot_data_range()
+    if data_range is None:
+      return None
+    offset, data_size = data_range
+    try:
+      self._lease = memoryview(self._shmem)[offset:offset + data_size]
+    except TypeError:
+      # mmap does not provide the new buffer interface in Python 2
+      self._lease = memoryview((ctypes.c_char * data_size).from_buffer(self._shmem, offset))
+    return self._lease
+
+
+  ##
+  # @if jp
+  # @brief lease_slot() ǻȤåȤβ
+  #
+  # @param self
+  # @param advance True ξɤ߽Фֹʤ
+  #
+  # @else
+  # @brief Releasing the slot referred by lease_slot()
+  #
+  # @param self
+  # @param advance If True, the read sequence number is advanced
+  #
+  # @endif
+  #
+  def release_slot(self, advance=True):
+    guard = OpenRTM_aist.ScopedLock(self._ringMutex)
+    if self._lease is None:
+      return
+    view = self._lease
+    self._lease = None
+    if hasattr(view, "release"):
+      try:
+        view.release()
+      except BufferError:
+        self._rtcout.RTC_WARN("the leased slot is still referred.")
+    del view
+    if advance:
+      self.advance_slot()
+    return
+
+
+  ##
+  # @if jp
+  # @brief 󥰤ƬΥåȤΥǡϰ
+  #
+  # åȤΥֹ椬פʤϥåȤɤФ
+  # _ringMutex åƸƤӽФȡ
+  #
+  # @param self
+  # @return (եå, ǡ)åȤξ None
+  #
+  # @else
+  # @brief The range of the data of the first slot of the ring
+  #
+  # The slot is skipped if its sequence number does not match. This
+  # must be called with _ringMutex locked.
+  #
+  # @param self
+  # @return (offset, data size), None if the slots are empty
+  #
+  # @endif
+  #
+  def slot_data_range(self):
+    if not self.is_ring():
+      return None
+    header = self.ring_header()
+    seq = header[SharedMemory.RING_READ_SEQ]
+    if seq == header[SharedMemory.RING_WRITE_SEQ]:
+      return None
+    # the generation is read after the write sequence number, so that
+    # the growth before the slot was written is always detected
+    del header
+    header = self.check_generation()
+    if header is None:
+      return None
+    offset = self.slot_offset(header, seq)
+    slot_seq, data_size = SharedMemory.slot_header.unpack_from(self._shmem, offset)
+    if slot_seq != seq:
+      self._rtcout.RTC_ERROR("invalid slot: sequence %d != %d", (slot_seq, seq))
+      header[SharedMemory.RING_READ_SEQ] = seq + 1
+      return None
+    return (offset + SharedMemory.slot_header_size, data_size)
+
+
+  ##
+  # @if jp
+  # @brief ɤ߽Фֹʤ
+  #
+  # ƬΥåȤ lease_slot() ǻȤƤ֤Ͽʤʤ
+  #
+  # @else
+  # @brief Advancing the read sequence number
+  #
+  # This is not advanced while the first slot is referred by
+  # lease_slot().
+  #
+  # @endif
+  #
+  def advance_slot(self):
+    guard = OpenRTM_aist.ScopedLock(self._ringMutex)
+    if self._lease is not None:
+      self._rtcout.RTC_WARN("advance_slot(): the first slot is leased.")
+      return
+    if self.is_ring():
+      header = self.ring_header()
+      header[SharedMemory.RING_READ_SEQ] = header[SharedMemory.RING_READ_SEQ] + 1
+    return
+
+
+  ##
+  # @if jp
+  # @brief 󥰤ɤ߽Ф¦ɤ߽ФޤԤ
+  #
+  # @param self
+  # @param timeout ॢ [s]
+  # @return 󥰤ˤʤä True
+  #
+  # @else
+  # @brief Waiting for the reader to read all slots of the ring
+  #
+  # @param self
+  # @param timeout Timeout [s]
+  # @return True if the ring became empty
+  #
+  # @endif
+  #
+  def wait_drained(self, timeout):
+    end = time.time() + timeout
+    while True:
+      guard = OpenRTM_aist.ScopedLock(self._ringMutex)
+      if not self.is_ring():
+        return False
+      header = self.ring_header()
+      if header[SharedMemory.RING_WRITE_SEQ] == header[SharedMemory.RING_READ_SEQ]:
+        return True
+      del header
+      del guard
+      if time.time() >= end:
+        return False
+      time.sleep(0.001)
+
+
+  ##
+  # @if jp
+  # @brief Υե饰ΩƤ
+  #
+  # 񤭹¦ True ֤äΤɤ߽Ф¦Τ롣ɤ߽Ф¦
+  # ɤ߽ФǤ뤳Ȥ򼨤ˤȤ
+  #
+  # @param self
+  # @return ե饰ΩäƤʤä True
+  #
+  # @else
+  # @brief Setting the notification flag
+  #
+  # The writer notifies the reader only if True is returned. The
+  # reader also uses this to show that it is reading.
+  #
+  # @param self
+  # @return True if the flag was not set
+  #
+  # @endif
+  #
+  def set_notify(self):
+    guard = OpenRTM_aist.ScopedLock(self._ringMutex)
+    if not self.is_ring():
+      return False
+    header = self.ring_header()
+    if header[SharedMemory.RING_NOTIFY]:
+      return False
+    header[SharedMemory.RING_NOTIFY] = 1
+    return True
+
+
+  ##
+  # @if jp
+  # @brief Υե饰򲼤
+  #
+  # ɤ߽Ф¦ƤΥåȤɤ߽Ф˸ƤӽФ
+  #
+  # @else
+  # @brief Clearing the notification flag
+  #
+  # The reader calls this after reading all the slots.
+  #
+  # @endif
+  #
+  def clear_notify(self):
+    guard = OpenRTM_aist.ScopedLock(self._ringMutex)
+    if self.is_ring():
+      self.ring_header()[SharedMemory.RING_NOTIFY] = 0
+    return
+
+
+  ##
+  # @if jp
+  # @brief ѥޥե򳫤
+  #
+  # ͭƱ̾̾դޥե򳫤
+  #
+  # @param self
+  # @param create True ξ祻ޥեʤк
+  # @return ޥե True
+  #
+  # @else
+  # @brief Opening the semaphore for the notification
+  #
+  # The named semaphore with the same name as the shared memory is
+  # opened.
+  #
+  # @param self
+  # @param create If True, the semaphore is created if it does not exist
+  # @return True if the semaphore is opened
+  #
+  # @endif
+  #
+  def open_semaphore(self, create=False):
+    if self._sem is not None:
+      return True
+    if not self._semAvailable or not self._shm_address:
+      return False
+
+    if create:
+      O_CREAT = 64
+
+      S_IRUSR = 256
+      S_IWUSR = 128
+      S_IRGRP = 32
+      S_IWGRP = 16
+      S_IROTH = 4
+
+      sem = self.rt.sem_open(self._shm_address, O_CREAT,
+                             S_IRUSR|S_IWUSR|S_IRGRP|S_IWGRP|S_IROTH, 0)
+    else:
+      sem = self.rt.sem_open(self._shm_address, 0, 0, 0)
+    if not sem:
+      self._rtcout.RTC_WARN("sem_open() failed: %s", self._shm_address)
+      return False
+    self._sem = sem
+    return True
+
+
+  ##
+  # @if jp
+  # @brief ѥޥեĤ
+  #
+  # @param self
+  # @param unlink True ξ祻ޥե
+  #
+  # @else
+  # @brief Closing the semaphore for the notification
+  #
+  # @param self
+  # @param unlink If True, the semaphore is removed
+  #
+  # @endif
+  #
+  def close_semaphore(self, unlink=False):
+    if self._sem is not None:
+      self.rt.sem_close(self._sem)
+      self._sem = None
+      if unlink:
+        self.rt.sem_unlink(self._shm_address)
+    return
+
+
+  ##
+  # @if jp
+  # @brief 󥰤Τ˥ޥեѤ뤫ɤ
+  #
+  # 񤭹¦ޥեƤ硢ɤ߽Ф¦Ϥ
+  # ޥե򳫤
+  #
+  # @else
+  # @brief Whether the semaphore is used for the notification of the ring
+  #
+  # If the writer has created the semaphore, the reader opens it here.
+  #
+  # @endif
+  #
+  def use_semaphore(self):
+    guard = OpenRTM_aist.ScopedLock(self._ringMutex)
+    if not self.is_ring() or \
+          not self.ring_header()[SharedMemory.RING_FLAGS] & SharedMemory.RING_SEM_NOTIFY:
+      return False
+    return self.open_semaphore()
+
+
+  ##
+  # @if jp
+  # @brief ޥեˤɤ߽Ф¦ؤ
+  #
+  # @param self
+  # @return ΤǤ TrueCORBA Τɬפ False
+  #
+  # @else
+  # @brief Notifying the reader by the semaphore
+  #
+  # @param self
+  # @return True if notified, False if it must be notified by CORBA
+  #
+  # @endif
+  #
+  def notify_slot(self):
+    if not self.use_semaphore():
+      return False
+    return self.rt.sem_post(self._sem) == 0
+
+
+  ##
+  # @if jp
+  # @brief ޥեˤΤԤ
+  #
+  # @param self
+  # @param timeout ॢ [s]
+  # @return Τ줿 TrueॢȤ False
+  #
+  # @else
+  # @brief Waiting for the notification by the semaphore
+  #
+  # @param self
+  # @param timeout Timeout [s]
+  # @return True if notified, False if timed out
+  #
+  # @endif
+  #
+  def wait_slot(self, timeout):
+    if self._sem is None:
+      return False
+    abstime = time.time() + timeout
+    ts = _timespec(int(abstime), int((abstime - int(abstime)) * 1000000000))
+    return self.rt.sem_timedwait(self._sem, ctypes.byref(ts)) == 0
+
+
 
   ##
   # @if jp
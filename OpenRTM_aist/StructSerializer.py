@@ -0,0 +1,372 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  StructSerializer.py
+# @brief StructSerializer class
+# @date  $Date$
+#
+
+
+
+import struct
+
+from omniORB import CORBA
+from omniORB import any
+
+import OpenRTM_aist
+
+
+##
+# @if jp
+# @brief Ĺδܷ TypeCode μ struct ⥸塼νʸ
+#
+# char  omniORBpy ǤĹ1 str Τᡢ"B"  ord()/chr() ˤ
+# Ѵ롣
+#
+# @else
+# @brief The kinds of TypeCode of the fixed size basic types and the
+#        format characters of the struct module
+#
+# char is a str of length 1 in omniORBpy, so it is converted with
+# ord()/chr() as "B".
+#
+# @endif
+#
+struct_format_chars = [(CORBA.tk_short,     "h"),
+                       (CORBA.tk_long,      "i"),
+                       (CORBA.tk_ushort,    "H"),
+                       (CORBA.tk_ulong,     "I"),
+                       (CORBA.tk_longlong,  "q"),
+                       (CORBA.tk_ulonglong, "Q"),
+                       (CORBA.tk_float,     "f"),
+                       (CORBA.tk_double,    "d"),
+                       (CORBA.tk_boolean,   "?"),
+                       (CORBA.tk_char,      "B"),
+                       (CORBA.tk_octet,     "B")]
+
+
+##
+# @if jp
+#
+# @class StructSerializer
+#
+# @brief StructSerializer 饹
+#
+# Ĺδܷȹ¤Τʤǡ(TimedLongTimedPoint3D
+# )򡢻 struct.Struct ǰ٤˥ޡ󥰡
+# ޡ󥰤륷ꥢ饤ǡ TypeCode 
+# ƥФν񼰤ᡢCDR ƱΥѥǥ󥰤줿񼰤
+# struct.Struct 뤿ᡢϤ CDR ƱΥХȤʤ롣
+# 󥹤ʸʤɤβĹΥФޤǡˤбʤ
+#
+# ͥץѥƥ marshaling_type  cdr_struct ꤹȻѤ롣
+#
+# @else
+# @class StructSerializer
+#
+# @brief StructSerializer class
+#
+# This serializer marshals and unmarshals the data types which
+# consist only of fixed size basic types and structs (TimedLong,
+# TimedPoint3D etc.) at once with a precompiled struct.Struct. The
+# format of each member is derived from the TypeCode when the data
+# type is set, and the struct.Struct is created with the same
+# alignment padding as CDR, so the output is identical to CDR. Data
+# types which contain variable length members such as sequences or
+# strings are not supported.
+#
+# This serializer is used if the connector property marshaling_type
+# is cdr_struct.
+#
+# @endif
+#
+class StructSerializer(OpenRTM_aist.ByteDataStreamBase):
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # 󥹥ȥ饯
+  #
+  # @param self
+  #
+  # @else
+  # @brief Constructor
+  #
+  # Constructor
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def __init__(self):
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("StructSerializer")
+    self._endian = True
+    self._dataClass = None
+    self._members = None
+    self._formats = []
+    self._chars = []
+    self._struct = None
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǥ
+  #
+  # @param self
+  # @param little_endian True: ȥ륨ǥ, False: ӥåǥ
+  #
+  # @else
+  # @brief Setting the endian
+  #
+  # @param self
+  # @param little_endian True: little endian, False: big endian
+  #
+  # @endif
+  #
+  def isLittleEndian(self, little_endian):
+    self._endian = little_endian
+    self.compile()
+
+
+  ##
+  # @if jp
+  # @brief ǡ
+  #
+  # ǡ TypeCode ФιȽ񼰤롣Ĺ
+  # Фޤ False ֤
+  #
+  # @param self
+  # @param data ǡΥ󥹥
+  # @return True: бƤǡ, False: бƤʤǡ
+  #
+  # @else
+  # @brief Setting the data type
+  #
+  # This operation derives the members and their formats from the
+  # TypeCode of the data type. False is returned if it contains
+  # variable length members.
+  #
+  # @param self
+  # @param data An instance of the data type
+  # @return True: supported data type, False: not supported data type
+  #
+  # @endif
+  #
+  def setDataType(self, data):
+    self._formats = []
+    self._chars = []
+    members = self.parse(any.to_any(data).typecode(), data)
+    if members is None:
+      self._rtcout.RTC_WARN("%s is not a fixed size struct.",
+                            str(getattr(data, "_NP_RepositoryId", None)))
+      self._members = None
+      self._struct = None
+      return False
+
+    self._dataClass = data.__class__
+    self._members = members
+    self.compile()
+    return True
+
+
+  ##
+  # @if jp
+  # @brief ¤Τ TypeCode β
+  #
+  # ¤ΤΥФĴ١ܷνʸ self._formats ɲ
+  # 롣char ΥФΰ֤ self._chars ɲä롣Фι (̾, None) ޤ (̾, (饹, ))
+  # ΥꥹȤ֤бƤʤޤ None ֤
+  #
+  # @param self
+  # @param tc ¤Τ TypeCode
+  # @param sample ¤ΤΥ󥹥
+  # @return Фι
+  #
+  # @else
+  # @brief Parsing the TypeCode of a struct
+  #
+  # This operation examines the members of the struct in order and
+  # appends the format characters of the basic types to
+  # self._formats. The positions of the char members are appended to
+  # self._chars. The members are returned as the list of
+  # (name, None) or (name, (class, members)). None is returned if a
+  # type which is not supported is contained.
+  #
+  # @param self
+  # @param tc The TypeCode of the struct
+  # @param sample An instance of the struct
+  # @return The members
+  #
+  # @endif
+  #
+  def parse(self, tc, sample):
+    while tc.kind() == CORBA.tk_alias:
+      tc = tc.content_type()
+
+    if tc.kind() != CORBA.tk_struct:
+      return None
+
+    members = []
+    for i in range(tc.member_count()):
+      name = tc.member_name(i)
+      mtc = tc.member_type(i)
+      while mtc.kind() == CORBA.tk_alias:
+        mtc = mtc.content_type()
+
+      if mtc.kind() == CORBA.tk_struct:
+        value = getattr(sample, name)
+        sub = self.parse(mtc, value)
+        if sub is None:
+          return None
+        members.append((name, (value.__class__, sub)))
+        continue
+
+      fmt = None
+      for kind, c in struct_format_chars:
+        if mtc.kind() == kind:
+          fmt = c
+          break
+      if fmt is None:
+        return None
+
+      if mtc.kind() == CORBA.tk_char:
+        self._chars.append(len(self._formats))
+      self._formats.append(fmt)
+      members.append((name, None))
+
+    return members
+
+
+  ##
+  # @if jp
+  # @brief struct.Struct 
+  #
+  # ƥФ򤽤Υζ·ѥǥ󥰤줿񼰤
+  # struct.Struct 롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Creating the struct.Struct
+  #
+  # This operation creates the struct.Struct with the format which
+  # has padding to align each member to its size.
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def compile(self):
+    if self._members is None:
+      return
+
+    if self._endian:
+      order = "<"
+    else:
+      order = ">"
+
+    fmt = order
+    offset = 0
+    for c in self._formats:
+      size = struct.calcsize(order + c)
+      pad = (size - offset % size) % size
+      fmt += "x" * pad + c
+      offset += pad + size
+
+    self._struct = struct.Struct(fmt)
+
+
+  ##
+  # @if jp
+  # @brief ¤ΤΥФͤ˼Ф
+  # @else
+  # @brief Taking out the values of the members of the struct in order
+  # @endif
+  #
+  def flatten(self, data, members, values):
+    for name, sub in members:
+      if sub is None:
+        values.append(getattr(data, name))
+      else:
+        self.flatten(getattr(data, name), sub[1], values)
+
+
+  ##
+  # @if jp
+  # @brief ͤ¤Ӥ鹽¤Τ
+  # @else
+  # @brief Creating the struct from the values in order
+  # @endif
+  #
+  def build(self, cls, members, values):
+    args = []
+    for name, sub in members:
+      if sub is None:
+        args.append(next(values))
+      else:
+        args.append(self.build(sub[0], sub[1], values))
+    return cls(*args)
+
+
+  ##
+  # @if jp
+  # @brief ǡΥޡ
+  #
+  # @param self
+  # @param data ޡоݤΥǡ
+  # @return CDR ǡ
+  #
+  # @else
+  # @brief Marshaling data
+  #
+  # @param self
+  # @param data Data to be marshaled
+  # @return CDR data
+  #
+  # @endif
+  #
+  def serialize(self, data):
+    values = []
+    self.flatten(data, self._members, values)
+    for i in self._chars:
+      values[i] = ord(values[i])
+    return self._struct.pack(*values)
+
+
+  ##
+  # @if jp
+  # @brief ǡΥޡ
+  #
+  # @param self
+  # @param cdr CDR ǡ
+  # @return ޡ󥰤ǡ
+  #
+  # @else
+  # @brief Unmarshaling data
+  #
+  # @param self
+  # @param cdr CDR data
+  # @return Unmarshaled data
+  #
+  # @endif
+  #
+  def deserialize(self, cdr):
+    values = self._struct.unpack_from(cdr, 0)
+    if self._chars:
+      values = list(values)
+      for i in self._chars:
+        values[i] = chr(values[i])
+    return self.build(self._dataClass, self._members, iter(values))
+
+
+
+def StructSerializerInit():
+  factory = OpenRTM_aist.SerializerFactory.instance()
+  factory.addFactory("cdr_struct",
+                     OpenRTM_aist.StructSerializer,
+                     OpenRTM_aist.Delete)
@@ -15,7 +15,6 @@
 #     All rights reserved.
 
 
-import time
 import threading
 
 import OpenRTM_aist
@@ -27,6 +26,9 @@ import OpenRTM_aist
 # @brief Timer饹
 # 
 # Ͽ줿ꥹʡΥХåؿꤵ줿Ū˸ƤӽФ
+# ƥꥹʡμεưñĴûˤлݻ
+# TimerScheduler ǤᤤưΤ Timer Υåɤ
+# ꥹʡƤӽФΤᡢư٤ϥ޵ưˤʤ
 #
 # @since 0.4.0
 #
@@ -36,7 +38,11 @@ import OpenRTM_aist
 # @brief Timer class
 # 
 # Invoke the callback function of registered listener periodically
-# at the set cycle.
+# at the set cycle. The next invocation time of each listener is
+# kept as the absolute time of the monotonic clock, and the listeners
+# are invoked in the thread of Timer when it is notified by
+# TimerScheduler at the earliest invocation time. Therefore the
+# accuracy of the invocation does not depend on the interval of timer.
 #
 # @since 0.4.0
 #
@@ -52,7 +58,7 @@ class Timer:
   # 󥹥ȥ饯
   #
   # @param self
-  # @param interval ޵ư
+  # @param interval ޵ư(ꥹʡưκǾ)
   #
   # @else
   #
@@ -60,7 +66,8 @@ class Timer:
   # 
   # Constructor
   #
-  # @param interval The interval of timer
+  # @param interval The interval of timer (the minimum invocation
+  #                 interval of listeners)
   #
   # @endif
   def __init__(self, interval):
@@ -69,6 +76,9 @@ class Timer:
     self._runningMutex = threading.RLock()
     self._tasks = []
     self._taskMutex = threading.RLock()
+    self._expired = False
+    self._expiredCond = threading.Condition(threading.Lock())
+    self._timerId = None
     self._thread = threading.Thread(target=self.run)
     return
 
@@ -87,7 +97,7 @@ class Timer:
   #
   def __del__(self):
     self._running = False
-
+    self.cancel()
     self.join()
 
     self._thread = None
@@ -106,7 +116,8 @@ class Timer:
   # @brief Timer ѤΥåɼ¹Դؿ
   #
   # Timer ѤΥåɼ¹Դؿ
-  # Ͽ줿ꥹʡΥХåؿƤӽФ
+  # TimerScheduler Τ뤿ӤˡϿ줿ꥹʡ
+  # ХåؿƤӽФ
   #
   # @return ¹Է
   #
@@ -114,21 +125,93 @@ class Timer:
   # @brief Thread execution function for Timer
   #
   # Thread execution function for Timer.
-  # Invoke the callback function of registered listener.
+  # Invoke the callback function of registered listener every time
+  # it is notified by TimerScheduler.
   #
   # @return Execution result
   #
   # @endif
   def run(self):
     while self._running:
-      self.invoke()
-      if self._interval.tv_sec != 0:
-        time.sleep(self._interval.tv_sec)
-      elif self._interval.tv_usec:
-        time.sleep(self._interval.tv_usec/1000000.0)
+      self._expiredCond.acquire()
+      while self._running and not self._expired:
+        self._expiredCond.wait()
+      self._expired = False
+      self._expiredCond.release()
+
+      if self._running:
+        self.invoke()
     return 0
 
 
+  ##
+  # @if jp
+  # @brief ư
+  #
+  # TimerScheduler ΥåɤƤӽФ졢Timer Υåɤ򵯤
+  #
+  # @param self
+  #
+  # @else
+  # @brief Notifying the invocation time
+  #
+  # This is called from the thread of TimerScheduler and wakes up the
+  # thread of Timer.
+  #
+  # @param self
+  #
+  # @endif
+  def expire(self):
+    self._expiredCond.acquire()
+    self._expired = True
+    self._expiredCond.notify()
+    self._expiredCond.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief εưͽ
+  #
+  # Ͽ줿ꥹʡκǤᤤư TimerScheduler Ͽ롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Scheduling the next invocation time
+  #
+  # This registers the earliest invocation time of the registered
+  # listeners to TimerScheduler.
+  #
+  # @param self
+  #
+  # @endif
+  def reschedule(self):
+    guard = OpenRTM_aist.ScopedLock(self._taskMutex)
+    self.cancel()
+    if not self._running or not self._tasks:
+      return
+
+    deadline = min([task.deadline for task in self._tasks])
+    self._timerId = OpenRTM_aist.TimerScheduler.instance().schedule(deadline,
+                                                                   self.expire)
+    return
+
+
+  ##
+  # @if jp
+  # @brief ưͽμä
+  # @else
+  # @brief Cancelling the scheduled invocation time
+  # @endif
+  def cancel(self):
+    guard = OpenRTM_aist.ScopedLock(self._taskMutex)
+    if self._timerId is not None:
+      OpenRTM_aist.TimerScheduler.instance().cancel(self._timerId)
+      self._timerId = None
+    return
+
+
   ##
   # @if jp
   # @brief Timer 
@@ -149,6 +232,7 @@ class Timer:
     if not self._running:
       self._running = True
       self._thread.start()
+      self.reschedule()
     return
 
 
@@ -171,6 +255,8 @@ class Timer:
     guard = OpenRTM_aist.ScopedLock(self._runningMutex)
     if self._running:
       self._running = False
+      self.cancel()
+      self.expire()
       self.join()
     return
 
@@ -181,30 +267,63 @@ class Timer:
   #
   # @param self
   #
-  # Ͽ줿ƥꥹʤεưԤ֤饿޵ư򸺻롣
-  # ưԤ֤Ȥʤäꥹʤ¸ߤϡ
-  # ХåؿƤӽФ
+  # ưãꥹʤΥХåؿƤӽФεư
+  # ưʤ롣ư٤Ƽεư᤮Ƥϡ
+  # ߻狼鵯ưȤ롣
   #
   # @else
   #
   # @brief Invoke Timer task
   #
-  # Subtract the interval of timer from the waiting time for invocation
-  # of each registered listener.
-  # If the listener whose waiting time reached 0 exists, invoke the
-  # callback function.
+  # Invoke the callback function of the listeners which reached the
+  # invocation time, and advance the invocation time by the
+  # interval. If the invocation is delayed and the next invocation
+  # time has also passed, it is set to the interval after the
+  # current time.
   #
   # @endif
   def invoke(self):
     guard = OpenRTM_aist.ScopedLock(self._taskMutex)
-    for i in range(len(self._tasks)):
-      self._tasks[i].remains = self._tasks[i].remains - self._interval
-      if self._tasks[i].remains.sign() <= 0.0:
-        self._tasks[i].remains = self._tasks[i].period
-        self._tasks[i].listener.invoke()
+    for task in list(self._tasks):
+      now = OpenRTM_aist.TimerScheduler.now()
+      if task.deadline > now:
+        continue
+
+      period = self.period(task.period)
+      task.deadline += period
+      if task.deadline <= now:
+        task.deadline = now + period
+      task.listener.invoke()
+
+    self.reschedule()
     del guard
     return
 
+
+  ##
+  # @if jp
+  # @brief ꥹʡưμ
+  #
+  # ޵ưûưϥ޵ưȤ롣
+  #
+  # @param self
+  # @param tm ꥹʡư
+  # @return ꥹʡư [sec]
+  #
+  # @else
+  # @brief Getting the invocation interval of listener
+  #
+  # The interval shorter than the interval of timer is regarded as
+  # the interval of timer.
+  #
+  # @param self
+  # @param tm The invocation interval of listener
+  # @return The invocation interval of listener [sec]
+  #
+  # @endif
+  def period(self, tm):
+    return max(tm.toDouble(), self._interval.toDouble())
+
   ##
   # @if jp
   # @brief ꥹʡϿ
@@ -239,12 +358,15 @@ class Timer:
   # ListenerId registerListener(ListenerBase* listener, TimeValue tm);
   def registerListener(self, listener, tm):
     guard = OpenRTM_aist.ScopedLock(self._taskMutex)
+    deadline = OpenRTM_aist.TimerScheduler.now() + self.period(tm)
     for i in range(len(self._tasks)):
       if self._tasks[i].listener == listener:
         self._tasks[i].period = tm
-        self._tasks[i].remains = tm
+        self._tasks[i].deadline = deadline
+        self.reschedule()
         return listener
-    self._tasks.append(self.Task(listener, tm))
+    self._tasks.append(self.Task(listener, tm, deadline))
+    self.reschedule()
     return listener
 
 
@@ -359,8 +481,8 @@ class Timer:
   #
   # @endif
   class Task:
-    def __init__(self, lb, tm):
+    def __init__(self, lb, tm, deadline):
       self.listener = lb
       self.period = tm
-      self.remains = tm
+      self.deadline = deadline
       return
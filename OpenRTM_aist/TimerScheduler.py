@@ -0,0 +1,433 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  TimerScheduler.py
+# @brief TimerScheduler class
+# @date  $Date$
+#
+
+
+
+import ctypes
+import ctypes.util
+import errno
+import heapq
+import os
+import select
+import sys
+import threading
+import time
+
+if os.name != "nt":
+  import fcntl
+
+import OpenRTM_aist
+
+
+##
+# @if jp
+# @brief clock_gettime() Ϳ struct timespec
+# @else
+# @brief struct timespec given to clock_gettime()
+# @endif
+#
+class _timespec(ctypes.Structure):
+  _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+##
+# @if jp
+# @brief ץåȥե CLOCK_MONOTONIC 
+# @else
+# @brief The value of CLOCK_MONOTONIC for each platform
+# @endif
+#
+clock_monotonic_ids = {"linux": 1, "freebsd": 4, "darwin": 6}
+
+
+##
+# @if jp
+# @brief clock_gettime() μ
+#
+# librt ޤ libc  clock_gettime() 롣
+#
+# @return clock_gettime()ѤǤʤ None
+#
+# @else
+# @brief Getting clock_gettime()
+#
+# This gets clock_gettime() from librt or libc.
+#
+# @return clock_gettime(), or None if it is not available
+#
+# @endif
+#
+def load_clock_gettime():
+  for lib_ in ["librt.so.1", "librt.so", "c"]:
+    if lib_ == "c":
+      lib_ = ctypes.util.find_library(lib_)
+      if lib_ is None:
+        break
+    try:
+      func_ = ctypes.CDLL(lib_).clock_gettime
+    except (OSError, AttributeError):
+      continue
+    func_.argtypes = [ctypes.c_int, ctypes.POINTER(_timespec)]
+    func_.restype = ctypes.c_int
+    return func_
+  return None
+
+
+##
+# @if jp
+# @brief CLOCK_MONOTONIC ˤ [sec]
+# @else
+# @brief The time of CLOCK_MONOTONIC [sec]
+# @endif
+#
+def clock_monotonic():
+  ts_ = _timespec()
+  _clock_gettime(_clock_id, ctypes.byref(ts_))
+  return ts_.tv_sec + ts_.tv_nsec * 1e-9
+
+
+##
+# @if jp
+# @brief ñĴä [sec]
+#
+# time.monotonic() ѤǤʤ(Python 2) clock_gettime() 
+# CLOCK_MONOTONIC Ѥ롣碌ˤäƻ郎ȥޤ
+# ߤ뤿ᡢtime.time() ϤѤǤʤˤΤѤ롣
+#
+# @else
+# @brief The monotonic time [sec]
+#
+# CLOCK_MONOTONIC of clock_gettime() is used if time.monotonic() is
+# not available (Python 2). Since the timers stop when the clock is
+# stepped back, time.time() is used only if neither is available.
+#
+# @endif
+#
+try:
+  monotonic = time.monotonic
+except AttributeError:
+  monotonic = time.time
+  _clock_id = None
+  for platform_, id_ in clock_monotonic_ids.items():
+    if sys.platform.startswith(platform_):
+      _clock_id = id_
+  if _clock_id is not None:
+    _clock_gettime = load_clock_gettime()
+    if _clock_gettime is not None and \
+          _clock_gettime(_clock_id, ctypes.byref(_timespec())) == 0:
+      monotonic = clock_monotonic
+
+
+##
+# @if jp
+# @class TimerScheduler
+# @brief ޥ塼
+#
+# ץǶͭ륿ޥ塼顣Ͽ줿Хå
+# ñĴûˤлǻꤵ줿ˡĤΥåɤ
+# ƤӽФϿ줿ϥҡפǴ뤿ᡢϿȼФ
+# Ȥ O(log n) ǤꡢʬǽϸΥƥåǤϤʤ OS 
+# ꡼פ٤Ƿޤ롣åɤϺǤᤤޤ select() 
+# Եᤤ郎Ͽȥѥפؤν񤭹ߤǵ
+# ᡢPython 2  Condition.wait() Τ褦ʥݡ󥰤ϹԤʤ
+#
+# ХåϤΥåɤƤӽФ뤿ᡢû֤ǽλ
+# (¾ΥåɤؤΤʤ)ǤʤФʤʤTimer 
+# PooledPeriodicTask ϤΥ饹Ƕư롣
+#
+# @else
+# @class TimerScheduler
+# @brief Timer scheduler
+#
+# The timer scheduler shared in the process. The registered
+# callbacks are invoked from one thread at the absolute time of the
+# monotonic clock. Since the registered times are managed by a heap,
+# registering and taking out costs O(log n), and the resolution is
+# determined by the accuracy of the sleep of OS, not by a fixed tick.
+# The thread waits in select() until the earliest time and is woken
+# up by writing to a pipe when an earlier time is registered, so it
+# does not poll like Condition.wait() of Python 2.
+#
+# Since the callbacks are invoked from this thread, they must finish
+# in a short time (e.g. notifying other threads). Timer and
+# PooledPeriodicTask are driven by this class.
+#
+# @endif
+#
+class TimerScheduler:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # 塼Υåɤư롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Constructor
+  #
+  # This starts the thread of the scheduler.
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def __init__(self):
+    self._rtcout = OpenRTM_aist.Manager.instance().getLogbuf("TimerScheduler")
+    self._mutex = threading.Lock()
+    self._heap = []
+    if os.name == "nt":
+      self._event = threading.Event()
+      self._pipe = None
+    else:
+      self._pipe = os.pipe()
+      for fd_ in self._pipe:
+        flags_ = fcntl.fcntl(fd_, fcntl.F_GETFL)
+        fcntl.fcntl(fd_, fcntl.F_SETFL, flags_ | os.O_NONBLOCK)
+    self._seq = 0
+    self._thread = threading.Thread(target=self.svc)
+    self._thread.daemon = True
+    self._thread.start()
+    return
+
+
+  ##
+  # @if jp
+  # @brief 󥹥󥹼
+  #
+  # ץǶͭ TimerScheduler 롣
+  #
+  # @return TimerScheduler
+  #
+  # @else
+  # @brief Getting the instance
+  #
+  # This operation returns TimerScheduler shared in the process.
+  #
+  # @return TimerScheduler
+  #
+  # @endif
+  #
+  def instance():
+    global timerscheduler
+
+    guard = OpenRTM_aist.ScopedLock(scheduler_mutex)
+    if timerscheduler is None:
+      timerscheduler = TimerScheduler()
+    return timerscheduler
+
+  instance = staticmethod(instance)
+
+
+  ##
+  # @if jp
+  # @brief ߻μ
+  #
+  # 塼ѤñĴû롣
+  #
+  # @return ߻ [sec]
+  #
+  # @else
+  # @brief Getting the current time
+  #
+  # This operation returns the monotonic time used for scheduling.
+  #
+  # @return The current time [sec]
+  #
+  # @endif
+  #
+  def now():
+    return monotonic()
+
+  now = staticmethod(now)
+
+
+  ##
+  # @if jp
+  # @brief ХåϿ
+  #
+  # ꤷ˰٤ƤӽФХåϿ롣
+  #
+  # @param self
+  # @param deadline ƤӽФ(now() ˤл) [sec]
+  # @param callback Хå
+  # @return ϿID(cancel() Ϳ)
+  #
+  # @else
+  # @brief Registering a callback
+  #
+  # This operation registers a callback which is invoked once at
+  # the specified time.
+  #
+  # @param self
+  # @param deadline The time of invocation (absolute time of now()) [sec]
+  # @param callback The callback
+  # @return The ID of registration (given to cancel())
+  #
+  # @endif
+  #
+  def schedule(self, deadline, callback):
+    self._mutex.acquire()
+    self._seq += 1
+    entry = [deadline, self._seq, callback]
+    heapq.heappush(self._heap, entry)
+    earliest_ = self._heap[0] is entry
+    self._mutex.release()
+    if earliest_:
+      # the earliest deadline is changed
+      self.wakeup()
+    return entry
+
+
+  ##
+  # @if jp
+  # @brief ХåϿ
+  #
+  # ä줿ХåϸƤӽФ줺˥ҡפΤƤ롣
+  #
+  # @param self
+  # @param entry ϿID
+  #
+  # @else
+  # @brief Cancelling a callback
+  #
+  # The cancelled callback is discarded from the heap without being
+  # invoked.
+  #
+  # @param self
+  # @param entry The ID of registration
+  #
+  # @endif
+  #
+  def cancel(self, entry):
+    self._mutex.acquire()
+    entry[2] = None
+    self._mutex.release()
+    return
+
+
+  ##
+  # @if jp
+  # @brief 塼Υåɤ򵯤
+  #
+  # sleep() ԵΥåɤ򵯤Ե˸ƤФ줿ϼ
+  # sleep() ľ롣
+  #
+  # @param self
+  #
+  # @else
+  # @brief Waking up the thread of the scheduler
+  #
+  # This wakes up the thread waiting in sleep(). If this is called
+  # before the wait, the next sleep() returns immediately.
+  #
+  # @param self
+  #
+  # @endif
+  #
+  def wakeup(self):
+    if self._pipe is None:
+      self._event.set()
+      return
+
+    try:
+      os.write(self._pipe[1], b"x")
+    except OSError as e:
+      # the pipe is full, and the thread will wake up anyway
+      if e.errno != errno.EAGAIN:
+        raise
+    return
+
+
+  ##
+  # @if jp
+  # @brief 塼ΥåɤԵ
+  #
+  # ֤в᤹뤫 wakeup() ƤФޤԵ롣
+  #
+  # @param self
+  # @param timeout Ե [sec]None ξ wakeup() ޤԵ
+  #
+  # @else
+  # @brief Waiting of the thread of the scheduler
+  #
+  # This waits until the specified time passes or wakeup() is called.
+  #
+  # @param self
+  # @param timeout The waiting time [sec], or None to wait for wakeup()
+  #
+  # @endif
+  #
+  def sleep(self, timeout):
+    if self._pipe is None:
+      self._event.wait(timeout)
+      self._event.clear()
+      return
+
+    try:
+      select.select([self._pipe[0]], [], [], timeout)
+    except (select.error, OSError):
+      # interrupted by a signal
+      return
+
+    try:
+      while os.read(self._pipe[0], 256):
+        pass
+    except OSError as e:
+      if e.errno != errno.EAGAIN:
+        raise
+    return
+
+
+  ##
+  # @if jp
+  # @brief 塼Υåɤν
+  # @else
+  # @brief The procedure of the thread of the scheduler
+  # @endif
+  #
+  def svc(self):
+    while True:
+      callback = None
+      wait_time = None
+      self._mutex.acquire()
+      try:
+        while self._heap:
+          entry = self._heap[0]
+          if entry[2] is None:
+            heapq.heappop(self._heap)
+            continue
+
+          wait_time = entry[0] - monotonic()
+          if wait_time <= 0.0:
+            heapq.heappop(self._heap)
+            callback = entry[2]
+            entry[2] = None
+          break
+      finally:
+        self._mutex.release()
+
+      if callback is None:
+        # a callback registered meanwhile has written to the pipe
+        self.sleep(wait_time)
+        continue
+
+      try:
+        callback()
+      except:
+        self._rtcout.RTC_ERROR(OpenRTM_aist.Logger.print_exception())
+
+    return
+
+
+timerscheduler = None
+scheduler_mutex = threading.RLock()
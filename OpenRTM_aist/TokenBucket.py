@@ -0,0 +1,147 @@
+#!/usr/bin/env python
+# -*- coding: euc-jp -*-
+
+##
+# @file  TokenBucket.py
+# @brief TokenBucket class
+# @date  $Date$
+#
+
+
+
+import OpenRTM_aist
+
+
+##
+# @if jp
+# @class TokenBucket
+# @brief ȡХå
+#
+# ñ̻֤̤¤ȡХåȡȡ rate
+# [/s] ® burst ĤޤίޤꡢκݤʬΥȡ
+# 񤹤롣burst Ķ̤ϡХåȤդΤȤ˸¤
+# Ĥ­ʬϰʹߤ佼ֺѤ롣
+#
+# @else
+# @class TokenBucket
+# @brief Token bucket
+#
+# The token bucket which limits the amount of sending per unit
+# time. Tokens accumulate up to burst at the speed of rate [/s], and
+# the tokens of the amount are consumed when sending. Sending more
+# than burst is permitted only when the bucket is full, and the
+# shortage is repaid by the following refills.
+#
+# @endif
+#
+class TokenBucket:
+  """
+  """
+
+  ##
+  # @if jp
+  # @brief 󥹥ȥ饯
+  #
+  # @param self
+  # @param rate ȡ佼® [/s]
+  # @param burst ХåȤ (0 ʲξ1ʬ)
+  #
+  # @else
+  # @brief Constructor
+  #
+  # @param self
+  # @param rate The refill rate of tokens [/s]
+  # @param burst The capacity of the bucket (one second if 0 or less)
+  #
+  # @endif
+  #
+  def __init__(self, rate, burst=0.0):
+    self._rate = float(rate)
+    if burst <= 0.0:
+      burst = self._rate
+    self._burst = float(burst)
+    self._tokens = self._burst
+    self._last = OpenRTM_aist.TimerScheduler.now()
+    return
+
+
+  ##
+  # @if jp
+  # @brief ȡ佼
+  # @else
+  # @brief Refilling tokens
+  # @endif
+  #
+  def refill(self):
+    now = OpenRTM_aist.TimerScheduler.now()
+    self._tokens = min(self._burst,
+                       self._tokens + (now - self._last) * self._rate)
+    self._last = now
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǽǧ
+  #
+  # @param self
+  # @param n 
+  # @return ǽʾ True
+  #
+  # @else
+  # @brief Checking whether sending is possible
+  #
+  # @param self
+  # @param n The amount of sending
+  # @return True if sending is possible
+  #
+  # @endif
+  #
+  def available(self, n=1):
+    self.refill()
+    return self._tokens >= min(n, self._burst)
+
+
+  ##
+  # @if jp
+  # @brief ȡξ
+  #
+  # @param self
+  # @param n 
+  #
+  # @else
+  # @brief Consuming tokens
+  #
+  # @param self
+  # @param n The amount of sending
+  #
+  # @endif
+  #
+  def consume(self, n=1):
+    self._tokens -= n
+    return
+
+
+  ##
+  # @if jp
+  # @brief ǽˤʤޤǤλ
+  #
+  # @param self
+  # @param n 
+  # @return ǽˤʤޤǤλ [s]
+  #
+  # @else
+  # @brief The time until sending becomes possible
+  #
+  # @param self
+  # @param n The amount of sending
+  # @return The time until sending becomes possible [s]
+  #
+  # @endif
+  #
+  def delay(self, n=1):
+    self.refill()
+    shortage = min(n, self._burst) - self._tokens
+    if shortage <= 0.0:
+      return 0.0
+    return shortage / self._rate
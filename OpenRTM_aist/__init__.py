@@ -29,6 +29,7 @@ from BufferBase import *
 from RingBuffer import *
 from CdrBufferBase import *
 from CdrRingBuffer import *
+from SPSCRingBuffer import *
 from DataPortStatus import *
 from Listener import *
 from ListenerHolder import *
@@ -38,8 +39,10 @@ from ManagerActionListener import *
 from ComponentActionListener import *
 from Typename import *
 from Guard import *
+from TimerScheduler import *
 from PeriodicTask import *
 from DefaultPeriodicTask import *
+from PooledPeriodicTask import *
 from PeriodicTaskFactory import *
 from RTObject import *
 from ManagerServant import *
@@ -65,6 +68,10 @@ from InPortBase import *
 from InPortConsumer import *
 from OutPortConsumer import *
 from OutPortProvider import *
+from ConnectorMetrics import *
+from TokenBucket import *
+from CompressionCodec import *
+from DeltaCodec import *
 from PublisherBase import *
 from PublisherFlush import *
 from ExtTrigExecutionContext import *
@@ -82,6 +89,14 @@ from InPort import *
 from InPortProvider import *
 from InPortCorbaCdrConsumer import *
 from InPortCorbaCdrProvider import *
+from InPortCorbaCdrBatchConsumer import *
+from InPortCorbaCdrBatchProvider import *
+from InPortCorbaCdrOnewayConsumer import *
+from InPortCorbaCdrOnewayProvider import *
+from ByteDataStreamBase import *
+from CdrSerializer import *
+from CdrNumpySerializer import *
+from StructSerializer import *
 from ConnectorBase import *
 from ConnectorListener import *
 from InPortConnector import *
@@ -98,6 +113,7 @@ from OutPortPullConnector import *
 from OutPortPushConnector import *
 from PublisherNew import *
 from PublisherPeriodic import *
+from PublisherCoalesce import *
 from FactoryInit import *
 from InPortDirectConsumer import *
 from InPortDirectProvider import *
@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+
+#  \file test_CdrNumpySerializer.py
+#  \brief test for CdrNumpySerializer class
+#  \date $Date$
+#
+
+
+import sys
+sys.path.insert(1,"../")
+
+import unittest
+
+from omniORB import cdrMarshal
+from omniORB import cdrUnmarshal
+from omniORB import any
+
+from CdrNumpySerializer import *
+
+import RTC
+import OpenRTM_aist
+
+
+class TestCdrNumpySerializer(unittest.TestCase):
+  def setUp(self):
+    self._ser = CdrNumpySerializer()
+    return
+
+  def tearDown(self):
+    OpenRTM_aist.Manager.instance().shutdownManager()
+    return
+
+  def test_setDataType(self):
+    self.assertEqual(self._ser.setDataType(RTC.TimedDoubleSeq(RTC.Time(0,0),[])),True)
+    self.assertEqual(self._ser.setDataType(RTC.TimedLong(RTC.Time(0,0),0)),False)
+    return
+
+  def test_serialize(self):
+    for data in [RTC.TimedDoubleSeq(RTC.Time(1,2),[0.5,1.5,2.5]),
+                 RTC.TimedFloatSeq(RTC.Time(3,4),[0.5,1.5]),
+                 RTC.TimedShortSeq(RTC.Time(5,6),[1,-2,3]),
+                 RTC.TimedOctetSeq(RTC.Time(7,8),"abc"),
+                 RTC.TimedLongSeq(RTC.Time(9,10),[])]:
+      tc = any.to_any(data).typecode()
+      for endian in [True, False]:
+        self.assertEqual(self._ser.setDataType(data),True)
+        self._ser.isLittleEndian(endian)
+        cdr = self._ser.serialize(data)
+        self.assertEqual(cdr, cdrMarshal(tc, data, endian))
+        ret = self._ser.deserialize(cdr)
+        self.assertEqual(ret.tm.sec, data.tm.sec)
+        self.assertEqual(ret.tm.nsec, data.tm.nsec)
+        self.assertEqual(len(ret.data), len(data.data))
+        ret = cdrUnmarshal(tc, cdr, endian)
+        self.assertEqual(ret.tm.sec, data.tm.sec)
+    return
+
+  def test_roundtrip_padded(self):
+    # the 12 bytes header of TimedDoubleSeq needs 4 bytes of padding
+    data = RTC.TimedDoubleSeq(RTC.Time(1,2),[0.5,1.5,2.5])
+    self._ser.setDataType(data)
+    cdr = self._ser.serialize(data)
+    self.assertEqual(len(cdr), 16 + 3 * 8)
+    ret = self._ser.deserialize(cdr)
+    self.assertEqual((ret.tm.sec, ret.tm.nsec), (1, 2))
+    self.assertEqual(list(ret.data), [0.5,1.5,2.5])
+
+    data = RTC.TimedOctetSeq(RTC.Time(1,2),b"abc")
+    self._ser.setDataType(data)
+    ret = self._ser.deserialize(self._ser.serialize(data))
+    self.assertEqual(ret.data.tobytes(), b"abc")
+    return
+
+  def test_serialize_array(self):
+    data = RTC.TimedDoubleSeq(RTC.Time(1,2),[0.5,1.5,2.5,3.5])
+    self._ser.setDataType(data)
+    cdr = self._ser.serialize(data)
+    data.data = numpy.array([[0.5,1.5],[2.5,3.5]])
+    self.assertEqual(self._ser.serialize(data), cdr)
+    ret = self._ser.deserialize(cdr)
+    self.assertEqual(list(ret.data), [0.5,1.5,2.5,3.5])
+    return
+
+  def test_numpySequenceView(self):
+    data = RTC.TimedDoubleSeq(RTC.Time(1,2),[0.5,1.5,2.5])
+    for endian in [True, False]:
+      tc = any.to_any(data).typecode()
+      cdr = cdrMarshal(tc, data, endian)
+      sec, nsec, arr = numpySequenceView(memoryview(cdr), RTC.TimedDoubleSeq, endian)
+      self.assertEqual((sec, nsec), (1, 2))
+      self.assertEqual(list(arr), [0.5,1.5,2.5])
+    self.assertRaises(TypeError, numpySequenceView, cdr, RTC.TimedLong)
+    return
+
+
+############### test #################
+if __name__ == '__main__':
+        unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+# \file test_CompressionCodec.py
+# \brief test for CompressionCodec class
+# \date $Date$
+#
+
+
+import sys
+sys.path.insert(1,"../")
+
+import OpenRTM_aist
+import unittest
+
+from CompressionCodec import *
+
+
+class TestCompressionCodec(unittest.TestCase):
+  def setUp(self):
+    return
+
+  def tearDown(self):
+    OpenRTM_aist.Manager.instance().shutdownManager()
+    return
+
+  def test_compress(self):
+    codec = CompressionCodec("zlib", 64, 1)
+    data = b"abcd" * 256
+    compressed = codec.compress(data)
+    self.assertEqual(compressed[0:1], CompressionCodec.ZLIB)
+    self.assert_(len(compressed) < len(data))
+    self.assertEqual(CompressionCodec.decompress(compressed), data)
+
+    # data smaller than the threshold is not compressed
+    compressed = codec.compress(b"abcd")
+    self.assertEqual(compressed, CompressionCodec.RAW + b"abcd")
+    self.assertEqual(CompressionCodec.decompress(compressed), b"abcd")
+    return
+
+  def test_negotiate(self):
+    self.assertEqual(negotiateCompressionType("zlib"), "zlib")
+    self.assertEqual(negotiateCompressionType("foo, ZLIB"), "zlib")
+    self.assertEqual(negotiateCompressionType("foo"), "none")
+    self.assertEqual(negotiateCompressionType(""), "none")
+    self.assertEqual(negotiateCompressionType("lzma,zlib", ["zlib"]), "zlib")
+    self.assertEqual(negotiateCompressionType("zlib", []), "none")
+
+    prop = OpenRTM_aist.Properties()
+    self.assertEqual(createCompressionCodec(prop), None)
+    prop.setProperty("compression.type", "foo,zlib")
+    prop.setProperty("compression.threshold", "16")
+    codec = createCompressionCodec(prop)
+    self.assertEqual(codec.getType(), "zlib")
+    self.assertEqual(codec.key(), ("zlib", 16, 1))
+    return
+
+  def test_metrics(self):
+    metrics = OpenRTM_aist.ConnectorMetrics()
+    metrics.onCompress(1000, 201, 0.001)
+    metrics.onCompress(1000, 199, 0.001)
+    metrics.onDecompress(0.0005)
+    result = metrics.getMetrics()
+    self.assertEqual(result["compression.count"], 2)
+    self.assertAlmostEqual(result["compression.ratio"], 0.2)
+    self.assertAlmostEqual(result["compression.cpu_time"], 0.002)
+    self.assertEqual(result["decompression.count"], 1)
+    return
+
+
+############### test #################
+if __name__ == '__main__':
+  unittest.main()
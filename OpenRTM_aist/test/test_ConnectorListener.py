@@ -52,6 +52,18 @@ class DataListener(OpenRTM_aist.ConnectorDataListenerT):
 
 
 
+class OctetSeqListener(OpenRTM_aist.ConnectorDataListenerT):
+	def __init__(self):
+		self._data = []
+		return
+
+	def __call__(self, info, cdrdata):
+		data = OpenRTM_aist.ConnectorDataListenerT.__call__(self, info, cdrdata, RTC.TimedOctetSeq(RTC.Time(0,0),[]))
+		self._data.append(data)
+		return OpenRTM_aist.ConnectorListenerStatus.NO_CHANGE
+
+
+
 class Listener(OpenRTM_aist.ConnectorListener):
 	def __init__(self, name):
 		self._name = name
@@ -183,6 +195,40 @@ class TestConnectorListener(unittest.TestCase):
 		return
 
 
+	def test_delta(self):
+		info = OpenRTM_aist.ConnectorInfo("name",
+						  "id",
+						  [],
+						  OpenRTM_aist.Properties())
+		info.properties.setProperty("delta.enable","YES")
+		listener = OctetSeqListener()
+		holder = OpenRTM_aist.ConnectorDataListenerHolder()
+		holder.addListener(listener,True)
+
+		cdrs = []
+		for i in range(2):
+			data = RTC.TimedOctetSeq(RTC.Time(0,0),chr(i) + "\0" * 8191)
+			cdrs.append(cdrMarshal(any.to_any(data).typecode(), data, True))
+		encoder = OpenRTM_aist.DeltaEncoder(30, 1024)
+		key, key_frame = encoder.encode(cdrs[0])
+		key, delta_frame = encoder.encode(cdrs[1])
+		self.assertFalse(key)
+
+		# the listener is not invoked before the key frame
+		holder.notify(info, delta_frame)
+		self.assertEqual(listener._data, [])
+
+		# the frames written by the connector are restored without decoding
+		holder.notify(info, OpenRTM_aist.DeltaFrame(delta_frame, cdrs[1]))
+		self.assertEqual(listener._data[-1].data[0], chr(1))
+
+		holder.notify(info, key_frame)
+		holder.notify(info, delta_frame)
+		self.assertEqual(len(listener._data), 3)
+		self.assertEqual(listener._data[-1].data[0], chr(1))
+		return
+
+
 	def test_ConnectorListener(self):
 		# add Listener.
 		for i in range(OpenRTM_aist.ConnectorListenerType.CONNECTOR_LISTENER_NUM):
@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+# \file test_ConnectorMetrics.py
+# \brief test for ConnectorMetrics class
+# \date $Date$
+#
+
+
+import sys
+sys.path.insert(1,"../")
+sys.path.insert(1,"../RTM_IDL")
+
+import unittest
+import time
+
+from ConnectorMetrics import *
+import OpenRTM_aist
+import RTC
+
+
+class TestConnectorMetrics(unittest.TestCase):
+
+  def setUp(self):
+    self._metrics = ConnectorMetrics()
+
+  def test_counters(self):
+    self._metrics.onSent("abcd")
+    self._metrics.onSent("ef")
+    self._metrics.onReceived("abc")
+    self._metrics.onOverwrite()
+    self._metrics.onDrop(3)
+    self._metrics.onDrop(-1)
+    self._metrics.onBufferFull()
+    self._metrics.onBufferTimeout()
+    self._metrics.onReceiverFull()
+    self._metrics.onReceiverTimeout()
+    self._metrics.onError()
+    self._metrics.setOccupancy(4)
+    self._metrics.setOccupancy(2)
+
+    m = self._metrics.getMetrics()
+    self.assertEqual(m["sent"], 2)
+    self.assertEqual(m["sent_bytes"], 6)
+    self.assertEqual(m["received"], 1)
+    self.assertEqual(m["received_bytes"], 3)
+    self.assertEqual(m["overwrites"], 1)
+    self.assertEqual(m["drops"], 5)
+    self.assertEqual(m["buffer_full"], 1)
+    self.assertEqual(m["buffer_timeout"], 1)
+    self.assertEqual(m["receiver_full"], 1)
+    self.assertEqual(m["receiver_timeout"], 1)
+    self.assertEqual(m["errors"], 1)
+    self.assertEqual(m["high_water_mark"], 4)
+
+    self._metrics.reset()
+    m = self._metrics.getMetrics()
+    self.assertEqual(m["sent"], 0)
+    self.assertEqual(m["high_water_mark"], 0)
+    return
+
+  def test_latency(self):
+    now = time.time()
+    sec = int(now - 0.002)
+    nsec = int((now - 0.002 - sec) * 1e9)
+    self._metrics.onLatency(RTC.TimedLong(RTC.Time(sec, nsec), 0))
+    self._metrics.onLatency(0)
+
+    m = self._metrics.getMetrics()
+    self.assertEqual(m["latency.count"], 1)
+    self.assertEqual(sum(m["latency.histogram"]), 1)
+    self.assertEqual(m["latency.histogram"][3], 1)
+    self.assertTrue(m["latency.min"] >= 0.002)
+    return
+
+  def test_toStringPairs(self):
+    self._metrics.onSent("abcd")
+    pairs = dict(self._metrics.toStringPairs())
+    self.assertEqual(pairs["dataport.metrics.sent"], "1")
+    self.assertEqual(pairs["dataport.metrics.sent_bytes"], "4")
+    self.assertEqual(len(pairs["dataport.metrics.latency.histogram"].split(",")),
+                     len(ConnectorMetrics.latency_bounds))
+    return
+
+
+############### test #################
+if __name__ == '__main__':
+  unittest.main()
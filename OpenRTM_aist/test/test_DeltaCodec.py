@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+# \file test_DeltaCodec.py
+# \brief test for DeltaEncoder and DeltaDecoder classes
+# \date $Date$
+#
+
+
+import sys
+sys.path.insert(1,"../")
+
+import OpenRTM_aist
+import unittest
+
+from DeltaCodec import *
+
+
+def modify(data, offset, value):
+  buf = bytearray(data)
+  buf[offset] = value
+  return bytes(buf)
+
+
+class TestDeltaCodec(unittest.TestCase):
+  def setUp(self):
+    self._data = bytes(bytearray(range(256))) * 64
+    return
+
+  def tearDown(self):
+    OpenRTM_aist.Manager.instance().shutdownManager()
+    return
+
+  def test_encode(self):
+    encoder = DeltaEncoder(3, 1024)
+    decoder = DeltaDecoder()
+
+    key, frame = encoder.encode(self._data)
+    self.assert_(key)
+    self.assertEqual(decoder.decode(frame), self._data)
+
+    data = modify(modify(self._data, 10, 0), 5000, 0)
+    key, frame = encoder.encode(data)
+    self.assertFalse(key)
+    self.assert_(len(frame) < 2 * 1024 + 100)
+    self.assertEqual(decoder.decode(frame), data)
+    self.assertEqual(encoder.diff(data), [(0, 1024), (4096, 1024)])
+
+    # adjacent blocks are merged
+    data = modify(modify(self._data, 1023, 7), 1024, 7)
+    self.assertEqual(encoder.diff(data), [(0, 2048)])
+
+    # a key frame every key_interval data
+    encoder.encode(data)
+    encoder.encode(data)
+    key, frame = encoder.encode(data)
+    self.assert_(key)
+    self.assertEqual(decoder.decode(frame), data)
+
+    # a key frame when the length changes
+    key, frame = encoder.encode(self._data[:1000])
+    self.assert_(key)
+    return
+
+  def test_lost_key_frame(self):
+    encoder = DeltaEncoder(30, 1024)
+    decoder = DeltaDecoder()
+    key, frame = encoder.encode(self._data)
+    decoder.decode(frame)
+
+    encoder.forceKeyFrame()
+    key, frame = encoder.encode(self._data)
+    self.assert_(key)
+    key, frame = encoder.encode(modify(self._data, 0, 1))
+    self.assertFalse(key)
+    # the key frame was lost
+    self.assertEqual(decoder.decode(frame), None)
+
+    # a full frame is restored without changing the state
+    self.assertEqual(decoder.decode(DeltaEncoder.FULL + b"abc"), b"abc")
+    return
+
+  def test_frame(self):
+    encoder = DeltaEncoder(30, 1024)
+    key, frame = encoder.encode(self._data)
+    frame = DeltaFrame(frame, self._data)
+    self.assert_(isinstance(frame, bytes))
+    self.assertEqual(frame.data, self._data)
+    self.assertEqual(DeltaDecoder().decode(frame), self._data)
+    return
+
+  def test_create(self):
+    prop = OpenRTM_aist.Properties()
+    self.assertEqual(createDeltaEncoder(prop), None)
+    self.assertEqual(createDeltaDecoder(prop), None)
+    prop.setProperty("delta.enable", "YES")
+    prop.setProperty("delta.key_interval", "10")
+    encoder = createDeltaEncoder(prop)
+    self.assertEqual(encoder._keyInterval, 10)
+    self.assertEqual(encoder._blockSize, 4096)
+    self.assertNotEqual(createDeltaDecoder(prop), None)
+    return
+
+  def test_unreliable_publisher(self):
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("delta.enable", "YES")
+    prop.setProperty("subscription_type", "new")
+    prop.setProperty("publisher.push_policy", "new")
+    self.assertFalse(isDeltaReliable(prop))
+
+    # push_policy=new may drop the key frame, so all frames are key frames
+    encoder = createDeltaEncoder(prop)
+    for i in range(3):
+      key, frame = encoder.encode(modify(self._data, 0, i))
+      self.assert_(key)
+
+    prop.setProperty("publisher.push_policy", "fifo")
+    self.assert_(isDeltaReliable(prop))
+    encoder = createDeltaEncoder(prop)
+    encoder.encode(self._data)
+    key, frame = encoder.encode(modify(self._data, 0, 1))
+    self.assertFalse(key)
+
+    prop.setProperty("subscription_type", "coalesce")
+    self.assertFalse(isDeltaReliable(prop))
+    prop.setProperty("subscription_type", "flush")
+    prop.setProperty("publisher.push_policy", "new")
+    self.assert_(isDeltaReliable(prop))
+    return
+
+
+############### test #################
+if __name__ == '__main__':
+  unittest.main()
@@ -121,6 +121,52 @@ class TestDirectPort(unittest.TestCase):
     self.outport_obj.disconnect_all()
 
 
+  def test_Push_queue(self):
+    print "Push queue"
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("dataport.interface_type","direct")
+    prop.setProperty("dataport.dataflow_type","push")
+    prop.setProperty("dataport.direct.queue","YES")
+    ret = OpenRTM_aist.connect("con1",prop,self.inport_obj,self.outport_obj)
+
+    # the data written before reading is not lost
+    for i in range(3):
+      self._d_out.data = i
+      self._outOut.write()
+
+    for i in range(3):
+      self.assertTrue(self._inIn.isNew())
+      data = self._inIn.read()
+      self.assertEqual(data.data, i)
+      # a shallow copy is stored in the queue
+      self.assertFalse(data is self._d_out)
+    self.assertFalse(self._inIn.isNew())
+
+    self.outport_obj.disconnect_all()
+
+
+  def test_Push_upgrade(self):
+    print "Push upgrade"
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("dataport.interface_type","corba_cdr")
+    prop.setProperty("dataport.dataflow_type","push")
+    prop.setProperty("dataport.transport_upgrade","YES")
+    ret = OpenRTM_aist.connect("con1",prop,self.inport_obj,self.outport_obj)
+
+    # the ports in the same process are connected with direct
+    cprof = self._outOut.getConnectorProfiles()[0]
+    self.assertEqual(cprof.properties.getProperty("interface_type"), "direct")
+    self.assertEqual(cprof.properties.getProperty("transport_upgrade.requested"), "corba_cdr")
+
+    for i in range(2):
+      self._d_out.data = i
+      self._outOut.write()
+    for i in range(2):
+      self.assertEqual(self._inIn.read().data, i)
+
+    self.outport_obj.disconnect_all()
+
+
 
   def test_Pull(self):
     print "Pull"
@@ -119,6 +119,26 @@ class TestInPort(unittest.TestCase):
     self._ipn.update()
     return
 
+  def test_read_into(self):
+    target = RTC.TimedLong(RTC.Time(0,0), 0)
+    self._connector.write(RTC.TimedLong(RTC.Time(1,2), 789))
+    self.assertEqual(self._ipn.read_into(target), target)
+    self.assertEqual(target.data, 789)
+    self.assertEqual(target.tm.sec, 1)
+    self.assertEqual(target.tm.nsec, 2)
+    return
+
+  def test_read_all_direct(self):
+    self._ipn.write(RTC.TimedLong(RTC.Time(0,0), 321))
+    # direct data is not consumed by a raw read
+    self.assertEqual(self._ipn.read_all(raw=True), [])
+    self.assertEqual(self._ipn.isNew(), True)
+    values = self._ipn.read_all()
+    self.assertEqual(len(values), 1)
+    self.assertEqual(values[0].data, 321)
+    self.assertEqual(self._ipn.isNew(), False)
+    return
+
   def test_OnRead(self):
     self._connector.write(RTC.TimedLong(RTC.Time(0,0), 456))
     self._ipn.setOnRead(OnRWTest().echo)
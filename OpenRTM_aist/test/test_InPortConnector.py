@@ -20,6 +20,9 @@ sys.path.insert(1,"../")
 
 import unittest
 
+from omniORB import cdrMarshal
+from omniORB import any
+
 from InPortConnector import *
 
 import RTC, RTC__POA
@@ -46,6 +49,13 @@ class TestInPortConnector(unittest.TestCase):
 	def test_getBuffer(self):
 		self.assertEqual(self._ic.getBuffer(),None)
 
+	def test_setDataType(self):
+		self.assertEqual(self._ic.setConnectorInfo(self._prof),RTC.RTC_OK)
+		self._ic.setDataType(RTC.TimedLong(RTC.Time(0,0),0))
+		cdr = cdrMarshal(any.to_any(RTC.TimedLong(RTC.Time(0,0),0)).typecode(),
+				 RTC.TimedLong(RTC.Time(0,0),123), True)
+		self.assertEqual(self._ic._unmarshal(cdr).data,123)
+
 
 
 ############### test #################
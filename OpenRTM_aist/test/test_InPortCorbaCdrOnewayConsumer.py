@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+
+#  \file test_InPortCorbaCdrOnewayConsumer.py
+#  \brief test for InPortCorbaCdrOnewayConsumer class
+#  \date $Date$
+#
+
+
+import sys
+sys.path.insert(1,"../")
+
+import unittest
+
+from InPortCorbaCdrOnewayConsumer import *
+
+import OpenRTM
+import OpenRTM_aist
+
+
+class InPortCdrOnewayMock:
+	def __init__(self):
+		self._data = []
+		self._status = OpenRTM.PORT_OK
+		self._lost = 0
+		return
+
+	def push(self, data):
+		if self._lost > 0:
+			self._lost -= 1
+			return
+		self._data.append(data)
+		return
+
+	def ack(self):
+		ret = (self._status, len(self._data))
+		self._data = []
+		return ret
+
+
+class DataListenerMock(OpenRTM_aist.ConnectorDataListener):
+	def __init__(self):
+		self._data = []
+		return
+
+	def __call__(self, info, data):
+		self._data.append(data)
+		return OpenRTM_aist.ConnectorListenerStatus.NO_CHANGE
+
+
+
+class TestInPortCorbaCdrOnewayConsumer(unittest.TestCase):
+	def setUp(self):
+		self._cons = InPortCorbaCdrOnewayConsumer()
+		self._inport = InPortCdrOnewayMock()
+		self._cons._ptr = lambda get_ref=False: self._inport
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("ack_interval","2")
+		self._cons.init(prop)
+		self._listeners = OpenRTM_aist.ConnectorListeners()
+		self._full = DataListenerMock()
+		self._listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_RECEIVER_FULL].addListener(self._full,True)
+		self._metrics = OpenRTM_aist.ConnectorMetrics()
+		cinfo = OpenRTM_aist.ConnectorInfo("", "", [], OpenRTM_aist.Properties())
+		self._cons.setListener(cinfo, self._listeners)
+		self._cons.setMetrics(self._metrics)
+		return
+
+	def tearDown(self):
+		OpenRTM_aist.Manager.instance().shutdownManager()
+		return
+
+	def test_put_ack(self):
+		# the status of ack() is notified, not returned for the sent data
+		self._inport._status = OpenRTM.BUFFER_FULL
+		self.assertEqual(self._cons.put("a"), OpenRTM_aist.DataPortStatus.PORT_OK)
+		self.assertEqual(self._cons.put("b"), OpenRTM_aist.DataPortStatus.PORT_OK)
+		self.assertEqual(self._full._data, ["b"])
+		self._inport._status = OpenRTM.PORT_OK
+		return
+
+	def test_lost(self):
+		# the data of the last interval may still be on the way
+		self._inport._lost = 1
+		self._cons.put("a")
+		self._cons.put("b")
+		self.assertEqual(self._metrics.getMetrics()["drops"], 0)
+		self._cons.put("c")
+		self._cons.put("d")
+		self.assertEqual(self._metrics.getMetrics()["drops"], 1)
+		self._cons.put("e")
+		self._cons.put("f")
+		self.assertEqual(self._metrics.getMetrics()["drops"], 1)
+		return
+
+
+
+############### test #################
+if __name__ == '__main__':
+        unittest.main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+
+#  \file test_InPortCorbaCdrOnewayProvider.py
+#  \brief test for InPortCorbaCdrOnewayProvider class
+#  \date $Date$
+#
+
+
+from omniORB import *
+from omniORB import any
+
+import sys
+sys.path.insert(1,"../")
+
+import unittest
+
+from InPortCorbaCdrOnewayProvider import *
+
+import RTC, RTC__POA
+import OpenRTM
+import OpenRTM_aist
+
+
+class ConnectorMock:
+	def __init__(self):
+		self._data = []
+		self._ret = OpenRTM_aist.BufferStatus.BUFFER_OK
+		return
+
+	def write(self, data):
+		self._data.append(data)
+		return self._ret
+
+
+
+class TestInPortCorbaCdrOnewayProvider(unittest.TestCase):
+	def setUp(self):
+		OpenRTM_aist.InPortCorbaCdrOnewayProviderInit()
+		self._prov = OpenRTM_aist.InPortProviderFactory.instance().createObject("corba_cdr_oneway")
+		self._con = ConnectorMock()
+		self._prov._connector = self._con
+		return
+
+	def tearDown(self):
+		OpenRTM_aist.Manager.instance().shutdownManager()
+		return
+
+	def test_push_ack(self):
+		data = RTC.TimedLong(RTC.Time(0,0),123)
+		cdr = cdrMarshal(any.to_any(data).typecode(), data, 1)
+		self._prov.push(cdr)
+		self._prov.push(cdr)
+		self.assertEqual(self._prov.ack(),(OpenRTM.PORT_OK,2))
+		self.assertEqual(len(self._con._data),2)
+		self._con._ret = OpenRTM_aist.BufferStatus.BUFFER_FULL
+		self._prov.push(cdr)
+		self._con._ret = OpenRTM_aist.BufferStatus.BUFFER_OK
+		self._prov.push(cdr)
+		self.assertEqual(self._prov.ack(),(OpenRTM.BUFFER_FULL,2))
+		self.assertEqual(self._prov.ack(),(OpenRTM.PORT_OK,0))
+		return
+
+
+
+############### test #################
+if __name__ == '__main__':
+        unittest.main()
@@ -100,6 +100,33 @@ class TestInPortSHMProvider(unittest.TestCase):
 		self.assertEqual(get_data.data, 123)
 		return
 
+	def test_lease(self):
+		self._con = ConnectorMock(self._buffer)
+		self._prov._connector = self._con
+		self._prov.setBuffer(self._buffer)
+		prop = OpenRTM_aist.Properties()
+		prop.setProperty("shem_lease","YES")
+		self._prov.init(prop)
+		self.assertTrue(self._prov.init_ring(2))
+		self.assertTrue(self._prov.write_slot(b"data0"))
+		self.assertTrue(self._prov.write_slot(b"data1"))
+
+		# the slots are left for leaseData() instead of the buffer
+		self.assertEqual(self._prov.put(),OpenRTM.PORT_OK)
+		self.assertEqual(self._buffer._data, None)
+		view = self._prov.leaseData()
+		self.assertEqual(view.tobytes(), b"data0")
+		# the drain does not pass the leased slot
+		self._prov._draining = True
+		self._prov.drainSlots()
+		self.assertEqual(self._buffer._data, None)
+		del view
+		self._prov.releaseData()
+		self.assertEqual(self._prov.leaseData().tobytes(), b"data1")
+		self._prov.releaseData()
+		self.assertEqual(self._prov.leaseData(), None)
+		return
+
 
 
 ############### test #################
@@ -88,6 +88,34 @@ class TestOutPortPullConnector(unittest.TestCase):
     return
 
 
+  def test_lazy_marshal(self):
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("lazy_marshal","YES")
+    profile = OpenRTM_aist.ConnectorInfo("test","id",["in","out"],prop)
+    oc = OutPortPullConnector(profile,OutPortProviderMock(),OpenRTM_aist.ConnectorListeners(),OpenRTM_aist.RingBuffer())
+
+    marshaled = []
+    def serializeData(data, cache=None):
+      marshaled.append(data.data)
+      return data.data
+    oc.serializeData = serializeData
+
+    d = RTC.TimedLong(RTC.Time(0,0),0)
+    for i in range(3):
+      d.data = i
+      oc.write(d)
+    # nothing is marshaled when written
+    self.assertEqual(marshaled, [])
+
+    cdr = [None]
+    oc.read(cdr)
+    self.assertEqual(cdr[0], 0)
+    oc.read(cdr)
+    self.assertEqual(cdr[0], 1)
+    self.assertEqual(marshaled, [0, 1])
+    return
+
+
 ############### test #################
 if __name__ == '__main__':
   unittest.main()
@@ -82,6 +82,18 @@ class TestOutPortPushConnector(unittest.TestCase):
     self.assertEqual(get_data.data, 123)
     return
 
+  def test_write_cache(self):
+    wdata = RTC.TimedLong(RTC.Time(0,0), 123)
+    cache = {}
+    self._oc.write(wdata, cache)
+    self.assertEqual(len(cache), 1)
+    self.assertEqual(cache.values()[0], self._buffer.read())
+    # cached data is reused by the next write with the same cache
+    cache[cache.keys()[0]] = "cached"
+    self._oc.write(RTC.TimedLong(RTC.Time(0,0), 456), cache)
+    self.assertEqual(self._buffer.read(), "cached")
+    return
+
 
   def test_disconnect(self):
     self.assertEqual(self._oc.disconnect(), OpenRTM_aist.DataPortStatus.PORT_OK)
@@ -230,6 +230,39 @@ class TestPeriodicExecutionContext(unittest.TestCase):
   def test_get_profile(self):
     print "get_profile.kind: ", self._pec.get_profile().kind
 
+
+  def test_nextDeadline(self):
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("scheduling_mode", "absolute")
+    self._pec.setSchedulingMode(prop)
+    self.assertEqual(self._pec._absolute, True)
+    self.assertEqual(self._pec._overrunPolicy, "skip")
+
+    # no overrun
+    self.assertAlmostEqual(self._pec.nextDeadline(1.0, 1.05, 0.1), 1.1)
+    self.assertEqual(self._pec.getOverrunCount(), 0)
+
+    # skip: 2 cycles (1.1, 1.2) are missed
+    self.assertAlmostEqual(self._pec.nextDeadline(1.0, 1.25, 0.1), 1.3)
+    self.assertEqual(self._pec.getOverrunCount(), 1)
+    self.assertEqual(self._pec.getMissedCycleCount(), 2)
+
+    prop.setProperty("overrun_policy", "catchup")
+    self._pec.setSchedulingMode(prop)
+    self.assertAlmostEqual(self._pec.nextDeadline(1.0, 1.25, 0.1), 1.1)
+
+    # catchup: 20 cycles are missed, more than catchup_limit
+    prop.setProperty("catchup_limit", "5")
+    self._pec.setSchedulingMode(prop)
+    self.assertAlmostEqual(self._pec.nextDeadline(1.0, 3.05, 0.1), 3.1)
+    self.assertEqual(self._pec.getMissedCycleCount(), 22)
+
+    prop.setProperty("overrun_policy", "shift")
+    self._pec.setSchedulingMode(prop)
+    self.assertAlmostEqual(self._pec.nextDeadline(1.0, 1.25, 0.1), 1.25)
+    self.assertEqual(self._pec.getOverrunCount(), 4)
+    self.assertEqual(self._pec.getMissedCycleCount(), 22)
+
   
 
 ############### test #################
@@ -0,0 +1,140 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+# \file test_PooledPeriodicTask.py
+# \brief test for PooledPeriodicTask class
+# \date $Date$
+#
+
+
+import sys,time
+sys.path.insert(1,"../")
+
+import OpenRTM_aist
+import unittest
+import threading
+
+from PooledPeriodicTask import *
+
+
+class Svc:
+	def __init__(self, wait=0.0):
+		self.count = 0
+		self.running = False
+		self.overlapped = False
+		self.wait = wait
+		return
+
+	def __call__(self):
+		if self.running:
+			self.overlapped = True
+		self.running = True
+		self.count += 1
+		time.sleep(self.wait)
+		self.running = False
+		return 0
+
+
+class TestPooledPeriodicTask(unittest.TestCase):
+	def setUp(self):
+		return
+
+	def tearDown(self):
+		OpenRTM_aist.Manager.instance().shutdownManager()
+		return
+
+	def test_signal(self):
+		svc = Svc()
+		pt = PooledPeriodicTask()
+		pt.setTask(svc)
+		pt.setPeriod(0.0)
+		pt.suspend()
+		pt.activate()
+		pt.suspend()
+		time.sleep(0.05)
+		self.assertEqual(0, svc.count)
+
+		pt.signal()
+		time.sleep(0.05)
+		self.assertEqual(1, svc.count)
+
+		pt.signal()
+		time.sleep(0.05)
+		self.assertEqual(2, svc.count)
+
+		pt.finalize()
+		pt.signal()
+		time.sleep(0.05)
+		self.assertEqual(2, svc.count)
+		return
+
+	def test_finalize(self):
+		svc = Svc(0.1)
+		pt = PooledPeriodicTask()
+		pt.setTask(svc)
+		pt.setPeriod(0.0)
+		pt.suspend()
+		pt.activate()
+		pt.suspend()
+		pt.signal()
+		time.sleep(0.02)
+		self.assert_(svc.running)
+
+		# finalize() returns after the running task ends
+		pt.finalize()
+		self.assertFalse(svc.running)
+		self.assertEqual(1, svc.count)
+		return
+
+	def test_setPeriod(self):
+		svc = Svc()
+		pt = PooledPeriodicTask()
+		pt.setTask(svc)
+		pt.setPeriod(0.01)
+		pt.activate()
+		time.sleep(0.1)
+		pt.suspend()
+		time.sleep(0.02)
+		count = svc.count
+		self.assert_(12 > count)
+		self.assert_( 5 < count)
+
+		time.sleep(0.05)
+		self.assertEqual(count, svc.count)
+		pt.finalize()
+		return
+
+	def test_ordering(self):
+		svcs = [Svc(0.001) for i in range(20)]
+		tasks = []
+		for svc in svcs:
+			pt = PooledPeriodicTask()
+			pt.setTask(svc)
+			pt.setPeriod(0.0)
+			pt.suspend()
+			pt.activate()
+			pt.suspend()
+			tasks.append(pt)
+
+		for i in range(10):
+			for pt in tasks:
+				pt.signal()
+			time.sleep(0.002)
+		time.sleep(0.2)
+
+		for svc in svcs:
+			self.assert_(0 < svc.count)
+			self.assertFalse(svc.overlapped)
+
+		for pt in tasks:
+			pt.finalize()
+			pt.wait()
+
+		# no thread is created for each task
+		self.assert_(threading.activeCount() < len(tasks))
+		return
+
+
+############### test #################
+if __name__ == '__main__':
+	unittest.main()
@@ -111,6 +111,23 @@ class TestPortBase(unittest.TestCase):
 
 
 
+  def test_negotiateCompression(self):
+    outp = OutPortObj().get_ports()
+    inp  = InPortObj().get_ports()
+    nvlist = [OpenRTM_aist.NVUtil.newNV("dataport.compression.type","lzma,zlib")]
+    prof = RTC.ConnectorProfile("connector0","connector_id1",[inp[0],outp[0]],nvlist)
+    self._pb.negotiateCompression(prof)
+    self.assertEqual(OpenRTM_aist.NVUtil.toString(prof.properties,"dataport.compression.type"),
+                     OpenRTM_aist.negotiateCompressionType("lzma,zlib"))
+
+    # a port publishing no compression types supports only none
+    prof = RTC.ConnectorProfile("connector0","connector_id1",[inp[0],self._pb.getPortRef()],nvlist)
+    self._pb.negotiateCompression(prof)
+    self.assertEqual(OpenRTM_aist.NVUtil.toString(prof.properties,"dataport.compression.type"),
+                     "none")
+    return
+
+
   def test_getProfile(self):
     outp = OutPortObj().get_ports()
     self._pb.setName("test")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+# \file test_PublisherCoalesce.py
+# \brief test for PublisherCoalesce class
+# \date $Date$
+#
+
+
+import sys,time
+sys.path.insert(1,"../")
+
+import unittest
+
+import OpenRTM_aist
+from PublisherCoalesce import *
+
+
+class ConsumerMock(OpenRTM_aist.InPortCorbaCdrConsumer):
+  def __init__(self):
+    self._data = []
+
+  def __del__(self):
+    pass
+
+  def put(self, data):
+    self._data.append(data)
+    return self.PORT_OK
+
+
+class BatchConsumerMock(ConsumerMock):
+  def __init__(self):
+    ConsumerMock.__init__(self)
+    self._calls = 0
+
+  def put_batch(self, data):
+    self._calls += 1
+    self._data.extend(data)
+    return (self.PORT_OK, len(data))
+
+
+class TestPublisherCoalesce(unittest.TestCase):
+
+  def setUp(self):
+    return
+
+  def tearDown(self):
+    OpenRTM_aist.Manager.instance().shutdownManager()
+    return
+
+  def createPublisher(self, cons, window, samples, nbytes="65536"):
+    pc = PublisherCoalesce()
+    prop = OpenRTM_aist.Properties()
+    cinfo = OpenRTM_aist.ConnectorInfo("", "", [], prop)
+    pc.setListener(cinfo, OpenRTM_aist.ConnectorListeners())
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("publisher.coalesce.window", window)
+    prop.setProperty("publisher.coalesce.max_samples", samples)
+    prop.setProperty("publisher.coalesce.max_bytes", nbytes)
+    self.assertEqual(pc.init(prop), OpenRTM_aist.DataPortStatus.PORT_OK)
+    pc.setConsumer(cons)
+    buff = OpenRTM_aist.CdrRingBuffer()
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("length", "16")
+    buff.init(prop)
+    pc.setBuffer(buff)
+    pc.activate()
+    return pc
+
+  def test_max_samples(self):
+    cons = ConsumerMock()
+    pc = self.createPublisher(cons, "1.0", "4")
+    for i in range(3):
+      self.assertEqual(pc.write("abc", 0, 0), OpenRTM_aist.DataPortStatus.PORT_OK)
+    time.sleep(0.05)
+    self.assertEqual(len(cons._data), 0)
+
+    pc.write("abc", 0, 0)
+    time.sleep(0.05)
+    self.assertEqual(len(cons._data), 4)
+    pc.deactivate()
+    pc.__del__()
+    return
+
+  def test_max_bytes(self):
+    cons = ConsumerMock()
+    pc = self.createPublisher(cons, "1.0", "16", "8")
+    pc.write("abcd", 0, 0)
+    time.sleep(0.05)
+    self.assertEqual(len(cons._data), 0)
+
+    pc.write("abcd", 0, 0)
+    time.sleep(0.05)
+    self.assertEqual(len(cons._data), 2)
+    pc.deactivate()
+    pc.__del__()
+    return
+
+  def test_window(self):
+    cons = BatchConsumerMock()
+    pc = self.createPublisher(cons, "0.05", "16")
+    for i in range(5):
+      pc.write("abc", 0, 0)
+    time.sleep(0.01)
+    self.assertEqual(len(cons._data), 0)
+
+    time.sleep(0.1)
+    self.assertEqual(len(cons._data), 5)
+    self.assertEqual(cons._calls, 1)
+    self.assertEqual(pc._metrics.getMetrics()["sent"], 5)
+    pc.deactivate()
+    pc.__del__()
+    return
+
+  def test_send_full(self):
+    cons = ConsumerMock()
+    pc = self.createPublisher(cons, "1.0", "4")
+    pc._retcode = OpenRTM_aist.DataPortStatus.SEND_FULL
+    # the data not written into the buffer are not pending
+    pc.writeBuffer = lambda data, sec, usec: OpenRTM_aist.BufferStatus.BUFFER_FULL
+    self.assertEqual(pc.write("abc", 0, 0), OpenRTM_aist.DataPortStatus.BUFFER_FULL)
+    self.assertEqual(pc._pending, 0)
+    self.assertEqual(pc._pendingBytes, 0)
+    pc.deactivate()
+    pc.__del__()
+    return
+
+
+############### test #################
+if __name__ == '__main__':
+  unittest.main()
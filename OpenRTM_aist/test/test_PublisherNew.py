@@ -86,6 +86,53 @@ class ConsumerMock(OpenRTM_aist.InPortCorbaCdrConsumer):
 
 
 
+class BatchConsumerMock(ConsumerMock):
+  def __init__(self):
+    ConsumerMock.__init__(self)
+    self._calls = 0
+
+  def put_batch(self, data):
+    self._calls += 1
+    count = 0
+    for d in data:
+      ret = self.put(d)
+      if ret != self.PORT_OK:
+        return (ret, count)
+      count += 1
+    return (self.PORT_OK, count)
+
+
+
+class FullBatchConsumerMock(BatchConsumerMock):
+  def __init__(self, limit):
+    BatchConsumerMock.__init__(self)
+    self._limit = limit
+
+  def put_batch(self, data):
+    ret, count = BatchConsumerMock.put_batch(self, data[:self._limit])
+    if ret == self.PORT_OK and count < len(data):
+      ret = self.SEND_FULL
+    return (ret, count)
+
+
+
+class SlowBatchConsumerMock(BatchConsumerMock):
+  def put_batch(self, data):
+    time.sleep(0.05)
+    return BatchConsumerMock.put_batch(self, data)
+
+
+
+class DataListenerMock(OpenRTM_aist.ConnectorDataListener):
+  def __init__(self):
+    self._data = []
+
+  def __call__(self, info, data):
+    self._data.append(data)
+    return OpenRTM_aist.ConnectorListenerStatus.NO_CHANGE
+
+
+
 class TestPublisherNew(unittest.TestCase):
 
   def setUp(self):
@@ -257,6 +304,80 @@ class TestPublisherNew(unittest.TestCase):
     _pn.__del__()
     return
 
+  def test_pushAllBatch(self):
+    _pn = PublisherNew()
+    prop = OpenRTM_aist.Properties()
+    cinfo = OpenRTM_aist.ConnectorInfo("",
+                                       "",
+                                       [],
+                                       prop)
+    _pn.setListener(cinfo,OpenRTM_aist.ConnectorListeners())
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("publisher.push_policy","all")
+    prop.setProperty("thread_type","default")
+    _pn.init(prop)
+    cons = BatchConsumerMock()
+    self.assertEqual(_pn.setConsumer(cons),OpenRTM_aist.DataPortStatus.PORT_OK)
+    buff = OpenRTM_aist.CdrRingBuffer()
+    _pn.setBuffer(buff)
+    buff.write(1)
+    buff.write(2)
+    buff.write(3)
+    # all readable data is sent in one call
+    self.assertEqual(_pn.pushAll(),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(cons._calls,1)
+    self.assertEqual(cons.get_m_put_data_len(),3)
+    self.assertEqual(buff.readable(),0)
+    _pn.__del__()
+    return
+
+  def test_pushAllBatch_full(self):
+    _pn = PublisherNew()
+    prop = OpenRTM_aist.Properties()
+    cinfo = OpenRTM_aist.ConnectorInfo("",
+                                       "",
+                                       [],
+                                       prop)
+    listeners = OpenRTM_aist.ConnectorListeners()
+    send = DataListenerMock()
+    listeners.connectorData_[OpenRTM_aist.ConnectorDataListenerType.ON_SEND].addListener(send,True)
+    _pn.setListener(cinfo,listeners)
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("publisher.push_policy","all")
+    prop.setProperty("thread_type","default")
+    _pn.init(prop)
+    cons = FullBatchConsumerMock(2)
+    self.assertEqual(_pn.setConsumer(cons),OpenRTM_aist.DataPortStatus.PORT_OK)
+    buff = OpenRTM_aist.CdrRingBuffer()
+    _pn.setBuffer(buff)
+    buff.write(1)
+    buff.write(2)
+    buff.write(3)
+    # the samples taken by the consumer and the rejected one are notified
+    # as sent
+    self.assertEqual(_pn.pushAll(),OpenRTM_aist.DataPortStatus.SEND_FULL)
+    self.assertEqual(send._data,[1,2,3])
+    self.assertEqual(buff.readable(),1)
+    _pn.__del__()
+    return
+
+  def test_pushAllBatch_rtt(self):
+    _pn = PublisherNew()
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("publisher.push_policy","adaptive")
+    _pn.setPushPolicy(prop)
+    self.assertEqual(_pn.setConsumer(SlowBatchConsumerMock()),
+                     OpenRTM_aist.DataPortStatus.PORT_OK)
+    buff = OpenRTM_aist.CdrRingBuffer()
+    _pn.setBuffer(buff)
+    buff.write(1)
+    buff.write(2)
+    # the round-trip time is that of the whole put_batch()
+    self.assertEqual(_pn.pushAll(),OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertTrue(_pn._rtt >= 0.2 * 0.05)
+    self.assertEqual(_pn._sendTime, None)
+    return
+
   def test_pushFifo(self):
     _pn = PublisherNew()
     prop = OpenRTM_aist.Properties()
@@ -363,6 +484,89 @@ class TestPublisherNew(unittest.TestCase):
     _pn.__del__()
     return
 
+  def test_pushAdaptive(self):
+    _pn = PublisherNew()
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("publisher.push_policy","adaptive")
+    prop.setProperty("publisher.adaptive.hold_count","2")
+    _pn.setPushPolicy(prop)
+    self.assertEqual(_pn._skipn, 1)
+    buff = OpenRTM_aist.CdrRingBuffer()
+    _pn.setBuffer(buff)
+    self.assertEqual(_pn._adaptivePolicy, PublisherNew.PUBLISHER_POLICY_ALL)
+
+    # backlog above high_watermark
+    for i in range(5):
+      buff.write("abc")
+    _pn.updateAdaptivePolicy()
+    self.assertEqual(_pn._adaptivePolicy, PublisherNew.PUBLISHER_POLICY_SKIP)
+
+    # saturated
+    for i in range(3):
+      buff.write("abc")
+    _pn.updateAdaptivePolicy()
+    self.assertEqual(_pn._adaptivePolicy, PublisherNew.PUBLISHER_POLICY_NEW)
+
+    # stepping back with hysteresis
+    buff.advanceRptr(buff.readable())
+    _pn.updateAdaptivePolicy()
+    self.assertEqual(_pn._adaptivePolicy, PublisherNew.PUBLISHER_POLICY_NEW)
+    _pn.updateAdaptivePolicy()
+    self.assertEqual(_pn._adaptivePolicy, PublisherNew.PUBLISHER_POLICY_SKIP)
+    _pn.updateAdaptivePolicy()
+    _pn.updateAdaptivePolicy()
+    self.assertEqual(_pn._adaptivePolicy, PublisherNew.PUBLISHER_POLICY_ALL)
+
+    # slow receiver
+    _pn._rtt = 0.5
+    _pn.updateAdaptivePolicy()
+    self.assertEqual(_pn._adaptivePolicy, PublisherNew.PUBLISHER_POLICY_NEW)
+
+    m = _pn._metrics.getMetrics()
+    self.assertEqual(m["push_policy"], "new")
+    self.assertEqual(m["policy_changes"], 5)
+    return
+
+  def test_throttle(self):
+    _pn = PublisherNew()
+    prop = OpenRTM_aist.Properties()
+    cinfo = OpenRTM_aist.ConnectorInfo("", "", [], prop)
+    _pn.setListener(cinfo, OpenRTM_aist.ConnectorListeners())
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("publisher.max_msgs_per_sec", "2")
+    _pn.setThrottle(prop)
+    cons = ConsumerMock()
+    _pn.setConsumer(cons)
+    buff = OpenRTM_aist.CdrRingBuffer()
+    _pn.setBuffer(buff)
+
+    # "new" drops the data exceeding the limit
+    for i in range(3):
+      buff.write("abc")
+      self.assertEqual(_pn.pushNew(), OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(cons.get_m_put_data_len(), 2)
+    self.assertEqual(buff.readable(), 0)
+
+    # "fifo" defers the data until tokens are refilled
+    _pn._task = OpenRTM_aist.PeriodicTask()
+    buff.write("abc")
+    self.assertEqual(_pn.pushFifo(), OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(cons.get_m_put_data_len(), 2)
+    self.assertEqual(buff.readable(), 1)
+    self.assertNotEqual(_pn._throttleTimer, None)
+
+    # the pending deferral is neither notified nor rescheduled again
+    timer = _pn._throttleTimer
+    self.assertEqual(_pn.pushFifo(), OpenRTM_aist.DataPortStatus.PORT_OK)
+    self.assertEqual(buff.readable(), 1)
+    self.assertEqual(_pn._throttleTimer, timer)
+
+    m = _pn._metrics.getMetrics()
+    self.assertEqual(m["throttled"], 2)
+    self.assertEqual(m["drops"], 1)
+    OpenRTM_aist.TimerScheduler.instance().cancel(_pn._throttleTimer)
+    return
+
   def test_convertReturn(self):
     _pn = PublisherNew()
     self.assertEqual(_pn.convertReturn(OpenRTM_aist.BufferStatus.BUFFER_OK,0),
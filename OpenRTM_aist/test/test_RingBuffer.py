@@ -135,6 +135,16 @@ class TestRingBuffer(unittest.TestCase):
     self.assertEqual(data[0],"string")
     self.assertEqual(self._rb.read(data,1,0),OpenRTM_aist.BufferStatus.TIMEOUT)
 
+  def test_readAll(self):
+    self.assertEqual(self._rb.readAll(),[])
+    for i in range(5):
+      self.assertEqual(self._rb.write(i),OpenRTM_aist.BufferStatus.BUFFER_OK)
+    self.assertEqual(self._rb.readAll(2),[0,1])
+    self.assertEqual(self._rb.readable(),3)
+    self.assertEqual(self._rb.readAll(),[2,3,4])
+    self.assertEqual(self._rb.readable(),0)
+    self.assertEqual(self._rb.empty(),True)
+
   def test_readable(self):
     data=[0]
     self.assertEqual(self._rb.readable(),0)
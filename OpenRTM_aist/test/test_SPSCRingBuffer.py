@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+# \file test_SPSCRingBuffer.py
+# \brief test for SPSCRingBuffer class
+# \date $Date$
+#
+
+
+import sys
+sys.path.insert(1,"../")
+sys.path.insert(1,"../RTM_IDL")
+
+import unittest
+import threading
+
+from SPSCRingBuffer import *
+import OpenRTM_aist
+
+class TestSPSCRingBuffer(unittest.TestCase):
+
+  def setUp(self):
+    self._rb = SPSCRingBuffer()
+
+  def tearDown(self):
+    OpenRTM_aist.Manager.instance().shutdownManager()
+    return
+
+  def test_init(self):
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("length","5")
+    prop.setProperty("write.full_policy","do_nothing")
+    prop.setProperty("read.empty_policy","do_nothing")
+    self._rb.init(prop)
+    self.assertEqual(self._rb.length(),5)
+    for i in range(5):
+      self.assertEqual(self._rb.write(i),OpenRTM_aist.BufferStatus.BUFFER_OK)
+    self.assertEqual(self._rb.write(5),OpenRTM_aist.BufferStatus.BUFFER_FULL)
+    data=[0]
+    for i in range(5):
+      self.assertEqual(self._rb.read(data),OpenRTM_aist.BufferStatus.BUFFER_OK)
+      self.assertEqual(data[0],i)
+    self.assertEqual(self._rb.read(data),OpenRTM_aist.BufferStatus.BUFFER_EMPTY)
+
+  def test_overwrite(self):
+    for i in range(10):
+      self.assertEqual(self._rb.write(i),OpenRTM_aist.BufferStatus.BUFFER_OK)
+    self.assertEqual(self._rb.readable(),8)
+    self.assertEqual(self._rb.readAll(),list(range(2,10)))
+    # readback
+    data=[0]
+    self.assertEqual(self._rb.read(data),OpenRTM_aist.BufferStatus.BUFFER_OK)
+    self.assertEqual(data[0],9)
+
+  def test_block(self):
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("length","2")
+    prop.setProperty("write.full_policy","block")
+    prop.setProperty("write.timeout","0.1")
+    prop.setProperty("read.empty_policy","block")
+    prop.setProperty("read.timeout","0.1")
+    self._rb.init(prop)
+    data=[0]
+    self.assertEqual(self._rb.read(data),OpenRTM_aist.BufferStatus.TIMEOUT)
+    self.assertEqual(self._rb.write(0),OpenRTM_aist.BufferStatus.BUFFER_OK)
+    self.assertEqual(self._rb.write(1),OpenRTM_aist.BufferStatus.BUFFER_OK)
+    self.assertEqual(self._rb.write(2),OpenRTM_aist.BufferStatus.TIMEOUT)
+    self.assertEqual(self._rb.readAll(),[0,1])
+
+  def test_producer_consumer(self):
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("write.full_policy","block")
+    prop.setProperty("write.timeout","1.0")
+    prop.setProperty("read.empty_policy","block")
+    prop.setProperty("read.timeout","1.0")
+    self._rb.init(prop)
+    def produce():
+      for i in range(1000):
+        self._rb.write(i)
+    th = threading.Thread(target=produce)
+    th.start()
+    data=[0]
+    values=[]
+    for i in range(1000):
+      self.assertEqual(self._rb.read(data),OpenRTM_aist.BufferStatus.BUFFER_OK)
+      values.append(data[0])
+    th.join()
+    self.assertEqual(values,list(range(1000)))
+
+  def test_advance(self):
+    for i in range(3):
+      self._rb.put(i)
+      self.assertEqual(self._rb.advanceWptr(1),OpenRTM_aist.BufferStatus.BUFFER_OK)
+    self.assertEqual(self._rb.rptr(2),2)
+    self.assertEqual(self._rb.advanceRptr(3),OpenRTM_aist.BufferStatus.BUFFER_OK)
+    self.assertEqual(self._rb.advanceRptr(1),OpenRTM_aist.BufferStatus.PRECONDITION_NOT_MET)
+    self.assertEqual(self._rb.empty(),True)
+
+
+############### test #################
+if __name__ == '__main__':
+        unittest.main()
@@ -205,6 +205,126 @@ class TestSharedMemory(unittest.TestCase):
     self.assertEqual(data.data, self._d_out.data)
     
 
+    self.outport_obj.disconnect_all()
+
+  def test_Ring(self):
+      sh_read = OpenRTM_aist.SharedMemory()
+      sh_read_var = sh_read._this()
+      sh_write = OpenRTM_aist.SharedMemory()
+      sh_write.setInterface(sh_read_var)
+
+      sh_write.create_memory(1000,"test_ring")
+      self.assertFalse(sh_read.is_ring())
+      self.assertTrue(sh_write.init_ring(4))
+      self.assertTrue(sh_read.is_ring())
+
+      # the writer does not wait for the reader until the ring is full
+      for i in range(4):
+          self.assertTrue(sh_write.write_slot(b"data%d" % i))
+      self.assertFalse(sh_write.write_slot(b"data4"))
+
+      self.assertTrue(sh_write.set_notify())
+      self.assertFalse(sh_write.set_notify())
+
+      for i in range(4):
+          self.assertEqual(sh_read.read_slot(), b"data%d" % i)
+          sh_read.advance_slot()
+      self.assertEqual(sh_read.read_slot(), None)
+      sh_read.clear_notify()
+      self.assertTrue(sh_write.set_notify())
+
+      # the slots are enlarged when the ring is empty
+      self.assertTrue(sh_write.write_slot(b"a"*5000))
+      self.assertEqual(sh_read.read_slot(), b"a"*5000)
+      sh_read.advance_slot()
+      self.assertEqual(sh_read._memory_size, sh_write._memory_size)
+
+      # the slot size is at least doubled without creating the memory again
+      self.assertTrue(sh_write.write_slot(b"b"*5001))
+      self.assertTrue(sh_write.write_slot(b"c"*9000))
+      header = sh_write.ring_header()
+      self.assertEqual(header[OpenRTM_aist.SharedMemory.RING_SLOT_SIZE], 10000)
+      self.assertEqual(header[OpenRTM_aist.SharedMemory.RING_GENERATION], 2)
+      del header
+      self.assertEqual(sh_read.read_slot(), b"b"*5001)
+      sh_read.advance_slot()
+      self.assertEqual(sh_read.read_slot(), b"c"*9000)
+      sh_read.advance_slot()
+      sh_write.close_memory(True)
+
+  def test_Ring_lease(self):
+      sh_read = OpenRTM_aist.SharedMemory()
+      sh_read_var = sh_read._this()
+      sh_write = OpenRTM_aist.SharedMemory()
+      sh_write.setInterface(sh_read_var)
+
+      sh_write.create_memory(1000,"test_ring_lease")
+      self.assertTrue(sh_write.init_ring(2))
+      self.assertEqual(sh_read.lease_slot(), None)
+      self.assertTrue(sh_write.write_slot(b"data0"))
+      self.assertTrue(sh_write.write_slot(b"data1"))
+
+      view = sh_read.lease_slot()
+      self.assertEqual(view.tobytes(), b"data0")
+      # the leased slot is not overwritten
+      self.assertFalse(sh_write.write_slot(b"data2"))
+      self.assertEqual(sh_read.lease_slot().tobytes(), b"data0")
+      # the leased slot is neither copied nor advanced
+      self.assertEqual(sh_read.read_slot(), None)
+      sh_read.advance_slot()
+      self.assertEqual(sh_read.lease_slot().tobytes(), b"data0")
+      del view
+      sh_read.release_slot()
+
+      self.assertTrue(sh_write.write_slot(b"data2"))
+      self.assertEqual(sh_read.lease_slot().tobytes(), b"data1")
+      sh_read.release_slot()
+      self.assertEqual(sh_read.read_slot(), b"data2")
+      sh_write.close_memory(True)
+
+  def test_Ring_semaphore(self):
+      sh_read = OpenRTM_aist.SharedMemory()
+      sh_read_var = sh_read._this()
+      sh_write = OpenRTM_aist.SharedMemory()
+      sh_write.setInterface(sh_read_var)
+
+      sh_write.create_memory(1000,"test_ring_sem")
+      self.assertTrue(sh_write.init_ring(4))
+      if platform.system() == "Windows":
+          self.assertFalse(sh_read.use_semaphore())
+          self.assertFalse(sh_write.notify_slot())
+      else:
+          self.assertTrue(sh_read.use_semaphore())
+          self.assertFalse(sh_read.wait_slot(0.01))
+          self.assertTrue(sh_write.notify_slot())
+          self.assertTrue(sh_read.wait_slot(0.01))
+      sh_read.close_semaphore()
+      sh_write.close_semaphore(True)
+      sh_write.close_memory(True)
+
+  def test_Push_ring(self):
+    prop = OpenRTM_aist.Properties()
+    prop.setProperty("dataport.interface_type","shared_memory")
+    prop.setProperty("dataport.dataflow_type","push")
+    prop.setProperty("dataport.shem_slot_count","8")
+    ret = OpenRTM_aist.connect("con1",prop,self.inport_obj,self.outport_obj)
+
+    for i in range(3):
+      self._d_out.data = "a"*(100+i)
+      self._outOut.write()
+    time.sleep(0.1)
+
+    for i in range(3):
+      data = self._inIn.read()
+      self.assertEqual(data.data, "a"*(100+i))
+
+    self._d_out.data = "a"*50000
+    self._outOut.write()
+    time.sleep(0.1)
+
+    data = self._inIn.read()
+    self.assertEqual(data.data, self._d_out.data)
+
     self.outport_obj.disconnect_all()
 
 ############### test #################
@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+
+#  \file test_StructSerializer.py
+#  \brief test for StructSerializer class
+#  \date $Date$
+#
+
+
+import sys
+sys.path.insert(1,"../")
+
+import unittest
+
+from omniORB import cdrMarshal
+from omniORB import any
+
+from StructSerializer import *
+
+import RTC
+import OpenRTM_aist
+
+
+class TestStructSerializer(unittest.TestCase):
+  def setUp(self):
+    self._ser = StructSerializer()
+    return
+
+  def tearDown(self):
+    OpenRTM_aist.Manager.instance().shutdownManager()
+    return
+
+  def test_setDataType(self):
+    self.assertEqual(self._ser.setDataType(RTC.TimedLong(RTC.Time(0,0),0)),True)
+    self.assertEqual(self._ser.setDataType(RTC.TimedLongSeq(RTC.Time(0,0),[])),False)
+    self.assertEqual(self._ser.setDataType(RTC.TimedString(RTC.Time(0,0),"")),False)
+    return
+
+  def test_serialize(self):
+    for data in [RTC.TimedLong(RTC.Time(1,2),-123),
+                 RTC.TimedShort(RTC.Time(3,4),5),
+                 RTC.TimedDouble(RTC.Time(5,6),0.5),
+                 RTC.TimedBoolean(RTC.Time(7,8),True),
+                 RTC.TimedChar(RTC.Time(7,8),"a"),
+                 RTC.TimedPoint3D(RTC.Time(9,10),RTC.Point3D(0.5,1.5,2.5)),
+                 RTC.TimedPose2D(RTC.Time(11,12),
+                                 RTC.Pose2D(RTC.Point2D(0.5,1.5),0.25))]:
+      tc = any.to_any(data).typecode()
+      for endian in [True, False]:
+        self.assertEqual(self._ser.setDataType(data),True)
+        self._ser.isLittleEndian(endian)
+        cdr = self._ser.serialize(data)
+        self.assertEqual(cdr, cdrMarshal(tc, data, endian))
+        self.assertEqual(cdrMarshal(tc, self._ser.deserialize(cdr), endian), cdr)
+    return
+
+  def test_char(self):
+    data = RTC.TimedChar(RTC.Time(1,2),"x")
+    self.assertEqual(self._ser.setDataType(data),True)
+    ret = self._ser.deserialize(self._ser.serialize(data))
+    self.assertEqual(ret.data, "x")
+    self.assertEqual(type(ret.data), str)
+    return
+
+  def test_createSerializer(self):
+    data = RTC.TimedLong(RTC.Time(0,0),0)
+    ser = OpenRTM_aist.createSerializer("cdr_struct", data, True)
+    self.assertEqual(isinstance(ser, StructSerializer), True)
+    ser = OpenRTM_aist.createSerializer("cdr", data, True)
+    self.assertEqual(isinstance(ser, OpenRTM_aist.CdrSerializer), True)
+    self.assertEqual(OpenRTM_aist.createSerializer("cdr_struct",
+                                                   RTC.TimedLongSeq(RTC.Time(0,0),[]),
+                                                   True), None)
+    self.assertEqual(OpenRTM_aist.createSerializer("unknown", data, True), None)
+    return
+
+
+############### test #################
+if __name__ == '__main__':
+        unittest.main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+# \file test_TimerScheduler.py
+# \brief test for TimerScheduler class
+# \date $Date$
+#
+
+
+import sys,time
+sys.path.insert(1,"../")
+
+import OpenRTM_aist
+import unittest
+
+from TimerScheduler import *
+
+
+class TestTimerScheduler(unittest.TestCase):
+  def setUp(self):
+    self._scheduler = TimerScheduler.instance()
+    self._called = []
+    return
+
+  def tearDown(self):
+    OpenRTM_aist.Manager.instance().shutdownManager()
+    return
+
+  def callback(self, name):
+    def func():
+      self._called.append((name, TimerScheduler.now()))
+    return func
+
+  def test_schedule(self):
+    now = TimerScheduler.now()
+    self._scheduler.schedule(now + 0.03, self.callback("c"))
+    self._scheduler.schedule(now + 0.01, self.callback("a"))
+    self._scheduler.schedule(now + 0.02, self.callback("b"))
+    time.sleep(0.1)
+
+    self.assertEqual(["a", "b", "c"], [name for name, tm in self._called])
+    self.assert_(self._called[0][1] >= now + 0.01)
+    return
+
+  def test_cancel(self):
+    now = TimerScheduler.now()
+    entry = self._scheduler.schedule(now + 0.01, self.callback("a"))
+    self._scheduler.schedule(now + 0.02, self.callback("b"))
+    self._scheduler.cancel(entry)
+    time.sleep(0.1)
+
+    self.assertEqual(["b"], [name for name, tm in self._called])
+    return
+
+  def test_wakeup(self):
+    now = TimerScheduler.now()
+    self._scheduler.schedule(now + 10.0, self.callback("b"))
+    time.sleep(0.02)
+    self._scheduler.schedule(now + 0.03, self.callback("a"))
+    time.sleep(0.1)
+
+    self.assertEqual(["a"], [name for name, tm in self._called])
+    self.assert_(self._called[0][1] < now + 0.08)
+    return
+
+  def test_monotonic(self):
+    if sys.platform.startswith("linux"):
+      self.assertNotEqual(time.time, monotonic)
+    prev = TimerScheduler.now()
+    for i in range(100):
+      now = TimerScheduler.now()
+      self.assert_(now >= prev)
+      prev = now
+    return
+
+  def test_timer(self):
+    timer = OpenRTM_aist.Timer(OpenRTM_aist.TimeValue(0, 1000))
+    id_ = timer.registerListenerFunc(self.callback("a"),
+                                     OpenRTM_aist.TimeValue(0, 10000))
+    timer.start()
+    time.sleep(0.2)
+    timer.unregisterListener(id_)
+    count = len(self._called)
+    time.sleep(0.05)
+    timer.stop()
+
+    self.assert_(15 < count)
+    self.assert_(22 > count)
+    self.assertEqual(count, len(self._called))
+    return
+
+
+############### test #################
+if __name__ == '__main__':
+  unittest.main()
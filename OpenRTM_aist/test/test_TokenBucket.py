@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- Python -*-
+
+# \file test_TokenBucket.py
+# \brief test for TokenBucket class
+# \date $Date$
+#
+
+
+import sys,time
+sys.path.insert(1,"../")
+
+import OpenRTM_aist
+import unittest
+
+from TokenBucket import *
+
+
+class TestTokenBucket(unittest.TestCase):
+  def setUp(self):
+    return
+
+  def tearDown(self):
+    OpenRTM_aist.Manager.instance().shutdownManager()
+    return
+
+  def test_consume(self):
+    bucket = TokenBucket(100.0, 10.0)
+    for i in range(10):
+      self.assert_(bucket.available(1))
+      bucket.consume(1)
+    self.assertFalse(bucket.available(1))
+    self.assert_(0.0 < bucket.delay(1) <= 0.01)
+
+    time.sleep(0.05)
+    self.assert_(bucket.available(4))
+    self.assertEqual(bucket.delay(4), 0.0)
+    return
+
+  def test_large_data(self):
+    # data larger than the burst are sent when the bucket is full
+    bucket = TokenBucket(1000.0, 100.0)
+    self.assert_(bucket.available(500))
+    bucket.consume(500)
+    self.assertFalse(bucket.available(10))
+    self.assert_(0.4 < bucket.delay(10) <= 0.41)
+    return
+
+
+############### test #################
+if __name__ == '__main__':
+  unittest.main()